@@ -0,0 +1,573 @@
+#!/usr/bin/env python3
+"""
+Generate box_pusher's level bank with an offline Sokoban solver.
+
+Random 8x8 layouts (wall border, one box, one target) are solved with a
+push-optimal A* (or IDA*) search and only levels a player can finish inside
+the 4-second beat budget are kept. The result is written to level_bank.gd,
+so the game picks a verified level at runtime without any search.
+
+Solver:
+- states are (box cells, normalized player region): the player's reachable
+  area is flood-filled with bitmasks and represented by its lowest cell
+- states are Zobrist-hashed (XOR of per-cell box and player keys) into a transposition
+  table that keeps the cheapest push count seen per state
+- dead squares (cells the box can never be pushed out of toward a target)
+  are precomputed per layout by pulling the box back from the targets; the
+  same pull distances are the admissible A* heuristic
+- candidates are solved in parallel across a process pool
+
+A level fits the budget when READ_TIME + moves / MOVES_PER_SECOND <= 4 s,
+where moves is the player step count of the push-optimal solution. That
+budget assumes speed 1.0: director.gd runs the beat timer at
+delta * speed_multiplier, so at speed s only 4 / s seconds of wall-clock
+time are available. The bank is sorted by move count and stores it (MOVES)
+with the timing constants, and main.gd picks only from the prefix of levels
+that fits 4 / speed_multiplier (the shortest few when none do).
+
+Usage:
+    python3 games/box_pusher/generate_levels.py [--count N] [--seed S] [--jobs N] [--search astar|ida]
+    python3 games/box_pusher/generate_levels.py --check    # re-verify the committed bank
+"""
+
+import argparse
+import heapq
+import os
+import random
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+GAME_DIR = Path(__file__).resolve().parent
+BANK_PATH = GAME_DIR / "level_bank.gd"
+GENERATOR = "games/box_pusher/generate_levels.py"
+
+# Board: 8x8 with a wall border (main.gd GRID_W/GRID_H); cells are y * 8 + x
+SIZE = 8
+INNER = SIZE - 2
+DIRS = {"U": -SIZE, "R": 1, "D": SIZE, "L": -1}
+BORDER = sum(1 << c for c in range(SIZE * SIZE)
+             if c % SIZE in (0, SIZE - 1) or c // SIZE in (0, SIZE - 1))
+
+# Timing model (director.gd NORMAL_GAME_BEATS * BEAT_DURATION = 4 s)
+BEAT_BUDGET = 4.0
+READ_TIME = 1.0  # Seconds to take in the layout before the first move
+MOVES_PER_SECOND = 5.0
+
+DEFAULT_COUNT = 200
+DEFAULT_MIN_PUSHES = 2
+DEFAULT_MAX_NODES = 200_000
+
+# Zobrist keys, fixed so hashes are reproducible across processes
+_zobrist_rng = random.Random(0x5B0C0BA)
+Z_BOX = [_zobrist_rng.getrandbits(64) for _ in range(SIZE * SIZE)]
+Z_PLAYER = [_zobrist_rng.getrandbits(64) for _ in range(SIZE * SIZE)]
+
+
+class LevelBankError(ValueError):
+    """Raised when level_bank.gd is missing, unreadable or fails validation."""
+
+
+def bit(cell: int) -> int:
+    return 1 << cell
+
+
+def low_cell(mask: int) -> int:
+    return (mask & -mask).bit_length() - 1
+
+
+def flood(start: int, free: int) -> int:
+    """Cells reachable from start through free cells, as a bitmask."""
+    reach = bit(start)
+    while True:
+        grown = (reach | reach << 1 | reach >> 1 | reach << SIZE | reach >> SIZE) & free
+        grown |= reach
+        if grown == reach:
+            return reach
+        reach = grown
+
+
+class Board:
+    """Static part of a level: walls, targets, dead squares and push distances."""
+
+    def __init__(self, walls: int, targets: tuple[int, ...]):
+        self.walls = walls | BORDER
+        self.floor = ~self.walls & ((1 << SIZE * SIZE) - 1)
+        self.targets = targets
+        self.target_mask = sum(bit(t) for t in targets)
+        self.distance = self._pull_distances()
+        self.dead = self.floor & ~sum(bit(c) for c in self.distance)
+
+    def _pull_distances(self) -> dict[int, int]:
+        """Minimum pushes from each cell to the nearest target, ignoring other boxes.
+
+        Pulling the box away from the targets: the box at c came from c - d
+        if both c - d and the player's cell c - 2d are floor. Cells never
+        reached are dead squares.
+        """
+        distance = {t: 0 for t in self.targets}
+        queue = list(self.targets)
+        for cell in queue:
+            for d in DIRS.values():
+                prev, player = cell - d, cell - 2 * d
+                if self.floor >> prev & 1 and self.floor >> player & 1 and prev not in distance:
+                    distance[prev] = distance[cell] + 1
+                    queue.append(prev)
+        return distance
+
+    def heuristic(self, boxes: tuple[int, ...]) -> int:
+        return sum(self.distance[b] for b in boxes)
+
+    def state(self, boxes: tuple[int, ...], player: int) -> tuple[int, int, int]:
+        """(hash, normalized player cell, reach mask) for a position."""
+        box_mask = sum(bit(b) for b in boxes)
+        reach = flood(player, self.floor & ~box_mask)
+        norm = low_cell(reach)
+        key = Z_PLAYER[norm]
+        for b in boxes:
+            key ^= Z_BOX[b]
+        return key, norm, reach
+
+    def pushes(self, boxes: tuple[int, ...], reach: int):
+        """Yield (box index, direction, new boxes) for every push that avoids a dead square."""
+        box_mask = sum(bit(b) for b in boxes)
+        for i, b in enumerate(boxes):
+            for name, d in DIRS.items():
+                to = b + d
+                if not reach >> (b - d) & 1 or not self.floor >> to & 1 or box_mask >> to & 1:
+                    continue
+                if self.dead >> to & 1:
+                    continue
+                yield i, name, tuple(sorted(boxes[:i] + (to,) + boxes[i + 1:]))
+
+    def deadlocked(self, boxes: tuple[int, ...]) -> bool:
+        return any(self.dead >> b & 1 for b in boxes)
+
+    def solved(self, boxes: tuple[int, ...]) -> bool:
+        return all(self.target_mask >> b & 1 for b in boxes)
+
+
+def solve_astar(board: Board, boxes: tuple[int, ...], player: int, max_nodes: int):
+    """Push-optimal A*. Returns [(box cell, direction), ...] or None."""
+    if board.deadlocked(boxes):
+        return None
+    key, _, reach = board.state(boxes, player)
+    best = {key: 0}  # Transposition table: hash -> fewest pushes seen
+    parent = {key: None}
+    heap = [(board.heuristic(boxes), 0, key, boxes, player, reach)]
+    nodes = 0
+    while heap:
+        _, g, key, boxes, player, reach = heapq.heappop(heap)
+        if g > best[key]:
+            continue
+        if board.solved(boxes):
+            path = []
+            while parent[key] is not None:
+                key, push = parent[key]
+                path.append(push)
+            return path[::-1]
+        nodes += 1
+        if nodes > max_nodes:
+            return None
+        for i, name, next_boxes in board.pushes(boxes, reach):
+            next_player = boxes[i]
+            next_key, _, next_reach = board.state(next_boxes, next_player)
+            if best.get(next_key, g + 2) <= g + 1:
+                continue
+            best[next_key] = g + 1
+            parent[next_key] = (key, (boxes[i], name))
+            heapq.heappush(heap, (g + 1 + board.heuristic(next_boxes), g + 1, next_key,
+                                  next_boxes, next_player, next_reach))
+    return None
+
+
+def solve_ida(board: Board, boxes: tuple[int, ...], player: int, max_nodes: int):
+    """Push-optimal IDA* with the same transposition table and heuristic."""
+    if board.deadlocked(boxes):
+        return None
+    path = []
+    nodes = 0
+
+    def search(boxes, player, g, bound, table):
+        nonlocal nodes
+        key, _, reach = board.state(boxes, player)
+        f = g + board.heuristic(boxes)
+        if f > bound:
+            return f
+        if board.solved(boxes):
+            return True
+        if table.get(key, g + 1) <= g:
+            return None  # Reached before with as few pushes
+        table[key] = g
+        nodes += 1
+        if nodes > max_nodes:
+            return None
+        smallest = None
+        for i, name, next_boxes in board.pushes(boxes, reach):
+            path.append((boxes[i], name))
+            result = search(next_boxes, boxes[i], g + 1, bound, table)
+            if result is True:
+                return True
+            path.pop()
+            if result is not None and (smallest is None or result < smallest):
+                smallest = result
+        return smallest
+
+    bound = board.heuristic(boxes)
+    while nodes <= max_nodes:
+        result = search(boxes, player, 0, bound, {})
+        if result is True:
+            return path
+        if result is None:
+            return None
+        bound = result
+    return None
+
+
+SOLVERS = {"astar": solve_astar, "ida": solve_ida}
+
+
+def expand_moves(board: Board, boxes: tuple[int, ...], player: int, pushes: list) -> str | None:
+    """Turn a push sequence into the player's step-by-step moves (UDLR)."""
+    moves = []
+    boxes = list(boxes)
+    for box, name in pushes:
+        d = DIRS[name]
+        free = board.floor & ~sum(bit(b) for b in boxes)
+        steps = _walk_path(player, box - d, free)
+        if steps is None:
+            return None
+        moves.append(steps + name)
+        boxes[boxes.index(box)] = box + d
+        player = box
+    return "".join(moves)
+
+
+def _walk_path(start: int, goal: int, free: int) -> str | None:
+    previous = {start: None}
+    queue = [start]
+    for cell in queue:
+        if cell == goal:
+            break
+        for name, d in DIRS.items():
+            nxt = cell + d
+            if free >> nxt & 1 and nxt not in previous:
+                previous[nxt] = (cell, name)
+                queue.append(nxt)
+    if goal not in previous:
+        return None
+    steps = []
+    while previous[goal] is not None:
+        goal, name = previous[goal]
+        steps.append(name)
+    return "".join(reversed(steps))
+
+
+def replay(walls: int, player: int, box: int, target: int, moves: str) -> bool:
+    """Play moves with main.gd's rules; True if the box ends on the target."""
+    blocked = walls | BORDER
+    for name in moves:
+        d = DIRS[name]
+        nxt = player + d
+        if blocked >> nxt & 1:
+            return False
+        if nxt == box:
+            if blocked >> (box + d) & 1:
+                return False
+            box += d
+            if box == target:
+                return True
+        player = nxt
+    return False
+
+
+def play_seconds(moves: int) -> float:
+    return READ_TIME + moves / MOVES_PER_SECOND
+
+
+# =============================================================================
+# Candidates
+# =============================================================================
+
+def random_layout(rng: random.Random) -> tuple[int, int, int, int] | None:
+    """(walls, player, box, target) with all floor connected, or None."""
+    density = rng.uniform(0.12, 0.32)
+    walls = BORDER
+    for y in range(1, SIZE - 1):
+        for x in range(1, SIZE - 1):
+            if rng.random() < density:
+                walls |= bit(y * SIZE + x)
+    floor = ~walls & ((1 << SIZE * SIZE) - 1)
+    cells = [c for c in range(SIZE * SIZE) if floor >> c & 1]
+    if len(cells) < 12:
+        return None
+    region = flood(rng.choice(cells), floor)
+    walls |= floor & ~region  # Wall off unreachable pockets
+    cells = [c for c in cells if region >> c & 1]
+    if len(cells) < 12:
+        return None
+    player, box, target = rng.sample(cells, 3)
+    return walls, player, box, target
+
+
+def canonical_key(walls: int, player: int, box: int, target: int) -> tuple:
+    """Same level under any of the 8 board symmetries (player by region) maps to one key."""
+    board = Board(walls, (target,))
+    _, norm, _ = board.state((box,), player)
+    keys = []
+    for transform in _SYMMETRIES:
+        t_walls = sum(bit(transform(c)) for c in range(SIZE * SIZE) if walls >> c & 1)
+        t_reach = flood(transform(player), ~t_walls & ~bit(transform(box)) & ((1 << SIZE * SIZE) - 1))
+        keys.append((t_walls, transform(box), transform(target), low_cell(t_reach)))
+    return min(keys)
+
+
+def _symmetry(flip: bool, turns: int):
+    def transform(cell: int) -> int:
+        x, y = cell % SIZE, cell // SIZE
+        if flip:
+            x = SIZE - 1 - x
+        for _ in range(turns):
+            x, y = SIZE - 1 - y, x
+        return y * SIZE + x
+    return transform
+
+
+_SYMMETRIES = [_symmetry(flip, turns) for flip in (False, True) for turns in range(4)]
+
+
+def evaluate(task: tuple[int, str, int, int]) -> dict | None:
+    """Generate and solve one candidate; the level dict if it is worth keeping."""
+    seed, search, min_pushes, max_nodes = task
+    layout = random_layout(random.Random(seed))
+    if layout is None:
+        return None
+    walls, player, box, target = layout
+    board = Board(walls, (target,))
+    pushes = SOLVERS[search](board, (box,), player, max_nodes)
+    if pushes is None or len(pushes) < min_pushes:
+        return None
+    moves = expand_moves(board, (box,), player, pushes)
+    if moves is None or play_seconds(len(moves)) > BEAT_BUDGET:
+        return None
+    return {
+        "seed": seed, "walls": walls, "player": player, "box": box, "target": target,
+        "dead": board.dead, "pushes": len(pushes), "moves": moves,
+        "key": canonical_key(walls, player, box, target),
+    }
+
+
+def generate(count: int, seed: int, jobs: int, search: str, min_pushes: int,
+             max_nodes: int, max_candidates: int) -> tuple[list[dict], int]:
+    """Unique levels in seed order; also returns how many candidates were tried."""
+    levels, seen = [], set()
+    batch = max(1, jobs) * 256
+    tried = 0
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        while len(levels) < count and tried < max_candidates:
+            tasks = [(seed + tried + i, search, min_pushes, max_nodes) for i in range(batch)]
+            tried += batch
+            for level in pool.map(evaluate, tasks, chunksize=32):
+                if level and level["key"] not in seen and len(levels) < count:
+                    seen.add(level["key"])
+                    levels.append(level)
+    return levels, tried
+
+
+# =============================================================================
+# Bank encoding (decoded by main.gd _load_random_level)
+# =============================================================================
+
+def to_inner(cell: int) -> int:
+    return (cell // SIZE - 1) * INNER + (cell % SIZE - 1)
+
+
+def from_inner(index: int) -> int:
+    return (index // INNER + 1) * SIZE + index % INNER + 1
+
+
+def inner_mask(mask: int) -> int:
+    return sum(bit(i) for i in range(INNER * INNER) if mask >> from_inner(i) & 1)
+
+
+def outer_mask(mask: int) -> int:
+    return sum(bit(from_inner(i)) for i in range(INNER * INNER) if mask >> i & 1)
+
+
+def pack_level(level: dict) -> int:
+    """Interior walls in bits 0-35, then player, box and target (6 bits each)."""
+    return (inner_mask(level["walls"]) | to_inner(level["player"]) << 36
+            | to_inner(level["box"]) << 42 | to_inner(level["target"]) << 48)
+
+
+def unpack_level(packed: int) -> tuple[int, int, int, int]:
+    walls = outer_mask(packed & ((1 << 36) - 1)) | BORDER
+    return walls, from_inner(packed >> 36 & 63), from_inner(packed >> 42 & 63), from_inner(packed >> 48 & 63)
+
+
+def render_bank(levels: list[dict], args_line: str) -> str:
+    def int_rows(values, per_row):
+        return "\n".join("\t" + " ".join(f"{v}," for v in values[i:i + per_row])
+                         for i in range(0, len(values), per_row))
+
+    return "\n".join([
+        "extends RefCounted",
+        "",
+        f"## Box Pusher level bank: Generated by {GENERATOR}.",
+        "## Do not edit by hand; rerun the script (or --check it) instead.",
+        f"## {len(levels)} levels solvable in {BEAT_BUDGET:g} s ({args_line})",
+        "## LEVELS packs the 6x6 interior inside the wall border into one int:",
+        "## bits 0-35 walls, 36-41 player, 42-47 box, 48-53 target (interior",
+        "## index = (y - 1) * 6 + (x - 1)). DEAD_SQUARES marks interior cells the",
+        "## box can never be pushed to the target from. SOLUTIONS are push-optimal.",
+        f"## Levels are sorted by MOVES (solution length); the {BEAT_BUDGET:g} s budget is at",
+        "## speed 1.0, so main.gd only picks levels whose moves fit BEAT_SECONDS / speed.",
+        "",
+        "const INNER_SIZE = 6",
+        f"const BEAT_SECONDS = {BEAT_BUDGET!r}",
+        f"const READ_TIME = {READ_TIME!r}",
+        f"const MOVES_PER_SECOND = {MOVES_PER_SECOND!r}",
+        "",
+        "const LEVELS = [",
+        int_rows([pack_level(level) for level in levels], 4),
+        "]",
+        "",
+        "const DEAD_SQUARES = [",
+        int_rows([inner_mask(level["dead"]) for level in levels], 6),
+        "]",
+        "",
+        "const PUSHES = [",
+        int_rows([level["pushes"] for level in levels], 20),
+        "]",
+        "",
+        "const MOVES = [",
+        int_rows([len(level["moves"]) for level in levels], 20),
+        "]",
+        "",
+        "const SOLUTIONS = [",
+        "\n".join(f'\t"{level["moves"]}",' for level in levels),
+        "]",
+        "",
+    ])
+
+
+def read_bank(path: Path) -> list[dict]:
+    try:
+        return parse_bank(path.read_text(encoding="utf-8"))
+    except OSError as e:
+        raise LevelBankError(f"{path}: {e}")
+    except LevelBankError as e:
+        raise LevelBankError(f"{path}: {e}")
+
+
+def parse_bank(text: str) -> list[dict]:
+    def array(name: str) -> list[str]:
+        match = re.search(rf"^const {name} = \[(.*?)^\]", text, re.S | re.M)
+        if not match:
+            raise LevelBankError(f"no {name} array")
+        return [item.strip().strip('"') for item in match.group(1).split(",") if item.strip()]
+
+    packed, dead, pushes, moves = array("LEVELS"), array("DEAD_SQUARES"), array("PUSHES"), array("SOLUTIONS")
+    counts = array("MOVES")
+    if not len(packed) == len(dead) == len(pushes) == len(moves) == len(counts):
+        raise LevelBankError("arrays have different lengths")
+    levels = []
+    for values in zip(packed, dead, pushes, moves, counts):
+        walls, player, box, target = unpack_level(int(values[0]))
+        levels.append({"walls": walls, "player": player, "box": box, "target": target,
+                       "dead": outer_mask(int(values[1])), "pushes": int(values[2]), "moves": values[3],
+                       "move_count": int(values[4])})
+    return levels
+
+
+def validate(levels: list[dict], max_nodes: int) -> list[str]:
+    """Problems with a decoded bank: each level is re-solved and its solution replayed."""
+    problems, seen = [], set()
+    for i, level in enumerate(levels):
+        walls, player, box, target = level["walls"], level["player"], level["box"], level["target"]
+        board = Board(walls, (target,))
+        if len({player, box, target}) < 3 or (walls >> player | walls >> box | walls >> target) & 1:
+            problems.append(f"level {i}: player, box and target must be distinct floor cells")
+            continue
+        if board.dead != level["dead"]:
+            problems.append(f"level {i}: dead squares differ from the layout")
+        solution = solve_astar(board, (box,), player, max_nodes)
+        if solution is None or len(solution) != level["pushes"]:
+            problems.append(f"level {i}: optimal pushes {len(solution) if solution else 'none'}, bank says {level['pushes']}")
+        if not replay(walls, player, box, target, level["moves"]):
+            problems.append(f"level {i}: solution does not finish the level")
+        if play_seconds(len(level["moves"])) > BEAT_BUDGET:
+            problems.append(f"level {i}: {len(level['moves'])} moves do not fit {BEAT_BUDGET:g} s")
+        if level["move_count"] != len(level["moves"]):
+            problems.append(f"level {i}: MOVES says {level['move_count']}, solution has {len(level['moves'])}")
+        if i and level["move_count"] < levels[i - 1]["move_count"]:
+            problems.append(f"level {i}: not sorted by move count (main.gd picks a prefix)")
+        key = canonical_key(walls, player, box, target)
+        if key in seen:
+            problems.append(f"level {i}: duplicate of an earlier level")
+        seen.add(key)
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate box_pusher's verified level bank.")
+    parser.add_argument("--count", type=int, default=DEFAULT_COUNT, help=f"Levels to keep (default: {DEFAULT_COUNT})")
+    parser.add_argument("--seed", type=int, default=1, help="First candidate seed (default: 1)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Solver processes (default: CPU count)")
+    parser.add_argument("--search", choices=sorted(SOLVERS), default="astar", help="Search algorithm (default: astar)")
+    parser.add_argument("--min-pushes", type=int, default=DEFAULT_MIN_PUSHES,
+                        help=f"Skip levels solved in fewer pushes (default: {DEFAULT_MIN_PUSHES})")
+    parser.add_argument("--max-nodes", type=int, default=DEFAULT_MAX_NODES,
+                        help=f"Give up on a candidate after this many expansions (default: {DEFAULT_MAX_NODES})")
+    parser.add_argument("--max-candidates", type=int, default=200_000, help="Stop after this many candidates")
+    parser.add_argument("--output", default=str(BANK_PATH), help="Bank path (default: level_bank.gd next to this script)")
+    parser.add_argument("--check", action="store_true", help="Verify the existing bank instead of generating")
+    args = parser.parse_args()
+
+    output = Path(args.output)
+    if args.check:
+        try:
+            levels = read_bank(output)
+        except LevelBankError as e:
+            print(f"Error: {e}")
+            return 1
+        problems = validate(levels, args.max_nodes)
+        for problem in problems:
+            print(f"Error: {problem}")
+        if problems:
+            return 1
+        print(f"{output}: {len(levels)} levels OK")
+        return 0
+
+    levels, tried = generate(args.count, args.seed, args.jobs, args.search, args.min_pushes,
+                             args.max_nodes, args.max_candidates)
+    if len(levels) < args.count:
+        print(f"Warning: Only {len(levels)} of {args.count} levels after {tried} candidates")
+    if not levels:
+        print("Error: No levels generated")
+        return 1
+    # By move count, so the levels that fit a faster beat are a prefix
+    levels.sort(key=lambda level: (len(level["moves"]), level["pushes"], level["seed"]))
+
+    # Round-trip the encoding before writing anything
+    text = render_bank(levels, f"seed {args.seed}, min pushes {args.min_pushes}")
+    problems = validate(parse_bank(text), args.max_nodes)
+    if problems:
+        for problem in problems:
+            print(f"Error: {problem}")
+        return 1
+    output.write_text(text, encoding="utf-8")
+
+    histogram = {}
+    for level in levels:
+        histogram[level["pushes"]] = histogram.get(level["pushes"], 0) + 1
+    print(f"Tried {tried} candidates, kept {len(levels)} levels")
+    print("Pushes: " + ", ".join(f"{p}: {n}" for p, n in sorted(histogram.items())))
+    print(f"Longest solution: {max(len(level['moves']) for level in levels)} moves "
+          f"({play_seconds(max(len(level['moves']) for level in levels)):.1f} s)")
+    print(f"Wrote {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,335 @@
+extends RefCounted
+
+## Box Pusher level bank: Generated by games/box_pusher/generate_levels.py.
+## Do not edit by hand; rerun the script (or --check it) instead.
+## 200 levels solvable in 4 s (seed 1, min pushes 2)
+## LEVELS packs the 6x6 interior inside the wall border into one int:
+## bits 0-35 walls, 36-41 player, 42-47 box, 48-53 target (interior
+## index = (y - 1) * 6 + (x - 1)). DEAD_SQUARES marks interior cells the
+## box can never be pushed to the target from. SOLUTIONS are push-optimal.
+## Levels are sorted by MOVES (solution length); the 4 s budget is at
+## speed 1.0, so main.gd only picks levels whose moves fit BEAT_SECONDS / speed.
+
+const INNER_SIZE = 6
+const BEAT_SECONDS = 4.0
+const READ_TIME = 1.0
+const MOVES_PER_SECOND = 5.0
+
+const LEVELS = [
+	1197781889200623, 5093006597177392, 8809794236322400, 7666503772086625,
+	5664891142975587, 7157133502152968, 6871250283804240, 4851936456082943,
+	2010973481992192, 1421189788516352, 13923273445952, 6545051337359429,
+	317733275179013, 35871558221840, 6518181753933838, 3699452082128928,
+	679438090240003, 1412186354812416, 1725984156983306, 5750652508569650,
+	8587151453356527, 1451504624205971, 5951725160633348, 5154785388941312,
+	9711746495309824, 7952566948464737, 6260206908473377, 5124825844678916,
+	938915335517648, 2081564563359811, 7385011582926928, 5414611188990994,
+	322567210813825, 9685976691646720, 5133139592616192, 6282747165545024,
+	3694429007446080, 2913585562910720, 8810884893770789, 7688497209280773,
+	2627335226276033, 31887993126916, 4310983363264512, 4055651719062554,
+	8811554971713536, 3136125539451014, 624531230173184, 4914343476986137,
+	5128330537926658, 7130436069228548, 2939277027580623, 9378288757637648,
+	4879151572190738, 8594951120892418, 678656918097080, 371302078710033,
+	2931300688232466, 9610281382873089, 3725154539667648, 2054352273703448,
+	4320329078408200, 3695492393343104, 6260580690301200, 3462498883767680,
+	6880743776145429, 9609903426003200, 1761162086621190, 9632238352203859,
+	6810100145594400, 6546578131392519, 9157973024768257, 3747858255708259,
+	5463387416862848, 5411298590329440, 8585416607859712, 7712155496295481,
+	3193462954464336, 4337986007269378, 5754364031468659, 6844116285526080,
+	6276218764657281, 7416558150292608, 345384371135489, 5753332031553840,
+	8560625735631272, 6564290978906112, 1187962192889920, 7997117446180799,
+	1444299795333120, 1801171994280481, 7966337557136464, 2931298804957824,
+	4897260294899296, 5748873445069895, 6546045840394298, 9691309162589369,
+	9128360821270600, 8587117773194240, 581846542909698, 9949757787119616,
+	9706523546912512, 907681879949313, 7384414631766080, 9131796260193288,
+	4539956594737154, 345316042342400, 79914053339184, 6787958057379852,
+	1413920489232896, 4904305079361568, 7134991874002556, 2350344097774279,
+	8532502557786374, 2085756965292096, 969150781718528, 6510345787031552,
+	1509286106494943, 1783614019878912, 5110873640665096, 879969392041984,
+	7402682172047744, 7953463389588064, 5381117366501384, 2016101706383428,
+	4254427401700368, 7070031582069256, 9356569109332992, 7670605449527330,
+	1752141716783128, 5151831727669760, 2876538783531009, 4060257265387520,
+	1189259541250176, 3779922359422847, 3417796713914372, 9921997307922480,
+	6848376893345792, 1777880254120588, 8506990470107648, 8538137295998014,
+	1440222793564672, 8480327067634748, 5095343175780360, 9399535927627777,
+	3488063200248864, 5687553131544833, 6304187499627523, 3493595126564994,
+	7636935573251104, 391426144870008, 4332961382017073, 4012392841254915,
+	1500008738198528, 88381837017088, 1805329377526275, 2068817027268609,
+	7640162711371840, 5697325943292071, 4346202028316976, 2059866386546688,
+	6228046227308576, 9345848844517888, 112107258382344, 1469497424773120,
+	1469497290527943, 9897254223609856, 1469363093798938, 2310280373752320,
+	3463462233614896, 7670702069121024, 7670836337050626, 8234792369930848,
+	57612724979216, 9924019601802311, 3705002268819681, 7659406313392707,
+	63088573317120, 4620165326053376, 8789514213002812, 7359707526604832,
+	2904637128572928, 7646235809284488, 9049083809366016, 9048414297866336,
+	928958551955712, 7663515278478464, 7725031828488200, 3492540170898019,
+	8230978413658128, 3704670212065536, 8501855684428928, 4033803823711137,
+	9632891466155138, 3132993589741058, 3153674231218178, 9347345640606250,
+	9937317372428289, 9051731623150092, 353355700683589, 97032505922304,
+]
+
+const DEAD_SQUARES = [
+	67168127488, 68191127567, 40425097247, 46800459934, 67136850076, 68208189047,
+	9941273007, 2164529664, 32774428799, 66052296769, 26779256864, 65548849210,
+	25241714808, 8632360, 66588772465, 60675199071, 59618498656, 66589069377,
+	42415573045, 67671300173, 17725159952, 56405135436, 68208167035, 68191127679,
+	1099305087, 62906306590, 68191393886, 66043512891, 67185559585, 17072362556,
+	63913203759, 2499942509, 2005545056, 1099192575, 67654254719, 68225214655,
+	67398572095, 51019913343, 44585850970, 43528622202, 16391423294, 66035255354,
+	63980312703, 33848171109, 35995785343, 24981672313, 59618234465, 60163363430,
+	66043643965, 33831655547, 60742312240, 38210509935, 67662516333, 34921908349,
+	16395539009, 57466576488, 65794414701, 35995652222, 59064457279, 16378960999,
+	63913204343, 34906964095, 38478809199, 662913599, 68187195498, 1637226751,
+	48858023993, 2693142700, 68191668255, 50482774136, 34938951806, 32774690972,
+	16670726271, 16400125983, 43633777279, 24981279302, 67645997103, 68191393917,
+	67134429324, 68191389759, 68208171134, 59618240639, 68336163424, 68207908943,
+	17741913687, 67662778495, 59613910049, 42434080832, 45114200129, 34108152862,
+	35995916335, 67671300223, 32766171167, 60402313400, 33823265861, 43513025350,
+	52911477943, 34376652927, 1262885089, 5922756735, 1099126911, 33311168610,
+	42421588159, 53175786103, 64048470141, 67671169121, 6593446920, 14397015091,
+	51019940161, 65515296863, 13447336195, 67687809080, 43495082681, 16383349823,
+	68207908961, 67662778495, 67935141888, 68190996543, 2230327, 52226955361,
+	54232750207, 59618103327, 29671954551, 58612529211, 63980312687, 33831655543,
+	36063287423, 68224948317, 67125774375, 67408825407, 58276059262, 32774688895,
+	68203976801, 60704460928, 35174615099, 11811558479, 68191127679, 29536684339,
+	34905131135, 43486609921, 68208040001, 35375350275, 68191125559, 35995650174,
+	68191127583, 14252382334, 68199651452, 33822867517, 65524078687, 68208099333,
+	7675974734, 68208164988, 67662774337, 59601192992, 68191127612, 51028039806,
+	68208171071, 68191131992, 29587285199, 68208171135, 68191524959, 35987527807,
+	42421583924, 67662778433, 67662782728, 1090785407, 64460492869, 68191291519,
+	68062233871, 40290752639, 43562440829, 67671202079, 42421324072, 2101432,
+	8217040926, 66052296892, 64483362848, 51045619839, 43512041795, 10754790495,
+	66331220095, 42455145079, 18816047231, 9957677087, 59744059489, 11811164799,
+	67671562359, 58275791004, 33303173231, 64986943615, 48058534463, 29016595550,
+	37069658237, 64449941629, 68208103549, 5922787797, 1090785406, 35995916659,
+	68191131704, 67705645152,
+]
+
+const PUSHES = [
+	2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 3, 2, 2, 3, 3, 3, 4, 4, 2, 2,
+	2, 2, 2, 2, 2, 2, 2, 2, 3, 3, 3, 3, 3, 3, 4, 2, 2, 2, 2, 2,
+	2, 2, 2, 2, 2, 2, 2, 2, 3, 3, 3, 3, 3, 4, 4, 4, 5, 5, 2, 2,
+	2, 2, 2, 2, 4, 5, 5, 5, 2, 2, 2, 2, 2, 2, 2, 2, 3, 3, 3, 3,
+	3, 3, 3, 3, 3, 3, 4, 4, 4, 4, 4, 5, 6, 2, 2, 2, 2, 2, 2, 3,
+	3, 3, 3, 3, 3, 3, 3, 4, 4, 4, 4, 4, 4, 4, 5, 5, 5, 5, 6, 2,
+	2, 2, 2, 3, 3, 3, 3, 3, 3, 3, 3, 3, 4, 4, 4, 4, 4, 4, 5, 5,
+	5, 6, 2, 3, 3, 4, 4, 4, 4, 4, 4, 4, 5, 5, 5, 5, 7, 2, 3, 3,
+	4, 5, 5, 5, 5, 5, 5, 2, 2, 3, 3, 3, 3, 4, 4, 4, 4, 4, 4, 4,
+	4, 4, 5, 5, 7, 3, 3, 4, 4, 4, 4, 4, 5, 5, 5, 5, 6, 6, 7, 7,
+]
+
+const MOVES = [
+	2, 3, 3, 3, 3, 3, 3, 4, 4, 4, 4, 5, 5, 5, 5, 5, 5, 5, 6, 6,
+	6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 7, 7, 7, 7, 7,
+	7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 8, 8,
+	8, 8, 8, 8, 8, 8, 8, 8, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9,
+	9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 10, 10, 10, 10, 10, 10, 10,
+	10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 11,
+	11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11,
+	11, 11, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 13, 13, 13,
+	13, 13, 13, 13, 13, 13, 13, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14,
+	14, 14, 14, 14, 14, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15,
+]
+
+const SOLUTIONS = [
+	"UU",
+	"LDD",
+	"DDD",
+	"LDD",
+	"LDD",
+	"DLL",
+	"DLL",
+	"RRRR",
+	"RULL",
+	"LURR",
+	"ULLL",
+	"LDLDR",
+	"ULDLU",
+	"LLDLU",
+	"DDLDR",
+	"LLULD",
+	"RUUUU",
+	"URRRR",
+	"UUULLL",
+	"LULDLU",
+	"URRDLL",
+	"RDRDRU",
+	"UULLDD",
+	"DDDLLL",
+	"DRDDRR",
+	"URRRDD",
+	"UURURD",
+	"LLLULD",
+	"RURUUU",
+	"DDRUUU",
+	"LDDRDL",
+	"RDRDLL",
+	"UURULL",
+	"LDLDRR",
+	"DRDLLL",
+	"LULLURR",
+	"RRDLULD",
+	"URRRRUU",
+	"ULLLLDD",
+	"DLLDLDR",
+	"DRRRUUU",
+	"ULLLDLU",
+	"DDRULUR",
+	"DDDDLUU",
+	"UUULLDD",
+	"DDLLURR",
+	"DDDRRUU",
+	"RRRDRUU",
+	"DDLLULD",
+	"DLLLULD",
+	"DRDRUUU",
+	"URRURDD",
+	"RRULURR",
+	"DDDLLLL",
+	"DDRUUUU",
+	"ULDLUUU",
+	"UUULURR",
+	"RURDDDD",
+	"RRRRDDLL",
+	"RRDDDLUU",
+	"URRDLDLU",
+	"UULLDRDL",
+	"UUURRURD",
+	"DLLLLDLU",
+	"RRRULLLL",
+	"RDDDDLDR",
+	"UURULLLL",
+	"RDDDLDRR",
+	"UUULLLLDD",
+	"UUUURDLDR",
+	"RRRRRDDLL",
+	"DDDLLURUL",
+	"DRDDLURUL",
+	"UURURDRDL",
+	"RRDDDRDLL",
+	"ULLDLLURR",
+	"RRDDRDRUU",
+	"LDDLUULUR",
+	"RDRRURULL",
+	"DLLLDRDLL",
+	"LDDLLDRRR",
+	"DRRULLULD",
+	"LUULUURUL",
+	"RDDDLLDLU",
+	"ULLLDRDLL",
+	"LLLULURRR",
+	"DDRUULURR",
+	"DLDLLURRR",
+	"UUURRRDRU",
+	"LLLUUURUL",
+	"ULLDLDRRR",
+	"UULURRDRU",
+	"LUULURRRR",
+	"DDRDDLURUL",
+	"UUURRRDLDR",
+	"UULLLDRURD",
+	"LULRUULLDD",
+	"UURRRDDLLL",
+	"URRRURRULL",
+	"UURRDDDLDR",
+	"RDDDDLDRRR",
+	"RURULURDRU",
+	"RRRDDLULDD",
+	"URRDDLLULD",
+	"UULLLDLDRR",
+	"LUUURULDLU",
+	"LDDDLLLUUU",
+	"URUULULDDD",
+	"UUUULURRRR",
+	"RDDDRRDRUU",
+	"URRRDRDLLL",
+	"RRURULLDLU",
+	"DDDLLLULDD",
+	"DDDLUUURUL",
+	"DDLUUUURUL",
+	"UURRRRURDD",
+	"DDLDDRUUUU",
+	"ULLUURULLL",
+	"RDLLLLULDD",
+	"DLDDLLUULUR",
+	"DLLLLLDRURD",
+	"RUULUURRDDD",
+	"URUUULLULDD",
+	"URUUURRDLLL",
+	"LLLULURRURD",
+	"UUULLUULDDD",
+	"UURUULLDDDD",
+	"RRRRRDLULDD",
+	"UUURRDLLDLU",
+	"ULUURRDLULD",
+	"DLLDDRULURR",
+	"RRDDDRUURUL",
+	"UUUDLLUURRR",
+	"DLLURULLDLU",
+	"RDRRULLLULD",
+	"RRRDRDDDLDR",
+	"RDDLULDRDLL",
+	"DDLURULLDLU",
+	"LLLULDDDRDL",
+	"ULDRDLLLULD",
+	"UUURULURRRR",
+	"RRULLULDDDD",
+	"UUULULLULLDD",
+	"RDDDLLURRURD",
+	"DDDDRURULDLU",
+	"RRDRRUULDRDL",
+	"ULLDRDRULURR",
+	"DLLDLURULDLU",
+	"UULUULDDDLDR",
+	"RDDDLDDRUUUU",
+	"DDDRULURRDRU",
+	"UURRDRDLLDLU",
+	"LDDLDRRDRUUU",
+	"RRRDDLLDLUUU",
+	"RUURULDLURUL",
+	"RRRRULLLDLUU",
+	"LLLULDDDLDRR",
+	"ULUURDURRDDLL",
+	"RRDDDRURULDLU",
+	"DLLULRDDLLUUU",
+	"URRDLDRURDLDR",
+	"RDDDLDRURDLDR",
+	"UUDRRUULLDLUU",
+	"LDDRULURRRDRU",
+	"RDDLLURRRDRUU",
+	"UUURRRRURDDDD",
+	"RDDRULURRRDRU",
+	"UDRRURUULLLLDR",
+	"LULUUURRDDLDLU",
+	"RRRDLDDRRULULD",
+	"URRDDLRUULLDDD",
+	"UURUURRRDDDLDR",
+	"DDRULUURRDLDLU",
+	"ULLURLUURRDDDD",
+	"UURRRULLULDRDL",
+	"ULUULLULDDLDRR",
+	"LLUDRRUULLLDLU",
+	"LURDRUURUULLDR",
+	"ULLUUURRDDDRDL",
+	"URUUURDRDLULDD",
+	"DLLUULURDRULUR",
+	"UUUUULDRDLULDD",
+	"UUURUULDDDDRDL",
+	"UULULDDDRDLULD",
+	"LDLDDRUUUULURR",
+	"RUUULUURRDDDLDR",
+	"RRRRULUURRDLULD",
+	"RDRDDLDLURULDLU",
+	"UUUURDLDRURDLDR",
+	"ULUURDLDDRRULLL",
+	"URRDDLRUULLDDDD",
+	"DDLLLULLDDRULUR",
+	"DLLLLURURDDDLDR",
+	"UUULLLDLDRRRDRU",
+	"DLLLLDRRDRULURR",
+	"LLLUURDDLDRRURD",
+	"ULURURDLDRRRURD",
+	"DRRRUULDDDDRDLL",
+	"RUULDRDLLLDLUUU",
+	"DDLDDRUUURULLLL",
+]
@@ -1,11 +1,11 @@
 extends "res://shared/scripts/microgame.gd"
 
-# Assets
-const TEX_PLAYER = preload("res://games/box_pusher/assets/player.png")
-const TEX_BOX = preload("res://games/box_pusher/assets/box.png")
-const TEX_TARGET = preload("res://games/box_pusher/assets/target.png")
-const TEX_WALL = preload("res://games/box_pusher/assets/wall.png")
-const TEX_FLOOR = preload("res://games/box_pusher/assets/floor.png")
+# Assets (1x/2x/3x variant picked for the display density)
+var tex_player: Texture2D = AssetDensity.load_texture("res://games/box_pusher/assets/player.png")
+var tex_box: Texture2D = AssetDensity.load_texture("res://games/box_pusher/assets/box.png")
+var tex_target: Texture2D = AssetDensity.load_texture("res://games/box_pusher/assets/target.png")
+var tex_wall: Texture2D = AssetDensity.load_texture("res://games/box_pusher/assets/wall.png")
+var tex_floor: Texture2D = AssetDensity.load_texture("res://games/box_pusher/assets/floor.png")
 
 const SFX_MOVE = preload("res://games/box_pusher/assets/sfx_move.wav")
 const SFX_PUSH = preload("res://games/box_pusher/assets/sfx_push.wav")
@@ -17,88 +17,10 @@ const TILE_SIZE = 64
 const GRID_W = 8 # Increased grid size
 const GRID_H = 8 # Increased grid size
 
-const PREMADE_LEVELS = [
-	[
-		"########",
-		"#    ###",
-		"# P B T#",
-		"#      #",
-		"#      #",
-		"#  ##  #",
-		"#      #",
-		"########"
-	],
-	[
-		"########",
-		"#   T###",
-		"#   B ##",
-		"#   P  #",
-		"#      #",
-		"##     #",
-		"###    #",
-		"########"
-	],
-	[
-		"########",
-		"#      #",
-		"#  P   #",
-		"# #B#  #",
-		"#  T   #",
-		"#      #",
-		"#      #",
-		"########"
-	],
-	[
-		"########",
-		"#      #",
-		"# T B P#",
-		"#  #   #",
-		"#  ##  #",
-		"#   #  #",
-		"#      #",
-		"########"
-	],
-	[
-		"########",
-		"#T   ###",
-		"##B    #",
-		"#  P####",
-		"#     ##",
-		"#      #",
-		"#      #",
-		"########"
-	],
-	[
-		"########",
-		"#     T#",
-		"#  ##B #",
-		"#   P  #",
-		"#  #####",
-		"#   ####",
-		"#     ##",
-		"########"
-	],
-	[
-		"########",
-		"####   #",
-		"#  P   #",
-		"# B    #",
-		"#T ##  #",
-		"#  ##  #",
-		"#####  #",
-		"########"
-	],
-	[
-		"########",
-		"###    #",
-		"#   P  #",
-		"#    B##",
-		"#     T#",
-		"#    ###",
-		"#      #",
-		"########"
-	]
-]
+# Verified levels from generate_levels.py (layout, dead squares, solution)
+const LevelBank = preload("res://games/box_pusher/level_bank.gd")
+# Levels to choose from when none fits the beat at the current speed
+const MIN_LEVEL_CHOICES = 8
 
 enum TileType { FLOOR, WALL, TARGET }
 
@@ -106,6 +28,9 @@ var grid = [] # 2D array [y][x] storing TileType
 var player_pos: Vector2i
 var box_pos: Vector2i
 var target_pos: Vector2i
+var dead_squares: int = 0 # Interior cells the box can't leave toward the target (bitmask)
+var level_index: int = -1
+var solution: String = "" # Push-optimal moves (U/R/D/L), used by the test harness
 var game_active = true
 
 # Nodes
@@ -140,31 +65,47 @@ func _ready():
 func _load_random_level():
 	var rng = RandomNumberGenerator.new()
 	rng.randomize()
-	var layout_idx = rng.randi() % PREMADE_LEVELS.size()
-	var layout = PREMADE_LEVELS[layout_idx]
+	level_index = rng.randi() % _playable_level_count()
+	var packed: int = LevelBank.LEVELS[level_index]
+	dead_squares = LevelBank.DEAD_SQUARES[level_index]
+	solution = LevelBank.SOLUTIONS[level_index]
+	
+	# Interior bits 0-35 are walls, then player, box and target cells
+	player_pos = _inner_to_grid((packed >> 36) & 63)
+	box_pos = _inner_to_grid((packed >> 42) & 63)
+	target_pos = _inner_to_grid((packed >> 48) & 63)
 	
 	grid = []
 	
 	for y in range(GRID_H):
 		var row_data = []
-		var line = layout[y]
 		for x in range(GRID_W):
-			var line_char = line[x]
 			var type = TileType.FLOOR
 			
-			if line_char == '#':
+			if x == 0 or y == 0 or x == GRID_W - 1 or y == GRID_H - 1:
+				type = TileType.WALL
+			elif (packed >> _grid_to_inner(Vector2i(x, y))) & 1:
 				type = TileType.WALL
-			elif line_char == 'T':
+			elif Vector2i(x, y) == target_pos:
 				type = TileType.TARGET
-				target_pos = Vector2i(x, y)
-			elif line_char == 'B':
-				box_pos = Vector2i(x, y)
-			elif line_char == 'P':
-				player_pos = Vector2i(x, y)
 			
 			row_data.append(type)
 		grid.append(row_data)
 
+## Levels are sorted by solution length, so the ones a player can finish in
+## the beat at this speed (BEAT_SECONDS / speed_multiplier of real time) are a prefix
+func _playable_level_count() -> int:
+	var seconds = LevelBank.BEAT_SECONDS / speed_multiplier
+	var max_moves = int((seconds - LevelBank.READ_TIME) * LevelBank.MOVES_PER_SECOND)
+	var count = LevelBank.MOVES.bsearch(max_moves, false)
+	return clampi(count, MIN_LEVEL_CHOICES, LevelBank.LEVELS.size())
+
+func _inner_to_grid(index: int) -> Vector2i:
+	return Vector2i(index % LevelBank.INNER_SIZE + 1, index / LevelBank.INNER_SIZE + 1)
+
+func _grid_to_inner(pos: Vector2i) -> int:
+	return (pos.y - 1) * LevelBank.INNER_SIZE + (pos.x - 1)
+
 func _render_level():
 	# Clear previous children if any
 	for child in level_root.get_children():
@@ -190,6 +131,9 @@ func _render_level():
 	var scaled_size = Vector2(grid_px_w, grid_px_h) * final_scale
 	level_root.position = (viewport_size - scaled_size) / 2.0
 	
+	# Tile textures may be any density variant; scale them back to TILE_SIZE
+	var tile_scale = Vector2.ONE * (TILE_SIZE / float(tex_floor.get_width()))
+	
 	for y in range(GRID_H):
 		for x in range(GRID_W):
 			var pos = Vector2(x * TILE_SIZE + TILE_SIZE/2.0, y * TILE_SIZE + TILE_SIZE/2.0)
@@ -197,41 +141,44 @@ func _render_level():
 			
 			# Floor background for everything
 			var floor_spr = Sprite2D.new()
-			floor_spr.texture = TEX_FLOOR
+			floor_spr.texture = tex_floor
+			floor_spr.scale = tile_scale
 			floor_spr.centered = true
 			floor_spr.position = pos
 			level_root.add_child(floor_spr)
 			
 			if type == TileType.WALL:
 				var wall = Sprite2D.new()
-				wall.texture = TEX_WALL
+				wall.texture = tex_wall
+				wall.scale = tile_scale
 				wall.centered = true
 				wall.position = pos
 				level_root.add_child(wall)
 			elif type == TileType.TARGET:
 				var target = Sprite2D.new()
-				target.texture = TEX_TARGET
+				target.texture = tex_target
+				target.scale = tile_scale
 				target.centered = true
 				target.position = pos
 				level_root.add_child(target)
 
 	# Create dynamic sprites
 	box_sprite = Sprite2D.new()
-	box_sprite.texture = TEX_BOX
+	box_sprite.texture = tex_box
 	box_sprite.centered = true
 	box_sprite.z_index = 1
 	# Force scale to fit tile
-	var box_scale = (TILE_SIZE / float(TEX_BOX.get_width())) * 0.9
+	var box_scale = (TILE_SIZE / float(tex_box.get_width())) * 0.9
 	box_sprite.scale = Vector2(box_scale, box_scale)
 	level_root.add_child(box_sprite)
 	_update_sprite_pos(box_sprite, box_pos)
 	
 	player_sprite = Sprite2D.new()
-	player_sprite.texture = TEX_PLAYER
+	player_sprite.texture = tex_player
 	player_sprite.centered = true
 	player_sprite.z_index = 2
 	# Force scale to fit tile
-	var player_scale = (TILE_SIZE / float(TEX_PLAYER.get_width())) * 0.9
+	var player_scale = (TILE_SIZE / float(tex_player.get_width())) * 0.9
 	player_sprite.scale = Vector2(player_scale, player_scale)
 	level_root.add_child(player_sprite)
 	_update_sprite_pos(player_sprite, player_pos)
@@ -309,13 +256,9 @@ func _try_move(dir: Vector2i):
 		sfx_move.play()
 
 func _check_stuck():
-	# Simple Deadlock Detection: Corner
-	# If box is blocked horizontally AND vertically, and not on target -> Stuck
-	
-	var blocked_h = _is_wall(box_pos + Vector2i.LEFT) or _is_wall(box_pos + Vector2i.RIGHT)
-	var blocked_v = _is_wall(box_pos + Vector2i.UP) or _is_wall(box_pos + Vector2i.DOWN)
-	
-	if blocked_h and blocked_v:
+	# Deadlock Detection: the bank lists every square the box can never be
+	# pushed to the target from (corners, dead wall runs), so this is a lookup
+	if (dead_squares >> _grid_to_inner(box_pos)) & 1:
 		print("Box Stuck! Game Over.")
 		_fail()
 
@@ -1,188 +1,170 @@
 #!/usr/bin/env python3
 """
-Generate pipe sprites for Loop Connect microgame.
-Creates 5 pipe types: straight, L-bend, T-junction, cross, and terminal.
+Generate the pipe sprite atlas for Loop Connect microgame.
+
+Pipes are described as round-capped line segments (capsules) and discs on a
+32x32 design grid and rasterized with anti-aliasing from their signed
+distance field in NumPy. Every pipe type is emitted in all four clockwise
+rotations into a single atlas, so the game swaps atlas regions instead of
+rotating sprite nodes.
+
+Atlas layout (one cell per tile):
+    rows    = pipe types in PipeType order: straight, L-bend, T-junction, cross, terminal
+    columns = rotation 0..3 (90 degrees clockwise each)
+
+Usage:
+    python3 games/loop_connect/generate_assets.py [--out-dir DIR] [--scales 1,2,3]
+
+Writes pipe_atlas.png (1x, 32px cells), pipe_atlas@2x.png (64px cells) and
+pipe_atlas@3x.png (96px cells). The SDF is evaluated at each density, so every
+variant is anti-aliased at its own resolution rather than upscaled.
 """
 
-from PIL import Image, ImageDraw
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
 
-# Configuration
-SIZE = 32  # Canvas size (32x32px)
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "shared" / "asset_generators"))
+
+from png_encoder import write_png
+from sprite_compiler import DENSITIES, variant_filename
+
+# Configuration (design units; 1 unit = 1 pixel at 1x)
+SIZE = 32  # Canvas size (32x32px at 1x)
 LINE_WIDTH = 8  # Pipe line width
-COLOR_BLACK = (0, 0, 0, 255)  # Pure black, fully opaque
-COLOR_TRANSPARENT = (0, 0, 0, 0)  # Transparent
+COLOR_BLACK = (0, 0, 0)  # Pure black
 
 JUNCTION_CIRCLE_RADIUS = 3  # 6px diameter = 3px radius
 TERMINAL_CIRCLE_RADIUS = 8  # 16px diameter = 8px radius
 
 CENTER = SIZE // 2  # 16px (center of 32x32 canvas)
 
+DEFAULT_OUT_DIR = Path(__file__).resolve().parent / "assets"
 
-def create_canvas():
-    """Create a transparent canvas."""
-    return Image.new('RGBA', (SIZE, SIZE), COLOR_TRANSPARENT)
 
+def capsule(a, b, radius=LINE_WIDTH / 2):
+    """Round-capped segment from a to b."""
+    return ("capsule", a, b, radius)
 
-def save_sprite(image, filename):
-    """Save sprite to assets folder."""
-    filepath = f"/Users/tbarrass/Documents/GitHub/ai-microgames/games/loop_connect/assets/{filename}"
-    image.save(filepath, 'PNG')
-    print(f"✓ Created {filename}")
 
+def disc(center, radius):
+    return ("disc", center, center, radius)
 
-# 1. STRAIGHT PIPE
-# Horizontal black line, centered, rounded caps
+
+# 1. STRAIGHT PIPE - horizontal line, connections WEST and EAST
 def create_pipe_straight():
-    img = create_canvas()
-    draw = ImageDraw.Draw(img)
-    
-    # Horizontal line from left edge to right edge
-    # y-coordinate = CENTER (16), x from 0 to SIZE (32)
-    draw.line(
-        [(0, CENTER), (SIZE, CENTER)],
-        fill=COLOR_BLACK,
-        width=LINE_WIDTH,
-        joint='curve'
-    )
-    
-    return img
-
-
-# 2. L-BEND PIPE
-# L-shaped connecting bottom-left to top-right
-# This means: connections at SOUTH and EAST
+    return [capsule((0, CENTER), (SIZE, CENTER))]
+
+
+# 2. L-BEND PIPE - connections SOUTH and EAST, rounded join at the bend
 def create_pipe_l_bend():
-    img = create_canvas()
-    draw = ImageDraw.Draw(img)
-    
-    # Vertical line from center to bottom edge (SOUTH connection)
-    draw.line(
-        [(CENTER, CENTER), (CENTER, SIZE)],
-        fill=COLOR_BLACK,
-        width=LINE_WIDTH,
-        joint='curve'
-    )
-    
-    # Horizontal line from center to right edge (EAST connection)
-    draw.line(
-        [(CENTER, CENTER), (SIZE, CENTER)],
-        fill=COLOR_BLACK,
-        width=LINE_WIDTH,
-        joint='curve'
-    )
-    
-    # Add a small circle at the bend for smooth rounded join
-    draw.ellipse(
-        [CENTER - LINE_WIDTH//2, CENTER - LINE_WIDTH//2, 
-         CENTER + LINE_WIDTH//2, CENTER + LINE_WIDTH//2],
-        fill=COLOR_BLACK
-    )
-    
-    return img
-
-
-# 3. T-JUNCTION PIPE
-# T-shaped with 3 directions: LEFT, TOP, RIGHT (missing SOUTH)
+    return [
+        capsule((CENTER, CENTER), (CENTER, SIZE)),
+        capsule((CENTER, CENTER), (SIZE, CENTER)),
+    ]
+
+
+# 3. T-JUNCTION PIPE - connections WEST, NORTH and EAST (missing SOUTH)
 def create_pipe_t_junction():
-    img = create_canvas()
-    draw = ImageDraw.Draw(img)
-    
-    # Horizontal line (LEFT to RIGHT)
-    draw.line(
-        [(0, CENTER), (SIZE, CENTER)],
-        fill=COLOR_BLACK,
-        width=LINE_WIDTH,
-        joint='curve'
-    )
-    
-    # Vertical line from center to top edge (NORTH connection)
-    draw.line(
-        [(CENTER, 0), (CENTER, CENTER)],
-        fill=COLOR_BLACK,
-        width=LINE_WIDTH,
-        joint='curve'
-    )
-    
-    # Filled circle at junction point
-    draw.ellipse(
-        [CENTER - JUNCTION_CIRCLE_RADIUS, CENTER - JUNCTION_CIRCLE_RADIUS,
-         CENTER + JUNCTION_CIRCLE_RADIUS, CENTER + JUNCTION_CIRCLE_RADIUS],
-        fill=COLOR_BLACK
-    )
-    
-    return img
-
-
-# 4. CROSS PIPE
-# 4-way cross/plus sign with filled circle at center
+    return [
+        capsule((0, CENTER), (SIZE, CENTER)),
+        capsule((CENTER, 0), (CENTER, CENTER)),
+        disc((CENTER, CENTER), JUNCTION_CIRCLE_RADIUS),
+    ]
+
+
+# 4. CROSS PIPE - all four connections
 def create_pipe_cross():
-    img = create_canvas()
-    draw = ImageDraw.Draw(img)
-    
-    # Horizontal line (full width)
-    draw.line(
-        [(0, CENTER), (SIZE, CENTER)],
-        fill=COLOR_BLACK,
-        width=LINE_WIDTH,
-        joint='curve'
-    )
-    
-    # Vertical line (full height)
-    draw.line(
-        [(CENTER, 0), (CENTER, SIZE)],
-        fill=COLOR_BLACK,
-        width=LINE_WIDTH,
-        joint='curve'
-    )
-    
-    # Filled circle at center intersection
-    draw.ellipse(
-        [CENTER - JUNCTION_CIRCLE_RADIUS, CENTER - JUNCTION_CIRCLE_RADIUS,
-         CENTER + JUNCTION_CIRCLE_RADIUS, CENTER + JUNCTION_CIRCLE_RADIUS],
-        fill=COLOR_BLACK
-    )
-    
-    return img
-
-
-# 5. TERMINAL PIPE
-# Filled circle (16px diameter) with single pipe stub extending to top edge
+    return [
+        capsule((0, CENTER), (SIZE, CENTER)),
+        capsule((CENTER, 0), (CENTER, SIZE)),
+        disc((CENTER, CENTER), JUNCTION_CIRCLE_RADIUS),
+    ]
+
+
+# 5. TERMINAL PIPE - single NORTH stub ending in a large circle
 def create_pipe_terminal():
-    img = create_canvas()
-    draw = ImageDraw.Draw(img)
-    
-    # Pipe stub from center to top edge (NORTH connection)
-    draw.line(
-        [(CENTER, 0), (CENTER, CENTER)],
-        fill=COLOR_BLACK,
-        width=LINE_WIDTH,
-        joint='curve'
-    )
-    
-    # Large filled circle at center (16px diameter = 8px radius)
-    draw.ellipse(
-        [CENTER - TERMINAL_CIRCLE_RADIUS, CENTER - TERMINAL_CIRCLE_RADIUS,
-         CENTER + TERMINAL_CIRCLE_RADIUS, CENTER + TERMINAL_CIRCLE_RADIUS],
-        fill=COLOR_BLACK
-    )
-    
-    return img
-
-
-# Generate all sprites
+    return [
+        capsule((CENTER, 0), (CENTER, CENTER)),
+        disc((CENTER, CENTER), TERMINAL_CIRCLE_RADIUS),
+    ]
+
+
+# Atlas row order must match PipeType in main.gd (BLANK has no row)
+PIPE_SHAPES = [
+    ("straight", create_pipe_straight),
+    ("l_bend", create_pipe_l_bend),
+    ("t_junction", create_pipe_t_junction),
+    ("cross", create_pipe_cross),
+    ("terminal", create_pipe_terminal),
+]
+
+
+def signed_distance(shapes, scale: int) -> np.ndarray:
+    """Signed distance (in output pixels) to the union of shapes at each pixel center."""
+    size = SIZE * scale
+    coords = (np.arange(size, dtype=np.float64) + 0.5) / scale
+    px, py = np.meshgrid(coords, coords)
+    dist = np.full((size, size), np.inf)
+    for _, a, b, radius in shapes:
+        ax, ay = a
+        bx, by = b
+        dx, dy = bx - ax, by - ay
+        length_sq = dx * dx + dy * dy
+        if length_sq == 0:
+            t = 0.0
+        else:
+            t = np.clip(((px - ax) * dx + (py - ay) * dy) / length_sq, 0.0, 1.0)
+        d = np.hypot(px - (ax + t * dx), py - (ay + t * dy)) - radius
+        dist = np.minimum(dist, d)
+    return dist * scale
+
+
+def rasterize(shapes, scale: int) -> np.ndarray:
+    """Anti-aliased RGBA tile: alpha is pixel coverage estimated from the SDF."""
+    coverage = np.clip(0.5 - signed_distance(shapes, scale), 0.0, 1.0)
+    tile = np.zeros(coverage.shape + (4,), dtype=np.uint8)
+    tile[..., :3] = COLOR_BLACK
+    tile[..., 3] = np.round(coverage * 255).astype(np.uint8)
+    return tile
+
+
+def build_atlas(scale: int) -> np.ndarray:
+    """Render every pipe type in all four clockwise rotations."""
+    cell = SIZE * scale
+    atlas = np.zeros((cell * len(PIPE_SHAPES), cell * 4, 4), dtype=np.uint8)
+    for row, (_, create) in enumerate(PIPE_SHAPES):
+        tile = rasterize(create(), scale)
+        for rotation in range(4):
+            # np.rot90 with negative k rotates clockwise (screen space, y down)
+            atlas[row * cell:(row + 1) * cell, rotation * cell:(rotation + 1) * cell] = \
+                np.rot90(tile, k=-rotation)
+    return atlas
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the Loop Connect pipe atlas.")
+    parser.add_argument("--out-dir", default=str(DEFAULT_OUT_DIR),
+                        help="Output directory (default: this game's assets/)")
+    parser.add_argument("--scales", default=",".join(map(str, DENSITIES)),
+                        help="Comma-separated density variants to emit (default: 1,2,3)")
+    args = parser.parse_args()
+
+    out_dir = Path(args.out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    scales = [int(s) for s in args.scales.split(",") if s.strip()]
+
+    print("Generating Loop Connect pipe atlas...")
+    print(f"Cell: {SIZE}x{SIZE}px at 1x, line width {LINE_WIDTH}px")
+    for scale in scales:
+        atlas = build_atlas(scale)
+        path = out_dir / variant_filename("pipe_atlas.png", scale)
+        write_png(path, atlas)
+        print(f"✓ Created {path} ({atlas.shape[1]}x{atlas.shape[0]})")
+    return 0
+
+
 if __name__ == "__main__":
-    print("Generating Loop Connect pipe sprites...")
-    print(f"Size: {SIZE}x{SIZE}px")
-    print(f"Line width: {LINE_WIDTH}px")
-    print(f"Color: Black (#000000)")
-    print()
-    
-    save_sprite(create_pipe_straight(), "pipe_straight.png")
-    save_sprite(create_pipe_l_bend(), "pipe_l_bend.png")
-    save_sprite(create_pipe_t_junction(), "pipe_t_junction.png")
-    save_sprite(create_pipe_cross(), "pipe_cross.png")
-    save_sprite(create_pipe_terminal(), "pipe_terminal.png")
-    
-    print()
-    print("✓ All pipe sprites generated successfully!")
-    print("Location: games/loop_connect/assets/")
+    exit(main())
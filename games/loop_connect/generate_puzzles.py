@@ -0,0 +1,445 @@
+#!/usr/bin/env python3
+"""
+Generate Loop Connect's puzzle bank with a constraint-propagation solver.
+
+Each puzzle starts from a random tree of pipes grown over the 4x4 grid
+(every opening meets a neighbor's, so it satisfies the game's win check),
+then a few tiles are rotated away from the solution. A layout is kept only
+if that solution is the only rotation assignment that connects every
+opening, so the game can compare tiles against it instead of walking pipes.
+
+Solver: every cell's possible rotations are a 4-bit domain mask. For each
+pipe type and side there is a precomputed mask of rotations open on that
+side, so revising a neighbor is two ANDs: keep the rotations whose side
+matches what this cell can still offer. Arc consistency runs to a fixed
+point; undecided cells are branched on to count solutions (up to 2).
+
+Puzzles are graded by propagation steps (revisions that narrowed a
+domain, plus a penalty per guess) and must fit the 4-second beat: READ_TIME
++ taps * TAP_SECONDS, where taps are the clockwise rotations needed.
+
+Usage:
+    python3 games/loop_connect/generate_puzzles.py [--count N] [--seed S] [--jobs N]
+        [--min-taps N] [--max-taps N]
+    python3 games/loop_connect/generate_puzzles.py --check    # re-verify the committed bank
+"""
+
+import argparse
+import os
+import random
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+GAME_DIR = Path(__file__).resolve().parent
+BANK_PATH = GAME_DIR / "puzzle_bank.gd"
+GENERATOR = "games/loop_connect/generate_puzzles.py"
+
+GRID_SIZE = 4  # main.gd GRID_SIZE
+CELLS = GRID_SIZE * GRID_SIZE
+ALL = 0b1111
+
+# Directions and pipe types follow main.gd (Direction, PipeType, PIPE_CONNECTIONS)
+NORTH, EAST, SOUTH, WEST = range(4)
+STEP = {NORTH: (0, -1), EAST: (1, 0), SOUTH: (0, 1), WEST: (-1, 0)}
+BLANK, STRAIGHT, L_BEND, T_JUNCTION, CROSS, TERMINAL = range(6)
+BASE_OPENINGS = {
+    BLANK: 0,
+    STRAIGHT: 1 << EAST | 1 << WEST,
+    L_BEND: 1 << SOUTH | 1 << EAST,
+    T_JUNCTION: 1 << NORTH | 1 << EAST | 1 << WEST,
+    CROSS: ALL,
+    TERMINAL: 1 << NORTH,
+}
+
+
+def rotate_mask(mask: int, turns: int) -> int:
+    """Openings after turns clockwise quarter turns (N -> E -> S -> W)."""
+    turns %= 4
+    return (mask << turns | mask >> (4 - turns)) & ALL
+
+
+# OPENINGS[type][rotation] -> side mask; OPEN_ROTATIONS[type][side] -> rotation mask
+OPENINGS = {t: [rotate_mask(base, r) for r in range(4)] for t, base in BASE_OPENINGS.items()}
+OPEN_ROTATIONS = {t: [sum(1 << r for r in range(4) if OPENINGS[t][r] >> side & 1) for side in range(4)]
+                  for t in OPENINGS}
+# Rotations that look different (straight: 0-1, cross and blank: 0)
+DISTINCT = {t: sum(1 << r for r in range(4) if OPENINGS[t][r] not in OPENINGS[t][:r]) for t in OPENINGS}
+PERIOD = {t: bin(DISTINCT[t]).count("1") for t in OPENINGS}
+
+# Timing model (director.gd NORMAL_GAME_BEATS * BEAT_DURATION = 4 s)
+BEAT_BUDGET = 4.0
+READ_TIME = 1.0  # Seconds to spot the wrong tiles
+TAP_SECONDS = 0.35  # Per rotation, including moving to the tile
+
+DEFAULT_COUNT = 300
+DEFAULT_MIN_TAPS = 2
+DEFAULT_MAX_TAPS = 6
+DEFAULT_MIN_CELLS = 6
+GUESS_PENALTY = 10  # Grade steps charged per branching guess
+
+
+class PuzzleBankError(ValueError):
+    """Raised when puzzle_bank.gd is missing, unreadable or fails validation."""
+
+
+def neighbors(cell: int):
+    """(side, neighbor cell) inside the grid."""
+    x, y = cell % GRID_SIZE, cell // GRID_SIZE
+    for side, (dx, dy) in STEP.items():
+        nx, ny = x + dx, y + dy
+        if 0 <= nx < GRID_SIZE and 0 <= ny < GRID_SIZE:
+            yield side, ny * GRID_SIZE + nx
+
+
+def popcount(mask: int) -> int:
+    return bin(mask).count("1")
+
+
+# =============================================================================
+# Solver
+# =============================================================================
+
+def initial_domains(types: list[int]) -> list[int]:
+    """Distinct rotations per cell, minus those opening onto the grid border."""
+    domains = []
+    for cell, t in enumerate(types):
+        domain = DISTINCT[t]
+        inside = {side for side, _ in neighbors(cell)}
+        for side in range(4):
+            if side not in inside:
+                domain &= ~OPEN_ROTATIONS[t][side]
+        domains.append(domain)
+    return domains
+
+
+def propagate(types: list[int], domains: list[int], queue: list[int]) -> tuple[bool, int]:
+    """Arc consistency from the queued cells. Returns (consistent, narrowing steps)."""
+    steps = 0
+    queued = set(queue)
+    while queue:
+        cell = queue.pop()
+        queued.discard(cell)
+        t, domain = types[cell], domains[cell]
+        for side, other in neighbors(cell):
+            opens = OPEN_ROTATIONS[t][side]
+            facing = OPEN_ROTATIONS[types[other]][(side + 2) % 4]
+            allowed = (facing if domain & opens else 0) | (ALL & ~facing if domain & ~opens & ALL else 0)
+            narrowed = domains[other] & allowed
+            if narrowed == domains[other]:
+                continue
+            if not narrowed:
+                return False, steps
+            domains[other] = narrowed
+            steps += 1
+            if other not in queued:
+                queued.add(other)
+                queue.append(other)
+    return True, steps
+
+
+def solve(types: list[int], limit: int = 2) -> tuple[list[list[int]], int, int]:
+    """Up to limit solutions (rotation per cell), propagation steps and guesses."""
+    solutions = []
+    stats = {"steps": 0, "guesses": 0}
+
+    def search(domains, queue):
+        ok, steps = propagate(types, domains, queue)
+        stats["steps"] += steps
+        if not ok:
+            return
+        open_cells = [c for c in range(CELLS) if popcount(domains[c]) > 1]
+        if not open_cells:
+            solutions.append([d.bit_length() - 1 for d in domains])
+            return
+        cell = min(open_cells, key=lambda c: popcount(domains[c]))
+        for r in range(4):
+            if domains[cell] >> r & 1 and len(solutions) < limit:
+                stats["guesses"] += 1
+                branch = domains[:]
+                branch[cell] = 1 << r
+                search(branch, [cell])
+
+    search(initial_domains(types), list(range(CELLS)))
+    return solutions, stats["steps"], stats["guesses"]
+
+
+def connected(types: list[int], rotations: list[int]) -> bool:
+    """The game's win check: every opening meets an opening (main.gd _check_win)."""
+    for cell in range(CELLS):
+        openings = OPENINGS[types[cell]][rotations[cell]]
+        inside = dict(neighbors(cell))
+        for side in range(4):
+            if not openings >> side & 1:
+                continue
+            other = inside.get(side)
+            if other is None or not OPENINGS[types[other]][rotations[other]] >> (side + 2) % 4 & 1:
+                return False
+    return True
+
+
+# =============================================================================
+# Candidates
+# =============================================================================
+
+def random_tree(rng: random.Random, size: int) -> list[int]:
+    """Opening masks of a random tree grown from a random cell over size cells."""
+    openings = [0] * CELLS
+    start = rng.randrange(CELLS)
+    in_tree = {start}
+    frontier = [(start, side, other) for side, other in neighbors(start)]
+    while len(in_tree) < size and frontier:
+        cell, side, other = frontier.pop(rng.randrange(len(frontier)))
+        if other in in_tree:
+            continue
+        in_tree.add(other)
+        openings[cell] |= 1 << side
+        openings[other] |= 1 << (side + 2) % 4
+        frontier += [(other, s, n) for s, n in neighbors(other) if n not in in_tree]
+    return openings
+
+
+def classify(openings: int) -> tuple[int, int]:
+    """(pipe type, rotation) showing exactly these openings."""
+    for t in OPENINGS:
+        for r in range(4):
+            if DISTINCT[t] >> r & 1 and OPENINGS[t][r] == openings:
+                return t, r
+    raise ValueError(f"no pipe has openings {openings:04b}")
+
+
+def taps_needed(t: int, start: int, solution: int) -> int:
+    return (solution - start) % PERIOD[t]
+
+
+def play_seconds(taps: int) -> float:
+    return READ_TIME + taps * TAP_SECONDS
+
+
+def canonical_key(openings: list[int]) -> tuple:
+    """Same layout under any of the 8 grid symmetries maps to one key."""
+    keys = []
+    for flip in (False, True):
+        for turns in range(4):
+            grid = [0] * CELLS
+            for cell, mask in enumerate(openings):
+                x, y = cell % GRID_SIZE, cell // GRID_SIZE
+                if flip:
+                    x = GRID_SIZE - 1 - x
+                    mask = mask & 0b0101 | (mask >> EAST & 1) << WEST | (mask >> WEST & 1) << EAST
+                for _ in range(turns):
+                    x, y = GRID_SIZE - 1 - y, x
+                    mask = rotate_mask(mask, 1)
+                grid[y * GRID_SIZE + x] = mask
+            keys.append(tuple(grid))
+    return min(keys)
+
+
+def evaluate(task: tuple[int, int, int, int]) -> dict | None:
+    """Generate, verify and scramble one candidate; the puzzle dict if it is worth keeping."""
+    seed, min_cells, min_taps, max_taps = task
+    rng = random.Random(seed)
+    openings = random_tree(rng, rng.randint(min_cells, CELLS))
+    types, solution = zip(*(classify(mask) for mask in openings))
+    types, solution = list(types), list(solution)
+
+    solutions, steps, guesses = solve(types)
+    if len(solutions) != 1:
+        return None
+    assert solutions[0] == solution and connected(types, solution)
+
+    # Scramble: rotate random tiles away from the solution within the tap budget
+    target = rng.randint(min_taps, max_taps)
+    start, taps = solution[:], 0
+    cells = [c for c in range(CELLS) if PERIOD[types[c]] > 1]
+    rng.shuffle(cells)
+    for cell in cells:
+        if taps >= target:
+            break
+        offset = rng.randint(1, min(PERIOD[types[cell]] - 1, target - taps))
+        start[cell] = (solution[cell] - offset) % 4
+        taps += offset
+    if taps < min_taps or play_seconds(taps) > BEAT_BUDGET:
+        return None
+
+    return {
+        "seed": seed, "types": types, "start": start, "solution": solution, "taps": taps,
+        "grade": steps + GUESS_PENALTY * guesses, "key": canonical_key(openings),
+    }
+
+
+def generate(count: int, seed: int, jobs: int, min_cells: int, min_taps: int, max_taps: int,
+             max_candidates: int) -> tuple[list[dict], int]:
+    """Unique puzzles in seed order; also returns how many candidates were tried."""
+    puzzles, seen = [], set()
+    batch = max(1, jobs) * 256
+    tried = 0
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        while len(puzzles) < count and tried < max_candidates:
+            tasks = [(seed + tried + i, min_cells, min_taps, max_taps) for i in range(batch)]
+            tried += batch
+            for puzzle in pool.map(evaluate, tasks, chunksize=32):
+                if puzzle and puzzle["key"] not in seen and len(puzzles) < count:
+                    seen.add(puzzle["key"])
+                    puzzles.append(puzzle)
+    return puzzles, tried
+
+
+# =============================================================================
+# Bank encoding (decoded by main.gd _load_puzzle)
+# =============================================================================
+
+def pack(values: list[int], bits: int) -> int:
+    return sum(value << (cell * bits) for cell, value in enumerate(values))
+
+
+def unpack(packed: int, bits: int) -> list[int]:
+    return [packed >> (cell * bits) & ((1 << bits) - 1) for cell in range(CELLS)]
+
+
+def render_bank(puzzles: list[dict], args_line: str) -> str:
+    def int_rows(values, per_row):
+        return "\n".join("\t" + " ".join(f"{v}," for v in values[i:i + per_row])
+                         for i in range(0, len(values), per_row))
+
+    return "\n".join([
+        "extends RefCounted",
+        "",
+        f"## Loop Connect puzzle bank: Generated by {GENERATOR}.",
+        "## Do not edit by hand; rerun the script (or --check it) instead.",
+        f"## {len(puzzles)} puzzles with a unique solution, solvable in {BEAT_BUDGET:g} s ({args_line})",
+        "## Cells are row * 4 + col. TYPES packs a PipeType per cell in 3 bits;",
+        "## START and SOLUTION pack a rotation per cell in 2 bits. GRADES are",
+        "## propagation steps to deduce the solution (higher is harder).",
+        "",
+        "const TYPES = [",
+        int_rows([pack(p["types"], 3) for p in puzzles], 6),
+        "]",
+        "",
+        "const START = [",
+        int_rows([pack(p["start"], 2) for p in puzzles], 6),
+        "]",
+        "",
+        "const SOLUTION = [",
+        int_rows([pack(p["solution"], 2) for p in puzzles], 6),
+        "]",
+        "",
+        "const GRADES = [",
+        int_rows([p["grade"] for p in puzzles], 20),
+        "]",
+        "",
+    ])
+
+
+def read_bank(path: Path) -> list[dict]:
+    try:
+        return parse_bank(path.read_text(encoding="utf-8"))
+    except OSError as e:
+        raise PuzzleBankError(f"{path}: {e}")
+    except PuzzleBankError as e:
+        raise PuzzleBankError(f"{path}: {e}")
+
+
+def parse_bank(text: str) -> list[dict]:
+    def array(name: str) -> list[int]:
+        match = re.search(rf"^const {name} = \[(.*?)^\]", text, re.S | re.M)
+        if not match:
+            raise PuzzleBankError(f"no {name} array")
+        return [int(item) for item in match.group(1).replace("\n", " ").split(",") if item.strip()]
+
+    types, start, solution, grades = array("TYPES"), array("START"), array("SOLUTION"), array("GRADES")
+    if not len(types) == len(start) == len(solution) == len(grades):
+        raise PuzzleBankError("arrays have different lengths")
+    return [{"types": unpack(t, 3), "start": unpack(s, 2), "solution": unpack(sol, 2), "grade": g}
+            for t, s, sol, g in zip(types, start, solution, grades)]
+
+
+def validate(puzzles: list[dict]) -> list[str]:
+    """Problems with a decoded bank: each puzzle is re-solved from scratch."""
+    problems, seen = [], set()
+    for i, puzzle in enumerate(puzzles):
+        types, start, solution = puzzle["types"], puzzle["start"], puzzle["solution"]
+        if any(t not in OPENINGS for t in types):
+            problems.append(f"puzzle {i}: unknown pipe type")
+            continue
+        solutions, steps, guesses = solve(types)
+        if solutions != [solution]:
+            problems.append(f"puzzle {i}: {len(solutions)} solutions (or not the stored one)")
+            continue
+        if steps + GUESS_PENALTY * guesses != puzzle["grade"]:
+            problems.append(f"puzzle {i}: grade {puzzle['grade']}, solver says {steps + GUESS_PENALTY * guesses}")
+        taps = sum(taps_needed(t, s, sol) for t, s, sol in zip(types, start, solution))
+        if taps == 0:
+            problems.append(f"puzzle {i}: starts solved")
+        if play_seconds(taps) > BEAT_BUDGET:
+            problems.append(f"puzzle {i}: {taps} taps do not fit {BEAT_BUDGET:g} s")
+        key = canonical_key([OPENINGS[t][r] for t, r in zip(types, solution)])
+        if key in seen:
+            problems.append(f"puzzle {i}: duplicate of an earlier layout")
+        seen.add(key)
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate Loop Connect's verified puzzle bank.")
+    parser.add_argument("--count", type=int, default=DEFAULT_COUNT, help=f"Puzzles to keep (default: {DEFAULT_COUNT})")
+    parser.add_argument("--seed", type=int, default=1, help="First candidate seed (default: 1)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Solver processes (default: CPU count)")
+    parser.add_argument("--min-cells", type=int, default=DEFAULT_MIN_CELLS,
+                        help=f"Smallest pipe network (default: {DEFAULT_MIN_CELLS}, max {CELLS})")
+    parser.add_argument("--min-taps", type=int, default=DEFAULT_MIN_TAPS,
+                        help=f"Fewest rotations to solve (default: {DEFAULT_MIN_TAPS})")
+    parser.add_argument("--max-taps", type=int, default=DEFAULT_MAX_TAPS,
+                        help=f"Most rotations to solve (default: {DEFAULT_MAX_TAPS})")
+    parser.add_argument("--max-candidates", type=int, default=200_000, help="Stop after this many candidates")
+    parser.add_argument("--output", default=str(BANK_PATH), help="Bank path (default: puzzle_bank.gd next to this script)")
+    parser.add_argument("--check", action="store_true", help="Verify the existing bank instead of generating")
+    args = parser.parse_args()
+
+    output = Path(args.output)
+    if args.check:
+        try:
+            puzzles = read_bank(output)
+        except PuzzleBankError as e:
+            print(f"Error: {e}")
+            return 1
+        problems = validate(puzzles)
+        for problem in problems:
+            print(f"Error: {problem}")
+        if problems:
+            return 1
+        print(f"{output}: {len(puzzles)} puzzles OK")
+        return 0
+
+    if not 2 <= args.min_cells <= CELLS or not 1 <= args.min_taps <= args.max_taps:
+        print("Error: Need 2 <= --min-cells <= 16 and 1 <= --min-taps <= --max-taps")
+        return 1
+
+    puzzles, tried = generate(args.count, args.seed, args.jobs, args.min_cells, args.min_taps,
+                              args.max_taps, args.max_candidates)
+    if len(puzzles) < args.count:
+        print(f"Warning: Only {len(puzzles)} of {args.count} puzzles after {tried} candidates")
+    if not puzzles:
+        print("Error: No puzzles generated")
+        return 1
+    puzzles.sort(key=lambda p: (p["grade"], p["taps"], p["seed"]))
+
+    # Round-trip the encoding and re-solve before writing anything
+    text = render_bank(puzzles, f"seed {args.seed}, {args.min_taps}-{args.max_taps} taps")
+    problems = validate(parse_bank(text))
+    if problems:
+        for problem in problems:
+            print(f"Error: {problem}")
+        return 1
+    output.write_text(text, encoding="utf-8")
+
+    grades = [p["grade"] for p in puzzles]
+    print(f"Tried {tried} candidates, kept {len(puzzles)} puzzles")
+    print(f"Grades: min {grades[0]}, median {grades[len(grades) // 2]}, max {grades[-1]}")
+    print(f"Taps: {min(p['taps'] for p in puzzles)}-{max(p['taps'] for p in puzzles)}")
+    print(f"Wrote {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
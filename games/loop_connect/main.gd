@@ -17,7 +17,8 @@ const GRID_OFFSET = Vector2(PADDING, PADDING)  # Start from padding edge
 enum PipeType { BLANK, STRAIGHT, L_BEND, T_JUNCTION, CROSS, TERMINAL }
 enum Direction { NORTH, EAST, SOUTH, WEST }
 
-# Pipe connection data: which sides have openings (matching sprite assets)
+# Pipe connection data: which sides have openings (matching sprite assets,
+# mirrored by BASE_OPENINGS in generate_puzzles.py)
 const PIPE_CONNECTIONS = {
 	PipeType.BLANK: [],  # No connections
 	PipeType.STRAIGHT: [Direction.EAST, Direction.WEST],  # Horizontal ═ by default (sprite is horizontal)
@@ -27,20 +28,17 @@ const PIPE_CONNECTIONS = {
 	PipeType.TERMINAL: [Direction.NORTH]  # Single opening pointing up
 }
 
-# Sprite paths
-const PIPE_SPRITES = {
-	PipeType.STRAIGHT: "res://games/loop_connect/assets/pipe_straight.png",
-	PipeType.L_BEND: "res://games/loop_connect/assets/pipe_l_bend.png",
-	PipeType.T_JUNCTION: "res://games/loop_connect/assets/pipe_t_junction.png",
-	PipeType.CROSS: "res://games/loop_connect/assets/pipe_cross.png",
-	PipeType.TERMINAL: "res://games/loop_connect/assets/pipe_terminal.png"
-}
+# Pipe atlas (generated by generate_assets.py)
+# Rows follow PipeType order starting at STRAIGHT, columns are rotations 0-3 (clockwise)
+const PIPE_ATLAS_PATH = "res://games/loop_connect/assets/pipe_atlas.png"
+const ATLAS_ROWS = 5
+const ATLAS_COLUMNS = 4
 
-# Puzzle definitions using text notation
-# Format: Each line is a row, each character pair is (type)(rotation)
-# Types: . = blank, - = straight, L = L-bend, T = T-junction, + = cross, O = terminal
-#
-# ROTATION REFERENCE (base connections rotate clockwise):
+# Puzzles come from puzzle_bank.gd (generated by generate_puzzles.py): random pipe
+# trees with exactly one solution, scrambled by a few rotations
+const PuzzleBank = preload("res://games/loop_connect/puzzle_bank.gd")
+
+# Rotation reference (base connections rotate clockwise):
 # ═══════════════════════════════════════════════════════
 # STRAIGHT (-): Base has E,W connections (horizontal ═)
 #   -0 = ═ (E,W)    -1 = ║ (N,S)    -2 = ═ (E,W)*   -3 = ║ (N,S)*
@@ -59,89 +57,6 @@ const PIPE_SPRITES = {
 #   O0 = ↑ (N)      O1 = → (E)      O2 = ↓ (S)      O3 = ← (W)
 # ═══════════════════════════════════════════════════════
 
-# L_BEND rotation: L0=╔(S,E) → L1=╗(S,W) → L2=╝(N,W) → L3=╚(N,E) → L0
-# STRAIGHT rotation: -0=═(E,W) → -1=║(N,S) → -0=═(E,W)...
-
-# PUZZLE 1: Single small loop - 1 rotation needed
-# Target: ╔╗    L0=╔ L1=╗
-#         ╚╝    L3=╚ L2=╝
-# Start:  ╔╗
-#         ╚╔    [1,1] is ╔ (L0), needs 1 rotation to become ╗ (L1)
-const PUZZLE_1 = [
-	"L0L1.0.0",  # ╔╗··
-	"L3L0.0.0",  # ╚╔·· ← [1,1] needs 1 rotation
-	".0.0.0.0",  # ····
-	".0.0.0.0"   # ····
-]
-
-# PUZZLE 2: Horizontal line loop - 1 rotation needed
-# Target: ╔══╗    L0 -0 -0 L1
-#         ╚══╝    L3 -0 -0 L2
-# Start:  ╔═╗╗    [0,3] is ╗ (L1), but should be... wait need different puzzle
-#         ╚══╝
-const PUZZLE_2 = [
-	"L0-1-0L1",  # ╔║═╗ ← [0,1] is ║, needs 1 rotation to become ═
-	"L3-0-0L2",  # ╚══╝
-	".0.0.0.0",  # ····
-	".0.0.0.0"   # ····
-]
-
-# PUZZLE 3: Simple square loop centered - 1 rotation needed
-# Target: ·╔╗·
-#         ·╚╝·
-# Start:  ·╔╗·
-#         ·╚╔·    [1,2] is ╔ (L0), needs 1 rotation to become ╗ (L1)
-const PUZZLE_3 = [
-	".0L0L1.0",  # ·╔╗·
-	".0-1-1.0",  # ·║║· ← [1,2] needs 1 rotation
-	".0L3L0.0",  # ·╚╔·
-	".0.0.0.0"   # ····
-]
-
-# PUZZLE 4: Two separate small loops - 2 rotations needed  
-# Target: ╔╗╔╗    L0 L1 L0 L1
-#         ╚╝╚╝    L3 L2 L3 L2
-# Start:  ╔╗╔╗    All correct except...
-#         ╚╝╝╝    [1,2] is ╝ (L2), needs 1 rotation to become ╚ (L3)
-#                 [1,3] is ╝ (L2), needs 0 rotations... wait need 2 wrong tiles
-# REDESIGN:
-# Start:  ╔╗╔╗
-#         ╝╝╝╝    [1,0] needs 1 rot to ╚, [1,2] needs 1 rot to ╚
-const PUZZLE_4 = [
-	"L0L1L0L1",  # ╔╗╔╗
-	"L2L2L2L2",  # ╝╝╝╝ ← [1,0] and [1,2] need 1 rotation each to become ╚
-	".0.0.0.0",  # ····
-	".0.0.0.0"   # ····
-]
-
-# PUZZLE 5: Vertical rectangle - 2 rotations needed
-# Target: ╔╗··    L0 L1
-#         ║║··    -1 -1
-#         ╚╝··    L3 L2
-# Start:  ╔╗··
-#         ══··    [1,0] and [1,1] are ═ (-0), need 1 rotation each to become ║ (-1)
-#         ╚╝··
-const PUZZLE_5 = [
-	"L0L1.0.0",  # ╔╗··
-	"-0-0.0.0",  # ══·· ← [1,0] and [1,1] need 1 rotation each
-	"L3L2.0.0",  # ╚╝··
-	".0.0.0.0"   # ····
-]
-
-# PUZZLE 6: Horizontal line loop - 1 rotation needed
-# Target: ╔╗
-#         ╚╝
-# Start:  ╔╗
-#         ╝╝      [1,0] is ╝ (L2), needs 1 rotation to become ╚ (L3)
-const PUZZLE_6 = [
-	".0.0.0.0",  # ╔╗··
-	".0L0L1.0",  # ╝╝·· ← [1,0] needs 1 rotation to become ╚
-	".0L3L0.0",  # ····
-	".0.0.0.0"   # ····
-]
-
-const PUZZLES = [PUZZLE_1, PUZZLE_2, PUZZLE_3, PUZZLE_4, PUZZLE_5, PUZZLE_6]
-
 # Game state
 var grid = []  # 2D array of tile data
 var selected_tile = Vector2(1, 1)  # For keyboard control
@@ -150,12 +65,16 @@ var time_elapsed = 0.0
 var game_ended = false
 const GAME_DURATION = 5.0
 var rotating_tiles = []  # Track tiles currently animating
+var pipe_atlas: Texture2D
+var pipe_textures = {}  # Cached AtlasTexture per (type, rotation)
+var mismatched_tiles = 0  # Tiles not showing their solution rotation; 0 = solved
 
 func _ready():
 	instruction = "CONNECT!"
 	super._ready()
 	
 	_initialize_sounds()
+	pipe_atlas = AssetDensity.load_texture(PIPE_ATLAS_PATH)  # 1x/2x/3x by display density
 	_setup_game()
 
 func _initialize_sounds():
@@ -174,36 +93,19 @@ func _initialize_sounds():
 	sfx_lose.stream = load("res://games/loop_connect/assets/sfx_lose.wav")
 	add_child(sfx_lose)
 
-func _parse_puzzle(puzzle_strings: Array) -> Array:
-	"""Parse puzzle from text notation to tile data array."""
-	var parsed_puzzle = []
-	
-	for row_str in puzzle_strings:
-		var row_data = []
-		# Parse pairs of characters (type, rotation)
-		for i in range(0, row_str.length(), 2):
-			var type_char = row_str[i]
-			var rotation_char = row_str[i + 1]
-			
-			# Convert type character to PipeType enum
-			var pipe_type = PipeType.BLANK
-			match type_char:
-				".": pipe_type = PipeType.BLANK
-				"-": pipe_type = PipeType.STRAIGHT
-				"L": pipe_type = PipeType.L_BEND
-				"T": pipe_type = PipeType.T_JUNCTION
-				"+": pipe_type = PipeType.CROSS
-				"O": pipe_type = PipeType.TERMINAL
-			
-			# Convert rotation character to int
-			var rotation_value = int(rotation_char)
-			
-			row_data.append(pipe_type)
-			row_data.append(rotation_value)
-		
-		parsed_puzzle.append(row_data)
+func _get_pipe_texture(pipe_type: PipeType, pipe_rotation: int) -> AtlasTexture:
+	"""Return the atlas region showing a pipe type at a rotation (cached)."""
+	var key = pipe_type * ATLAS_COLUMNS + pipe_rotation
+	if pipe_textures.has(key):
+		return pipe_textures[key]
 	
-	return parsed_puzzle
+	# Cell size comes from the texture so any atlas resolution works
+	var cell = pipe_atlas.get_height() / float(ATLAS_ROWS)
+	var texture = AtlasTexture.new()
+	texture.atlas = pipe_atlas
+	texture.region = Rect2(pipe_rotation * cell, (pipe_type - PipeType.STRAIGHT) * cell, cell, cell)
+	pipe_textures[key] = texture
+	return texture
 
 func _setup_game():
 	# Draw background
@@ -217,22 +119,26 @@ func _setup_game():
 	# Draw grid lines
 	_draw_grid_lines()
 	
-	# Load random puzzle and parse it
-	var puzzle_strings = PUZZLES[randi() % PUZZLES.size()]
-	var puzzle = _parse_puzzle(puzzle_strings)
+	# Pick a random puzzle; each cell is a few bits of three packed ints
+	var puzzle_index = randi() % PuzzleBank.TYPES.size()
+	var types: int = PuzzleBank.TYPES[puzzle_index]
+	var start: int = PuzzleBank.START[puzzle_index]
+	var solution: int = PuzzleBank.SOLUTION[puzzle_index]
 	
 	# Initialize grid with puzzle data
 	grid = []
+	mismatched_tiles = 0
 	for row in range(GRID_SIZE):
 		var grid_row = []
 		for col in range(GRID_SIZE):
-			var idx = col * 2
-			var pipe_type = puzzle[row][idx]
-			var pipe_rotation = puzzle[row][idx + 1]
+			var cell = row * GRID_SIZE + col
+			var pipe_type = (types >> (cell * 3)) & 7
+			var pipe_rotation = (start >> (cell * 2)) & 3
 			
 			var tile_data = {
 				"type": pipe_type,
 				"rotation": pipe_rotation,
+				"solution": (solution >> (cell * 2)) & 3,
 				"sprite": null,
 				"highlight": null,
 				"flash": null
@@ -241,13 +147,9 @@ func _setup_game():
 			# Create sprite (only for non-blank tiles)
 			if pipe_type != PipeType.BLANK:
 				var sprite = Sprite2D.new()
-				sprite.texture = load(PIPE_SPRITES[pipe_type])
+				# Each rotation is pre-rendered in the atlas, so the sprite itself never rotates
+				sprite.texture = _get_pipe_texture(pipe_type, pipe_rotation)
 				sprite.position = _get_tile_position(col, row)
-				# Normalize rotation for straight pipes (0,2 look the same; 1,3 look the same)
-				var visual_rotation = pipe_rotation
-				if pipe_type == PipeType.STRAIGHT:
-					visual_rotation = pipe_rotation % 2
-				sprite.rotation_degrees = visual_rotation * 90
 				# Scale sprite to fill tile size
 				var sprite_size = sprite.texture.get_size()
 				sprite.scale = Vector2(TILE_SIZE / sprite_size.x, TILE_SIZE / sprite_size.y)
@@ -263,6 +165,8 @@ func _setup_game():
 			add_child(highlight)
 			tile_data.highlight = highlight
 			
+			if not _is_tile_solved(tile_data):
+				mismatched_tiles += 1
 			grid_row.append(tile_data)
 		grid.append(grid_row)
 	
@@ -382,26 +286,21 @@ func _rotate_tile(col: int, row: int):
 	rotating_tiles.append(Vector2(col, row))
 	
 	# Update rotation
+	var was_solved = _is_tile_solved(tile)
 	tile.rotation = (tile.rotation + 1) % 4
+	mismatched_tiles += int(was_solved) - int(_is_tile_solved(tile))
 	
 	# Play sound
 	$sfx_rotate.play()
 	
-	# Calculate visual rotation
-	# For straight pipes, only 2 visual states exist (0° horizontal, 90° vertical)
-	# For other pipes, use full 4-state rotation
-	var target_rotation: float
-	if tile.type == PipeType.STRAIGHT:
-		# Straight pipes alternate between 0° and 90°
-		target_rotation = (tile.rotation % 2) * 90.0
-		# Snap immediately to avoid weird backwards animation
-		tile.sprite.rotation_degrees = target_rotation
-	else:
-		target_rotation = tile.rotation * 90.0
+	# Swap to the pre-rotated atlas region, then give a short scale "pop" as feedback
+	tile.sprite.texture = _get_pipe_texture(tile.type, tile.rotation)
+	var base_scale = tile.sprite.scale
+	tile.sprite.scale = base_scale * 0.85
 	
 	var tween = create_tween()
 	tween.set_speed_scale(speed_multiplier)  # Scale animation with speed
-	tween.tween_property(tile.sprite, "rotation_degrees", target_rotation, 0.1)
+	tween.tween_property(tile.sprite, "scale", base_scale, 0.1)
 	tween.finished.connect(func():
 		rotating_tiles.erase(Vector2(col, row))
 		# Check win condition after rotation completes
@@ -410,78 +309,21 @@ func _rotate_tile(col: int, row: int):
 	)
 
 func _check_win() -> bool:
-	# Check if all pipes form closed loops with no dead ends
-	for row in range(GRID_SIZE):
-		for col in range(GRID_SIZE):
-			var tile = grid[row][col]
-			
-			# Skip blank tiles
-			if tile.type == PipeType.BLANK:
-				continue
-			
-			var connections = _get_rotated_connections(tile.type, tile.rotation)
-			
-			# Check each connection point
-			for dir in connections:
-				var neighbor_pos = _get_neighbor_position(col, row, dir)
-				
-				# If neighbor is out of bounds, this is a dead end
-				if neighbor_pos.x < 0 or neighbor_pos.x >= GRID_SIZE or neighbor_pos.y < 0 or neighbor_pos.y >= GRID_SIZE:
-					return false
-				
-				var neighbor = grid[int(neighbor_pos.y)][int(neighbor_pos.x)]
-				
-				# If neighbor is blank, this is a dead end
-				if neighbor.type == PipeType.BLANK:
-					return false
-				
-				var neighbor_connections = _get_rotated_connections(neighbor.type, neighbor.rotation)
-				var opposite_dir = _get_opposite_direction(dir)
-				
-				# Neighbor must have matching connection
-				if not opposite_dir in neighbor_connections:
-					return false
-	
-	return true
-
-func _get_rotated_connections(pipe_type: PipeType, pipe_rotation: int) -> Array:
-	var base_connections = PIPE_CONNECTIONS[pipe_type].duplicate()
-	var rotated = []
-	
-	# Normalize rotation for straight pipes (0,2 are identical; 1,3 are identical)
-	var effective_rotation = pipe_rotation
-	if pipe_type == PipeType.STRAIGHT:
-		effective_rotation = pipe_rotation % 2
-	
-	for dir in base_connections:
-		var new_dir = (dir + effective_rotation) % 4
-		rotated.append(new_dir)
-	
-	return rotated
-
-func _get_neighbor_position(col: int, row: int, direction: Direction) -> Vector2:
-	match direction:
-		Direction.NORTH:
-			return Vector2(col, row - 1)
-		Direction.EAST:
-			return Vector2(col + 1, row)
-		Direction.SOUTH:
-			return Vector2(col, row + 1)
-		Direction.WEST:
-			return Vector2(col - 1, row)
-	return Vector2(-1, -1)
-
-func _get_opposite_direction(direction: Direction) -> Direction:
-	match direction:
-		Direction.NORTH:
-			return Direction.SOUTH
-		Direction.EAST:
-			return Direction.WEST
-		Direction.SOUTH:
-			return Direction.NORTH
-		Direction.WEST:
-			return Direction.EAST
-	return Direction.NORTH
+	# The bank only holds puzzles with exactly one solution, so every opening
+	# connects exactly when every tile shows its solution rotation
+	return mismatched_tiles == 0
+
+func _is_tile_solved(tile: Dictionary) -> bool:
+	return _effective_rotation(tile.type, tile.rotation) == _effective_rotation(tile.type, tile.solution)
+
+func _effective_rotation(pipe_type: PipeType, pipe_rotation: int) -> int:
+	# Straight pipes repeat every 2 turns; crosses and blanks look the same at any rotation
+	match pipe_type:
+		PipeType.STRAIGHT:
+			return pipe_rotation % 2
+		PipeType.CROSS, PipeType.BLANK:
+			return 0
+	return pipe_rotation
 
 func _win_game():
 	if game_ended:
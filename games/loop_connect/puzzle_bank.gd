@@ -0,0 +1,185 @@
+extends RefCounted
+
+## Loop Connect puzzle bank: Generated by games/loop_connect/generate_puzzles.py.
+## Do not edit by hand; rerun the script (or --check it) instead.
+## 300 puzzles with a unique solution, solvable in 4 s (seed 1, 2-6 taps)
+## Cells are row * 4 + col. TYPES packs a PipeType per cell in 3 bits;
+## START and SOLUTION pack a rotation per cell in 2 bits. GRADES are
+## propagation steps to deduce the solution (higher is harder).
+
+const TYPES = [
+	76597201731584, 42951771213, 1237638451242, 77524167297536, 191114367893504, 92386501853184,
+	92386493467136, 75875036987432, 175930457098752, 9489361141760, 75481997377856, 75894894103040,
+	22677746257925, 84261572971008, 10572893, 5036864, 84467202916352, 22556181824,
+	77543089897472, 85363707533824, 92388649599296, 86356927713285, 92367571165226, 76585326892160,
+	42956280936, 191885183552000, 189822546500096, 9709850724864, 77543498219520, 88451624,
+	85373066, 189808882274325, 84711200423936, 175949379797312, 76585397290061, 175953004101952,
+	349419245610, 197924577608832, 85398126678016, 175949788905472, 84517224, 302043472,
+	11592336146432, 22555186253, 83960157, 77543089012736, 184765869457728, 2749081235461,
+	1443244638248, 3092695396357, 3092695398986, 1429853, 187487134941184, 5379981453,
+	84672733598813, 175951526134864, 705212741, 11175144, 77542587814989, 10584091558229,
+	181809775549002, 184719038483072, 366170510426, 181007823216661, 3092812734469, 175930455272138,
+	187840590008640, 178697759099392, 92729878288941, 189850053513221, 705215109, 2748924332752,
+	672553565, 84676500135981, 18533908480, 182318576717824, 2888544288768, 175953002530013,
+	5369352213, 42953266394, 95126495952896, 95064218, 2751195250856, 2751364075525,
+	189824361299968, 191884113118528, 181027966718314, 2829847245, 22038159294464, 1243007725898,
+	181053468184581, 2818998416, 5369563816, 21994125134568, 5380309333, 1443412353024,
+	85604368986157, 43307041088, 191110621331624, 182315188650304, 186532802235200, 21991311280808,
+	22334932040362, 185434847315264, 43624322128, 23108402580008, 175931126516456, 2829847272,
+	75679482937512, 75886312358248, 2888829685760, 184719329792005, 21991317918034, 187497295675432,
+	25129367293952, 200681541599232, 187487301423104, 22680273951434, 181055708009674, 362927197,
+	5637820776, 5638490845, 75481524132520, 22678120311656, 22036414726464, 715497493,
+	23983584006144, 199038723327080, 77886454531432, 189809286295597, 2932574179328, 199934388476421,
+	187607561175040, 5641742893, 5537968266, 198267676822336, 48323403781, 92370392636072,
+	43038358229, 191884195434634, 344285887109, 92388456737605, 187832395422557, 77879753756813,
+	175933355566173, 6051105501, 185621732168794, 85394312728621, 349278864592, 95135810835549,
+	23090047529290, 200670672725077, 20009245402, 190057085698384, 387917060826, 186207803985920,
+	187831990689832, 75482660406592, 45108593869, 23230694298733, 190923865492288, 181053709197677,
+	190949565575530, 48593996648, 3098198319104, 79209570573138, 349152059741, 198620381877322,
+	1448780143322, 24740219968221, 187814132744192, 95482647493322, 2891776375661, 10794814439581,
+	184739598865770, 23777158484112, 182112479936832, 9528704323904, 201026519598400, 190951182932845,
+	2892308488336, 5726643293, 191885453459776, 190057089108520, 3138065698858, 6040703296,
+	366841537629, 5380047184, 389946987738, 76788061788992, 22721904349549, 79208955846813,
+	9736864062120, 76791150870864, 92390789862490, 386870399325, 2794011119965, 82063154068333,
+	9709531993306, 200819176282826, 2754282889541, 76258380714322, 199934388550189, 190564640074445,
+	9530191813253, 75687259384650, 82096589263208, 2754769997845, 11547377019752, 85565767527277,
+	93623265037149, 46937520813, 46450462760, 76567812612437, 75502761925480, 22037160957146,
+	11546298831184, 45857446538, 22377877379738, 23089962920576, 198286051224232, 2751413461352,
+	3098344264789, 86358063055016, 95276639869533, 177394399484458, 82061048797789, 197932578873685,
+	187814126717760, 187497555010920, 185415574346381, 191885671565952, 3092814078101, 45769150784,
+	191154448617512, 184764802849421, 187650527572333, 191128636134762, 84470555073192, 46853301485,
+	24740387991893, 176285507236181, 23438861906250, 76573053672029, 45779616936, 197941308753256,
+	199041227250408, 2797720929448, 178685221688469, 93823068723944, 23439163429210, 187650515566733,
+	192212296839498, 86669527472986, 95465772227397, 2754769178944, 177383854692954, 25130284987477,
+	184765874244432, 5866642125, 5732421632, 75671641340629, 187858032548672, 75880667142813,
+	45768888666, 23095516188992, 199025704708949, 197932499162450, 23135328217802, 24028501883757,
+	45186132816, 190260211178205, 10837767891629, 95126641564365, 6135331498, 179043692354285,
+	200827491494528, 184764884499146, 199365307243181, 199170949307112, 187470317730477, 186207372958349,
+	2935262919253, 82269606107797, 187477074500096, 1283485192213, 187812935412365, 92373292797970,
+	184764796338517, 24032041360093, 86358325046101, 182361581793605, 181809628218688, 22036628679498,
+	95465755215208, 187513263012490, 23273842037085, 185632474409621, 199925806570197, 199923709360810,
+]
+
+const START = [
+	2202599424, 8405169, 168362255, 3024121920, 3238266880, 1354006528,
+	2147762304, 2286191628, 1073804416, 572784640, 3006435360, 1290272896,
+	318769410, 3009020032, 2421, 45984, 1095598080, 9498624,
+	2968809472, 1197857344, 3505684496, 3030122498, 3489710860, 2195288640,
+	12644676, 1150312576, 3284259456, 290476160, 2227213312, 45896,
+	2335, 53020165, 3031238656, 12849168, 3009082433, 9438208,
+	51382540, 3149936, 1130693632, 14730240, 6152, 721204,
+	1020076032, 9456765, 67642, 1089735680, 3234070528, 201788673,
+	83899400, 327938, 265724, 14645, 1682972672, 32784,
+	2354608457, 12853488, 466210, 1104, 1157625409, 538313765,
+	2364613952, 1611698416, 59870584, 3238857220, 201524993, 29920,
+	79810848, 13426688, 2428620938, 3286565120, 205250, 316652,
+	13193, 2355376902, 9210880, 2956395008, 253952000, 13631657,
+	2101517, 19497, 1279328256, 28698, 69206068, 204157184,
+	848723968, 1152435296, 3481884940, 2158673, 817926144, 186716976,
+	3271672067, 2887724, 3156208, 807403668, 1068068, 67305472,
+	2309163785, 639008, 3373843476, 2367697952, 315029664, 1081488,
+	51498444, 266100816, 536896, 1015825480, 4213956, 1364116,
+	2178991124, 3162033184, 253773312, 2686062594, 537972260, 2697043976,
+	601885184, 11272192, 74318336, 1059180704, 4080888924, 724340,
+	1843460, 3146857, 3284518036, 839418792, 11554848, 523268,
+	772605184, 1015072844, 2294514776, 3239907593, 63051264, 1056596354,
+	4247987200, 3961413, 4144944, 2151468192, 25344, 2422505872,
+	29922, 3296740626, 76209, 2429638562, 4034994872, 3292608017,
+	7622729, 33001, 558953802, 2211835146, 529492, 2968804729,
+	1007096080, 810832578, 10524328, 2697012272, 13489448, 4120906240,
+	541138944, 2209507408, 15743089, 187760966, 3277485152, 4089454362,
+	4091092271, 2933800, 2625280, 2959052198, 3224633, 1061529024,
+	151982504, 269769, 3761408000, 2429896144, 254878122, 537658393,
+	813897052, 973344016, 3006385184, 533274880, 537114704, 4062573674,
+	186193936, 1611896, 3226228768, 3267478664, 203442189, 2099472,
+	9552970, 3203088, 4198504, 2176652704, 868427050, 2962283033,
+	549684628, 2174044208, 2429563000, 607799, 15995145, 2927435178,
+	545276260, 266451424, 273202, 2353382696, 4058736778, 3425024977,
+	803063265, 3251399600, 3162513704, 136388865, 607948968, 2203939690,
+	2579948729, 12894917, 14478600, 1111114546, 2410711720, 7606376,
+	335872048, 16417183, 51380632, 1006639984, 564472, 136577064,
+	70990, 1142018052, 1570259403, 147543372, 2937689801, 5255213,
+	2955958432, 549736664, 3814377873, 3433130176, 202116880, 16521504,
+	3318549768, 3493118352, 4288750122, 3242449244, 2154350916, 14693158,
+	68628786, 66392370, 1006704689, 2960574921, 16266376, 539085912,
+	1006736836, 3231744, 70344821, 2638470116, 1009845304, 3476046879,
+	2218115390, 2808136891, 2890908066, 137442592, 2302788808, 12660082,
+	2965675184, 1165793, 2746624, 2170837472, 4085875360, 2352221589,
+	7345200, 1010054432, 944038066, 5287702, 1014765548, 301416810,
+	14786704, 2354633193, 602751682, 2416035297, 51652, 13219270,
+	266427584, 1882480096, 157238470, 1262869220, 4029727688, 4124085137,
+	255697346, 2952830405, 542174592, 180609029, 2954190993, 2423612940,
+	2963028005, 825359849, 2227015346, 4059330850, 4236812304, 4187004,
+	2488198232, 2968584080, 199373109, 559792324, 826773986, 809552380,
+]
+
+const SOLUTION = [
+	2206859264, 16449, 185139468, 2218840192, 3240364032, 2428796928,
+	2428780672, 2353300488, 4244608, 590086144, 2213711904, 2365087872,
+	856230146, 2203467904, 2377, 33184, 2169602048, 9490512,
+	2227458048, 2204490368, 2428801056, 2224226562, 2420130572, 2212053568,
+	49476, 3297796224, 3280065152, 563110016, 2230359040, 32904,
+	3344, 3274245637, 2360150016, 12873760, 2212152385, 13648928,
+	3213580, 7622720, 2208695552, 15766528, 8232, 722480,
+	616636416, 9486657, 2105, 2227454976, 4039381024, 462082,
+	151270408, 331010, 331200, 12601, 609230848, 53265,
+	2354604361, 12869696, 991522, 9316, 2227422785, 588649509,
+	3435211200, 4027633856, 9556296, 3272411141, 788226, 4227040,
+	616665632, 12636288, 2428622218, 3286565122, 991682, 324832,
+	12745, 2355409674, 9220096, 3241869824, 253804544, 13647977,
+	4357, 16488, 2420703232, 61720, 2101268, 2826498,
+	3282468864, 3296773200, 3280050476, 2412769, 12894208, 185143600,
+	3284254978, 2363408, 15560, 3412196, 52261, 151465984,
+	2175207690, 606240, 3239625748, 3240113184, 600242336, 1085588,
+	1163724, 601645136, 28992, 1015301256, 4210916, 2412772,
+	2171651092, 2356726824, 253872640, 4028305666, 1100836, 616670216,
+	14748160, 6291456, 610468352, 858116576, 3275579744, 593225,
+	3940648, 3933417, 2210776724, 855736488, 13684768, 1032197,
+	822936832, 1019266116, 2227229784, 3274518794, 264312320, 835412354,
+	4281340928, 3965834, 3345680, 7390368, 25346, 2422522260,
+	31202, 3296740624, 76226, 2428589986, 4035012281, 2218866193,
+	6574153, 54505, 558941512, 2207902986, 529504, 2431937865,
+	1007104304, 5526338, 11572456, 3250660400, 13497832, 4192406016,
+	608249864, 2213695568, 15742049, 187793734, 3281679520, 3284148010,
+	3285785900, 3982504, 3738624, 2963246500, 3223609, 860202304,
+	151458280, 1318377, 4029728768, 2429908448, 254902698, 556598297,
+	4035138908, 856034576, 3275145248, 600384032, 4229200, 3274032554,
+	252516368, 3972169, 3299637280, 3250685064, 2181388, 14624,
+	9559113, 60464, 12587112, 2180863392, 868295978, 2962282521,
+	566462100, 2178239536, 2429580360, 607801, 15995193, 3212664234,
+	562054504, 258079200, 277282, 2357576996, 835414410, 3425028321,
+	601736642, 2177661872, 3213893928, 3223813, 605847720, 2169861034,
+	2613499065, 12894666, 13421832, 2205303602, 2209449640, 3428712,
+	605622576, 15761808, 1167768, 1006905536, 13475016, 2366504,
+	3224898, 2226245652, 2681749961, 164320652, 3210319561, 5255205,
+	4029716640, 616845400, 592628113, 3298916544, 790290, 15743264,
+	3251440904, 4029989265, 4292944170, 3247429980, 2171193748, 12858214,
+	1511730, 8196402, 1006967088, 2205601225, 15742024, 14797912,
+	1019319780, 3236936, 7430469, 2571360996, 1010368824, 4281353233,
+	3291865392, 2221458616, 2421014946, 3221792, 155305160, 12922178,
+	4039421104, 3262945, 649472, 2170837474, 4039742112, 2356432281,
+	15733816, 1010051360, 1011147698, 5286996, 1023219680, 838304170,
+	15769776, 3424147945, 556614602, 2420230625, 51660, 13219302,
+	266435776, 4029963744, 157238730, 189127396, 4029727178, 4191455633,
+	252535234, 2960170437, 609282432, 197320965, 4028203153, 2420728836,
+	4040176677, 825327081, 2226229170, 3241429282, 3435701328, 3269552,
+	2420958296, 4029734288, 199635257, 558940357, 827052514, 826591692,
+]
+
+const GRADES = [
+	3, 3, 4, 4, 5, 5, 5, 5, 5, 6, 6, 6, 6, 6, 7, 7, 7, 7, 7, 7,
+	7, 7, 7, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+	8, 8, 8, 8, 8, 8, 8, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9,
+	9, 9, 9, 9, 9, 9, 9, 9, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10,
+	10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 11, 11, 11,
+	11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11,
+	11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 12, 12, 12, 12,
+	12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 13,
+	13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13,
+	13, 13, 13, 13, 13, 13, 13, 13, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14,
+	14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14,
+	14, 14, 14, 14, 14, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15,
+	15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 16, 16, 16, 16,
+	16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 17, 17, 17, 17, 17, 17, 17,
+	17, 17, 17, 17, 17, 17, 17, 17, 17, 18, 18, 18, 18, 18, 18, 18, 19, 19, 20, 20,
+]
@@ -0,0 +1,673 @@
+extends RefCounted
+
+## Minesweeper board bank: Generated by games/minesweeper/generate_boards.py.
+## Do not edit by hand; rerun the script (or --check it) instead.
+## 300 boards cleared without guessing from START in 4 s (seed 1, 4-8 bombs)
+## Cells are row * 5 + col. BOMBS are bitmasks; COUNTS hold each cell's
+## adjacent bombs as a digit ('*' for a bomb); SOLUTIONS list the logic
+## solver's clicks, one letter per cell ('a' = 0).
+
+const BOMBS = [
+	4376, 1091, 3145748, 33825, 17944, 1052804, 32505862, 284,
+	1082392, 16412, 5242897, 25444880, 7340040, 17968, 29, 13123585,
+	25427969, 4103, 61, 17825804, 4194334, 28311568, 1049100, 6291480,
+	16777253, 17313792, 2151, 1081377, 25182241, 17301538, 525347, 17457,
+	16778271, 17318412, 17335296, 33891, 524323, 3146241, 22544384, 28049408,
+	5275681, 1085456, 16811056, 15728642, 16778264, 5243920, 3146244, 33854,
+	21512208, 664, 8929312, 1146904, 1065483, 1097729, 20971535, 7897088,
+	18383360, 16778252, 408, 29769744, 27262992, 17874977, 4194325, 8405520,
+	17952, 25691136, 17825825, 5243937, 17859586, 25690624, 1066496, 12582918,
+	17303064, 33840, 6292496, 16795184, 49176, 1081405, 1082419, 22020097,
+	26312704, 1065232, 4325393, 16540, 14712832, 3146289, 17301553, 25182749,
+	26738688, 31522832, 8472, 21762048, 6211, 1281024, 4293632, 29630464,
+	1148432, 20972048, 1064981, 4211216, 1050120, 17301509, 32805, 14680072,
+	3276801, 16536, 25301008, 8405537, 4194341, 32522273, 5309441, 25690160,
+	1064965, 524812, 6291992, 50211, 1049094, 10518544, 1573377, 29360138,
+	8405009, 25691137, 17302027, 4719120, 1098760, 22020098, 30442498, 32823,
+	25722880, 1049121, 17334304, 24904192, 17318405, 13107204, 1045, 3211265,
+	32865, 25707018, 540679, 16777443, 17301660, 18367009, 17843201, 541230,
+	15204354, 17310360, 8388619, 29918240, 26763264, 2055, 17309720, 19927040,
+	1548, 4866048, 16797697, 13115392, 17318659, 8468, 1082892, 403,
+	21268, 33888, 90, 11731968, 20972056, 4329496, 4628, 1082432,
+	18350344, 2148, 4260897, 218, 281, 16778467, 12305, 25178640,
+	4472833, 27329536, 116, 27656192, 11538432, 18350212, 17280, 103424,
+	12552, 7407632, 2162712, 4296704, 17318784, 25198600, 8913440, 11567136,
+	50210, 3309600, 8389680, 17892352, 573448, 10486817, 5767170, 1574400,
+	17302021, 22086657, 2655232, 16793625, 4194364, 1573397, 30932997, 4227092,
+	540678, 33310, 25198596, 4211220, 525832, 17301786, 12583425, 540683,
+	16793626, 16826396, 643, 16782352, 4718625, 12599328, 1048739, 11559440,
+	1054737, 1052684, 34912, 1048646, 25305616, 12587024, 16643, 4327457,
+	1178, 1201, 1049345, 1082528, 4473344, 135201, 4472848, 1052816,
+	25698836, 134177, 1050673, 65585, 278545, 20980240, 1277984, 17302169,
+	1116161, 1083512, 16781465, 17318964, 17846272, 20987912, 1083396, 4719649,
+	16811072, 1052693, 10534912, 4981248, 4195856, 33954, 1057555, 17318032,
+	12599300, 25174032, 5144, 4228098, 16797720, 1081732, 3092, 2209,
+	17318924, 18751488, 21071905, 8843, 1101824, 17334276, 2075, 4360225,
+	17926, 16783392, 17826824, 17434, 25296913, 2166817, 897, 3984,
+	199680, 2272, 4280, 794625, 929792, 12845058, 30670850, 98328,
+	7296, 1081744, 25436161, 17825922,
+]
+
+const START = [
+	5, 3, 18, 19, 17, 4, 10, 16, 19, 10, 10, 15, 10, 7, 24, 3, 8, 10, 19, 22,
+	12, 1, 0, 13, 14, 20, 22, 13, 21, 15, 3, 22, 21, 16, 22, 24, 4, 23, 8, 6,
+	12, 0, 12, 9, 0, 24, 23, 23, 12, 19, 15, 23, 22, 7, 11, 5, 6, 14, 21, 15,
+	10, 17, 24, 10, 12, 3, 4, 7, 22, 12, 24, 9, 12, 23, 7, 17, 17, 14, 17, 12,
+	3, 11, 7, 24, 14, 2, 16, 12, 2, 5, 20, 4, 14, 14, 0, 1, 19, 11, 24, 7,
+	17, 12, 17, 6, 14, 21, 5, 2, 12, 7, 13, 2, 22, 12, 11, 24, 24, 2, 2, 11,
+	20, 7, 20, 2, 23, 3, 4, 17, 3, 12, 9, 10, 12, 10, 18, 24, 18, 10, 10, 4,
+	0, 2, 4, 12, 4, 5, 10, 4, 10, 4, 10, 4, 21, 20, 4, 3, 17, 16, 23, 16,
+	15, 8, 22, 4, 20, 19, 21, 13, 1, 13, 14, 18, 24, 22, 24, 20, 20, 1, 21, 4,
+	9, 4, 21, 1, 22, 24, 23, 3, 0, 1, 20, 12, 23, 7, 2, 14, 22, 12, 8, 12,
+	17, 14, 0, 21, 12, 22, 10, 19, 20, 17, 12, 5, 22, 20, 12, 17, 12, 22, 21, 22,
+	7, 20, 17, 6, 14, 5, 23, 9, 20, 0, 11, 24, 17, 23, 23, 18, 2, 14, 5, 5,
+	11, 3, 23, 24, 20, 20, 8, 21, 9, 22, 15, 12, 0, 6, 18, 2, 17, 22, 0, 5,
+	2, 23, 10, 5, 12, 2, 22, 8, 5, 19, 19, 9, 20, 4, 13, 21, 22, 4, 13, 14,
+	17, 4, 0, 24, 20, 23, 18, 18, 0, 24, 23, 4, 15, 4, 3, 0, 19, 22, 11, 17,
+]
+
+const COUNTS = [
+	"002**013*301*210111000000",
+	"**2004*200*21001100000000",
+	"01*2*011210000022100**100",
+	"*2000*3000*3000*200011000",
+	"001**1114**102*1101100000",
+	"02*2003*3002*2012110*1000",
+	"1**10122100000023332*****",
+	"01***013*3001110000000000",
+	"001**11122*2000*3000*2000",
+	"01***012430001*0001100000",
+	"*101*110110000012110*2*10",
+	"0002*0003*0013*002*4002**",
+	"001*1001110000023210***10",
+	"1102**203**202*1101100000",
+	"*2***12232000000000000000",
+	"*1000110110002*0124*01**2",
+	"*10001100000111002*3002**",
+	"***102432001*100111000000",
+	"*3****3232110000000000000",
+	"01**1012210000011011*101*",
+	"1****12332000000111001*10",
+	"0001*000110000022222**2**",
+	"01**20123*0001111000*1000",
+	"001**0012200000122101**10",
+	"*3*10*311011000000110001*",
+	"000000122101**20124*0002*",
+	"***10**4103*2001110000000",
+	"*2000*200022000*2000*2000",
+	"*2000*20111101*00133001**",
+	"2*100*2100110110002*0002*",
+	"**100*4100*20111101*00011",
+	"*201**3022*201*1101100000",
+	"*****34332*1000110110001*",
+	"01**20124*0003*0003*0002*",
+	"0000011000*2011*202*1102*",
+	"**200**200*4100*200011000",
+	"**100*3100110110001*00011",
+	"*10111101*0001122100**100",
+	"0000000000000111213**2*3*",
+	"000000000000122113**1*3**",
+	"*2000*200022000*3110*3*10",
+	"0001*0112112*10*3110*2000",
+	"1101**2011*3000*20111101*",
+	"1*100111000000023321****1",
+	"001**11122*1000110110001*",
+	"0001*11011*100023110*2*10",
+	"01*210112*0001122100**100",
+	"2*****4332*3000*200011000",
+	"0001*000220002*0114*01*3*",
+	"012**01*4*011210000000000",
+	"11000*10111102*0013*001*2",
+	"001**0012222100**100*3100",
+	"**2*22223*0002*11011*1000",
+	"*1000110111101**2011*2000",
+	"****123321000000112101*2*",
+	"000000000011011*422****21",
+	"000110001*11022*202**202*",
+	"01**112221*1000110110001*",
+	"013**01**3012210000000000",
+	"0001*000220123*02**402***",
+	"0001*0001100000112221*2**",
+	"*2000*20112201**2022*201*",
+	"*2*2*12121000000111001*10",
+	"0002*0003*0002*00122001*1",
+	"11011*202**202*1101100000",
+	"0000011000*10111113*001**",
+	"*2000*20001100011011*101*",
+	"*2000*3000*200023110*2*10",
+	"1*10022100*2000*3011*201*",
+	"000110001*000220013*001**",
+	"000111102**102*22011*1000",
+	"1**1012210000000122101**1",
+	"001**1113**10221102*0002*",
+	"1101**2011*3000*200011000",
+	"0001*11011*1000232101**10",
+	"1102**203**202*110220001*",
+	"001**001331101**101111000",
+	"*3****323222000*2000*2000",
+	"**11**4111*3000*3000*2000",
+	"*1000110000000012121*2*2*",
+	"000000000022100**222*32**",
+	"0012*001*30012*11011*1000",
+	"*101*110110111002*2002*20",
+	"02***02*530112*0001100000",
+	"000000000011000*33212***1",
+	"*202**202*1101122100**100",
+	"*201**2011110110002*0002*",
+	"*2***1225*0002*00133001**",
+	"0000000000000111113**11**",
+	"0001*00011111002*4322****",
+	"002**003*4002*20011100000",
+	"000000111001*32023**01*4*",
+	"**2004*4102**101221000000",
+	"0000022100**310***10*4210",
+	"0000011000*3100**21023*10",
+	"0000000111002*2014*401***",
+	"0002*1102**3111**100*3100",
+	"0002*0002*000110112101*2*",
+	"*2*2*121320001*11011*1000",
+	"0002*0003*0002*0112101*10",
+	"001*21112**101122000*1000",
+	"*2*1012110000110002*0002*",
+	"*3*10*311022000*100011000",
+	"001*10011100000123211***1",
+	"*1000110000111023*10**210",
+	"012**01*430112*0001100000",
+	"0001*0112102*2002*42012**",
+	"*2011*202*1102*00122001*1",
+	"*3*10*3110110000111001*10",
+	"*2000*20111101*23343*****",
+	"*100022000*21003*210*3*10",
+	"1101**1011110110013*001**",
+	"*2*10121210001*11011*1000",
+	"01**20123*000220001*00011",
+	"001**0013*00011122101**10",
+	"**100*4111*301**201111000",
+	"1**211222*0001111000*1000",
+	"0001*0001111000*22112*2*1",
+	"*10111101*000221101**1011",
+	"1*2*111211000000123201***",
+	"*101*110220001*00122001*1",
+	"*100022000*10111113*001**",
+	"**2*22222*000220002*0002*",
+	"0002*0002*000220112*01*21",
+	"001*111122*201**3011*2000",
+	"1*100111000000012121*2*2*",
+	"1*10022100*2000*4232*3***",
+	"***2**422122000*100011000",
+	"000000000011011*113*111**",
+	"*2011*201*1101111000*1000",
+	"11000*100022011*102*1102*",
+	"000110001*00133233*****4*",
+	"*2*211213*0003*0003*0002*",
+	"01*1001110000110123*01**2",
+	"*2*2*23121*10001100000000",
+	"*100011000111003*200**200",
+	"*3100**10033100*100011000",
+	"1*2*21123*0003*0014*001**",
+	"***10232210002*0002*00011",
+	"**310***1023210000110001*",
+	"02***02*42011210002*0002*",
+	"*2011*202*1103*1103**102*",
+	"*100022011*101*22022*101*",
+	"2***2*334*1103*0002*00011",
+	"1*10011100000111233*1***2",
+	"012**01*5*012*30013*0002*",
+	"**2*1222110000000111001*1",
+	"11000*2000*3011*324*12***",
+	"0000000122001**1125**11**",
+	"***10343101*1001110000000",
+	"001**00233001*20013*0002*",
+	"000000111001*1023221**11*",
+	"01**21223**10111100000000",
+	"00000000110113*02*4*02*31",
+	"*10001212101*2*011320001*",
+	"0000000111001*20134*01**2",
+	"**222222**0014*0003*0002*",
+	"01*3*013*3002*20011100000",
+	"01**21223**2011*3000*2000",
+	"**33*23**2012210000000000",
+	"01*4*023**01*4*0112100000",
+	"22100**100*4100*200011000",
+	"2*3**2*322111000000000000",
+	"0000011000*32104**21**4*1",
+	"001**0013*000110112101*2*",
+	"001**0123202*2003*3002*20",
+	"01*3*0224*01*210111000000",
+	"111002*100*3100*3000*2000",
+	"002*2002*2001221102**102*",
+	"23*10**3103*2001110000000",
+	"*2000*3000*31002*21012*10",
+	"2*4**2**32122100000000000",
+	"*12**112*3001110000000000",
+	"**310***10*4210110110001*",
+	"*101*1223201**10122100000",
+	"0002*0124*01**201343001**",
+	"*1000110110012*012*201*21",
+	"0000011000*21003*3222*3**",
+	"23*2***221221000000000000",
+	"00000000000122112**31*4**",
+	"000000111001*1023321**2*1",
+	"02*2002*20011211102**102*",
+	"0123201***0124*0001100000",
+	"0000012110*4*10**21022100",
+	"002*2014*301**20122100000",
+	"0001*111112*2004*410***10",
+	"001**00122111002*2002*200",
+	"000000111023*10**32023*10",
+	"0123201***0125*0003*0002*",
+	"001*10011111000*1122111**",
+	"11011*101*110220012*001*2",
+	"11000*100022000*3211**2*1",
+	"2*100*3111*301**201111000",
+	"11000*100023110*4*10**210",
+	"1101**2011*200011111001*1",
+	"0000011000*21003*111*211*",
+	"001*1001221102**102*11011",
+	"*2000*3000*2000222111*2*1",
+	"1*10011100000111212**2*21",
+	"000111101**10222201**1011",
+	"*2*211212*000220002*0002*",
+	"*100022000*21003*221*3*2*",
+	"0000011000*2011*311*2*111",
+	"*11**111330001*000220001*",
+	"12****2232110000111001*10",
+	"*2*3*1213*000221101**1011",
+	"*2*1012110000111224**2***",
+	"01*2*0112111000*211012*10",
+	"1**10122210002*0002*00011",
+	"1****1234*11011*100011000",
+	"01*100111011000*1122111**",
+	"01*3*0114*0002*0112101*10",
+	"001*21112**10221101*00011",
+	"1*3**113*3001220002*0002*",
+	"*10111101*000110122101**1",
+	"**2*1222220002*0002*00011",
+	"1*2**112330001*000220001*",
+	"01***012431101**10221101*",
+	"**22123*2*011210000000000",
+	"0001*12121*2*10121210001*",
+	"*2000*2000110110112*01*21",
+	"11000*10111101*0123201**1",
+	"**210*4*101211011000*1000",
+	"0002*0014*001**22333**2*1",
+	"*101*232211**1023210*1000",
+	"01**10233101*1012110*1000",
+	"22100**2004*200*210011000",
+	"2**102*3101110011000*1000",
+	"0002*0013*012*201*43012**",
+	"0001*0112101*100233101**1",
+	"**211222*20012*0001100000",
+	"*2000*31002*21013*2002*20",
+	"1*3**23*32*21101100000000",
+	"*312**4*21*31101100000000",
+	"*1122111**0012211000*1000",
+	"12110*3*10*4110*3000*2000",
+	"000110002*0013*012*201*21",
+	"*2000*311013*2002*2001110",
+	"0001*000220012*012*201*21",
+	"0112*02*3102*2012110*1000",
+	"01*3*0124*001*30024*001**",
+	"*2000*4100**21023*1001110",
+	"*201**31112*10022100*1000",
+	"*201**2011221001*10011100",
+	"*101*110220012*001*200111",
+	"0002*0013*001*20123201*2*",
+	"11000*100034210***10*4210",
+	"*22**12*4*011320002*0002*",
+	"*1000221002*2003*200*2100",
+	"222****3224*200*3100*2000",
+	"*22**13*4202*20011210001*",
+	"12*2**3132*202*1103*0002*",
+	"000000112101*2*12132*101*",
+	"001*1001220001*0113201*2*",
+	"01*10122102*100*3100*2000",
+	"*2000*3000*20111212*01*21",
+	"111002*100*3100*20111101*",
+	"*2*2*1323101*1012110*1000",
+	"00000000111101**22222*2*1",
+	"000110001*00133012**01*32",
+	"0002*1102**10111211001*10",
+	"2*210*4*10*4110*200011000",
+	"**23*223**002*311111*1000",
+	"0112*01*320113*0003*0002*",
+	"01*10011210001*0123201**1",
+	"0001*00122001*100233001**",
+	"001**12232*2*101211000000",
+	"1*10022100*2000*311012*10",
+	"001**0124301*2*011320001*",
+	"02*3102**112221*2000*2000",
+	"01*2*23221**1002210000000",
+	"*3110*4*102*2101110000000",
+	"01**112232*102*1103*0002*",
+	"0000000111013*312****224*",
+	"*2000*31004*200**32123*2*",
+	"**3*223*4*012*20011100000",
+	"000000112112*2**3121*2000",
+	"01*100111011011*102*1102*",
+	"**2**333221*1001110000000",
+	"*2000*31003*210*4*2013*20",
+	"1**212323**102*1101100000",
+	"11000*32102**10122210001*",
+	"001*111111*100022011*101*",
+	"1*2**22233*101*1101100000",
+	"*101*110110111001*32012**",
+	"*2000*311023*102*3102*200",
+	"*223212***012320000000000",
+	"0124*23*****3322210000000",
+	"0000022100**3103**1012210",
+	"23210***103*3101110000000",
+	"122***3*4213*200111000000",
+	"*100011111002*3002**00122",
+	"000000122102**302***01232",
+	"1*1001110000111013*201**2",
+	"1*1001110000111123*3*2***",
+	"001**0012222100**10022100",
+	"0111024*20***202321000000",
+	"0123*01**212221*2000*2000",
+	"*100011111002*2003*4002**",
+	"1*21012*100111011011*101*",
+]
+
+const SOLUTIONS = [
+	"fj",
+	"df",
+	"sd",
+	"tu",
+	"ra",
+	"ek",
+	"ka",
+	"qj",
+	"ta",
+	"kj",
+	"kv",
+	"pt",
+	"ke",
+	"ha",
+	"yb",
+	"dy",
+	"it",
+	"kh",
+	"tb",
+	"we",
+	"ma",
+	"bw",
+	"ae",
+	"nu",
+	"ob",
+	"uo",
+	"wk",
+	"nk",
+	"vt",
+	"pa",
+	"dy",
+	"wj",
+	"vf",
+	"qe",
+	"wu",
+	"yu",
+	"ey",
+	"xe",
+	"ivx",
+	"guw",
+	"mkv",
+	"ano",
+	"mau",
+	"jay",
+	"alm",
+	"ypv",
+	"xde",
+	"xau",
+	"mjx",
+	"tci",
+	"pay",
+	"xbv",
+	"wce",
+	"hfk",
+	"lex",
+	"fxy",
+	"geo",
+	"oae",
+	"vcj",
+	"pjt",
+	"kuw",
+	"rkt",
+	"ybd",
+	"kty",
+	"mae",
+	"dpu",
+	"ekp",
+	"hpv",
+	"waf",
+	"meo",
+	"yep",
+	"jay",
+	"mao",
+	"xau",
+	"hpu",
+	"rat",
+	"rju",
+	"obk",
+	"rcd",
+	"mvx",
+	"dvw",
+	"ldj",
+	"hko",
+	"yij",
+	"ouy",
+	"ckp",
+	"qjo",
+	"mbt",
+	"cvw",
+	"fpu",
+	"uoj",
+	"erx",
+	"okf",
+	"owv",
+	"avu",
+	"bot",
+	"thv",
+	"lotx",
+	"ybdj",
+	"htxy",
+	"raep",
+	"mbde",
+	"rbku",
+	"geuy",
+	"ofkw",
+	"vcij",
+	"fnow",
+	"cety",
+	"mbkp",
+	"hkpt",
+	"nfpv",
+	"cajo",
+	"wbde",
+	"meoy",
+	"lotu",
+	"ycdu",
+	"yade",
+	"cuwy",
+	"ceoy",
+	"lace",
+	"ujty",
+	"hfpu",
+	"uceo",
+	"coxy",
+	"xaej",
+	"davx",
+	"eafv",
+	"rdku",
+	"duvw",
+	"mekp",
+	"jaku",
+	"keox",
+	"mbde",
+	"kdey",
+	"sbdf",
+	"yfkp",
+	"sbku",
+	"kace",
+	"kdey",
+	"ecmr",
+	"aijo",
+	"cekp",
+	"efpt",
+	"maey",
+	"eauy",
+	"fcio",
+	"kcey",
+	"eauv",
+	"kswv",
+	"egkf",
+	"kioj",
+	"erwx",
+	"vfae",
+	"usxy",
+	"eknt",
+	"dosy",
+	"rcde",
+	"qdoj",
+	"xfae",
+	"qcjd",
+	"phnd",
+	"ibua",
+	"wcfa",
+	"epwy",
+	"uxot",
+	"tchb",
+	"vhdi",
+	"nbfa",
+	"bjoe",
+	"nbka",
+	"opvu",
+	"scfa",
+	"ycjb",
+	"wijc",
+	"ycoj",
+	"uost",
+	"utxy",
+	"bpwu",
+	"vbda",
+	"etwu",
+	"jrwy",
+	"emrf",
+	"vcde",
+	"blvu",
+	"woje",
+	"ybkp",
+	"xbpu",
+	"drvu",
+	"acde",
+	"beuvw",
+	"uaeoy",
+	"makwy",
+	"xacdu",
+	"hakqw",
+	"capuy",
+	"opvwx",
+	"wejuy",
+	"mpuwy",
+	"iavxy",
+	"meopy",
+	"rbdeo",
+	"ofpvx",
+	"auwxy",
+	"vbcjt",
+	"mabkp",
+	"wbdoy",
+	"kbdev",
+	"taduv",
+	"uadey",
+	"rafku",
+	"mauvw",
+	"fdtxy",
+	"waeoy",
+	"uacjo",
+	"meoty",
+	"rcejy",
+	"macjt",
+	"wajtu",
+	"vcide",
+	"wlnoc",
+	"hkpxy",
+	"uhaty",
+	"rcgkp",
+	"gswty",
+	"ockfp",
+	"fhrwe",
+	"xbkau",
+	"jfkpa",
+	"uoswt",
+	"anory",
+	"lcdje",
+	"ykqpu",
+	"rcfga",
+	"xcgbd",
+	"xbcde",
+	"scgab",
+	"cxety",
+	"oklwp",
+	"fjtxy",
+	"fcrwd",
+	"ldiso",
+	"dqwpu",
+	"xbckp",
+	"ykpvu",
+	"ujtxy",
+	"uosxt",
+	"iakwv",
+	"vciob",
+	"jkvfp",
+	"wbcka",
+	"pcnob",
+	"mjabd",
+	"anrwt",
+	"gxejt",
+	"sbgka",
+	"cpuxy",
+	"rbafu",
+	"whkbd",
+	"atuwy",
+	"feoxy",
+	"coptu",
+	"xcgua",
+	"kcwdo",
+	"fcijd",
+	"mdety",
+	"cosjt",
+	"wchlb",
+	"ivafu",
+	"fnijt",
+	"tfjde",
+	"tbdga",
+	"jcgkb",
+	"ufjae",
+	"eowvx",
+	"nkvxu",
+	"vcioe",
+	"wklnf",
+	"ehmau",
+	"ncgkf",
+	"okquv",
+	"rfade",
+	"ekrwa",
+	"almep",
+	"yfjac",
+	"ucwjo",
+	"xklpu",
+	"scbde",
+	"sgacd",
+	"awvpu",
+	"yckba",
+	"xcbga",
+	"ekoxy",
+	"powxy",
+	"elaty",
+	"dlatv",
+	"ainvu",
+	"tcbga",
+	"wfjcd",
+	"lbcot",
+	"rkoca",
+]
@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""
+Generate the minesweeper board bank: 5x5 boards solvable without guessing.
+
+Boards are integer bitboards (bit row * 5 + col). Neighbor sets are the
+union of eight shifted copies of a board with column wrap masked off, and
+adjacent-bomb counts for all 25 cells at once come from adding those eight
+shifted bomb boards into four bit planes (a ripple-carry adder on ints).
+
+From the start cell (a zero, so its reveal cascades) a deterministic logic
+solver plays the board the way a player would, without flags or the total
+bomb count:
+
+- a revealed number whose unknown neighbors must all be bombs, or all safe
+- subset rule: if one number's unknown neighbors contain another's, the
+  difference holds exactly the difference in remaining bombs
+
+Each round it clicks every cell proven safe. A board is kept only if this
+reveals every safe cell, which makes it fair in a 4-second beat, and if the
+clicks fit the budget: READ_TIME + clicks * CLICK_SECONDS. Candidates are
+solved across a process pool.
+
+The bank stores, per board, the bomb bitmask, start cell, precomputed
+counts and the solver's click order, so main.gd does no runtime work.
+
+Usage:
+    python3 games/minesweeper/generate_boards.py [--count N] [--seed S] [--jobs N]
+        [--min-bombs N] [--max-bombs N] [--min-clicks N]
+    python3 games/minesweeper/generate_boards.py --check    # re-verify the committed bank
+"""
+
+import argparse
+import os
+import random
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+GAME_DIR = Path(__file__).resolve().parent
+BANK_PATH = GAME_DIR / "board_bank.gd"
+GENERATOR = "games/minesweeper/generate_boards.py"
+
+GRID_SIZE = 5  # main.gd GRID_SIZE
+CELLS = GRID_SIZE * GRID_SIZE
+FULL = (1 << CELLS) - 1
+FIRST_COL = sum(1 << (row * GRID_SIZE) for row in range(GRID_SIZE))
+LAST_COL = FIRST_COL << (GRID_SIZE - 1)
+
+# Timing model (director.gd NORMAL_GAME_BEATS * BEAT_DURATION = 4 s)
+BEAT_BUDGET = 4.0
+READ_TIME = 0.6  # Seconds to find the start star
+CLICK_SECONDS = 0.6  # Per click, including reading the numbers that justify it
+
+DEFAULT_COUNT = 300
+DEFAULT_MIN_BOMBS = 4
+DEFAULT_MAX_BOMBS = 8
+DEFAULT_MIN_CLICKS = 2  # Including the start; 1 would be a single cascade
+
+CELL_CHARS = "abcdefghijklmnopqrstuvwxy"  # Click order encoding, one char per cell
+
+
+class BoardBankError(ValueError):
+    """Raised when board_bank.gd is missing, unreadable or fails validation."""
+
+
+# =============================================================================
+# Bitboards
+# =============================================================================
+
+def shifts(board: int) -> list[int]:
+    """The board moved one step in each of the 8 directions (nothing wraps)."""
+    east = (board << 1) & ~FIRST_COL & FULL
+    west = (board >> 1) & ~LAST_COL
+    rows = [board, east, west]
+    return [east, west] + [(b >> GRID_SIZE) for b in rows] + [(b << GRID_SIZE) & FULL for b in rows]
+
+
+def spread(board: int) -> int:
+    """Every cell adjacent to a cell of the board."""
+    result = 0
+    for shifted in shifts(board):
+        result |= shifted
+    return result
+
+
+def count_planes(bombs: int) -> list[int]:
+    """Adjacent-bomb counts of all cells as 4 bit planes (bit i of each count)."""
+    planes = [0, 0, 0, 0]
+    for shifted in shifts(bombs):
+        carry = shifted
+        for i in range(4):
+            planes[i], carry = planes[i] ^ carry, planes[i] & carry
+    return planes
+
+
+def cell_count(planes: list[int], cell: int) -> int:
+    return sum((plane >> cell & 1) << i for i, plane in enumerate(planes))
+
+
+def cells(board: int):
+    while board:
+        low = board & -board
+        yield low.bit_length() - 1
+        board ^= low
+
+
+def popcount(board: int) -> int:
+    return bin(board).count("1")
+
+
+NEIGHBORS = [spread(1 << cell) for cell in range(CELLS)]
+
+
+# =============================================================================
+# Solver
+# =============================================================================
+
+def reveal(cell: int, bombs: int, zeros: int) -> int:
+    """Cells a click opens: the cell, and if it is a zero the flood around it (main.gd _flood_reveal)."""
+    opened = 1 << cell
+    while True:
+        grown = opened | spread(opened & zeros) & ~bombs
+        if grown == opened:
+            return opened
+        opened = grown
+
+
+def deduce(revealed: int, mines: int, counts: list[int]) -> tuple[int, int]:
+    """(cells proven safe, cells proven bombs) from the visible numbers."""
+    safe = 0
+    while True:
+        constraints = []
+        for cell in cells(revealed):
+            unknown = NEIGHBORS[cell] & ~revealed & ~mines & ~safe
+            if unknown:
+                constraints.append((unknown, counts[cell] - popcount(NEIGHBORS[cell] & mines)))
+        found_safe, found_mines = 0, 0
+        for unknown, need in constraints:
+            if need == 0:
+                found_safe |= unknown
+            elif need == popcount(unknown):
+                found_mines |= unknown
+        for small, small_need in constraints:
+            for big, big_need in constraints:
+                if small != big and small & big == small:
+                    diff, extra = big & ~small, big_need - small_need
+                    if extra == 0:
+                        found_safe |= diff
+                    elif extra == popcount(diff):
+                        found_mines |= diff
+        if not (found_safe & ~safe or found_mines & ~mines):
+            return safe, mines
+        safe |= found_safe
+        mines |= found_mines
+
+
+def solve(bombs: int, start: int) -> tuple[list[int], int] | None:
+    """Click order and deduction rounds to clear the board from start, or None if a guess is needed."""
+    planes = count_planes(bombs)
+    counts = [cell_count(planes, cell) for cell in range(CELLS)]
+    zeros = ~(planes[0] | planes[1] | planes[2] | planes[3]) & ~bombs & FULL
+    goal = FULL & ~bombs
+
+    clicks = [start]
+    revealed = reveal(start, bombs, zeros)
+    mines, rounds = 0, 0
+    while revealed != goal:
+        safe, mines = deduce(revealed, mines, counts)
+        safe &= ~revealed
+        if not safe:
+            return None
+        assert not safe & bombs and mines & ~bombs == 0, "unsound deduction"
+        rounds += 1
+        for cell in cells(safe):
+            if not revealed >> cell & 1:
+                clicks.append(cell)
+                revealed |= reveal(cell, bombs, zeros)
+    return clicks, rounds
+
+
+def play_seconds(clicks: int) -> float:
+    return READ_TIME + clicks * CLICK_SECONDS
+
+
+# =============================================================================
+# Candidates
+# =============================================================================
+
+def transform_cell(cell: int, flip: bool, turns: int) -> int:
+    x, y = cell % GRID_SIZE, cell // GRID_SIZE
+    if flip:
+        x = GRID_SIZE - 1 - x
+    for _ in range(turns):
+        x, y = GRID_SIZE - 1 - y, x
+    return y * GRID_SIZE + x
+
+
+def canonical_key(bombs: int) -> int:
+    """Same bombs under any of the 8 grid symmetries map to one key (start cells aside)."""
+    return min(sum(1 << transform_cell(c, flip, turns) for c in cells(bombs))
+               for flip in (False, True) for turns in range(4))
+
+
+def evaluate(task: tuple[int, int, int, int]) -> dict | None:
+    """Generate and solve one candidate; the board dict if it is worth keeping."""
+    seed, min_bombs, max_bombs, min_clicks = task
+    rng = random.Random(seed)
+    bombs = sum(1 << c for c in rng.sample(range(CELLS), rng.randint(min_bombs, max_bombs)))
+    planes = count_planes(bombs)
+    zeros = ~(planes[0] | planes[1] | planes[2] | planes[3]) & ~bombs & FULL
+    if not zeros:
+        return None
+    start = rng.choice(list(cells(zeros)))
+    result = solve(bombs, start)
+    if result is None:
+        return None
+    clicks, rounds = result
+    if len(clicks) < min_clicks or play_seconds(len(clicks)) > BEAT_BUDGET:
+        return None
+    return {
+        "seed": seed, "bombs": bombs, "start": start, "clicks": clicks, "rounds": rounds,
+        "counts": [cell_count(planes, cell) for cell in range(CELLS)],
+        "key": canonical_key(bombs),
+    }
+
+
+def generate(count: int, seed: int, jobs: int, min_bombs: int, max_bombs: int, min_clicks: int,
+             max_candidates: int) -> tuple[list[dict], int]:
+    """Unique boards in seed order; also returns how many candidates were tried."""
+    boards, seen = [], set()
+    batch = max(1, jobs) * 256
+    tried = 0
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        while len(boards) < count and tried < max_candidates:
+            tasks = [(seed + tried + i, min_bombs, max_bombs, min_clicks) for i in range(batch)]
+            tried += batch
+            for board in pool.map(evaluate, tasks, chunksize=32):
+                if board and board["key"] not in seen and len(boards) < count:
+                    seen.add(board["key"])
+                    boards.append(board)
+    return boards, tried
+
+
+# =============================================================================
+# Bank encoding (read by main.gd _setup_grid)
+# =============================================================================
+
+def encode_counts(bombs: int, counts: list[int]) -> str:
+    return "".join("*" if bombs >> cell & 1 else str(counts[cell]) for cell in range(CELLS))
+
+
+def render_bank(boards: list[dict], args_line: str) -> str:
+    def int_rows(values, per_row):
+        return "\n".join("\t" + " ".join(f"{v}," for v in values[i:i + per_row])
+                         for i in range(0, len(values), per_row))
+
+    return "\n".join([
+        "extends RefCounted",
+        "",
+        f"## Minesweeper board bank: Generated by {GENERATOR}.",
+        "## Do not edit by hand; rerun the script (or --check it) instead.",
+        f"## {len(boards)} boards cleared without guessing from START in {BEAT_BUDGET:g} s ({args_line})",
+        "## Cells are row * 5 + col. BOMBS are bitmasks; COUNTS hold each cell's",
+        "## adjacent bombs as a digit ('*' for a bomb); SOLUTIONS list the logic",
+        "## solver's clicks, one letter per cell ('a' = 0).",
+        "",
+        "const BOMBS = [",
+        int_rows([board["bombs"] for board in boards], 8),
+        "]",
+        "",
+        "const START = [",
+        int_rows([board["start"] for board in boards], 20),
+        "]",
+        "",
+        "const COUNTS = [",
+        "\n".join(f'\t"{encode_counts(board["bombs"], board["counts"])}",' for board in boards),
+        "]",
+        "",
+        "const SOLUTIONS = [",
+        "\n".join(f'\t"{"".join(CELL_CHARS[c] for c in board["clicks"])}",' for board in boards),
+        "]",
+        "",
+    ])
+
+
+def read_bank(path: Path) -> list[dict]:
+    try:
+        return parse_bank(path.read_text(encoding="utf-8"))
+    except OSError as e:
+        raise BoardBankError(f"{path}: {e}")
+    except BoardBankError as e:
+        raise BoardBankError(f"{path}: {e}")
+
+
+def parse_bank(text: str) -> list[dict]:
+    def array(name: str) -> list[str]:
+        match = re.search(rf"^const {name} = \[(.*?)^\]", text, re.S | re.M)
+        if not match:
+            raise BoardBankError(f"no {name} array")
+        return [item.strip().strip('"') for item in match.group(1).split(",") if item.strip()]
+
+    bombs, start, counts, solutions = array("BOMBS"), array("START"), array("COUNTS"), array("SOLUTIONS")
+    if not len(bombs) == len(start) == len(counts) == len(solutions):
+        raise BoardBankError("arrays have different lengths")
+    return [{"bombs": int(b), "start": int(s), "counts_text": c, "clicks": [CELL_CHARS.index(ch) for ch in sol]}
+            for b, s, c, sol in zip(bombs, start, counts, solutions)]
+
+
+def validate(boards: list[dict]) -> list[str]:
+    """Problems with a decoded bank: each board is re-counted and re-solved."""
+    problems, seen = [], set()
+    for i, board in enumerate(boards):
+        bombs, start = board["bombs"], board["start"]
+        if bombs & ~FULL or not 0 <= start < CELLS or bombs >> start & 1:
+            problems.append(f"board {i}: bombs or start out of range")
+            continue
+        planes = count_planes(bombs)
+        if board["counts_text"] != encode_counts(bombs, [cell_count(planes, c) for c in range(CELLS)]):
+            problems.append(f"board {i}: counts do not match the bombs")
+        result = solve(bombs, start)
+        if result is None:
+            problems.append(f"board {i}: needs a guess")
+            continue
+        if result[0] != board["clicks"]:
+            problems.append(f"board {i}: click order differs from the solver's")
+        if play_seconds(len(board["clicks"])) > BEAT_BUDGET:
+            problems.append(f"board {i}: {len(board['clicks'])} clicks do not fit {BEAT_BUDGET:g} s")
+        key = canonical_key(bombs)
+        if key in seen:
+            problems.append(f"board {i}: duplicate of an earlier board")
+        seen.add(key)
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the no-guess minesweeper board bank.")
+    parser.add_argument("--count", type=int, default=DEFAULT_COUNT, help=f"Boards to keep (default: {DEFAULT_COUNT})")
+    parser.add_argument("--seed", type=int, default=1, help="First candidate seed (default: 1)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Solver processes (default: CPU count)")
+    parser.add_argument("--min-bombs", type=int, default=DEFAULT_MIN_BOMBS, help=f"(default: {DEFAULT_MIN_BOMBS})")
+    parser.add_argument("--max-bombs", type=int, default=DEFAULT_MAX_BOMBS, help=f"(default: {DEFAULT_MAX_BOMBS})")
+    parser.add_argument("--min-clicks", type=int, default=DEFAULT_MIN_CLICKS,
+                        help=f"Fewest clicks to clear, start included (default: {DEFAULT_MIN_CLICKS})")
+    parser.add_argument("--max-candidates", type=int, default=500_000, help="Stop after this many candidates")
+    parser.add_argument("--output", default=str(BANK_PATH), help="Bank path (default: board_bank.gd next to this script)")
+    parser.add_argument("--check", action="store_true", help="Verify the existing bank instead of generating")
+    args = parser.parse_args()
+
+    output = Path(args.output)
+    if args.check:
+        try:
+            boards = read_bank(output)
+        except BoardBankError as e:
+            print(f"Error: {e}")
+            return 1
+        problems = validate(boards)
+        for problem in problems:
+            print(f"Error: {problem}")
+        if problems:
+            return 1
+        print(f"{output}: {len(boards)} boards OK")
+        return 0
+
+    if not 1 <= args.min_bombs <= args.max_bombs < CELLS:
+        print(f"Error: Need 1 <= --min-bombs <= --max-bombs < {CELLS}")
+        return 1
+
+    boards, tried = generate(args.count, args.seed, args.jobs, args.min_bombs, args.max_bombs,
+                             args.min_clicks, args.max_candidates)
+    if len(boards) < args.count:
+        print(f"Warning: Only {len(boards)} of {args.count} boards after {tried} candidates")
+    if not boards:
+        print("Error: No boards generated")
+        return 1
+    boards.sort(key=lambda b: (len(b["clicks"]), b["rounds"], b["seed"]))
+
+    # Round-trip the encoding and re-solve before writing anything
+    text = render_bank(boards, f"seed {args.seed}, {args.min_bombs}-{args.max_bombs} bombs")
+    problems = validate(parse_bank(text))
+    if problems:
+        for problem in problems:
+            print(f"Error: {problem}")
+        return 1
+    output.write_text(text, encoding="utf-8")
+
+    histogram = {}
+    for board in boards:
+        histogram[len(board["clicks"])] = histogram.get(len(board["clicks"]), 0) + 1
+    print(f"Tried {tried} candidates, kept {len(boards)} boards")
+    print("Clicks: " + ", ".join(f"{c}: {n}" for c, n in sorted(histogram.items())))
+    print(f"Wrote {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -36,41 +36,17 @@ const COLOR_NUMBERS = {
 	8: Color("#e67e22")
 }
 
-# Map data structure: [bomb_positions, goal_positions]
-# Positions are [row, col] pairs
-const MAPS = [
-	{
-		"name": "Corner Safe Zone",
-		"bombs": [[0,4], [1,3], [2,2], [3,1], [4,0]],
-		"goals": [[0,0]],
-		"instruction": "FIND STAR!"
-	},
-	{
-		"name": "Two Islands",
-		"bombs": [[0,0], [0,4], [1,2], [2,1], [2,3], [4,0]],
-		"goals": [[3,2], [4,4]],
-		"instruction": "FIND STARS!"
-	},
-	{
-		"name": "Center Goal",
-		"bombs": [[0,0], [0,1], [0,3], [0,4], [1,0], [1,4], [3,0], [3,4], [4,0], [4,1], [4,3], [4,4]],
-		"goals": [[2,2]],
-		"instruction": "FIND STAR!"
-	},
-	{
-		"name": "Edge Path",
-		"bombs": [[0,2], [1,0], [2,2], [2,3], [3,4], [4,2]],
-		"goals": [[0,4], [4,0]],
-		"instruction": "FIND STARS!"
-	}
-]
+# Boards come from board_bank.gd (generated by generate_boards.py): bombs,
+# precomputed counts and a start cell from which every safe tile can be
+# cleared by logic alone. The start cell is marked with the star.
+const BoardBank = preload("res://games/minesweeper/board_bank.gd")
 
 # Game state
 var grid: Array = []  # 5x5 array of tile data
 var tiles: Array = []  # Visual tile nodes
-var current_map: Dictionary
-var goals_found: int = 0
-var first_click: bool = true
+var board_index: int = -1
+var safe_left: int = 0  # Safe tiles still hidden; 0 = win
+var solution: String = ""  # Logic solver's clicks ('a' = cell 0), used by the test harness
 var game_ended: bool = false
 var time_elapsed: float = 0.0
 const GAME_DURATION: float = 5.0
@@ -80,60 +56,36 @@ const SFX_WIN = preload("res://shared/assets/sfx_win.wav")
 const SFX_LOSE = preload("res://shared/assets/sfx_lose.wav")
 
 func _ready():
-	# Select random map
-	current_map = MAPS.pick_random()
-	instruction = current_map["instruction"]
+	instruction = "CLEAR!"
 	super._ready()
 	
 	_setup_grid()
 	_create_tiles()
 
 func _setup_grid():
-	"""Initialize the 5x5 grid with bomb and goal data."""
-	# Initialize empty grid
+	"""Initialize the 5x5 grid from a random bank board (no counting at runtime)."""
+	board_index = randi() % BoardBank.BOMBS.size()
+	var bombs: int = BoardBank.BOMBS[board_index]
+	var counts: String = BoardBank.COUNTS[board_index]
+	var start: int = BoardBank.START[board_index]
+	solution = BoardBank.SOLUTIONS[board_index]
+	
+	safe_left = 0
 	for row in range(GRID_SIZE):
 		var row_data = []
 		for col in range(GRID_SIZE):
+			var cell = row * GRID_SIZE + col
+			var is_bomb = ((bombs >> cell) & 1) == 1
 			row_data.append({
 				"state": TileState.UNREVEALED,
-				"is_bomb": false,
-				"is_goal": false,
-				"adjacent_bombs": 0,
+				"is_bomb": is_bomb,
+				"is_start": cell == start,
+				"adjacent_bombs": 0 if is_bomb else counts.unicode_at(cell) - 48,  # "0".."8"
 				"revealed": false
 			})
+			if not is_bomb:
+				safe_left += 1
 		grid.append(row_data)
-	
-	# Place bombs
-	for pos in current_map["bombs"]:
-		var row = pos[0]
-		var col = pos[1]
-		grid[row][col]["is_bomb"] = true
-	
-	# Place goals
-	for pos in current_map["goals"]:
-		var row = pos[0]
-		var col = pos[1]
-		grid[row][col]["is_goal"] = true
-	
-	# Calculate adjacent bomb counts
-	for row in range(GRID_SIZE):
-		for col in range(GRID_SIZE):
-			if not grid[row][col]["is_bomb"]:
-				grid[row][col]["adjacent_bombs"] = _count_adjacent_bombs(row, col)
-
-func _count_adjacent_bombs(row: int, col: int) -> int:
-	"""Count bombs in the 8 adjacent cells."""
-	var count = 0
-	for dr in range(-1, 2):
-		for dc in range(-1, 2):
-			if dr == 0 and dc == 0:
-				continue
-			var nr = row + dr
-			var nc = col + dc
-			if nr >= 0 and nr < GRID_SIZE and nc >= 0 and nc < GRID_SIZE:
-				if grid[nr][nc]["is_bomb"]:
-					count += 1
-	return count
 
 func _create_tiles():
 	"""Create visual tile nodes for the grid."""
@@ -165,8 +117,8 @@ func _create_tile(row: int, col: int) -> Control:
 	hover_style.bg_color = COLOR_TILE_HOVER
 	tile.add_theme_stylebox_override("hover", hover_style)
 	
-	# Add goal sparkle if this is a goal tile
-	if grid[row][col]["is_goal"]:
+	# Add goal sparkle on the start tile
+	if grid[row][col]["is_start"]:
 		var sparkle = _create_sparkle()
 		sparkle.position = Vector2(TILE_SIZE - 25, 15)
 		tile.add_child(sparkle)
@@ -214,13 +166,6 @@ func _on_tile_clicked(row: int, col: int):
 	if tile_data["revealed"]:
 		return
 	
-	# First click safety - move bomb if clicked
-	if first_click and tile_data["is_bomb"]:
-		_move_first_bomb(row, col)
-		tile_data = grid[row][col]  # Refresh data
-	
-	first_click = false
-	
 	# Check for bomb BEFORE revealing
 	if tile_data["is_bomb"]:
 		tile_data["revealed"] = true
@@ -232,7 +177,7 @@ func _on_tile_clicked(row: int, col: int):
 	_flood_reveal(row, col)
 	
 	# Check win condition after flood reveal
-	if goals_found >= current_map["goals"].size():
+	if safe_left == 0:
 		_win_game()
 
 func _flood_reveal(start_row: int, start_col: int):
@@ -256,11 +201,11 @@ func _flood_reveal(start_row: int, start_col: int):
 		
 		# Reveal this tile
 		tile_data["revealed"] = true
+		safe_left -= 1
 		_reveal_tile(row, col)
 		
-		# Check if this was a goal
-		if tile_data["is_goal"]:
-			goals_found += 1
+		# Check if this was the start star
+		if tile_data["is_start"]:
 			_play_goal_sound()
 		
 		# If this tile has no adjacent bombs, add neighbors to queue
@@ -272,31 +217,6 @@ func _flood_reveal(start_row: int, start_col: int):
 						continue
 					queue.append([row + dr, col + dc])
 
-func _move_first_bomb(row: int, col: int):
-	"""Move bomb from first click to a random safe square."""
-	# Remove bomb from clicked square
-	grid[row][col]["is_bomb"] = false
-	
-	# Find all safe squares (not bomb, not goal, not clicked)
-	var safe_squares = []
-	for r in range(GRID_SIZE):
-		for c in range(GRID_SIZE):
-			if r == row and c == col:
-				continue
-			if not grid[r][c]["is_bomb"] and not grid[r][c]["is_goal"]:
-				safe_squares.append([r, c])
-	
-	# Move bomb to random safe square
-	if safe_squares.size() > 0:
-		var new_pos = safe_squares.pick_random()
-		grid[new_pos[0]][new_pos[1]]["is_bomb"] = true
-	
-	# Recalculate adjacent bomb counts
-	for r in range(GRID_SIZE):
-		for c in range(GRID_SIZE):
-			if not grid[r][c]["is_bomb"]:
-				grid[r][c]["adjacent_bombs"] = _count_adjacent_bombs(r, c)
-
 func _reveal_tile(row: int, col: int):
 	"""Update tile visual to show revealed state."""
 	var tile = tiles[row][col]
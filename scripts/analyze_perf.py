@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Aggregate performance logs exported by the director's perf monitor.
+
+Logs come from shared/scripts/perf_monitor.gd (enable with ?perf=1 on web or
+"-- --perf" on desktop, export with F10). Each holds per-frame delta and
+process times tagged with the running game, scene load times and the
+intermission overhead (time between the last intermission beat and the next
+game being on screen).
+
+Across all sessions this reports, per game:
+
+- frame time p50/p95/p99 and the share of frames over --frame-budget-ms
+  (frame times are deltas between frames, so a healthy 60 Hz game jitters
+  around 16.7 ms; the default budget of 1.5 vsync intervals counts only
+  frames that missed a vsync)
+- process time p95 (whole scene tree)
+- load time p50/max and how scenes were obtained (cache, threaded, sync)
+- the worst intermission overhead before that game
+
+Games whose frame p95, load p95 or intermission overhead exceed the budgets
+are flagged, slowest first.
+
+Usage:
+    python3 scripts/analyze_perf.py LOG_OR_DIR [...] [--frame-budget-ms MS]
+        [--load-budget-ms MS] [--gap-budget-ms MS] [--json FILE] [--fail-on-flag]
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+SUPPORTED_VERSIONS = (1,)
+NO_GAME = -1  # Frames outside gameplay (perf_monitor.gd NO_GAME)
+OUTSIDE_GAMEPLAY = "(outside gameplay)"
+
+VSYNC_INTERVAL_MS = 1000 / 60
+# Deltas past 1.5 vsync intervals mean at least one refresh was missed
+DEFAULT_FRAME_BUDGET_MS = 1.5 * VSYNC_INTERVAL_MS
+DEFAULT_LOAD_BUDGET_MS = 100.0
+DEFAULT_GAP_BUDGET_MS = 50.0
+
+
+class PerfLogError(ValueError):
+    """Raised when a file is not a readable perf monitor log."""
+
+
+def percentile(values: list, pct: float) -> float | None:
+    """Nearest-rank percentile (same definition as the in-game overlay)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def load_log(path: Path) -> dict:
+    try:
+        with open(path, encoding="utf-8") as f:
+            log = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        raise PerfLogError(f"{path}: {e}")
+    if not isinstance(log, dict) or log.get("version") not in SUPPORTED_VERSIONS:
+        raise PerfLogError(f"{path}: not a perf log (version {log.get('version') if isinstance(log, dict) else '?'})")
+    frames = log.get("frames", {})
+    lengths = {len(frames.get(key, [])) for key in ("frame_ms", "process_ms", "game")}
+    if len(lengths) != 1:
+        raise PerfLogError(f"{path}: frame channels have different lengths")
+    return log
+
+
+def collect_logs(inputs: list[str]) -> list[Path]:
+    paths = []
+    for item in inputs:
+        path = Path(item)
+        paths += sorted(path.glob("*.json")) if path.is_dir() else [path]
+    return paths
+
+
+def aggregate(logs: list[dict]) -> dict:
+    """game id -> {"frame_ms", "process_ms", "loads", "sources", "gaps"} lists across sessions."""
+    games = {}
+
+    def entry(game_id: str) -> dict:
+        return games.setdefault(game_id, {"frame_ms": [], "process_ms": [], "loads": [], "sources": {}, "gaps": []})
+
+    for log in logs:
+        names = log.get("games", [])
+        frames = log["frames"]
+        for frame, process, tag in zip(frames["frame_ms"], frames["process_ms"], frames["game"]):
+            game_id = names[tag] if tag != NO_GAME and 0 <= tag < len(names) else OUTSIDE_GAMEPLAY
+            item = entry(game_id)
+            item["frame_ms"].append(frame)
+            item["process_ms"].append(process)
+        for load in log.get("loads", []):
+            item = entry(load["game"])
+            item["loads"].append(load["ms"])
+            item["sources"][load["source"]] = item["sources"].get(load["source"], 0) + 1
+        for gap in log.get("intermissions", []):
+            entry(gap["game"])["gaps"].append(gap["ms"])
+    return games
+
+
+def summarize(games: dict, frame_budget: float, load_budget: float, gap_budget: float) -> list[dict]:
+    rows = []
+    for game_id, item in games.items():
+        frames = item["frame_ms"]
+        row = {
+            "game": game_id,
+            "frames": len(frames),
+            "frame_p50_ms": percentile(frames, 50),
+            "frame_p95_ms": percentile(frames, 95),
+            "frame_p99_ms": percentile(frames, 99),
+            "over_budget_pct": round(100 * sum(1 for f in frames if f > frame_budget) / len(frames), 2) if frames else None,
+            "process_p95_ms": percentile(item["process_ms"], 95),
+            "loads": len(item["loads"]),
+            "load_p50_ms": percentile(item["loads"], 50),
+            "load_p95_ms": percentile(item["loads"], 95),
+            "load_max_ms": max(item["loads"]) if item["loads"] else None,
+            "load_sources": item["sources"],
+            "gap_max_ms": max(item["gaps"]) if item["gaps"] else None,
+        }
+        flags = []
+        if game_id != OUTSIDE_GAMEPLAY and row["frame_p95_ms"] is not None and row["frame_p95_ms"] > frame_budget:
+            flags.append("frame")
+        if row["load_p95_ms"] is not None and row["load_p95_ms"] > load_budget:
+            flags.append("load")
+        if row["gap_max_ms"] is not None and row["gap_max_ms"] > gap_budget:
+            flags.append("intermission")
+        row["flags"] = flags
+        rows.append(row)
+    # Slowest first: flagged games, then by frame p95
+    rows.sort(key=lambda r: (not r["flags"], -(r["frame_p95_ms"] or 0)))
+    return rows
+
+
+def format_ms(value: float | None) -> str:
+    return "-" if value is None else f"{value:.1f}"
+
+
+def print_report(rows: list[dict], sessions: int, frame_budget: float) -> None:
+    print(f"Sessions: {sessions}, frame budget {frame_budget:.1f} ms")
+    print()
+    header = (f"{'Game':<20} {'Frames':>7} {'p50':>6} {'p95':>6} {'p99':>6} {'>bud%':>6} "
+              f"{'proc95':>7} {'Loads':>6} {'ld p50':>7} {'ld max':>7} {'gap max':>8}  Flags")
+    print(header)
+    print("-" * len(header))
+    for row in rows:
+        over = "-" if row["over_budget_pct"] is None else f"{row['over_budget_pct']:.1f}"
+        print(f"{row['game']:<20} {row['frames']:>7} {format_ms(row['frame_p50_ms']):>6} "
+              f"{format_ms(row['frame_p95_ms']):>6} {format_ms(row['frame_p99_ms']):>6} {over:>6} "
+              f"{format_ms(row['process_p95_ms']):>7} {row['loads']:>6} {format_ms(row['load_p50_ms']):>7} "
+              f"{format_ms(row['load_max_ms']):>7} {format_ms(row['gap_max_ms']):>8}  {', '.join(row['flags'])}")
+    print("(times in ms)")
+
+    flagged = [row for row in rows if row["flags"]]
+    print()
+    if flagged:
+        print("Slowest games:")
+        for row in flagged:
+            print(f"  - {row['game']}: {', '.join(row['flags'])}")
+    else:
+        print("No game exceeds the budgets.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Aggregate perf monitor logs and flag slow games.")
+    parser.add_argument("logs", nargs="+", help="Log files or directories of *.json logs")
+    parser.add_argument("--frame-budget-ms", type=float, default=DEFAULT_FRAME_BUDGET_MS,
+                        help="Budget for the delta between frames, not the work inside one; "
+                             f"jitter around the 60 Hz vsync interval is normal "
+                             f"(default: {DEFAULT_FRAME_BUDGET_MS:.1f}, 1.5 vsync intervals)")
+    parser.add_argument("--load-budget-ms", type=float, default=DEFAULT_LOAD_BUDGET_MS,
+                        help=f"Scene load budget (default: {DEFAULT_LOAD_BUDGET_MS:g})")
+    parser.add_argument("--gap-budget-ms", type=float, default=DEFAULT_GAP_BUDGET_MS,
+                        help=f"Intermission overhead budget (default: {DEFAULT_GAP_BUDGET_MS:g})")
+    parser.add_argument("--json", default=None, metavar="FILE", help="Write the summary as JSON")
+    parser.add_argument("--fail-on-flag", action="store_true", help="Exit 1 when any game is flagged")
+    args = parser.parse_args()
+
+    paths = collect_logs(args.logs)
+    if not paths:
+        print("Error: No logs found")
+        return 1
+    try:
+        logs = [load_log(path) for path in paths]
+    except PerfLogError as e:
+        print(f"Error: {e}")
+        return 1
+
+    rows = summarize(aggregate(logs), args.frame_budget_ms, args.load_budget_ms, args.gap_budget_ms)
+    print_report(rows, len(logs), args.frame_budget_ms)
+
+    if args.json:
+        report = {
+            "sessions": [{"path": str(p), "platform": log.get("platform"), "started_at": log.get("started_at")}
+                         for p, log in zip(paths, logs)],
+            "budgets": {"frame_ms": args.frame_budget_ms, "load_ms": args.load_budget_ms,
+                        "gap_ms": args.gap_budget_ms},
+            "games": rows,
+        }
+        Path(args.json).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"\nWrote {args.json}")
+
+    if args.fail_on_flag and any(row["flags"] for row in rows):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Build the game catalog from games/*/main.tscn and metadata.json.
+
+One place discovers games and validates their metadata; everything else
+reads the result:
+
+- shared/scripts/game_catalog.gd  GameCatalog.GAMES for the director, debugger
+                                  and test harness (no runtime directory scan
+                                  or ResourceLoader.exists checks)
+- shared/game_catalog.json        the same entries plus full metadata, used by
+                                  generate_game_pages.py
+
+Each entry has the game id, title, scene path, the bytes of assets only that
+game uses (its dependency closure minus the core, see split_packs.py) and a
+load cost estimate. The director starts loading costly games earlier (see
+_queue_next_game in director.gd); loading main.tscn pulls in everything else.
+
+Usage:
+    python3 scripts/build_catalog.py [--project-dir DIR]   # write both files
+    python3 scripts/build_catalog.py --check               # exit 1 if invalid or stale
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+from build_utils import write_if_changed
+from split_packs import compute_packs
+
+CATALOG_JSON_PATH = Path("shared") / "game_catalog.json"
+CATALOG_GD_PATH = Path("shared") / "scripts" / "game_catalog.gd"
+
+REQUIRED_STRING_FIELDS = ("title", "description")
+OPTIONAL_STRING_FIELDS = ("og_image", "difficulty", "genre", "playtime", "controls", "one_liner", "tagline")
+OPTIONAL_LIST_FIELDS = ("tags", "seo_keywords", "features")
+
+# Load cost = asset bytes + a fixed overhead per file (open, parse, import
+# lookup). Roughly bytes-equivalent; only the relative order matters.
+LOAD_COST_PER_FILE = 8 * 1024
+
+
+class CatalogError(ValueError):
+    """Raised when a game's metadata.json is missing or malformed."""
+
+
+def validate_metadata(game_id: str, meta) -> list[str]:
+    """Return warnings; raise CatalogError for problems that break pages or the game list."""
+    if not isinstance(meta, dict):
+        raise CatalogError(f"{game_id}: metadata.json must contain an object")
+    for key in REQUIRED_STRING_FIELDS:
+        if not isinstance(meta.get(key), str) or not meta[key].strip():
+            raise CatalogError(f"{game_id}: metadata.json needs a non-empty string '{key}'")
+    for key in OPTIONAL_STRING_FIELDS:
+        if key in meta and not isinstance(meta[key], str):
+            raise CatalogError(f"{game_id}: '{key}' must be a string")
+    for key in OPTIONAL_LIST_FIELDS:
+        if key in meta and not (isinstance(meta[key], list) and all(isinstance(v, str) for v in meta[key])):
+            raise CatalogError(f"{game_id}: '{key}' must be a list of strings")
+
+    known = set(REQUIRED_STRING_FIELDS) | set(OPTIONAL_STRING_FIELDS) | set(OPTIONAL_LIST_FIELDS)
+    return [f"{game_id}: unknown metadata key '{key}'" for key in sorted(set(meta) - known)]
+
+
+def estimate_load_cost(graph, files: list[str]) -> int:
+    """Relative cost of loading a game's own resources on first play."""
+    return graph.size(files) + LOAD_COST_PER_FILE * len(files)
+
+
+def build_catalog(project_dir: Path) -> tuple[dict, list[str]]:
+    """Return ({"games": [entry, ...]}, warnings)."""
+    packs = compute_packs(project_dir)
+    graph = packs["graph"]
+    warnings = []
+    games = []
+    for game_id, files in packs["games"].items():
+        meta_path = project_dir / "games" / game_id / "metadata.json"
+        if not meta_path.exists():
+            raise CatalogError(f"{game_id}: missing metadata.json")
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+        except json.JSONDecodeError as e:
+            raise CatalogError(f"{game_id}: invalid metadata.json: {e}")
+        warnings += validate_metadata(game_id, meta)
+
+        games.append({
+            "id": game_id,
+            "title": meta["title"],
+            "scene": f"res://games/{game_id}/main.tscn",
+            "asset_bytes": graph.size(files),
+            "load_cost": estimate_load_cost(graph, files),
+            "meta": meta,
+        })
+    return {"games": games}, warnings
+
+
+def render_json(catalog: dict) -> str:
+    return json.dumps(catalog, indent=2, ensure_ascii=False) + "\n"
+
+
+def _gd_string(value: str) -> str:
+    return json.dumps(value, ensure_ascii=False)
+
+
+def render_gdscript(catalog: dict) -> str:
+    lines = [
+        "extends RefCounted",
+        "class_name GameCatalog",
+        "",
+        "## Game Catalog: Generated by scripts/build_catalog.py from games/*/metadata.json.",
+        "## Do not edit by hand; rerun the script after adding or changing a game.",
+        "",
+        "const GAMES: Array[Dictionary] = [",
+    ]
+    for game in catalog["games"]:
+        lines += [
+            "\t{",
+            f'\t\t"id": {_gd_string(game["id"])},',
+            f'\t\t"title": {_gd_string(game["title"])},',
+            f'\t\t"scene": {_gd_string(game["scene"])},',
+            f'\t\t"asset_bytes": {game["asset_bytes"]},',
+            f'\t\t"load_cost": {game["load_cost"]},',
+            "\t},",
+        ]
+    lines += [
+        "]",
+        "",
+        "static func ids() -> Array[String]:",
+        "\tvar result: Array[String] = []",
+        "\tfor game in GAMES:",
+        '\t\tresult.append(game["id"])',
+        "\treturn result",
+        "",
+        "static func get_game(game_id: String) -> Dictionary:",
+        "\tfor game in GAMES:",
+        '\t\tif game["id"] == game_id:',
+        "\t\t\treturn game",
+        "\treturn {}",
+        "",
+        "static func load_cost(game_id: String) -> int:",
+        '\treturn get_game(game_id).get("load_cost", 0)',
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def load_catalog(path: Path) -> dict | None:
+    """Read shared/game_catalog.json; None when it hasn't been built."""
+    if not path.exists():
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the game catalog from games/*/metadata.json.")
+    parser.add_argument("--project-dir", default=".", help="Godot project directory (default: .)")
+    parser.add_argument("--check", action="store_true",
+                        help="Validate and fail if the committed catalog is out of date")
+    args = parser.parse_args()
+
+    project_dir = Path(args.project_dir).resolve()
+    try:
+        catalog, warnings = build_catalog(project_dir)
+    except CatalogError as e:
+        print(f"Error: {e}")
+        return 1
+    for warning in warnings:
+        print(f"Warning: {warning}")
+
+    outputs = {
+        project_dir / CATALOG_JSON_PATH: render_json(catalog),
+        project_dir / CATALOG_GD_PATH: render_gdscript(catalog),
+    }
+
+    if args.check:
+        stale = [path for path, content in outputs.items()
+                 if not path.exists() or path.read_text(encoding="utf-8") != content]
+        if stale:
+            print("ERROR: The game catalog is out of date:")
+            for path in stale:
+                print(f"  - {path.relative_to(project_dir)}")
+            print()
+            print("Run: python3 scripts/build_catalog.py")
+            return 1
+        print(f"Game catalog up to date ({len(catalog['games'])} games)")
+        return 0
+
+    for path, content in outputs.items():
+        changed = write_if_changed(path, content.encode("utf-8"))
+        print(f"{'Wrote' if changed else 'Unchanged'}: {path.relative_to(project_dir)}")
+    print(f"Catalog: {len(catalog['games'])} games")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,79 @@
+"""
+File helpers shared by the web build scripts.
+
+Writes are content-addressed: a file is only rewritten when its bytes change,
+and static files are hardlinked (or reflinked) into the build output instead
+of copied, so incremental rebuilds touch only what actually changed.
+"""
+
+import hashlib
+import os
+import shutil
+from pathlib import Path
+
+# Linux FICLONE ioctl (copy-on-write clone on btrfs/XFS/overlayfs)
+FICLONE = 0x40049409
+
+CHUNK_SIZE = 1 << 20
+
+
+def file_digest(path: Path, algorithm: str = "sha256") -> str:
+    """Hex digest of a file's contents, read in chunks."""
+    digest = hashlib.new(algorithm)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def write_if_changed(path: Path, content: bytes) -> bool:
+    """Write ``content`` to ``path`` unless the file already has the same hash.
+
+    Returns True when the file was written.
+    """
+    if path.exists() and path.stat().st_size == len(content):
+        if file_digest(path) == hashlib.sha256(content).hexdigest():
+            return False
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+    return True
+
+
+def _reflink(src: Path, dst: Path) -> bool:
+    try:
+        import fcntl
+    except ImportError:  # Not available on Windows
+        return False
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+        return True
+    except OSError:
+        if dst.exists():
+            dst.unlink()
+        return False
+
+
+def link_or_copy(src: Path, dst: Path) -> str:
+    """Place ``src`` at ``dst`` as cheaply as possible.
+
+    Returns "unchanged" (already the same file or bytes), "hardlinked",
+    "reflinked" or "copied".
+    """
+    if dst.exists():
+        if os.path.samefile(src, dst):
+            return "unchanged"
+        if dst.stat().st_size == src.stat().st_size and file_digest(dst) == file_digest(src):
+            return "unchanged"
+        dst.unlink()
+    try:
+        os.link(src, dst)
+        return "hardlinked"
+    except OSError:
+        pass  # Cross-device or unsupported filesystem
+    if _reflink(src, dst):
+        return "reflinked"
+    shutil.copyfile(src, dst)
+    return "copied"
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Find assets under games/ and shared/ that nothing references.
+
+Builds the static resource graph (see resource_graph.py) and walks it from
+project.godot (main scene, autoloads, icon), following runtime-built paths
+such as ``"res://games/" + id + "/main.tscn"`` into every game. Any exported
+file type under games/ or shared/ that is not reached is reported as an
+orphan with its size. Typical orphans are the generic sounds from
+``generate_sfx_hq.py --all`` and legacy files in shared/assets/.
+
+The export uses "all_resources", so orphans still ship in index.pck. Pass
+--exclude-list to write them one per line, or --write-presets to add them to
+the Web preset's exclude_filter. Pass ``--root res://test_harness.tscn`` so
+the harness script is not reported; the Web preset excludes the harness
+scene and script itself.
+
+Usage:
+    python3 scripts/find_unused_assets.py [--project-dir DIR] [--root RES_PATH ...]
+        [--exclude-list FILE] [--write-presets [PATH]]
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+from build_utils import write_if_changed
+from resource_graph import build_graph, iter_project_files, path_to_res, project_roots
+from split_packs import WEB_PRESET_NAME, _preset_value, _set_preset_value, split_presets
+
+SCAN_DIRS = ("games", "shared")
+
+# File types Godot exports as resources (docs, generators and metadata aren't)
+ASSET_SUFFIXES = {
+    ".png", ".jpg", ".jpeg", ".webp", ".svg",
+    ".wav", ".ogg", ".mp3",
+    ".ttf", ".otf",
+    ".tscn", ".tres", ".res", ".gd", ".gdshader",
+}
+
+
+def find_orphans(project_dir: Path, extra_roots: list[str] | None = None) -> tuple[list, int]:
+    """Return ([(res path, size)], total asset bytes) for unreferenced assets."""
+    graph = build_graph(project_dir)
+    reachable = graph.closure(project_roots(project_dir) + list(extra_roots or []),
+                              follow_dynamic=True)
+
+    orphans, total = [], 0
+    for path in iter_project_files(graph.project_dir):
+        relative = path.relative_to(graph.project_dir)
+        if relative.parts[0] not in SCAN_DIRS or path.suffix.lower() not in ASSET_SUFFIXES:
+            continue
+        size = path.stat().st_size
+        total += size
+        res_path = path_to_res(graph.project_dir, path)
+        if res_path not in reachable:
+            orphans.append((res_path, size))
+    return orphans, total
+
+
+def print_report(orphans: list, total: int) -> None:
+    if not orphans:
+        print("No unreferenced assets found.")
+        return
+
+    by_dir = {}
+    for res_path, size in orphans:
+        by_dir.setdefault(res_path.rsplit("/", 1)[0], []).append((res_path, size))
+
+    for directory, files in sorted(by_dir.items()):
+        dir_bytes = sum(size for _, size in files)
+        print(f"{directory}/  ({len(files)} files, {dir_bytes / 1024:.1f} KB)")
+        for res_path, size in sorted(files):
+            print(f"  {res_path.rsplit('/', 1)[1]:<40} {size / 1024:>8.1f} KB")
+
+    orphan_bytes = sum(size for _, size in orphans)
+    print()
+    print(f"Orphaned: {len(orphans)} files, {orphan_bytes / 1024:.1f} KB "
+          f"({100 * orphan_bytes / max(1, total):.1f}% of {total / 1024:.1f} KB in {', '.join(SCAN_DIRS)}/)")
+
+
+def add_to_exclude_filter(presets_path: Path, res_paths: list[str]) -> bool:
+    """Merge res_paths into the Web preset's exclude_filter."""
+    text = presets_path.read_text(encoding="utf-8")
+    preamble, presets = split_presets(text)
+    for index, section in presets:
+        if _preset_value(section, "name") == WEB_PRESET_NAME:
+            existing = [p for p in (_preset_value(section, "exclude_filter") or "").split(",") if p]
+            merged = existing + [p for p in res_paths if p not in existing]
+            updated = _set_preset_value(section, "exclude_filter", json.dumps(",".join(merged)))
+            return write_if_changed(presets_path, text.replace(section, updated, 1).encode("utf-8"))
+    raise ValueError(f'No "{WEB_PRESET_NAME}" preset in {presets_path}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report assets nothing references.")
+    parser.add_argument("--project-dir", default=".", help="Godot project directory (default: .)")
+    parser.add_argument("--root", action="append", default=[], metavar="RES_PATH",
+                        help="Extra entry point to treat as used (e.g. res://test_harness.tscn)")
+    parser.add_argument("--exclude-list", default=None, metavar="FILE",
+                        help="Write orphaned res:// paths to FILE, one per line")
+    parser.add_argument("--write-presets", nargs="?", const="export_presets.cfg", default=None,
+                        metavar="PATH", help="Add orphans to the Web preset's exclude_filter")
+    args = parser.parse_args()
+
+    project_dir = Path(args.project_dir).resolve()
+    if not (project_dir / "project.godot").exists():
+        print(f"Error: No project.godot in {project_dir}")
+        return 1
+
+    orphans, total = find_orphans(project_dir, args.root)
+    print_report(orphans, total)
+    orphan_paths = [res_path for res_path, _ in orphans]
+
+    if args.exclude_list:
+        Path(args.exclude_list).write_text("".join(f"{p}\n" for p in orphan_paths), encoding="utf-8")
+        print(f"\nWrote exclude list: {args.exclude_list}")
+    if args.write_presets and orphan_paths:
+        try:
+            changed = add_to_exclude_filter(project_dir / args.write_presets, orphan_paths)
+        except ValueError as e:
+            print(f"Error: {e}")
+            return 1
+        print(f"\n{'Updated' if changed else 'Unchanged'}: {args.write_presets}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
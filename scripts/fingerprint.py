@@ -0,0 +1,124 @@
+"""
+Content-hash fingerprinting of the Godot web export.
+
+The export writes fixed names (index.js, index.wasm, index.pck, ...), so the
+multi-megabyte engine and game data can't be cached immutably. This renames
+them to content-hashed names and rewrites the references in the root
+index.html, including the GODOT_CONFIG object the JS loader reads:
+
+    index.js, index.wasm, index.audio.worklet.js  ->  index.<bundle hash>.*
+    index.pck                                     ->  index.<pack hash>.pck
+
+The engine files share one hash because the loader derives their names from
+``executable``; the pack gets its own, so a content-only change leaves the
+cached engine valid. A manifest (asset-manifest.json) maps original names to
+fingerprinted ones for later build steps.
+
+Used by generate_game_pages.py before the game pages are templated from the
+root page. Anything that rewrites the engine files (minification) must run
+before this, or the content no longer matches the hashed name.
+"""
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+
+from build_utils import file_digest, write_if_changed
+
+MANIFEST_NAME = "asset-manifest.json"
+HASH_LENGTH = 12
+
+# Files the loader locates from the ``executable`` base name
+BUNDLE_SUFFIXES = (".js", ".wasm", ".audio.worklet.js", ".audio.position.worklet.js", ".worker.js")
+PACK_SUFFIX = ".pck"
+
+GODOT_CONFIG_PATTERN = re.compile(r"const GODOT_CONFIG = ")
+
+
+def hashed_name(stem: str, digest: str, suffix: str) -> str:
+    """``("index", "0123...", ".wasm")`` -> ``index.0123456789ab.wasm``."""
+    return f"{stem}.{digest[:HASH_LENGTH]}{suffix}"
+
+
+def load_manifest(build_dir: Path) -> dict:
+    """Original name -> fingerprinted name, or {} when the build isn't fingerprinted."""
+    path = build_dir / MANIFEST_NAME
+    if not path.exists():
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def plan_renames(build_dir: Path, stem: str = "index") -> dict:
+    """Compute fingerprinted names for the export's engine files and pack."""
+    bundle = [f"{stem}{suffix}" for suffix in BUNDLE_SUFFIXES
+              if (build_dir / f"{stem}{suffix}").exists()]
+    renames = {}
+    if bundle:
+        digest = hashlib.sha256()
+        for name in bundle:
+            digest.update(f"{name}\0{file_digest(build_dir / name)}\0".encode("utf-8"))
+        bundle_hash = digest.hexdigest()
+        for name in bundle:
+            renames[name] = hashed_name(stem, bundle_hash, name[len(stem):])
+    pack = f"{stem}{PACK_SUFFIX}"
+    if (build_dir / pack).exists():
+        renames[pack] = hashed_name(stem, file_digest(build_dir / pack), PACK_SUFFIX)
+    return renames
+
+
+def rewrite_config(page: str, renames: dict, stem: str = "index") -> str:
+    """Point GODOT_CONFIG's executable, mainPack and fileSizes at the new names."""
+    match = GODOT_CONFIG_PATTERN.search(page)
+    if match is None:
+        raise ValueError("GODOT_CONFIG not found in base HTML")
+    config, end = json.JSONDecoder().raw_decode(page, match.end())
+
+    wasm = renames.get(f"{stem}.wasm")
+    if wasm is not None and config.get("executable") == stem:
+        config["executable"] = wasm[:-len(".wasm")]
+    pack = renames.get(f"{stem}{PACK_SUFFIX}")
+    if pack is not None:
+        config["mainPack"] = pack
+    config["fileSizes"] = {renames.get(name, name): size
+                           for name, size in config.get("fileSizes", {}).items()}
+
+    return page[:match.end()] + json.dumps(config, separators=(",", ":")) + page[end:]
+
+
+def rewrite_references(page: str, renames: dict) -> str:
+    """Replace quoted references (src="index.js", "index.wasm") outside the config."""
+    for name, new_name in renames.items():
+        page = page.replace(f'"{name}"', f'"{new_name}"')
+    return page
+
+
+def fingerprint_build(build_dir: Path, stem: str = "index") -> tuple[dict, bool]:
+    """Fingerprint the export in build_dir and rewrite its root index.html.
+
+    Returns (manifest, whether anything was renamed). Running it again on an
+    already fingerprinted build is a no-op that returns the existing manifest.
+    """
+    renames = plan_renames(build_dir, stem)
+    if not renames:
+        return load_manifest(build_dir), False
+
+    page_path = build_dir / "index.html"
+    page = page_path.read_text(encoding="utf-8")
+    page = rewrite_references(rewrite_config(page, renames, stem), renames)
+
+    # Drop files from a previous fingerprinting pass that are now stale
+    previous = load_manifest(build_dir)
+    manifest = {**previous, **renames}
+    for old_name in previous.values():
+        if old_name not in manifest.values():
+            (build_dir / old_name).unlink(missing_ok=True)
+    for name, new_name in renames.items():
+        os.replace(build_dir / name, build_dir / new_name)
+
+    write_if_changed(page_path, page.encode("utf-8"))
+    content = json.dumps(manifest, indent=2, sort_keys=True) + "\n"
+    write_if_changed(build_dir / MANIFEST_NAME, content.encode("utf-8"))
+    return manifest, True
@@ -6,8 +6,33 @@ This script creates subdirectories for each game in the build output, each conta
 an index.html with game-specific meta tags for social sharing. All pages load the
 same Godot WASM bundle but pre-set the ?game= parameter.
 
+Before templating, the engine files are renamed to content-hashed names and
+the root page is rewritten to match (see fingerprint.py), so they can be
+served with Cache-Control: immutable. Each game page also gets
+<link rel=preload> hints for the engine files found in the build dir, so the
+browser starts fetching the wasm and pack before the loader runs.
+
+Finally a service worker (sw.js) and its precache manifest are written and
+registered from every page, for offline play and instant repeat visits
+(see service_worker.py). When the pages are minified afterwards, generate
+with --no-service-worker and run --service-worker-only after minification,
+so the manifest hashes the pages as served.
+
+Games and their metadata come from shared/game_catalog.json (see
+build_catalog.py); without it, games/ is scanned for main.tscn files.
+
+Games without an assets/og_image.png get a procedurally rendered preview
+(see og_image_renderer.py) when NumPy is available.
+
+With --compress, a final stage writes precompressed .gz/.br/.zst siblings for
+every compressible artifact (see precompress.py). Use --compress-only to run
+just that stage, e.g. after minification has rewritten the pages.
+
 Usage:
     python3 scripts/generate_game_pages.py [--base-url URL] [--games-dir DIR] [--build-dir DIR]
+        [--catalog FILE] [--og-cache-dir DIR] [--no-render-og] [--jobs N] [--incremental]
+        [--no-fingerprint] [--no-service-worker] [--compress | --compress-only]
+    python3 scripts/generate_game_pages.py --service-worker-only [--build-dir DIR]
 
 Environment variables:
     BASE_URL: Base URL for the deployed site (default: https://tombarr.github.io/ai-microgames)
@@ -21,9 +46,25 @@ import html
 import json
 import os
 import re
-import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from build_catalog import CATALOG_JSON_PATH, load_catalog
+from build_utils import link_or_copy, write_if_changed
+from fingerprint import HASH_LENGTH, MANIFEST_NAME, fingerprint_build
+from precompress import precompress
+from service_worker import (
+    PRECACHE_MANIFEST_NAME, SERVICE_WORKER_NAME, register_in_page, registration_script,
+    strip_registration, write_service_worker,
+)
+
+try:
+    from og_image_renderer import DEFAULT_CACHE_DIR as DEFAULT_OG_CACHE_DIR, render_all
+except ImportError:  # NumPy not installed: fall back to the site-wide OG image
+    DEFAULT_OG_CACHE_DIR = ".og_cache"
+    render_all = None
+
 
 # Default configuration - can be overridden by environment variables or CLI args
 DEFAULT_BASE_URL = os.environ.get("BASE_URL", "https://tombarr.github.io/ai-microgames")
@@ -64,12 +105,19 @@ def escape_meta_content(text: str) -> str:
     return html.escape(text, quote=True)
 
 
-def generate_meta_tags(game_id: str, meta: dict, base_url: str, site_name: str) -> str:
-    """Generate OpenGraph and Twitter meta tags for a game."""
+def generate_meta_tags(game_id: str, meta: dict, base_url: str, site_name: str,
+                       has_og_image: bool | None = None) -> str:
+    """Generate OpenGraph and Twitter meta tags for a game.
+
+    ``has_og_image`` overrides the metadata's ``og_image`` field once the
+    caller knows whether a per-game image was actually published.
+    """
     game_url = f"{base_url}/{game_id}/"
     
     # Determine OG image URL
-    if meta.get("og_image"):
+    if has_og_image is None:
+        has_og_image = bool(meta.get("og_image"))
+    if has_og_image:
         og_image_url = f"{base_url}/{game_id}/og_image.png"
     else:
         og_image_url = f"{base_url}/og_image.png"
@@ -117,61 +165,170 @@ def generate_game_script(game_id: str) -> str:
 '''
 
 
-def generate_game_page(game_id: str, base_html: str, games_dir: Path, 
-                       base_url: str, site_name: str) -> str:
+# Preload hints for the engine files, in the order the loader needs them.
+# The loader fetch()es the wasm and pack (CORS mode, hence crossorigin) and
+# loads index.js as a classic script, so nothing here is a modulepreload
+# candidate. Worklets are excluded: their requests use a different
+# destination and would not reuse a preloaded response.
+RESOURCE_HINTS = [
+    (re.compile(r"^index(?:\.[0-9a-f]+)?\.js$"), 'as="script"', "high"),
+    (re.compile(r"\.wasm$"), 'as="fetch" type="application/wasm" crossorigin', "high"),
+    (re.compile(r"\.pck$"), 'as="fetch" type="application/octet-stream" crossorigin', "auto"),
+]
+
+# Files above this size are left to the loader: a preload that large competes
+# with the wasm for bandwidth and may not finish before the engine asks for it
+PRELOAD_MAX_BYTES = 64 * 1024 * 1024
+
+
+def generate_resource_hints(assets: list[str], build_dir: Path,
+                            asset_url=lambda name: f"../{name}") -> str:
+    """Generate <link rel=preload> tags for engine files present in build_dir."""
+    links = []
+    for pattern, attributes, priority in RESOURCE_HINTS:
+        for name in assets:
+            path = build_dir / name
+            if not pattern.search(name) or not path.is_file():
+                continue
+            if path.stat().st_size > PRELOAD_MAX_BYTES:
+                continue
+            fetch_priority = f' fetchpriority="{priority}"' if priority != "auto" else ""
+            links.append(f'    <link rel="preload" href="{asset_url(name)}" {attributes}{fetch_priority}>')
+    if not links:
+        return ""
+    return "\n    <!-- Engine preload hints -->\n" + "\n".join(links) + "\n"
+
+
+# Asset references rewritten to the shared bundle in the parent directory.
+# Since game pages are in subdirectories (e.g., /loop_connect/index.html),
+# src="index.js" becomes src="../index.js", "index.wasm" and the "executable"
+# base name in the loader config become "../index.wasm" and "../index", and
+# favicon/icon hrefs point one level up. Fingerprinted names
+# (index.<hash>.wasm, see fingerprint.py) are matched the same way.
+ASSET_REFERENCE_PATTERNS = [
+    r'(?P<pre>src=")(?P<asset>index\.[^"]+)(?P<post>")',
+    r'(?P<pre>")(?P<asset>index(?:\.[0-9a-f]{%d})?'
+    r'\.(?:wasm|pck|worker\.js|audio\.worklet\.js|audio\.position\.worklet\.js))(?P<post>")'
+    % HASH_LENGTH,
+    # The extensionless base name only counts as an asset under this key
+    r'(?P<pre>"executable"\s*:\s*")(?P<asset>index(?:\.[0-9a-f]{%d})?)(?P<post>")' % HASH_LENGTH,
+    r'(?P<pre>href=")(?P<asset>favicon[^"]*)(?P<post>")',
+    r'(?P<pre>href=")(?P<asset>icon\.[^"]+)(?P<post>")',
+]
+
+# Insertion points: first <head>, first </head>, and every asset reference.
+# Alternation order matters: at a given position the earlier pattern wins,
+# so src="index.wasm" is claimed by the src= rule, not the bare-string rule.
+TEMPLATE_SCANNER = re.compile(
+    "|".join(
+        ["(?P<head_open><head>)", "(?P<head_close></head>)"]
+        + [p.replace("?P<", f"?P<a{i}_") for i, p in enumerate(ASSET_REFERENCE_PATTERNS)]
+    )
+)
+
+HEAD_OPEN = "head_open"
+HEAD_CLOSE = "head_close"
+
+
+class PageTemplate:
+    """Base HTML split once into literal segments and insertion points.
+
+    ``parts`` holds literal strings and ``(kind, name)`` slots: ``("slot",
+    HEAD_OPEN)`` right after ``<head>``, ``("slot", HEAD_CLOSE)`` right
+    before ``</head>``, and ``("asset", filename)`` for each asset reference.
+    Rendering a page is one ``str.join`` over precomputed pieces instead of
+    a full-document scan per rewrite rule.
+    """
+
+    def __init__(self, base_html: str):
+        self.parts = []
+        filled = set()
+        pos = 0
+        for match in TEMPLATE_SCANNER.finditer(base_html):
+            kind = match.lastgroup
+            if kind in (HEAD_OPEN, HEAD_CLOSE):
+                if kind in filled:
+                    continue  # only the first occurrence is an insertion point
+                filled.add(kind)
+                # Content goes after <head> but before </head>
+                cut = match.end() if kind == HEAD_OPEN else match.start()
+                self.parts += [base_html[pos:cut], ("slot", kind)]
+                pos = cut
+                continue
+            rule = kind.split("_", 1)[0]
+            self.parts += [base_html[pos:match.end(f"{rule}_pre")],
+                           ("asset", match.group(f"{rule}_asset"))]
+            pos = match.start(f"{rule}_post")
+        self.parts.append(base_html[pos:])
+        self.assets = sorted({part[1] for part in self.parts
+                              if isinstance(part, tuple) and part[0] == "asset"})
+
+    def render(self, head_open: str = "", head_close: str = "",
+               asset_url=lambda name: f"../{name}") -> str:
+        """Fill the insertion points and return the page."""
+        values = {("slot", HEAD_OPEN): head_open, ("slot", HEAD_CLOSE): head_close}
+        for name in self.assets:
+            values[("asset", name)] = asset_url(name)
+        return "".join(part if isinstance(part, str) else values[part] for part in self.parts)
+
+
+def generate_game_page(game_id: str, template: PageTemplate, games_dir: Path,
+                       base_url: str, site_name: str, has_og_image: bool | None = None,
+                       resource_hints: str = "", meta: dict | None = None) -> str:
     """Generate a complete HTML page for a specific game."""
-    meta = get_game_metadata(games_dir, game_id)
-    meta_tags = generate_meta_tags(game_id, meta, base_url, site_name)
+    if meta is None:
+        meta = get_game_metadata(games_dir, game_id)
+    meta_tags = generate_meta_tags(game_id, meta, base_url, site_name, has_og_image)
     game_script = generate_game_script(game_id)
     
-    # Insert meta tags after <head>
-    modified_html = base_html.replace("<head>", f"<head>{meta_tags}", 1)
-    
-    # Insert game script before </head>
-    modified_html = modified_html.replace("</head>", f"{game_script}</head>", 1)
-    
-    return modified_html
+    # Meta tags go after <head>, preload hints and the game script before
+    # </head>, and asset references point to the parent directory
+    return template.render(head_open=meta_tags, head_close=resource_hints + game_script)
 
 
-def update_asset_paths(html_content: str) -> str:
-    """Update relative asset paths to point to parent directory.
-    
-    Since game pages are in subdirectories (e.g., /loop_connect/index.html),
-    we need to update paths to the shared WASM/JS/PCK files.
+def build_game_page(game_id: str, template: PageTemplate, games_dir: Path, build_dir: Path,
+                    base_url: str, site_name: str, rendered_image: str | None,
+                    incremental: bool, resource_hints: str = "",
+                    meta: dict | None = None) -> tuple[list[str], bool]:
+    """Write one game's index.html and og_image.png.
+
+    Returns (log lines, whether index.html was written). Safe to run from
+    worker threads: it only touches build_dir/<game_id>/.
     """
-    # Patterns to update: src="index.js" -> src="../index.js"
-    # Also handle: "index.wasm", "index.pck", "index.worker.js", etc.
+    log = [f"Generating page for: {game_id}"]
     
-    # Update script src attributes
-    html_content = re.sub(
-        r'src="(index\.[^"]+)"',
-        r'src="../\1"',
-        html_content
-    )
+    # Create game directory
+    game_build_dir = build_dir / game_id
+    game_build_dir.mkdir(exist_ok=True)
     
-    # Update any other index.* references (like in JavaScript strings)
-    # Be careful not to double-replace
-    html_content = re.sub(
-        r'"(index\.(?:wasm|pck|worker\.js|audio\.worklet\.js))"',
-        r'"../\1"',
-        html_content
-    )
-    
-    # Update favicon if present
-    html_content = re.sub(
-        r'href="(favicon[^"]*)"',
-        r'href="../\1"',
-        html_content
-    )
+    # Link OG image if exists (hardlink/reflink, falling back to a copy)
+    og_image_src = games_dir / game_id / "assets" / "og_image.png"
+    if og_image_src.exists():
+        og_image_dst = game_build_dir / "og_image.png"
+        if not incremental and og_image_dst.exists():
+            og_image_dst.unlink()
+        log.append(f"  og_image.png: {link_or_copy(og_image_src, og_image_dst)}")
+    elif rendered_image is not None:
+        log.append(f"  og_image.png: rendered ({rendered_image})")
+    else:
+        log.append(f"  Warning: No og_image.png found for {game_id}")
+    has_og_image = og_image_src.exists() or rendered_image is not None
     
-    # Update icon.svg or icon.png
-    html_content = re.sub(
-        r'href="(icon\.[^"]+)"',
-        r'href="../\1"',
-        html_content
+    # Generate HTML with updated paths
+    game_html = generate_game_page(
+        game_id, template, games_dir, base_url, site_name, has_og_image, resource_hints, meta
     )
     
-    return html_content
+    # Write HTML (in incremental mode only when the content hash changed)
+    html_path = game_build_dir / "index.html"
+    content = game_html.encode("utf-8")
+    if incremental:
+        written = write_if_changed(html_path, content)
+    else:
+        html_path.write_bytes(content)
+        written = True
+    log.append(f"  {'Created' if written else 'Unchanged'}: {html_path}")
+    return log, written
 
 
 def discover_games(games_dir: Path) -> list[str]:
@@ -187,6 +344,20 @@ def discover_games(games_dir: Path) -> list[str]:
     return sorted(games)
 
 
+def write_service_worker_stage(build_dir: Path, base_html_path: Path, game_pages: bool = False) -> None:
+    """Register the worker in the root page (and, with game_pages, each game page), then write it.
+
+    Runs after every page is final, so the precache manifest hashes them as served.
+    """
+    register_in_page(base_html_path)
+    if game_pages:
+        for page_path in sorted(build_dir.glob("*/index.html")):
+            register_in_page(page_path, "../")
+    manifest = write_service_worker(build_dir, HASH_LENGTH)
+    print(f"Wrote {SERVICE_WORKER_NAME} and {PRECACHE_MANIFEST_NAME} "
+          f"({len(manifest['files'])} files, version {manifest['version']})")
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Generate individual HTML pages for each game with OG/Twitter meta tags.",
@@ -212,81 +383,187 @@ def main():
         default=DEFAULT_SITE_NAME,
         help=f"Site name for meta tags (env: SITE_NAME, default: {DEFAULT_SITE_NAME})"
     )
+    parser.add_argument(
+        "--catalog",
+        default=str(CATALOG_JSON_PATH),
+        help=f"Game catalog from build_catalog.py (default: {CATALOG_JSON_PATH})"
+    )
+    parser.add_argument(
+        "--og-cache-dir",
+        default=DEFAULT_OG_CACHE_DIR,
+        help=f"Cache for procedurally rendered OG images (default: {DEFAULT_OG_CACHE_DIR})"
+    )
+    parser.add_argument(
+        "--no-render-og",
+        action="store_true",
+        help="Don't render OG images for games missing og_image.png"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker threads for rendering and writing pages (default: CPU count)"
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only rewrite pages whose content hash changed"
+    )
+    parser.add_argument(
+        "--no-fingerprint",
+        action="store_true",
+        help="Keep the export's index.* names instead of content-hashed ones"
+    )
+    parser.add_argument(
+        "--no-service-worker",
+        action="store_true",
+        help="Don't generate or register the offline service worker"
+    )
+    parser.add_argument(
+        "--service-worker-only",
+        action="store_true",
+        help="Skip page generation; register and write the service worker for the pages in the build dir"
+    )
+    parser.add_argument(
+        "--compress",
+        action="store_true",
+        help="Write precompressed .gz/.br/.zst siblings after generating pages"
+    )
+    parser.add_argument(
+        "--compress-only",
+        action="store_true",
+        help="Skip page generation and only run the compression stage"
+    )
     args = parser.parse_args()
+    start_time = time.perf_counter()
     
     games_dir = Path(args.games_dir)
     build_dir = Path(args.build_dir)
     base_url = args.base_url.rstrip("/")
     
+    if args.compress_only:
+        if not build_dir.exists():
+            print(f"Error: Build directory not found: {build_dir}")
+            return 1
+        return precompress(build_dir, args.jobs)
+    
+    base_html_path = build_dir / "index.html"
+    if args.service_worker_only:
+        if not base_html_path.exists():
+            print(f"Error: Base HTML not found: {base_html_path}")
+            return 1
+        write_service_worker_stage(build_dir, base_html_path, game_pages=True)
+        return 0
+    
     # Validate paths
     if not games_dir.exists():
         print(f"Error: Games directory not found: {games_dir}")
         return 1
     
-    base_html_path = build_dir / "index.html"
     if not base_html_path.exists():
         print(f"Error: Base HTML not found: {base_html_path}")
         return 1
     
+    # Fingerprint engine files and rewrite the root page before templating it
+    if not args.no_fingerprint:
+        try:
+            manifest, renamed = fingerprint_build(build_dir)
+        except ValueError as e:
+            print(f"Error: {e}")
+            return 1
+        if renamed:
+            print(f"Fingerprinted {len(manifest)} files (manifest: {build_dir / MANIFEST_NAME})")
+            for name, hashed in sorted(manifest.items()):
+                print(f"  {name} -> {hashed}")
+        elif manifest:
+            print(f"Already fingerprinted ({len(manifest)} files in {MANIFEST_NAME})")
+    
     # Read base HTML
     print(f"Reading base HTML from: {base_html_path}")
     with open(base_html_path, encoding="utf-8") as f:
         base_html = f.read()
+    # The root page may carry a registration snippet from a previous run
+    template = PageTemplate(strip_registration(base_html))
+    resource_hints = generate_resource_hints(template.assets, build_dir)
+    if not args.no_service_worker:
+        resource_hints += registration_script("../")
     
-    # Discover games
-    games = discover_games(games_dir)
+    # Games and metadata from the catalog, falling back to a directory scan
+    catalog = load_catalog(Path(args.catalog))
+    if catalog is not None:
+        games = [game["id"] for game in catalog["games"]]
+        metadata = {game["id"]: {**DEFAULT_META, **game["meta"]} for game in catalog["games"]}
+        print(f"Using game catalog: {args.catalog}")
+    else:
+        games = discover_games(games_dir)
+        metadata = {}
     if not games:
         print(f"Warning: No games found in {games_dir}")
         return 0
     
     print(f"Found {len(games)} games: {', '.join(games)}")
     print(f"Base URL: {base_url}")
+    print(f"Preload hints: {resource_hints.count('<link ')}")
     print()
     
     # Track missing images
-    missing_images = []
-    
-    # Generate pages for each game
-    for game_id in games:
-        print(f"Generating page for: {game_id}")
-        
-        # Create game directory
-        game_build_dir = build_dir / game_id
-        game_build_dir.mkdir(exist_ok=True)
-        
-        # Generate HTML with updated paths
-        game_html = generate_game_page(
-            game_id, base_html, games_dir, base_url, args.site_name
-        )
-        game_html = update_asset_paths(game_html)
-        
-        # Write HTML
-        html_path = game_build_dir / "index.html"
-        with open(html_path, "w", encoding="utf-8") as f:
-            f.write(game_html)
-        print(f"  Created: {html_path}")
-        
-        # Copy OG image if exists
-        og_image_src = games_dir / game_id / "assets" / "og_image.png"
-        if og_image_src.exists():
-            og_image_dst = game_build_dir / "og_image.png"
-            shutil.copy(og_image_src, og_image_dst)
-            print(f"  Copied: og_image.png")
+    missing_images = [
+        game_id for game_id in games
+        if not (games_dir / game_id / "assets" / "og_image.png").exists()
+    ]
+
+    # Render procedural OG images for games that don't ship one (in parallel)
+    rendered_images = {}
+    if missing_images and not args.no_render_og:
+        if render_all is None:
+            print("Warning: NumPy not available, skipping procedural OG images")
         else:
-            missing_images.append(game_id)
-            print(f"  Warning: No og_image.png found for {game_id}")
+            print(f"Rendering OG images for {len(missing_images)} games...")
+            rendered_images = render_all(
+                [(game_id, build_dir / game_id / "og_image.png") for game_id in missing_images],
+                games_dir,
+                Path(args.og_cache_dir),
+                args.jobs,
+            )
+            print()
+    
+    # Generate pages for each game across a thread pool; logs print in game order
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        results = list(pool.map(
+            lambda game_id: build_game_page(
+                game_id, template, games_dir, build_dir, base_url, args.site_name,
+                rendered_images.get(game_id), args.incremental, resource_hints,
+                metadata.get(game_id)
+            ),
+            games,
+        ))
+    for log, _ in results:
+        print("\n".join(log))
     
+    written = sum(1 for _, was_written in results if was_written)
+    elapsed = time.perf_counter() - start_time
     print()
-    print(f"Generated {len(games)} game pages")
+    print(f"Generated {len(games)} game pages in {elapsed:.2f}s "
+          f"({written} written, {len(games) - written} skipped)")
     
-    if missing_images:
+    unresolved = [game_id for game_id in missing_images if game_id not in rendered_images]
+    if unresolved:
         print()
         print("Missing og_image.png files:")
-        for game_id in missing_images:
+        for game_id in unresolved:
             print(f"  - games/{game_id}/assets/og_image.png")
         print()
         print("These games will use the default OG image.")
     
+    # Service worker last, so the precache manifest hashes the final pages
+    if not args.no_service_worker:
+        print()
+        write_service_worker_stage(build_dir, base_html_path)
+    
+    if args.compress:
+        print()
+        return precompress(build_dir, args.jobs)
+    
     return 0
 
 
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+Load test the leaderboard API with a realistic mix of submits and reads.
+
+Every finished run in the game does an add_entry POST followed by a full
+top-N GET (_load_leaderboard), while opening the leaderboard screen only
+reads. Virtual players replay that mix in a loop: with probability
+--submit-ratio an iteration is a finished run (POST + GET), otherwise a
+view (GET).
+
+Concurrency ramps through --stages (one stage per level, --stage-seconds
+each). Requests go over a pool of keep-alive connections (--pool-size,
+default: the highest stage), so the numbers reflect the server rather than
+TCP/TLS handshakes. Each stage reports throughput, p50/p95/p99 latency per
+request type and the error rate, as a terminal table and optionally JSON.
+
+Defaults target the local stand-in (leaderboard_server.py); pass --url and
+--key to hit another PostgREST endpoint. Only do that against a project you
+own, since submits write real rows.
+
+Usage:
+    python3 scripts/leaderboard_load.py [--url URL] [--key KEY] [--table NAME]
+        [--stages 10,50,100] [--stage-seconds S] [--submit-ratio R] [--pool-size N]
+        [--think-ms MS] [--json FILE] [--max-error-rate R]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import ssl
+import string
+import time
+from urllib.parse import urlsplit
+
+DEFAULT_URL = "http://127.0.0.1:8787"
+DEFAULT_KEY = "local"
+DEFAULT_TABLE = "leaderboard"
+DEFAULT_STAGES = "10,50,100,200"
+DEFAULT_STAGE_SECONDS = 10.0
+DEFAULT_SUBMIT_RATIO = 0.3
+TOP_N = 10  # leaderboard_manager.gd MAX_ENTRIES
+
+REQUEST_TIMEOUT = 10.0
+PERCENTILES = (50, 95, 99)
+
+
+class HttpError(Exception):
+    """Raised for transport failures and unexpected status codes."""
+
+
+# =============================================================================
+# Pooled HTTP/1.1 client
+# =============================================================================
+
+class Connection:
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    def close(self) -> None:
+        self.writer.close()
+
+    async def request(self, method: str, host: str, path: str, headers: dict,
+                      body: bytes = b"") -> tuple[int, dict, bytes]:
+        lines = [f"{method} {path} HTTP/1.1", f"Host: {host}", "Connection: keep-alive",
+                 f"Content-Length: {len(body)}"]
+        lines += [f"{key}: {value}" for key, value in headers.items()]
+        self.writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+        await self.writer.drain()
+
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise HttpError("connection closed")
+        parts = status_line.decode("latin-1").split(" ", 2)
+        if len(parts) < 2 or not parts[1].isdigit():
+            raise HttpError(f"bad status line {status_line!r}")
+        status = int(parts[1])
+
+        response_headers = {}
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            key, _, value = line.decode("latin-1").partition(":")
+            response_headers[key.strip().lower()] = value.strip()
+
+        if response_headers.get("transfer-encoding", "").lower() == "chunked":
+            data = bytearray()
+            while True:
+                size = int((await self.reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    await self.reader.readline()
+                    break
+                data += await self.reader.readexactly(size)
+                await self.reader.readline()
+            return status, response_headers, bytes(data)
+        length = int(response_headers.get("content-length") or 0)
+        return status, response_headers, await self.reader.readexactly(length) if length else b""
+
+
+class ConnectionPool:
+    """At most `size` keep-alive connections, opened lazily and reused."""
+
+    def __init__(self, url: str, size: int):
+        parts = urlsplit(url)
+        self.secure = parts.scheme == "https"
+        self.hostname = parts.hostname
+        self.port = parts.port or (443 if self.secure else 80)
+        self.host_header = parts.netloc
+        self.base_path = parts.path.rstrip("/")
+        self.idle = asyncio.LifoQueue()
+        self.slots = asyncio.Semaphore(size)
+        self.opened = 0
+
+    async def _open(self) -> Connection:
+        context = ssl.create_default_context() if self.secure else None
+        reader, writer = await asyncio.open_connection(self.hostname, self.port, ssl=context)
+        self.opened += 1
+        return Connection(reader, writer)
+
+    async def request(self, method: str, path: str, headers: dict, body: bytes = b"") -> tuple[int, bytes]:
+        async with self.slots:
+            connection = self.idle.get_nowait() if not self.idle.empty() else await self._open()
+            try:
+                status, response_headers, data = await asyncio.wait_for(
+                    connection.request(method, self.host_header, self.base_path + path, headers, body),
+                    REQUEST_TIMEOUT)
+            except BaseException:
+                connection.close()
+                raise
+            if response_headers.get("connection", "").lower() == "close":
+                connection.close()
+            else:
+                self.idle.put_nowait(connection)
+            return status, data
+
+    def close(self) -> None:
+        while not self.idle.empty():
+            self.idle.get_nowait().close()
+
+
+# =============================================================================
+# Scenario
+# =============================================================================
+
+class Recorder:
+    """Latencies (seconds) and error counts per request type."""
+
+    def __init__(self):
+        self.latencies = {"read": [], "submit": []}
+        self.errors = {"read": 0, "submit": 0}
+        self.error_samples = {}
+
+    def record(self, kind: str, seconds: float | None, error: str | None = None) -> None:
+        if error is None:
+            self.latencies[kind].append(seconds)
+        else:
+            self.errors[kind] += 1
+            self.error_samples[error] = self.error_samples.get(error, 0) + 1
+
+
+async def timed(recorder: Recorder, kind: str, call, expected: int) -> None:
+    start = time.perf_counter()
+    try:
+        status, _ = await call()
+    except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, HttpError, ValueError) as e:
+        recorder.record(kind, None, type(e).__name__)
+        return
+    if status != expected:
+        recorder.record(kind, None, f"HTTP {status}")
+    else:
+        recorder.record(kind, time.perf_counter() - start)
+
+
+async def player(pool: ConnectionPool, args, recorder: Recorder, deadline: float) -> None:
+    auth = {"apikey": args.key, "Authorization": f"Bearer {args.key}"}
+    read_path = f"/rest/v1/{args.table}?select=*&order=score.desc&limit={TOP_N}"
+    submit_path = f"/rest/v1/{args.table}"
+    submit_headers = {**auth, "Content-Type": "application/json", "Prefer": "return=representation"}
+
+    while time.perf_counter() < deadline:
+        if random.random() < args.submit_ratio:
+            body = json.dumps({
+                "name": "".join(random.choices(string.ascii_uppercase, k=3)),
+                "score": int(random.expovariate(1 / 15)),
+            }).encode("utf-8")
+            await timed(recorder, "submit",
+                        lambda: pool.request("POST", submit_path, submit_headers, body), 201)
+        await timed(recorder, "read", lambda: pool.request("GET", read_path, auth), 200)
+        if args.think_ms:
+            await asyncio.sleep(random.uniform(0, 2 * args.think_ms) / 1000)
+
+
+async def run_stage(pool: ConnectionPool, args, concurrency: int) -> dict:
+    recorder = Recorder()
+    start = time.perf_counter()
+    deadline = start + args.stage_seconds
+    await asyncio.gather(*(player(pool, args, recorder, deadline) for _ in range(concurrency)))
+    return summarize(concurrency, time.perf_counter() - start, recorder)
+
+
+# =============================================================================
+# Report
+# =============================================================================
+
+def percentile(sorted_values: list, pct: float) -> float | None:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return None
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def latency_stats(values: list) -> dict:
+    values = sorted(values)
+    stats = {f"p{p}_ms": (None if percentile(values, p) is None else round(percentile(values, p) * 1000, 2))
+             for p in PERCENTILES}
+    stats["mean_ms"] = round(1000 * sum(values) / len(values), 2) if values else None
+    return stats
+
+
+def summarize(concurrency: int, elapsed: float, recorder: Recorder) -> dict:
+    ok = {kind: len(values) for kind, values in recorder.latencies.items()}
+    total = sum(ok.values()) + sum(recorder.errors.values())
+    return {
+        "concurrency": concurrency,
+        "seconds": round(elapsed, 2),
+        "requests": total,
+        "throughput_rps": round(total / elapsed, 1) if elapsed else 0.0,
+        "error_rate": round(sum(recorder.errors.values()) / total, 4) if total else 0.0,
+        "errors": recorder.error_samples,
+        "read": {"ok": ok["read"], "errors": recorder.errors["read"],
+                 **latency_stats(recorder.latencies["read"])},
+        "submit": {"ok": ok["submit"], "errors": recorder.errors["submit"],
+                   **latency_stats(recorder.latencies["submit"])},
+        "all": latency_stats(recorder.latencies["read"] + recorder.latencies["submit"]),
+    }
+
+
+def format_ms(value: float | None) -> str:
+    return "-" if value is None else f"{value:.1f}"
+
+
+def print_table(stages: list[dict]) -> None:
+    header = (f"{'Conc':>5} {'Reqs':>8} {'RPS':>9} {'Err%':>6}  "
+              f"{'read p50':>9} {'p95':>7} {'p99':>7}  {'submit p50':>10} {'p95':>7} {'p99':>7}")
+    print(header)
+    print("-" * len(header))
+    for stage in stages:
+        read, submit = stage["read"], stage["submit"]
+        print(f"{stage['concurrency']:>5} {stage['requests']:>8} {stage['throughput_rps']:>9.1f} "
+              f"{100 * stage['error_rate']:>6.2f}  "
+              f"{format_ms(read['p50_ms']):>9} {format_ms(read['p95_ms']):>7} {format_ms(read['p99_ms']):>7}  "
+              f"{format_ms(submit['p50_ms']):>10} {format_ms(submit['p95_ms']):>7} "
+              f"{format_ms(submit['p99_ms']):>7}")
+    print("(latencies in ms)")
+    errors = {}
+    for stage in stages:
+        for error, count in stage["errors"].items():
+            errors[error] = errors.get(error, 0) + count
+    if errors:
+        print()
+        print("Errors: " + ", ".join(f"{error} x{count}" for error, count in sorted(errors.items())))
+
+
+async def run(args, stages: list[int]) -> tuple[list[dict], int]:
+    pool = ConnectionPool(args.url, args.pool_size or max(stages))
+    results = []
+    try:
+        for concurrency in stages:
+            print(f"Stage: {concurrency} players for {args.stage_seconds:g}s...")
+            results.append(await run_stage(pool, args, concurrency))
+    finally:
+        pool.close()
+    return results, pool.opened
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test leaderboard submits and top-N reads.")
+    parser.add_argument("--url", default=DEFAULT_URL, help=f"API base URL (default: {DEFAULT_URL})")
+    parser.add_argument("--key", default=DEFAULT_KEY, help="API key sent as apikey/Bearer")
+    parser.add_argument("--table", default=DEFAULT_TABLE, help=f"Table name (default: {DEFAULT_TABLE})")
+    parser.add_argument("--stages", default=DEFAULT_STAGES,
+                        help=f"Comma-separated concurrency levels (default: {DEFAULT_STAGES})")
+    parser.add_argument("--stage-seconds", type=float, default=DEFAULT_STAGE_SECONDS,
+                        help=f"Duration of each stage (default: {DEFAULT_STAGE_SECONDS:g})")
+    parser.add_argument("--submit-ratio", type=float, default=DEFAULT_SUBMIT_RATIO,
+                        help=f"Fraction of iterations that submit before reading (default: {DEFAULT_SUBMIT_RATIO})")
+    parser.add_argument("--pool-size", type=int, default=None,
+                        help="Keep-alive connections (default: highest stage)")
+    parser.add_argument("--think-ms", type=float, default=0.0,
+                        help="Mean pause between a player's iterations")
+    parser.add_argument("--json", default=None, metavar="FILE", help="Write the results as JSON")
+    parser.add_argument("--max-error-rate", type=float, default=None,
+                        help="Exit 1 when any stage's error rate exceeds this fraction")
+    args = parser.parse_args()
+
+    try:
+        stages = [int(level) for level in args.stages.split(",") if level.strip()]
+    except ValueError:
+        print(f"Error: Invalid --stages: {args.stages}")
+        return 1
+    if not stages or min(stages) < 1:
+        print("Error: --stages needs positive concurrency levels")
+        return 1
+    if urlsplit(args.url).scheme not in ("http", "https"):
+        print(f"Error: Unsupported URL: {args.url}")
+        return 1
+
+    print(f"Target: {args.url} (table {args.table}, submit ratio {args.submit_ratio:g})")
+    results, opened = asyncio.run(run(args, stages))
+    print()
+    print_table(results)
+    print(f"Connections opened: {opened}")
+
+    if args.json:
+        report = {
+            "url": args.url,
+            "table": args.table,
+            "submit_ratio": args.submit_ratio,
+            "stage_seconds": args.stage_seconds,
+            "connections_opened": opened,
+            "stages": results,
+        }
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+        print(f"Wrote {args.json}")
+
+    if args.max_error_rate is not None:
+        worst = max(stage["error_rate"] for stage in results)
+        if worst > args.max_error_rate:
+            print(f"Error rate {100 * worst:.2f}% exceeds {100 * args.max_error_rate:.2f}%")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
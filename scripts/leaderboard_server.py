@@ -0,0 +1,562 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Supabase leaderboard API, for offline development and
+load testing.
+
+Implements the PostgREST subset leaderboard_manager.gd uses:
+
+    GET  /rest/v1/<table>?select=*&order=score.desc&limit=N[&offset=M]
+    POST /rest/v1/<table>   (object or array body, Prefer: return=representation)
+
+Reads carry a strong ETag (a hash of the response body) and honor
+If-None-Match with 304 Not Modified. Responses are cached per query until
+the next insert, so revalidating an unchanged leaderboard costs one lookup.
+
+Plus a rank lookup in PostgREST RPC style:
+
+    GET  /rest/v1/rpc/leaderboard_rank?score=N   -> 1-based rank of that score
+    POST /rest/v1/rpc/leaderboard_rank           {"score": N}
+
+Rows are kept in an order-statistics index keyed by (score desc, id), so
+top-N reads cost O(log n + N) and rank lookups O(log n). The index is
+sortedcontainers.SortedList when installed, otherwise the indexable skip
+list below. Other orderings fall back to sorting the table. With --db, rows
+are loaded from and written through to a SQLite file.
+
+Connections are kept alive (HTTP/1.1) and CORS preflights are answered, so
+web builds served from localhost can use it too. API keys are accepted but
+not checked.
+
+Point the game at it with an override.cfg next to project.godot:
+
+    [microgames]
+    leaderboard/url="http://127.0.0.1:8787"
+
+or the LEADERBOARD_URL environment variable (desktop), or ?leaderboard=URL
+on a web build served from localhost (see leaderboard_manager.gd).
+
+Usage:
+    python3 scripts/leaderboard_server.py [--host HOST] [--port PORT] [--db FILE]
+        [--table NAME] [--seed N]
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+import sqlite3
+import string
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib.parse import parse_qsl, urlsplit
+
+try:
+    from sortedcontainers import SortedList
+except ImportError:
+    SortedList = None
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8787
+DEFAULT_TABLE = "leaderboard"
+
+REST_PREFIX = "/rest/v1/"
+RPC_PREFIX = REST_PREFIX + "rpc/"
+RANK_FUNCTION = "leaderboard_rank"
+
+COLUMNS = ("id", "name", "score", "created_at")
+INDEXED_ORDER = [("score", True)]  # (column, descending)
+
+MAX_BODY_BYTES = 1024 * 1024
+MAX_NAME_LENGTH = 32
+
+CORS_HEADERS = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Methods": "GET, POST, OPTIONS",
+    "Access-Control-Allow-Headers": "apikey, authorization, content-type, prefer, if-none-match",
+    "Access-Control-Expose-Headers": "content-range, etag",
+    "Access-Control-Max-Age": "86400",
+}
+
+REASONS = {
+    200: "OK", 201: "Created", 204: "No Content", 304: "Not Modified", 400: "Bad Request",
+    404: "Not Found", 405: "Method Not Allowed", 413: "Payload Too Large",
+}
+
+
+class ApiError(ValueError):
+    """A request error, reported as a PostgREST-style JSON body."""
+
+    def __init__(self, status: int, code: str, message: str):
+        super().__init__(message)
+        self.status = status
+        self.code = code
+
+
+# =============================================================================
+# Order-statistics index
+# =============================================================================
+
+class SkipList:
+    """Sorted multiset with O(log n) add, remove, rank and positional access.
+
+    Each link stores how many elements it skips (its width), so walking
+    down the levels while summing widths finds positions as well as keys.
+    """
+
+    MAX_LEVEL = 32
+
+    class _Node:
+        __slots__ = ("key", "next", "width")
+
+        def __init__(self, key, level: int):
+            self.key = key
+            self.next = [None] * level
+            self.width = [1] * level
+
+    def __init__(self, keys=()):
+        self._head = self._Node(None, self.MAX_LEVEL)
+        self._size = 0
+        for key in keys:
+            self.add(key)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _random_level(self) -> int:
+        level = 1
+        while level < self.MAX_LEVEL and random.getrandbits(1):
+            level += 1
+        return level
+
+    def _path(self, key, inclusive: bool) -> tuple[list, list]:
+        """Last node before key on each level, and the position steps taken there."""
+        chain = [None] * self.MAX_LEVEL
+        steps = [0] * self.MAX_LEVEL
+        node = self._head
+        for level in reversed(range(self.MAX_LEVEL)):
+            while node.next[level] is not None and (
+                    node.next[level].key <= key if inclusive else node.next[level].key < key):
+                steps[level] += node.width[level]
+                node = node.next[level]
+            chain[level] = node
+        return chain, steps
+
+    def add(self, key) -> None:
+        chain, steps_at_level = self._path(key, inclusive=True)
+        level_count = self._random_level()
+        node = self._Node(key, level_count)
+        steps = 0
+        for level in range(level_count):
+            prev = chain[level]
+            node.next[level] = prev.next[level]
+            prev.next[level] = node
+            node.width[level] = prev.width[level] - steps
+            prev.width[level] = steps + 1
+            steps += steps_at_level[level]
+        for level in range(level_count, self.MAX_LEVEL):
+            chain[level].width[level] += 1
+        self._size += 1
+
+    def remove(self, key) -> None:
+        chain, _ = self._path(key, inclusive=False)
+        node = chain[0].next[0]
+        if node is None or node.key != key:
+            raise ValueError(f"{key!r} not in list")
+        for level in range(self.MAX_LEVEL):
+            prev = chain[level]
+            if prev.next[level] is node:
+                prev.width[level] += node.width[level] - 1
+                prev.next[level] = node.next[level]
+            else:
+                prev.width[level] -= 1
+        self._size -= 1
+
+    def bisect_left(self, key) -> int:
+        """Number of elements smaller than key."""
+        _, steps = self._path(key, inclusive=False)
+        return sum(steps)
+
+    def islice(self, start: int = 0, stop: int | None = None):
+        stop = self._size if stop is None else min(stop, self._size)
+        if start >= stop:
+            return
+        # Positions are 1-based: the head sits at 0
+        node, remaining = self._head, start + 1
+        for level in reversed(range(self.MAX_LEVEL)):
+            while node.next[level] is not None and node.width[level] <= remaining:
+                remaining -= node.width[level]
+                node = node.next[level]
+        for _ in range(stop - start):
+            yield node.key
+            node = node.next[0]
+
+
+def make_index():
+    """Both provide add, remove, bisect_left, islice and len."""
+    return SortedList() if SortedList is not None else SkipList()
+
+
+# =============================================================================
+# Table
+# =============================================================================
+
+class LeaderboardTable:
+    """Rows by id plus the (score desc, id) index, optionally backed by SQLite."""
+
+    def __init__(self, name: str, db_path: Path | None = None):
+        self.name = name
+        self.rows = {}
+        self.index = make_index()
+        self.next_id = 1
+        self.version = 0  # Bumped on every write; keys the read cache
+        self.db = None
+        if db_path is not None:
+            self._open_db(db_path)
+
+    def _open_db(self, db_path: Path) -> None:
+        self.db = sqlite3.connect(db_path)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute(
+            f'CREATE TABLE IF NOT EXISTS "{self.name}" ('
+            "id INTEGER PRIMARY KEY, name TEXT NOT NULL, "
+            "score INTEGER NOT NULL, created_at TEXT NOT NULL)"
+        )
+        for row_id, name, score, created_at in self.db.execute(
+                f'SELECT id, name, score, created_at FROM "{self.name}"'):
+            self._store({"id": row_id, "name": name, "score": score, "created_at": created_at})
+
+    def _store(self, row: dict) -> None:
+        self.rows[row["id"]] = row
+        self.index.add((-row["score"], row["id"]))
+        self.next_id = max(self.next_id, row["id"] + 1)
+        self.version += 1
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def validate(self, values) -> dict:
+        """Check one row's values; returns the name, score and created_at to store."""
+        if not isinstance(values, dict):
+            raise ApiError(400, "PGRST102", "Each row must be a JSON object")
+        unknown = set(values) - set(COLUMNS)
+        if unknown:
+            raise ApiError(400, "PGRST204",
+                           f"Could not find the '{sorted(unknown)[0]}' column of '{self.name}'")
+        name, score = values.get("name"), values.get("score")
+        if not isinstance(name, str) or not name or len(name) > MAX_NAME_LENGTH:
+            raise ApiError(400, "23514", f"name must be a string of 1-{MAX_NAME_LENGTH} characters")
+        if not isinstance(score, int) or isinstance(score, bool):
+            raise ApiError(400, "22P02", "score must be an integer")
+        created_at = values.get("created_at") or datetime.now(timezone.utc).isoformat()
+        if not isinstance(created_at, str):
+            raise ApiError(400, "22007", "created_at must be a string")
+        return {"name": name, "score": score, "created_at": created_at}
+
+    def insert(self, values) -> dict:
+        return self.insert_many([values])[0]
+
+    def insert_many(self, values: list) -> list:
+        """Insert every row or none: all rows are validated before any is stored."""
+        checked = [self.validate(v) for v in values]
+        rows = []
+        for fields in checked:
+            row = {"id": self.next_id, **fields}
+            self._store(row)
+            if self.db is not None:
+                self.db.execute(f'INSERT INTO "{self.name}" (id, name, score, created_at) VALUES (?, ?, ?, ?)',
+                                (row["id"], row["name"], row["score"], row["created_at"]))
+            rows.append(row)
+        return rows
+
+    def commit(self) -> None:
+        if self.db is not None:
+            self.db.commit()
+
+    def select(self, order: list, offset: int, limit: int | None) -> list:
+        stop = None if limit is None else offset + limit
+        if order == INDEXED_ORDER:
+            return [self.rows[row_id] for _, row_id in self.index.islice(offset, stop)]
+        rows = list(self.rows.values())
+        # Stable sorts, least significant key first
+        for column, descending in reversed(order):
+            rows.sort(key=lambda row: (row[column] is None, row[column]), reverse=descending)
+        return rows[offset:stop]
+
+    def rank(self, score: int) -> int:
+        """1-based position a row with this score would take (ties rank together)."""
+        return self.index.bisect_left((-score, 0)) + 1
+
+
+# =============================================================================
+# PostgREST query parsing
+# =============================================================================
+
+def parse_select(value: str) -> list[str]:
+    if value in ("", "*"):
+        return list(COLUMNS)
+    columns = [c.strip() for c in value.split(",")]
+    for column in columns:
+        if column not in COLUMNS:
+            raise ApiError(400, "42703", f"column leaderboard.{column} does not exist")
+    return columns
+
+
+def parse_order(value: str) -> list:
+    """``score.desc,created_at`` -> [("score", True), ("created_at", False)]."""
+    order = []
+    for term in filter(None, value.split(",")):
+        column, _, direction = term.partition(".")
+        direction = direction.split(".")[0] or "asc"  # nullsfirst/nullslast are ignored
+        if column not in COLUMNS or direction not in ("asc", "desc"):
+            raise ApiError(400, "PGRST100", f'failed to parse order "{value}"')
+        order.append((column, direction == "desc"))
+    return order
+
+
+def parse_count(value: str, name: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        raise ApiError(400, "PGRST100", f'failed to parse {name} "{value}"')
+    if number < 0:
+        raise ApiError(400, "PGRST100", f"{name} must not be negative")
+    return number
+
+
+def parse_prefer(header: str) -> set[str]:
+    return {part.strip() for part in header.split(",") if part.strip()}
+
+
+# =============================================================================
+# HTTP
+# =============================================================================
+
+class Request:
+    def __init__(self, method: str, target: str, headers: dict, body: bytes):
+        self.method = method
+        url = urlsplit(target)
+        self.path = url.path
+        self.params = dict(parse_qsl(url.query, keep_blank_values=True))
+        self.headers = headers
+        self.body = body
+
+
+async def read_request(reader: asyncio.StreamReader) -> Request | None:
+    """Parse one HTTP/1.1 request; None when the client closed the connection."""
+    line = await reader.readline()
+    if not line.strip():
+        return None
+    try:
+        method, target, _ = line.decode("latin-1").split(" ", 2)
+    except ValueError:
+        raise ApiError(400, "PGRST000", "Malformed request line")
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        key, _, value = line.decode("latin-1").partition(":")
+        headers[key.strip().lower()] = value.strip()
+
+    try:
+        length = int(headers.get("content-length") or 0)
+    except ValueError:
+        length = -1
+    if length < 0:
+        raise ApiError(400, "PGRST000", "Invalid Content-Length header")
+    if length > MAX_BODY_BYTES:
+        raise ApiError(413, "PGRST000", "Request body too large")
+    body = await reader.readexactly(length) if length else b""
+    return Request(method.upper(), target, headers, body)
+
+
+def render_response(status: int, body: bytes = b"", headers: dict | None = None,
+                    keep_alive: bool = True) -> bytes:
+    lines = [f"HTTP/1.1 {status} {REASONS.get(status, 'Error')}"]
+    all_headers = {**CORS_HEADERS, **(headers or {})}
+    all_headers["Content-Length"] = str(len(body))
+    all_headers["Connection"] = "keep-alive" if keep_alive else "close"
+    lines += [f"{key}: {value}" for key, value in all_headers.items()]
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body
+
+
+def json_body(data) -> bytes:
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def strong_etag(body: bytes) -> str:
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match uses the weak comparison: W/ prefixes are ignored."""
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in candidates if tag)
+
+
+class LeaderboardServer:
+    def __init__(self, table: LeaderboardTable):
+        self.table = table
+        self.read_cache = {}  # query -> (body, headers), valid for read_cache_version
+        self.read_cache_version = table.version
+
+    def handle(self, request: Request) -> tuple[int, bytes, dict]:
+        if request.method == "OPTIONS":
+            return 204, b"", {}
+        if request.path.startswith(RPC_PREFIX):
+            return self._handle_rpc(request)
+        if not request.path.startswith(REST_PREFIX):
+            raise ApiError(404, "PGRST000", f"No route for {request.path}")
+        table_name = request.path[len(REST_PREFIX):].strip("/")
+        if table_name != self.table.name:
+            raise ApiError(404, "42P01", f'relation "public.{table_name}" does not exist')
+        if request.method in ("GET", "HEAD"):
+            return self._handle_select(request)
+        if request.method == "POST":
+            return self._handle_insert(request)
+        raise ApiError(405, "PGRST000", f"{request.method} is not supported")
+
+    def _handle_select(self, request: Request) -> tuple[int, bytes, dict]:
+        prefer = parse_prefer(request.headers.get("prefer", ""))
+        if self.read_cache_version != self.table.version:
+            self.read_cache.clear()
+            self.read_cache_version = self.table.version
+        query = (tuple(sorted(request.params.items())), "count=exact" in prefer)
+        if query not in self.read_cache:
+            self.read_cache[query] = self._select(request.params, "count=exact" in prefer)
+        body, headers = self.read_cache[query]
+
+        if etag_matches(request.headers.get("if-none-match", ""), headers["ETag"]):
+            return 304, b"", {"ETag": headers["ETag"], "Cache-Control": headers["Cache-Control"]}
+        return 200, body if request.method == "GET" else b"", headers
+
+    def _select(self, query: dict, count_exact: bool) -> tuple[bytes, dict]:
+        params = dict(query)
+        columns = parse_select(params.pop("select", "*"))
+        order = parse_order(params.pop("order", ""))
+        limit = parse_count(params.pop("limit"), "limit") if "limit" in params else None
+        offset = parse_count(params.pop("offset", "0"), "offset")
+        if params:
+            raise ApiError(400, "PGRST100", f'unsupported query parameter "{next(iter(params))}"')
+
+        rows = self.table.select(order, offset, limit)
+        data = [{column: row[column] for column in columns} for row in rows]
+        total = str(len(self.table)) if count_exact else "*"
+        content_range = f"{offset}-{offset + len(rows) - 1}/{total}" if rows else f"*/{total}"
+        body = json_body(data)
+        headers = {
+            "Content-Type": "application/json; charset=utf-8",
+            "Content-Range": content_range,
+            "ETag": strong_etag(body),
+            # Clients may store the response but must revalidate before reuse
+            "Cache-Control": "no-cache",
+        }
+        return body, headers
+
+    def _handle_insert(self, request: Request) -> tuple[int, bytes, dict]:
+        try:
+            payload = json.loads(request.body or b"null")
+        except json.JSONDecodeError as e:
+            raise ApiError(400, "PGRST102", f"Invalid JSON body: {e}")
+        values = payload if isinstance(payload, list) else [payload]
+        rows = self.table.insert_many(values)  # A bad row rejects the whole batch, like PostgREST
+        self.table.commit()
+
+        if "return=representation" in parse_prefer(request.headers.get("prefer", "")):
+            return 201, json_body(rows), {"Content-Type": "application/json; charset=utf-8"}
+        return 201, b"", {}
+
+    def _handle_rpc(self, request: Request) -> tuple[int, bytes, dict]:
+        function = request.path[len(RPC_PREFIX):].strip("/")
+        if function != RANK_FUNCTION:
+            raise ApiError(404, "PGRST202", f"Could not find the function public.{function}")
+        if request.method == "POST":
+            try:
+                args = json.loads(request.body or b"{}")
+            except json.JSONDecodeError as e:
+                raise ApiError(400, "PGRST102", f"Invalid JSON body: {e}")
+        else:
+            args = request.params
+        if not isinstance(args, dict) or "score" not in args:
+            raise ApiError(400, "PGRST202", f"{function} needs a score argument")
+        try:
+            score = int(args["score"])
+        except (TypeError, ValueError):
+            raise ApiError(400, "22P02", f'invalid score "{args["score"]}"')
+        return 200, json_body(self.table.rank(score)), {"Content-Type": "application/json; charset=utf-8"}
+
+    async def serve_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    request = await read_request(reader)
+                    if request is None:
+                        break
+                    status, body, headers = self.handle(request)
+                except ApiError as e:
+                    request = None
+                    status, headers = e.status, {"Content-Type": "application/json; charset=utf-8"}
+                    body = json_body({"code": e.code, "message": str(e), "details": None, "hint": None})
+                keep_alive = request is not None and request.headers.get("connection", "").lower() != "close"
+                writer.write(render_response(status, body, headers, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+def seed_table(table: LeaderboardTable, count: int) -> None:
+    """Fill the table with random entries (for load testing)."""
+    for _ in range(count):
+        table.insert({
+            "name": "".join(random.choices(string.ascii_uppercase, k=3)),
+            "score": int(random.expovariate(1 / 15)),
+        })
+    table.commit()
+
+
+async def serve(host: str, port: int, table: LeaderboardTable) -> None:
+    app = LeaderboardServer(table)
+    server = await asyncio.start_server(app.serve_connection, host, port)
+    index_name = "SortedList" if SortedList is not None else "skip list"
+    print(f"Leaderboard stand-in on http://{host}:{port}{REST_PREFIX}{table.name} "
+          f"({len(table)} rows, {index_name} index)")
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Supabase/PostgREST stand-in for the leaderboard.")
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"Interface to bind (default: {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port (default: {DEFAULT_PORT})")
+    parser.add_argument("--db", default=None, metavar="FILE", help="Persist rows to this SQLite file")
+    parser.add_argument("--table", default=DEFAULT_TABLE, help=f"Table name (default: {DEFAULT_TABLE})")
+    parser.add_argument("--seed", type=int, default=0, metavar="N", help="Insert N random entries on start")
+    args = parser.parse_args()
+
+    try:
+        table = LeaderboardTable(args.table, Path(args.db) if args.db else None)
+    except sqlite3.Error as e:
+        print(f"Error: {e}")
+        return 1
+    seed_table(table, args.seed)
+
+    try:
+        asyncio.run(serve(args.host, args.port, table))
+    except KeyboardInterrupt:
+        pass
+    except OSError as e:
+        print(f"Error: {e}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+"""
+Render procedural OpenGraph preview images for games without an og_image.png.
+
+Each 1200x630 image is composited entirely in NumPy: a flat palette-banded
+background, the game's sprites (any PNGs under games/<id>/assets), and the
+title/tagline from metadata.json drawn with a built-in 5x7 bitmap font in the
+"sticker" style from VISUAL_STYLE_GUIDE.md (white text, heavy black stroke).
+No PIL is required; images are written with the streaming PNG encoder.
+
+Renders are cached by a hash of metadata.json plus the game's asset bytes, so
+unchanged games are a hardlink from the cache on later runs.
+
+Usage:
+    python3 scripts/og_image_renderer.py [GAME_ID ...] [--games-dir DIR] [--out-dir DIR]
+        [--cache-dir DIR] [--jobs N] [--force]
+
+By default images are written to games/<id>/assets/og_image.png for every game
+that does not already ship one.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "shared" / "asset_generators"))
+
+from png_encoder import read_png, write_png
+
+from build_utils import link_or_copy
+
+OG_WIDTH = 1200
+OG_HEIGHT = 630
+
+# Bump when the layout changes to invalidate cached renders
+RENDERER_VERSION = 1
+
+DEFAULT_CACHE_DIR = os.environ.get("OG_CACHE_DIR", ".og_cache")
+
+# Sticker palette from VISUAL_STYLE_GUIDE.md plus dark/light bands
+ACTION_PINK = (0xFF, 0x00, 0x55)
+ELECTRIC_CYAN = (0x00, 0xF0, 0xFF)
+TAPE_YELLOW = (0xFF, 0xEB, 0x3B)
+BLACK = (0x00, 0x00, 0x00)
+WHITE = (0xFF, 0xFF, 0xFF)
+
+# (base, band) background pairs; picked per game from a stable hash of its id
+BACKGROUNDS = [
+    ((0x1E, 0x1E, 0x2E), (0x2A, 0x2A, 0x40)),
+    ((0x3B, 0x0A, 0x45), (0x4F, 0x14, 0x5C)),
+    ((0x0B, 0x3D, 0x5C), (0x12, 0x50, 0x75)),
+    ((0x14, 0x4D, 0x2E), (0x1C, 0x63, 0x3C)),
+    ((0x5C, 0x1A, 0x0B), (0x75, 0x25, 0x12)),
+]
+
+# 5x7 bitmap font, one row per string, '#' = ink
+GLYPH_WIDTH = 5
+GLYPH_HEIGHT = 7
+FONT_ROWS = {
+    "A": ".###. #...# #...# ##### #...# #...# #...#",
+    "B": "####. #...# #...# ####. #...# #...# ####.",
+    "C": ".###. #...# #.... #.... #.... #...# .###.",
+    "D": "####. #...# #...# #...# #...# #...# ####.",
+    "E": "##### #.... #.... ####. #.... #.... #####",
+    "F": "##### #.... #.... ####. #.... #.... #....",
+    "G": ".###. #...# #.... #.### #...# #...# .####",
+    "H": "#...# #...# #...# ##### #...# #...# #...#",
+    "I": ".###. ..#.. ..#.. ..#.. ..#.. ..#.. .###.",
+    "J": "..### ...#. ...#. ...#. ...#. #..#. .##..",
+    "K": "#...# #..#. #.#.. ##... #.#.. #..#. #...#",
+    "L": "#.... #.... #.... #.... #.... #.... #####",
+    "M": "#...# ##.## #.#.# #.#.# #...# #...# #...#",
+    "N": "#...# #...# ##..# #.#.# #..## #...# #...#",
+    "O": ".###. #...# #...# #...# #...# #...# .###.",
+    "P": "####. #...# #...# ####. #.... #.... #....",
+    "Q": ".###. #...# #...# #...# #.#.# #..#. .##.#",
+    "R": "####. #...# #...# ####. #.#.. #..#. #...#",
+    "S": ".#### #.... #.... .###. ....# ....# ####.",
+    "T": "##### ..#.. ..#.. ..#.. ..#.. ..#.. ..#..",
+    "U": "#...# #...# #...# #...# #...# #...# .###.",
+    "V": "#...# #...# #...# #...# #...# .#.#. ..#..",
+    "W": "#...# #...# #...# #.#.# #.#.# #.#.# .#.#.",
+    "X": "#...# #...# .#.#. ..#.. .#.#. #...# #...#",
+    "Y": "#...# #...# .#.#. ..#.. ..#.. ..#.. ..#..",
+    "Z": "##### ....# ...#. ..#.. .#... #.... #####",
+    "0": ".###. #...# #..## #.#.# ##..# #...# .###.",
+    "1": "..#.. .##.. ..#.. ..#.. ..#.. ..#.. .###.",
+    "2": ".###. #...# ....# ...#. ..#.. .#... #####",
+    "3": "##### ...#. ..#.. ...#. ....# #...# .###.",
+    "4": "...#. ..##. .#.#. #..#. ##### ...#. ...#.",
+    "5": "##### #.... ####. ....# ....# #...# .###.",
+    "6": "..##. .#... #.... ####. #...# #...# .###.",
+    "7": "##### ....# ...#. ..#.. .#... .#... .#...",
+    "8": ".###. #...# #...# .###. #...# #...# .###.",
+    "9": ".###. #...# #...# .#### ....# ...#. .##..",
+    " ": "..... ..... ..... ..... ..... ..... .....",
+    "!": "..#.. ..#.. ..#.. ..#.. ..#.. ..... ..#..",
+    "?": ".###. #...# ....# ...#. ..#.. ..... ..#..",
+    "'": "..#.. ..#.. .#... ..... ..... ..... .....",
+    "-": "..... ..... ..... ##### ..... ..... .....",
+    ".": "..... ..... ..... ..... ..... .##.. .##..",
+    ",": "..... ..... ..... ..... .##.. ..#.. .#...",
+    ":": "..... .##.. .##.. ..... .##.. .##.. .....",
+    "&": ".##.. #..#. #.#.. .#... #.#.# #..#. .##.#",
+}
+
+FONT = {
+    char: np.array([[c == "#" for c in row] for row in rows.split()], dtype=bool)
+    for char, rows in FONT_ROWS.items()
+}
+
+
+def text_mask(text: str, scale: int) -> np.ndarray:
+    """Rasterize text to a boolean mask using the bitmap font.
+
+    Characters without a glyph render as '?'.
+    """
+    glyphs = [FONT.get(char, FONT["?"]) for char in text.upper()]
+    spacer = np.zeros((GLYPH_HEIGHT, 1), dtype=bool)
+    row = np.hstack([part for glyph in glyphs for part in (glyph, spacer)][:-1])
+    return row.repeat(scale, axis=0).repeat(scale, axis=1)
+
+
+def dilate(mask: np.ndarray, radius: int) -> np.ndarray:
+    """Grow a mask by ``radius`` pixels (square structuring element)."""
+    padded = np.pad(mask, radius)
+    h, w = mask.shape
+    out = np.zeros_like(padded)
+    for dy in range(2 * radius + 1):
+        for dx in range(2 * radius + 1):
+            out[dy:dy + h, dx:dx + w] |= mask
+    return out
+
+
+def fill_mask(canvas: np.ndarray, mask: np.ndarray, x: int, y: int, color: tuple) -> None:
+    """Paint ``color`` wherever ``mask`` is set, clipped to the canvas."""
+    h, w = mask.shape
+    x0, y0 = max(x, 0), max(y, 0)
+    x1, y1 = min(x + w, canvas.shape[1]), min(y + h, canvas.shape[0])
+    if x0 >= x1 or y0 >= y1:
+        return
+    region = canvas[y0:y1, x0:x1]
+    region[mask[y0 - y:y1 - y, x0 - x:x1 - x]] = color
+
+
+def blit(canvas: np.ndarray, sprite: np.ndarray, x: int, y: int) -> None:
+    """Alpha-composite an RGBA sprite onto an RGB canvas, clipped to bounds."""
+    h, w = sprite.shape[:2]
+    x0, y0 = max(x, 0), max(y, 0)
+    x1, y1 = min(x + w, canvas.shape[1]), min(y + h, canvas.shape[0])
+    if x0 >= x1 or y0 >= y1:
+        return
+    src = sprite[y0 - y:y1 - y, x0 - x:x1 - x].astype(np.uint16)
+    dst = canvas[y0:y1, x0:x1].astype(np.uint16)
+    alpha = src[..., 3:4]
+    canvas[y0:y1, x0:x1] = ((src[..., :3] * alpha + dst * (255 - alpha) + 127) // 255).astype(np.uint8)
+
+
+def draw_sticker_text(canvas: np.ndarray, text: str, center_x: int, y: int, scale: int,
+                      fill: tuple = WHITE, stroke: tuple = BLACK) -> int:
+    """Draw centered text with a heavy outline and drop shadow; returns its height."""
+    mask = text_mask(text, scale)
+    stroke_radius = max(2, scale // 2)
+    outline = dilate(mask, stroke_radius)
+    x = center_x - mask.shape[1] // 2
+    shadow = max(3, scale // 2)
+    fill_mask(canvas, outline, x - stroke_radius + shadow, y - stroke_radius + shadow, stroke)
+    fill_mask(canvas, outline, x - stroke_radius, y - stroke_radius, stroke)
+    fill_mask(canvas, mask, x, y, fill)
+    return mask.shape[0]
+
+
+def wrap_text(text: str, max_chars: int, max_lines: int = 2) -> list[str]:
+    """Greedy word wrap, truncating with '...' past ``max_lines``."""
+    lines, current = [], ""
+    for word in text.split():
+        candidate = f"{current} {word}".strip()
+        if len(candidate) <= max_chars:
+            current = candidate
+            continue
+        if current:
+            lines.append(current)
+        current = word[:max_chars]
+    if current:
+        lines.append(current)
+    if len(lines) > max_lines:
+        lines = lines[:max_lines]
+        lines[-1] = lines[-1][:max_chars - 3].rstrip() + "..."
+    return lines
+
+
+def render_background(game_id: str) -> np.ndarray:
+    """Flat base color with diagonal bands and a tape-yellow strip."""
+    digest = int(hashlib.sha1(game_id.encode("utf-8")).hexdigest(), 16)
+    base, band = BACKGROUNDS[digest % len(BACKGROUNDS)]
+    yy, xx = np.indices((OG_HEIGHT, OG_WIDTH))
+    bands = ((xx + yy) // 60) % 2 == 0
+    canvas = np.empty((OG_HEIGHT, OG_WIDTH, 3), dtype=np.uint8)
+    canvas[:] = base
+    canvas[bands] = band
+    # Instruction-style tape strip behind the title
+    canvas[150:330] = TAPE_YELLOW
+    canvas[140:150] = BLACK
+    canvas[330:340] = BLACK
+    return canvas
+
+
+def load_sprites(assets_dir: Path, limit: int = 5) -> list[np.ndarray]:
+    """Load up to ``limit`` sprite PNGs from a game's assets.
+
+    og_image.png and @2x/@3x density variants are skipped.
+    """
+    sprites = []
+    if not assets_dir.exists():
+        return sprites
+    for path in sorted(assets_dir.glob("*.png")):
+        if path.name == "og_image.png" or "@" in path.stem:
+            continue
+        try:
+            sprites.append(read_png(path))
+        except (ValueError, KeyError, OSError) as e:
+            print(f"  Warning: Skipping sprite {path}: {e}")
+        if len(sprites) >= limit:
+            break
+    return sprites
+
+
+def render_og_image(game_id: str, meta: dict, sprites: list[np.ndarray]) -> np.ndarray:
+    """Composite the OG image for one game and return it as (630, 1200, 3) uint8."""
+    canvas = render_background(game_id)
+
+    # Sprite row along the bottom, each upscaled (nearest) to ~128px
+    if sprites:
+        target = 112
+        gap = 32
+        scaled = []
+        for sprite in sprites:
+            factor = max(1, target // max(sprite.shape[:2]))
+            scaled.append(sprite.repeat(factor, axis=0).repeat(factor, axis=1))
+        total = sum(s.shape[1] for s in scaled) + gap * (len(scaled) - 1)
+        x = (OG_WIDTH - total) // 2
+        for sprite in scaled:
+            blit(canvas, sprite, x, OG_HEIGHT - 40 - sprite.shape[0])
+            x += sprite.shape[1] + gap
+
+    title = meta.get("title") or game_id.replace("_", " ").title()
+    max_title_width = OG_WIDTH - 120
+    scale = max(4, min(16, max_title_width // max(1, len(title) * (GLYPH_WIDTH + 1))))
+    title_height = GLYPH_HEIGHT * scale
+    draw_sticker_text(canvas, title, OG_WIDTH // 2, 240 - title_height // 2, scale,
+                      fill=WHITE, stroke=BLACK)
+
+    tagline = meta.get("one_liner") or meta.get("tagline") or meta.get("description", "")
+    y = 362
+    for line in wrap_text(tagline, max_chars=40):
+        y += draw_sticker_text(canvas, line, OG_WIDTH // 2, y, 4, fill=ELECTRIC_CYAN) + 14
+
+    draw_sticker_text(canvas, "MICROGAMES", OG_WIDTH // 2, 40, 6, fill=ACTION_PINK)
+    return canvas
+
+
+def content_hash(games_dir: Path, game_id: str) -> str:
+    """Hash metadata.json and asset PNGs so renders are reused until inputs change."""
+    digest = hashlib.sha256(f"v{RENDERER_VERSION}\0{game_id}\0".encode("utf-8"))
+    game_dir = games_dir / game_id
+    inputs = [game_dir / "metadata.json"] + sorted((game_dir / "assets").glob("*.png"))
+    for path in inputs:
+        if path.name == "og_image.png" or not path.exists():
+            continue
+        digest.update(path.name.encode("utf-8") + b"\0")
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def _load_metadata(games_dir: Path, game_id: str) -> dict:
+    meta_path = games_dir / game_id / "metadata.json"
+    if meta_path.exists():
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"  Warning: Could not load {meta_path}: {e}")
+    return {}
+
+
+def render_game(game_id: str, games_dir: Path, out_path: Path, cache_dir: Path | None) -> str:
+    """Render (or reuse a cached render of) one game's OG image.
+
+    Returns "rendered", "cached" (linked from the cache) or "unchanged"
+    (the output already holds the cached render).
+    """
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    cached = None
+    if cache_dir is not None:
+        cached = cache_dir / f"{game_id}-{content_hash(games_dir, game_id)}.png"
+        if cached.exists():
+            return "unchanged" if link_or_copy(cached, out_path) == "unchanged" else "cached"
+
+    meta = _load_metadata(games_dir, game_id)
+    sprites = load_sprites(games_dir / game_id / "assets")
+    pixels = render_og_image(game_id, meta, sprites)
+    if out_path.exists():
+        out_path.unlink()  # may be a hardlink to a stale cache entry
+    write_png(out_path, pixels)
+
+    if cached is not None:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        for stale in cache_dir.glob(f"{game_id}-*.png"):
+            stale.unlink()
+        link_or_copy(out_path, cached)
+    return "rendered"
+
+
+def render_all(jobs: list[tuple[str, Path]], games_dir: Path, cache_dir: Path | None,
+               workers: int | None = None) -> dict[str, str]:
+    """Render many (game_id, out_path) pairs across a process pool."""
+    if not jobs:
+        return {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            game_id: pool.submit(render_game, game_id, games_dir, out_path, cache_dir)
+            for game_id, out_path in jobs
+        }
+        return {game_id: future.result() for game_id, future in futures.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render procedural OG images for games.")
+    parser.add_argument("games", nargs="*", help="Game ids (default: all games missing og_image.png)")
+    parser.add_argument("--games-dir", default="games", help="Directory containing games")
+    parser.add_argument("--out-dir", default=None,
+                        help="Write <out-dir>/<id>/og_image.png instead of into games/<id>/assets/")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR,
+                        help=f"Render cache directory (env: OG_CACHE_DIR, default: {DEFAULT_CACHE_DIR})")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="Also render games that ship og_image.png")
+    args = parser.parse_args()
+
+    games_dir = Path(args.games_dir)
+    if not games_dir.exists():
+        print(f"Error: Games directory not found: {games_dir}")
+        return 1
+
+    game_ids = args.games or sorted(
+        p.name for p in games_dir.iterdir() if (p / "main.tscn").exists())
+
+    jobs = []
+    for game_id in game_ids:
+        shipped = games_dir / game_id / "assets" / "og_image.png"
+        if args.out_dir:
+            out_path = Path(args.out_dir) / game_id / "og_image.png"
+        else:
+            out_path = shipped
+        if shipped.exists() and not args.force:
+            continue
+        jobs.append((game_id, out_path))
+
+    results = render_all(jobs, games_dir, Path(args.cache_dir), args.jobs)
+    for game_id, out_path in jobs:
+        print(f"  {results[game_id]:>8}: {out_path}")
+    print(f"Rendered {sum(r == 'rendered' for r in results.values())}, "
+          f"reused {sum(r != 'rendered' for r in results.values())} OG images")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Losslessly recompress committed PNG assets.
+
+For every PNG under games/*/assets and shared/assets this tool:
+  1. parses the chunk stream and drops ancillary metadata (text, time, gamma,
+     color profiles...); only IHDR, PLTE, tRNS, IDAT and IEND survive,
+  2. tries smaller pixel formats: RGB when alpha is fully opaque, grayscale
+     when R == G == B, and an indexed palette (at 1/2/4/8 bits per pixel) when
+     the image has at most 256 distinct RGBA colors,
+  3. re-filters the rows with each fixed PNG filter plus an adaptive
+     per-row choice, and
+  4. recompresses every candidate with zlib at level 9.
+
+The smallest candidate is written back only if it is smaller than the
+original and decodes to exactly the same RGBA pixels. Gray and RGB color-key
+tRNS decodes to alpha 0, so keyed transparency moves into the new encoding's
+alpha or palette. Files are processed across a process pool.
+
+Usage:
+    python3 scripts/optimize_pngs.py [PATH ...] [--dry-run] [--jobs N]
+    python3 scripts/optimize_pngs.py --self-test    # round-trip known tricky encodings
+"""
+
+import argparse
+import os
+import struct
+import sys
+import tempfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "shared" / "asset_generators"))
+
+from png_encoder import (COLOR_TYPE_GRAY, COLOR_TYPE_PALETTE, COLOR_TYPE_RGB, COLOR_TYPE_RGBA,
+                         PNG_SIGNATURE, iter_chunks, pack_samples, read_png)
+
+DEFAULT_GLOBS = ["games/*/assets/*.png", "shared/assets/*.png"]
+
+COLOR_TYPE_GRAY_ALPHA = 4
+
+# Filter strategies tried per candidate; "adaptive" picks per row
+FILTER_STRATEGIES = [0, 1, 2, 3, 4, "adaptive"]
+
+ZLIB_STRATEGIES = [zlib.Z_DEFAULT_STRATEGY, zlib.Z_FILTERED]
+
+
+def chunk(chunk_type: bytes, data: bytes) -> bytes:
+    crc = zlib.crc32(chunk_type + data) & 0xFFFFFFFF
+    return struct.pack("!I", len(data)) + chunk_type + data + struct.pack("!I", crc)
+
+
+def filter_rows(rows: np.ndarray, bpp: int, strategy) -> bytes:
+    """Apply PNG filters to a (H, stride) uint8 array.
+
+    Filtering only reads unfiltered neighbours, so every filter type is
+    computed for the whole image at once.
+    """
+    height, stride = rows.shape
+    x = rows.astype(np.int16)
+    left = np.zeros_like(x)
+    left[:, bpp:] = x[:, :-bpp]
+    up = np.zeros_like(x)
+    up[1:] = x[:-1]
+    upleft = np.zeros_like(x)
+    upleft[1:, bpp:] = x[:-1, :-bpp]
+
+    p = left + up - upleft
+    pa, pb, pc = np.abs(p - left), np.abs(p - up), np.abs(p - upleft)
+    paeth = np.where((pa <= pb) & (pa <= pc), left, np.where(pb <= pc, up, upleft))
+
+    filtered = np.stack([
+        x,
+        x - left,
+        x - up,
+        x - ((left + up) >> 1),
+        x - paeth,
+    ]).astype(np.uint8)  # (5, H, stride), wraps mod 256
+
+    if strategy == "adaptive":
+        # Minimum sum of absolute differences, treating bytes as signed
+        cost = np.abs(filtered.view(np.int8).astype(np.int32)).sum(axis=2)
+        choice = cost.argmin(axis=0)
+    else:
+        choice = np.full(height, strategy)
+
+    out = np.empty((height, stride + 1), dtype=np.uint8)
+    out[:, 0] = choice
+    out[:, 1:] = filtered[choice, np.arange(height)]
+    return out.tobytes()
+
+
+def compress(raw: bytes) -> bytes:
+    """Best of the zlib strategies at maximum level."""
+    best = None
+    for strategy in ZLIB_STRATEGIES:
+        compressor = zlib.compressobj(9, zlib.DEFLATED, 15, 9, strategy)
+        data = compressor.compress(raw) + compressor.flush()
+        if best is None or len(data) < len(best):
+            best = data
+    return best
+
+
+def candidate_formats(rgba: np.ndarray):
+    """Yield (color_type, bit_depth, rows, bpp, extra_chunks) encodings of the image."""
+    height, width = rgba.shape[:2]
+    opaque = bool((rgba[..., 3] == 255).all())
+    gray = bool(((rgba[..., 0] == rgba[..., 1]) & (rgba[..., 1] == rgba[..., 2])).all())
+
+    yield COLOR_TYPE_RGBA, 8, rgba.reshape(height, -1), 4, b""
+    if opaque:
+        yield COLOR_TYPE_RGB, 8, rgba[..., :3].reshape(height, -1), 3, b""
+    if gray:
+        if opaque:
+            yield COLOR_TYPE_GRAY, 8, rgba[..., 0], 1, b""
+        else:
+            yield COLOR_TYPE_GRAY_ALPHA, 8, rgba[..., [0, 3]].reshape(height, -1), 2, b""
+
+    packed = rgba.view(np.uint32).reshape(height, width)
+    colors, indices = np.unique(packed, return_inverse=True)
+    if len(colors) > 256:
+        return
+    palette = colors.view(np.uint8).reshape(-1, 4)
+    # Non-opaque entries first so tRNS can stop early
+    order = np.argsort(palette[:, 3] == 255, kind="stable")
+    remap = np.empty_like(order)
+    remap[order] = np.arange(len(order))
+    palette = palette[order]
+    indices = remap[indices.reshape(height, width)].astype(np.uint8)
+
+    bit_depth = next(bd for bd in (1, 2, 4, 8) if len(palette) <= 1 << bd)
+    extra = chunk(b"PLTE", palette[:, :3].tobytes())
+    translucent = int((palette[:, 3] != 255).sum())
+    if translucent:
+        extra += chunk(b"tRNS", palette[:translucent, 3].tobytes())
+    yield COLOR_TYPE_PALETTE, bit_depth, pack_samples(indices, bit_depth), 1, extra
+
+
+def encode_best(rgba: np.ndarray) -> bytes:
+    """Return the smallest PNG encoding of an RGBA image across all candidates."""
+    height, width = rgba.shape[:2]
+    best = None
+    for color_type, bit_depth, rows, bpp, extra in candidate_formats(rgba):
+        header = chunk(b"IHDR", struct.pack("!IIBBBBB", width, height, bit_depth, color_type, 0, 0, 0))
+        for strategy in FILTER_STRATEGIES:
+            idat = compress(filter_rows(rows, bpp, strategy))
+            size = len(PNG_SIGNATURE) + len(header) + len(extra) + len(idat) + 24
+            if best is None or size < best[0]:
+                best = (size, header, extra, idat)
+    _, header, extra, idat = best
+    return PNG_SIGNATURE + header + extra + chunk(b"IDAT", idat) + chunk(b"IEND", b"")
+
+
+def optimize_file(path: str, dry_run: bool = False) -> tuple:
+    """Optimize one PNG. Returns (path, old_size, new_size, status)."""
+    original = Path(path).read_bytes()
+    old_size = len(original)
+    try:
+        dropped = [t.decode("latin-1") for t, _ in iter_chunks(original)
+                   if t not in (b"IHDR", b"PLTE", b"tRNS", b"IDAT", b"IEND")]
+        rgba = read_png(path)
+    except (ValueError, KeyError, struct.error, zlib.error) as e:
+        return path, old_size, old_size, f"skipped ({e})"
+
+    optimized = encode_best(rgba)
+    if len(optimized) >= old_size:
+        return path, old_size, old_size, "already optimal"
+
+    # Verify the new encoding is pixel-identical before touching the file
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(optimized)
+    try:
+        identical = np.array_equal(read_png(tmp_path), rgba)
+        if not identical:
+            return path, old_size, old_size, "skipped (pixel mismatch)"
+        if dry_run:
+            status = "would optimize"
+        else:
+            os.replace(tmp_path, path)
+            status = "optimized"
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    if dropped:
+        status += f", dropped {' '.join(sorted(set(dropped)))}"
+    return path, old_size, len(optimized), status
+
+
+def self_test() -> int:
+    """Optimize tricky encodings and check the pixels survive.
+
+    Regression: an RGB image with a tRNS color key plus a tEXt chunk used to
+    be rewritten without tRNS, losing its transparency.
+    """
+    rgb = np.zeros((4, 4, 3), dtype=np.uint8)
+    rgb[:, :2] = (255, 0, 255)  # Keyed magenta
+    rgb[:, 2:] = (10, 200, 30)
+    gray = np.array([[0, 1, 2, 3]] * 4, dtype=np.uint8)
+    expected_rgba = np.dstack([rgb, np.full((4, 4), 255, dtype=np.uint8)])
+    expected_rgba[:, :2, 3] = 0
+    expected_gray = np.repeat((gray * 85)[..., None], 4, axis=2)
+    expected_gray[..., 3] = np.where(gray == 1, 0, 255)
+
+    cases = [
+        ("rgb-color-key", COLOR_TYPE_RGB, 8, rgb.reshape(4, -1), 3,
+         chunk(b"tRNS", struct.pack("!HHH", 255, 0, 255)), expected_rgba),
+        ("gray2-color-key", COLOR_TYPE_GRAY, 2, pack_samples(gray, 2), 1,
+         chunk(b"tRNS", struct.pack("!H", 1)), expected_gray),
+    ]
+    failures = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, color_type, bit_depth, rows, bpp, trns, expected in cases:
+            header = chunk(b"IHDR", struct.pack("!IIBBBBB", 4, 4, bit_depth, color_type, 0, 0, 0))
+            padding = chunk(b"tEXt", b"Comment\0" + b"x" * 512)
+            raw = zlib.compress(filter_rows(rows, bpp, 0), 0)
+            path = os.path.join(tmp, f"{name}.png")
+            Path(path).write_bytes(PNG_SIGNATURE + header + trns + padding
+                                   + chunk(b"IDAT", raw) + chunk(b"IEND", b""))
+
+            ok = np.array_equal(read_png(path), expected)
+            _, _, _, status = optimize_file(path)
+            ok = ok and status.startswith("optimized") and np.array_equal(read_png(path), expected)
+            print(f"  {'ok  ' if ok else 'FAIL'}  {name}  [{status}]")
+            failures += not ok
+    if failures:
+        print(f"Error: {failures} self-test case(s) failed")
+        return 1
+    print("Self-test passed")
+    return 0
+
+
+def find_pngs(root: Path, patterns: list[str]) -> list[str]:
+    files = set()
+    for pattern in patterns:
+        files.update(str(p) for p in root.glob(pattern) if p.is_file())
+    return sorted(files)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Losslessly recompress PNG assets.")
+    parser.add_argument("paths", nargs="*", help="PNG files (default: games/*/assets and shared/assets)")
+    parser.add_argument("--dry-run", action="store_true", help="Report savings without rewriting files")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--self-test", action="store_true",
+                        help="Round-trip color-keyed test images and exit")
+    args = parser.parse_args()
+
+    if args.self_test:
+        return self_test()
+
+    files = args.paths or find_pngs(Path("."), DEFAULT_GLOBS)
+    if not files:
+        print("No PNG files found")
+        return 0
+
+    print(f"Optimizing {len(files)} PNG files...")
+    total_before = total_after = 0
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        for path, before, after, status in pool.map(optimize_file, files, [args.dry_run] * len(files)):
+            total_before += before
+            total_after += after
+            print(f"  {before:>8} -> {after:>8}  {path}  [{status}]")
+
+    saved = total_before - total_after
+    percent = 100.0 * saved / total_before if total_before else 0.0
+    verb = "Would save" if args.dry_run else "Saved"
+    print()
+    print(f"{verb} {saved} bytes of {total_before} ({percent:.1f}%)")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Parse Godot 4 PCK files and report where the bytes go.
+
+Reads the pack header and file table (path, offset, size, MD5, flags) of
+format version 2 (Godot 4.0-4.3, table right after the header) and 3 (4.4+,
+table at ``dir_offset``). Exported resources live under
+``.godot/imported/`` and ``.godot/exported/``; they're attributed back to
+their source file through the ``.import``/``.remap`` files in the same pack,
+then grouped by owner (``games/<id>``, ``shared`` or ``project``) and by
+asset type.
+
+Several packs (index.pck plus the per-game packs from split_packs.py) can be
+analyzed together. ``--diff`` compares against packs from a previous build,
+and ``--budget`` checks sizes against a JSON config and exits non-zero with
+a report when any limit is exceeded:
+
+    {
+        "total": "4 MB",
+        "core": "3 MB",
+        "game_default": "512 KB",
+        "games": {"loop_connect": "768 KB"},
+        "types": {".wav": "2 MB"}
+    }
+
+``total`` covers all packs, ``core`` everything not owned by a game,
+``game_default`` any game without its own entry in ``games``.
+
+Usage:
+    python3 scripts/pck_analyzer.py PCK [PCK ...] [--diff OLD_PCK ...] [--budget FILE]
+        [--top N] [--json FILE]
+"""
+
+import argparse
+import json
+import re
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+
+PACK_HEADER_MAGIC = 0x43504447  # "GDPC"
+SUPPORTED_FORMAT_VERSIONS = (2, 3)
+
+PACK_DIR_ENCRYPTED = 1 << 0
+PACK_REL_FILEBASE = 1 << 1  # file_base relative to the pack start (always 0 for standalone packs)
+PACK_FILE_ENCRYPTED = 1 << 0
+PACK_FILE_REMOVAL = 1 << 1
+
+RESERVED_WORDS = 16
+
+IMPORTED_PATH_PATTERN = re.compile(rb'^path(?:\.\w+)?="(res://[^"]+)"', re.MULTILINE)
+GAME_OWNER_PATTERN = re.compile(r"^games/([^/]+)/")
+
+DEFAULT_BUDGET_PATH = Path(__file__).resolve().parent / "pck_budget.json"
+
+
+class PckError(ValueError):
+    """Raised when a file is not a readable Godot 4 pack."""
+
+
+@dataclass(frozen=True)
+class PckEntry:
+    path: str  # without the res:// prefix
+    offset: int  # absolute offset in the pack file
+    size: int
+    md5: str
+    flags: int
+
+    @property
+    def encrypted(self) -> bool:
+        return bool(self.flags & PACK_FILE_ENCRYPTED)
+
+
+@dataclass(frozen=True)
+class PckFile:
+    path: Path
+    format_version: int
+    godot_version: tuple
+    flags: int
+    entries: tuple
+
+    @property
+    def size(self) -> int:
+        return self.path.stat().st_size
+
+    def read(self, entry: PckEntry) -> bytes:
+        with open(self.path, "rb") as f:
+            f.seek(entry.offset)
+            return f.read(entry.size)
+
+
+def _unpack(f, fmt: str):
+    data = f.read(struct.calcsize(fmt))
+    if len(data) != struct.calcsize(fmt):
+        raise PckError("unexpected end of file")
+    return struct.unpack(fmt, data)
+
+
+def read_pck(path) -> PckFile:
+    """Parse a standalone .pck file's header and file table."""
+    path = Path(path)
+    with open(path, "rb") as f:
+        magic, version, major, minor, patch, flags = _unpack(f, "<6I")
+        if magic != PACK_HEADER_MAGIC:
+            raise PckError(f"{path}: not a Godot pack (bad magic)")
+        if version not in SUPPORTED_FORMAT_VERSIONS:
+            raise PckError(f"{path}: unsupported pack format version {version}")
+        if flags & PACK_DIR_ENCRYPTED:
+            raise PckError(f"{path}: encrypted file table is not supported")
+
+        (file_base,) = _unpack(f, "<Q")
+        dir_offset = _unpack(f, "<Q")[0] if version >= 3 else None
+        _unpack(f, f"<{RESERVED_WORDS}I")
+        if dir_offset is not None:
+            f.seek(dir_offset)
+
+        (file_count,) = _unpack(f, "<I")
+        entries = []
+        for _ in range(file_count):
+            (path_length,) = _unpack(f, "<I")
+            name = f.read(path_length).rstrip(b"\0").decode("utf-8")
+            offset, size = _unpack(f, "<QQ")
+            md5 = f.read(16).hex()
+            (file_flags,) = _unpack(f, "<I")
+            if file_flags & PACK_FILE_REMOVAL:
+                continue  # patch packs only
+            name = name[len("res://"):] if name.startswith("res://") else name
+            entries.append(PckEntry(name, file_base + offset, size, md5, file_flags))
+
+    return PckFile(path, version, (major, minor, patch), flags, tuple(entries))
+
+
+def source_map(pck: PckFile) -> dict:
+    """Imported/exported resource path -> source path, from .import/.remap files."""
+    sources = {}
+    for entry in pck.entries:
+        if entry.encrypted or not entry.path.endswith((".import", ".remap")):
+            continue
+        source = entry.path.rsplit(".", 1)[0]
+        for target in IMPORTED_PATH_PATTERN.findall(pck.read(entry)):
+            sources[target.decode("utf-8")[len("res://"):]] = source
+    return sources
+
+
+def owner_of(source: str) -> str:
+    match = GAME_OWNER_PATTERN.match(source)
+    if match:
+        return f"games/{match.group(1)}"
+    if source.startswith("shared/"):
+        return "shared"
+    return "project"
+
+
+def asset_type(source: str) -> str:
+    name = source.rsplit("/", 1)[-1]
+    return "." + name.rsplit(".", 1)[1].lower() if "." in name.lstrip(".") else "(none)"
+
+
+def attribute(pcks: list[PckFile]) -> dict:
+    """Source path -> {"bytes", "files": [pack entries], "owner", "type"} across packs."""
+    sources = {}
+    for pck in pcks:
+        mapping = source_map(pck)
+        for entry in pck.entries:
+            source = mapping.get(entry.path)
+            if source is None and entry.path.endswith((".import", ".remap")):
+                source = entry.path.rsplit(".", 1)[0]
+            source = source or entry.path
+            item = sources.setdefault(source, {
+                "bytes": 0, "files": [], "owner": owner_of(source), "type": asset_type(source),
+            })
+            item["bytes"] += entry.size
+            item["files"].append(entry.path)
+    return sources
+
+
+def totals(sources: dict, key: str) -> dict:
+    result = {}
+    for item in sources.values():
+        result[item[key]] = result.get(item[key], 0) + item["bytes"]
+    return dict(sorted(result.items(), key=lambda kv: -kv[1]))
+
+
+def format_size(size: int) -> str:
+    sign = "-" if size < 0 else ""
+    size = abs(size)
+    if size < 1024:
+        return f"{sign}{size} B"
+    if size < 1024 * 1024:
+        return f"{sign}{size / 1024:.1f} KB"
+    return f"{sign}{size / (1024 * 1024):.2f} MB"
+
+
+def parse_size(value) -> int:
+    """``"512 KB"`` / ``"4MB"`` / ``1048576`` -> bytes."""
+    if isinstance(value, int):
+        return value
+    match = re.fullmatch(r"\s*([\d.]+)\s*(B|KB|MB|GB)?\s*", str(value), re.IGNORECASE)
+    if not match:
+        raise ValueError(f"invalid size {value!r}")
+    scale = {"B": 1, "KB": 1024, "MB": 1024 ** 2, "GB": 1024 ** 3}[(match.group(2) or "B").upper()]
+    return int(float(match.group(1)) * scale)
+
+
+def print_table(title: str, rows: dict, total: int) -> None:
+    print(title)
+    width = max([28] + [len(name) for name in rows])
+    for name, size in rows.items():
+        print(f"  {name:<{width}} {format_size(size):>10}  {100 * size / max(1, total):5.1f}%")
+    print()
+
+
+def print_report(pcks: list[PckFile], sources: dict, top: int) -> None:
+    total = sum(item["bytes"] for item in sources.values())
+    for pck in pcks:
+        version = ".".join(map(str, pck.godot_version))
+        print(f"{pck.path}: {format_size(pck.size)}, {len(pck.entries)} files "
+              f"(format {pck.format_version}, Godot {version})")
+    print()
+    print_table("By owner:", totals(sources, "owner"), total)
+    print_table("By asset type:", totals(sources, "type"), total)
+    largest = sorted(sources.items(), key=lambda kv: -kv[1]["bytes"])[:top]
+    print_table(f"Largest {len(largest)} sources:", {s: item["bytes"] for s, item in largest}, total)
+
+
+def diff_packs(old_pcks: list[PckFile], new_pcks: list[PckFile]) -> list:
+    """[(path, old size or None, new size or None)] for added, removed and changed entries."""
+    old = {e.path: e for pck in old_pcks for e in pck.entries}
+    new = {e.path: e for pck in new_pcks for e in pck.entries}
+    changes = []
+    for path in sorted(old.keys() | new.keys()):
+        before, after = old.get(path), new.get(path)
+        if before and after and before.md5 == after.md5 and before.size == after.size:
+            continue
+        changes.append((path, before.size if before else None, after.size if after else None))
+    return changes
+
+
+def print_diff(changes: list, old_total: int, new_total: int) -> None:
+    print(f"Diff: {format_size(old_total)} -> {format_size(new_total)} "
+          f"({format_size(new_total - old_total)})")
+    for path, before, after in sorted(changes, key=lambda c: -abs((c[2] or 0) - (c[1] or 0))):
+        if before is None:
+            status = "added"
+        elif after is None:
+            status = "removed"
+        else:
+            status = "changed"
+        delta = (after or 0) - (before or 0)
+        print(f"  {status:<8} {format_size(delta):>10}  {path}")
+    print()
+
+
+def check_budget(sources: dict, budget: dict) -> list[str]:
+    """Return human-readable violations (empty when within budget)."""
+    violations = []
+
+    def check(label: str, actual: int, limit) -> None:
+        if limit is not None and actual > parse_size(limit):
+            violations.append(f"{label}: {format_size(actual)} exceeds budget {format_size(parse_size(limit))} "
+                              f"by {format_size(actual - parse_size(limit))}")
+
+    owners = totals(sources, "owner")
+    check("total", sum(owners.values()), budget.get("total"))
+    check("core", sum(size for owner, size in owners.items() if not owner.startswith("games/")),
+          budget.get("core"))
+    for owner, size in owners.items():
+        if owner.startswith("games/"):
+            game_id = owner.split("/", 1)[1]
+            check(owner, size, budget.get("games", {}).get(game_id, budget.get("game_default")))
+    for type_name, size in totals(sources, "type").items():
+        check(f"type {type_name}", size, budget.get("types", {}).get(type_name))
+    return violations
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Analyze Godot PCK contents and sizes.")
+    parser.add_argument("pcks", nargs="+", help="Pack files to analyze together")
+    parser.add_argument("--diff", nargs="+", default=None, metavar="OLD_PCK",
+                        help="Compare against packs from a previous build")
+    parser.add_argument("--budget", nargs="?", const=str(DEFAULT_BUDGET_PATH), default=None,
+                        help=f"Fail when sizes exceed this JSON budget (default: {DEFAULT_BUDGET_PATH.name})")
+    parser.add_argument("--top", type=int, default=15, help="Number of largest sources to list")
+    parser.add_argument("--json", default=None, metavar="FILE", help="Write the attribution as JSON")
+    args = parser.parse_args()
+
+    try:
+        pcks = [read_pck(path) for path in args.pcks]
+        old_pcks = [read_pck(path) for path in args.diff] if args.diff else None
+    except (OSError, PckError) as e:
+        print(f"Error: {e}")
+        return 1
+
+    sources = attribute(pcks)
+    print_report(pcks, sources, args.top)
+
+    if old_pcks is not None:
+        print_diff(diff_packs(old_pcks, pcks),
+                   sum(e.size for p in old_pcks for e in p.entries),
+                   sum(e.size for p in pcks for e in p.entries))
+
+    if args.json:
+        report = {
+            "packs": [{"path": str(p.path), "size": p.size, "files": len(p.entries)} for p in pcks],
+            "owners": totals(sources, "owner"),
+            "types": totals(sources, "type"),
+            "sources": {s: {k: v for k, v in item.items() if k != "files"} for s, item in sources.items()},
+        }
+        Path(args.json).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"Wrote {args.json}")
+
+    if args.budget:
+        with open(args.budget, encoding="utf-8") as f:
+            budget = json.load(f)
+        violations = check_budget(sources, budget)
+        if violations:
+            print(f"Size budget exceeded ({args.budget}):")
+            for violation in violations:
+                print(f"  - {violation}")
+            return 1
+        print(f"Within size budget ({args.budget})")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Write precompressed siblings for the web build output.
+
+For every compressible artifact in the build directory (index.wasm, index.pck,
+JS, and the HTML pages generate_game_pages.py writes) this emits
+``file.gz`` and, when the optional modules are installed, ``file.br``
+(``brotli``) and ``file.zst`` (``zstandard``). Static hosts that support
+precompressed files can then serve them directly instead of compressing on
+the fly (or not at all).
+
+Each encoding runs at its maximum level across a process pool. A sibling is
+only kept when it is meaningfully smaller than the original; stale siblings
+are removed.
+
+Usage:
+    python3 scripts/precompress.py [BUILD_DIR] [--jobs N] [--min-savings PERCENT]
+"""
+
+import argparse
+import gzip
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+COMPRESSIBLE_EXTENSIONS = {
+    ".html", ".js", ".mjs", ".wasm", ".pck", ".css", ".svg", ".json",
+    ".txt", ".xml", ".map", ".webmanifest",
+}
+
+# Files smaller than this are not worth a sibling (one TCP packet anyway)
+MIN_FILE_SIZE = 1024
+
+# A sibling must be at least this much smaller than the original (percent)
+DEFAULT_MIN_SAVINGS = 10.0
+
+
+def compress_gzip(data: bytes) -> bytes:
+    # mtime=0 keeps output reproducible between builds
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def compress_brotli(data: bytes) -> bytes:
+    return brotli.compress(data, quality=11, lgwin=24)
+
+
+def compress_zstd(data: bytes) -> bytes:
+    return zstandard.ZstdCompressor(level=22).compress(data)
+
+
+def available_encodings() -> dict:
+    """Map of sibling extension -> compressor for the installed modules."""
+    encodings = {".gz": compress_gzip}
+    if brotli is not None:
+        encodings[".br"] = compress_brotli
+    if zstandard is not None:
+        encodings[".zst"] = compress_zstd
+    return encodings
+
+
+def find_compressible(build_dir: Path) -> list[Path]:
+    """All compressible artifacts under build_dir, largest first for better pool packing."""
+    files = [
+        path for path in build_dir.rglob("*")
+        if path.is_file()
+        and path.suffix in COMPRESSIBLE_EXTENSIONS
+        and path.stat().st_size >= MIN_FILE_SIZE
+    ]
+    return sorted(files, key=lambda path: path.stat().st_size, reverse=True)
+
+
+def compress_file(path: Path, min_savings: float) -> tuple[Path, int, dict]:
+    """Write all siblings for one file.
+
+    Returns (path, original size, {extension: size or None if skipped}).
+    """
+    data = path.read_bytes()
+    results = {}
+    for ext, compress in available_encodings().items():
+        sibling = path.with_name(path.name + ext)
+        compressed = compress(data)
+        if len(compressed) <= len(data) * (1 - min_savings / 100):
+            sibling.write_bytes(compressed)
+            results[ext] = len(compressed)
+        else:
+            if sibling.exists():
+                sibling.unlink()
+            results[ext] = None
+    return path, len(data), results
+
+
+def format_size(size: int) -> str:
+    for unit in ("B", "KB", "MB"):
+        if size < 1024 or unit == "MB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+def print_table(build_dir: Path, rows: list, encodings: list[str]) -> None:
+    """Print per-file sizes with each encoding's share of the original."""
+    name_width = max([len("File")] + [len(str(path.relative_to(build_dir))) for path, _, _ in rows])
+    header = f"{'File':<{name_width}}  {'Original':>10}" + "".join(f"  {ext:>16}" for ext in encodings)
+    print(header)
+    print("-" * len(header))
+
+    total_original = 0
+    totals = {ext: 0 for ext in encodings}
+    for path, original, results in rows:
+        line = f"{str(path.relative_to(build_dir)):<{name_width}}  {format_size(original):>10}"
+        total_original += original
+        for ext in encodings:
+            size = results.get(ext)
+            if size is None:
+                line += f"  {'skipped':>16}"
+                totals[ext] += original
+            else:
+                line += f"  {format_size(size):>9} ({100 * size / original:3.0f}%)"
+                totals[ext] += size
+        print(line)
+
+    print("-" * len(header))
+    line = f"{'Total':<{name_width}}  {format_size(total_original):>10}"
+    for ext in encodings:
+        line += f"  {format_size(totals[ext]):>9} ({100 * totals[ext] / max(1, total_original):3.0f}%)"
+    print(line)
+
+
+def precompress(build_dir: Path, jobs: int | None = None,
+                min_savings: float = DEFAULT_MIN_SAVINGS) -> int:
+    """Compression stage: write siblings for build_dir and print a size table."""
+    files = find_compressible(build_dir)
+    if not files:
+        print(f"No compressible files found in {build_dir}")
+        return 0
+
+    encodings = list(available_encodings())
+    missing = [name for name, module in (("brotli", brotli), ("zstandard", zstandard)) if module is None]
+    print(f"Precompressing {len(files)} files ({', '.join(encodings)})")
+    if missing:
+        print(f"  Note: install {' and '.join(missing)} for more encodings")
+    print()
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        rows = list(pool.map(compress_file, files, [min_savings] * len(files)))
+    print_table(build_dir, rows, encodings)
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write .gz/.br/.zst siblings for web build output.")
+    parser.add_argument("build_dir", nargs="?", default=os.environ.get("BUILD_DIR", "builds/web"),
+                        help="Build output directory (env: BUILD_DIR, default: builds/web)")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--min-savings", type=float, default=DEFAULT_MIN_SAVINGS,
+                        help=f"Minimum size reduction in percent to keep a sibling (default: {DEFAULT_MIN_SAVINGS})")
+    args = parser.parse_args()
+
+    build_dir = Path(args.build_dir)
+    if not build_dir.exists():
+        print(f"Error: Build directory not found: {build_dir}")
+        return 1
+    return precompress(build_dir, args.jobs, args.min_savings)
+
+
+if __name__ == "__main__":
+    exit(main())
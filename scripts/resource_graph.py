@@ -0,0 +1,192 @@
+"""
+Static resource dependency graph of the Godot project.
+
+Edges come from:
+- ``[ext_resource ... path="res://..."]`` entries in .tscn/.tres files
+- ``"res://..."`` string literals in .gd files (preload/load arguments,
+  ``extends "res://..."`` and path constants passed to loaders)
+- global ``class_name`` identifiers used by another script
+- project.godot: main scene, autoloads and icon
+
+Textures loaded through AssetDensity also pull in their ``@2x``/``@3x``
+variants. Paths built at runtime, like ``"res://games/" + id + "/main.tscn"``,
+are resolved by globbing each directory literal against the file-name
+literals of the same script; those matches are kept apart as
+``dynamic_edges`` so closures only follow them on request.
+
+Used by split_packs.py to compute each game's dependency closure and by
+find_unused_assets.py to find files nothing references.
+"""
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+RESOURCE_SUFFIXES = (".tscn", ".tres")
+SCRIPT_SUFFIX = ".gd"
+
+EXT_RESOURCE_PATTERN = re.compile(r'^\[ext_resource\b[^\]]*?\bpath="(res://[^"]+)"', re.MULTILINE)
+RES_LITERAL_PATTERN = re.compile(r'"(res://[^"]*)"')
+PATH_SUFFIX_LITERAL_PATTERN = re.compile(r'"(/[\w./-]+\.\w+)"')
+CLASS_NAME_PATTERN = re.compile(r"^class_name\s+(\w+)", re.MULTILINE)
+# A string literal (triple-quoted or single-line) or a comment. Strings are
+# matched first, so a "#" inside one ("#fff") never starts a comment
+CODE_TOKEN_PATTERN = re.compile(
+    r'(?P<string>"""(?:\\.|[^\\])*?"""'
+    r"|'''(?:\\.|[^\\])*?'''"
+    r'|"(?:\\.|[^"\\\n])*"'
+    r"|'(?:\\.|[^'\\\n])*')"
+    r"|(?P<comment>#[^\n]*)"
+)
+
+PROJECT_MAIN_SCENE_PATTERN = re.compile(r'^run/main_scene="(res://[^"]+)"', re.MULTILINE)
+PROJECT_ICON_PATTERN = re.compile(r'^config/icon="(res://[^"]+)"', re.MULTILINE)
+PROJECT_AUTOLOAD_PATTERN = re.compile(r'^\w+="\*?(res://[^"]+)"', re.MULTILINE)
+
+DENSITY_VARIANT_SUFFIXES = ("@2x", "@3x")
+
+# Generated index of every game (build_catalog.py); the director picks entries
+# at runtime, so its paths are dynamic edges rather than static dependencies
+CATALOG_SCRIPTS = {"res://shared/scripts/game_catalog.gd"}
+
+# Never part of the exported game content
+IGNORED_DIRS = {".godot", ".git", "builds", "node_modules", "backend", "scripts"}
+
+
+def res_to_path(project_dir: Path, res_path: str) -> Path:
+    return project_dir / res_path[len("res://"):]
+
+
+def path_to_res(project_dir: Path, path: Path) -> str:
+    return "res://" + path.relative_to(project_dir).as_posix()
+
+
+@dataclass
+class ResourceGraph:
+    """Adjacency lists keyed by res:// path."""
+    project_dir: Path
+    edges: dict = field(default_factory=dict)         # res path -> set of res paths
+    dynamic_refs: dict = field(default_factory=dict)  # res path -> set of directory literals
+    dynamic_edges: dict = field(default_factory=dict)  # res path -> files matched by built paths
+    missing: dict = field(default_factory=dict)       # res path -> set of unresolved res paths
+
+    def closure(self, roots, follow_dynamic: bool = False) -> set:
+        """Every resource reachable from roots (roots included)."""
+        seen = set()
+        stack = list(roots)
+        while stack:
+            node = stack.pop()
+            if node in seen:
+                continue
+            seen.add(node)
+            stack.extend(self.edges.get(node, ()))
+            if follow_dynamic:
+                stack.extend(self.dynamic_edges.get(node, ()))
+        return seen
+
+    def size(self, res_paths) -> int:
+        """Total source bytes of the given resources."""
+        return sum(res_to_path(self.project_dir, p).stat().st_size for p in res_paths
+                   if res_to_path(self.project_dir, p).is_file())
+
+
+def iter_project_files(project_dir: Path):
+    for path in sorted(project_dir.rglob("*")):
+        relative = path.relative_to(project_dir)
+        if relative.parts[0] in IGNORED_DIRS or any(part.startswith(".") for part in relative.parts):
+            continue
+        if path.is_file():
+            yield path
+
+
+def find_global_classes(project_dir: Path) -> dict:
+    """``class_name`` -> res path of the script declaring it."""
+    classes = {}
+    for path in iter_project_files(project_dir):
+        if path.suffix == SCRIPT_SUFFIX:
+            match = CLASS_NAME_PATTERN.search(path.read_text(encoding="utf-8"))
+            if match:
+                classes[match.group(1)] = path_to_res(project_dir, path)
+    return classes
+
+
+def project_roots(project_dir: Path) -> list[str]:
+    """Resources project.godot loads on startup: main scene, autoloads, icon."""
+    text = (project_dir / "project.godot").read_text(encoding="utf-8")
+    roots = PROJECT_MAIN_SCENE_PATTERN.findall(text) + PROJECT_ICON_PATTERN.findall(text)
+    autoload = text.partition("[autoload]")[2].split("\n[", 1)[0]
+    roots += PROJECT_AUTOLOAD_PATTERN.findall(autoload)
+    return roots
+
+
+def strip_comments(text: str) -> str:
+    """GDScript source without comments; string literals are left intact."""
+    return CODE_TOKEN_PATTERN.sub(lambda match: match.group("string") or "", text)
+
+
+def _script_references(text: str, classes: dict, own_path: str) -> tuple[set, set, set]:
+    """(file references, directory literals, path suffix literals) of one GDScript source."""
+    code = strip_comments(text)
+    refs, dynamic = set(), set()
+    for literal in RES_LITERAL_PATTERN.findall(code):
+        (dynamic if literal.endswith("/") else refs).add(literal)
+    for name, res_path in classes.items():
+        if res_path != own_path and re.search(rf"\b{name}\b", code):
+            refs.add(res_path)
+    return refs, dynamic, set(PATH_SUFFIX_LITERAL_PATTERN.findall(code))
+
+
+def resolve_dynamic_paths(project_dir: Path, directories: set, suffixes: set) -> set:
+    """``{"res://games/"} x {"/main.tscn"}`` -> every existing res://games/*/main.tscn."""
+    matches = set()
+    for directory in directories:
+        base = res_to_path(project_dir, directory)
+        if not base.is_dir():
+            continue
+        for suffix in suffixes:
+            for path in base.glob("*" + suffix):
+                if path.is_file():
+                    matches.add(path_to_res(project_dir, path))
+    return matches
+
+
+def build_graph(project_dir: Path) -> ResourceGraph:
+    """Parse every scene, resource and script under project_dir."""
+    project_dir = project_dir.resolve()
+    graph = ResourceGraph(project_dir)
+    classes = find_global_classes(project_dir)
+
+    for path in iter_project_files(project_dir):
+        res_path = path_to_res(project_dir, path)
+        if path.suffix in RESOURCE_SUFFIXES:
+            refs = set(EXT_RESOURCE_PATTERN.findall(path.read_text(encoding="utf-8")))
+            dynamic, suffixes = set(), set()
+        elif path.suffix == SCRIPT_SUFFIX:
+            refs, dynamic, suffixes = _script_references(
+                path.read_text(encoding="utf-8"), classes, res_path)
+        else:
+            continue
+
+        resolved = set()
+        for ref in refs:
+            target = res_to_path(project_dir, ref)
+            if target.is_file():
+                resolved.add(ref)
+                resolved.update(_density_variants(project_dir, ref))
+            else:
+                graph.missing.setdefault(res_path, set()).add(ref)
+        if res_path in CATALOG_SCRIPTS:
+            graph.dynamic_edges[res_path] = resolved
+            continue
+        graph.edges[res_path] = resolved
+        if dynamic:
+            graph.dynamic_refs[res_path] = dynamic
+            graph.dynamic_edges[res_path] = resolve_dynamic_paths(project_dir, dynamic, suffixes)
+    return graph
+
+
+def _density_variants(project_dir: Path, res_path: str) -> list[str]:
+    """``box.png`` -> existing ``box@2x.png``/``box@3x.png`` siblings."""
+    stem, dot, ext = res_path.rpartition(".")
+    variants = [f"{stem}{suffix}{dot}{ext}" for suffix in DENSITY_VARIANT_SUFFIXES]
+    return [v for v in variants if res_to_path(project_dir, v).is_file()]
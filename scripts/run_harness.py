@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Run the microgame test harness in parallel headless engine processes.
+
+test_harness.gd plays every game in sequence inside one engine instance.
+This splits the game list into --jobs shards and runs one headless engine
+per shard:
+
+    godot --headless --path . res://test_harness.tscn -- --games=a,b,c --json-lines
+
+With --json-lines the harness prints one ``HARNESS_JSON {...}`` line per
+event (start, begin, result, summary). Results from all shards are merged
+into one report with pass/fail per test and per-game load and run durations.
+When a shard crashes or times out, the test it had begun but not reported
+fails, as does every game it never started.
+
+Shards are dealt round-robin from the catalog ordered by load_cost (see
+build_catalog.py), so large games spread across processes.
+
+The engine binary comes from --godot, $GODOT_BIN, or godot/godot4 on PATH;
+without one the run fails. With --stub (and only then) a stub worker stands
+in: it answers the same protocol with simulated passing results, so the
+orchestration and report can be exercised on machines without an engine.
+Stub reports are labeled SIMULATED.
+
+Usage:
+    python3 scripts/run_harness.py [--godot PATH | --stub] [--jobs N] [--games a,b]
+        [--timeout S] [--json FILE] [--verbose]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import shutil
+import sys
+import time
+from pathlib import Path
+
+from build_catalog import CATALOG_JSON_PATH, load_catalog
+from split_packs import discover_games
+
+HARNESS_SCENE = "res://test_harness.tscn"
+JSON_LINE_PREFIX = "HARNESS_JSON "  # test_harness.gd JSON_LINE_PREFIX
+ENGINE_NAMES = ("godot", "godot4")
+ENGINE_ENV = "GODOT_BIN"
+STUB_ENGINE = "stub"
+
+DEFAULT_TIMEOUT = 600.0
+
+# Mirrors _build_test_queue in test_harness.gd (used by the stub)
+STUB_TESTS = ((1.0, "PERFECT"), (5.0, "PERFECT"), (1.0, "DO_NOTHING"))
+
+
+def find_engine(explicit: str | None) -> str | None:
+    for candidate in (explicit, os.environ.get(ENGINE_ENV)):
+        if candidate:
+            return shutil.which(candidate) or (candidate if Path(candidate).is_file() else None)
+    for name in ENGINE_NAMES:
+        path = shutil.which(name)
+        if path:
+            return path
+    return None
+
+
+def game_order(project_dir: Path) -> list[str]:
+    """Catalog games, most expensive to load first."""
+    catalog = load_catalog(project_dir / CATALOG_JSON_PATH)
+    if catalog is None:
+        return discover_games(project_dir)
+    games = sorted(catalog["games"], key=lambda g: (-g.get("load_cost", 0), g["id"]))
+    return [game["id"] for game in games]
+
+
+def make_shards(games: list[str], jobs: int) -> list[list[str]]:
+    shards = [games[i::jobs] for i in range(max(1, jobs))]
+    return [shard for shard in shards if shard]
+
+
+def shard_command(engine: str, project_dir: Path, games: list[str]) -> list[str]:
+    args = ["--", f"--games={','.join(games)}", "--json-lines"]
+    if engine == STUB_ENGINE:
+        return [sys.executable, str(Path(__file__).resolve()), "--stub-worker"] + args[1:]
+    return [engine, "--headless", "--path", str(project_dir), HARNESS_SCENE] + args
+
+
+async def run_shard(index: int, command: list[str], timeout: float) -> dict:
+    """Run one engine process; collect its JSON events and other output."""
+    start = time.perf_counter()
+    process = await asyncio.create_subprocess_exec(
+        *command, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT)
+    events, log = [], []
+
+    async def read_output():
+        async for raw in process.stdout:
+            line = raw.decode("utf-8", errors="replace").rstrip("\n")
+            if line.startswith(JSON_LINE_PREFIX):
+                try:
+                    events.append(json.loads(line[len(JSON_LINE_PREFIX):]))
+                    continue
+                except json.JSONDecodeError:
+                    pass
+            log.append(line)
+
+    timed_out = False
+    try:
+        await asyncio.wait_for(read_output(), timeout)
+        await process.wait()
+    except asyncio.TimeoutError:
+        timed_out = True
+        process.kill()
+        await process.wait()
+    return {
+        "shard": index,
+        "exit_code": process.returncode,
+        "timed_out": timed_out,
+        "seconds": round(time.perf_counter() - start, 2),
+        "events": events,
+        "log": log,
+    }
+
+
+async def run_all(commands: list[list[str]], timeout: float) -> list[dict]:
+    return await asyncio.gather(*(run_shard(i, cmd, timeout) for i, cmd in enumerate(commands)))
+
+
+def test_key(event: dict) -> tuple:
+    return event["game"], event["speed"], event["strategy"]
+
+
+def merge(shards: list[list[str]], runs: list[dict]) -> dict:
+    """Combine shard events into {"results": [...], "games": {id: stats}}."""
+    results = []
+    for games, run in zip(shards, runs):
+        shard_results = [e for e in run["events"] if e.get("event") == "result"]
+        results += [{k: v for k, v in e.items() if k != "event"} | {"shard": run["shard"]}
+                    for e in shard_results]
+        finished = any(e.get("event") == "summary" for e in run["events"])
+        if finished:
+            continue
+
+        # Crash or timeout: the test that began without a result fails, and
+        # so does each game the shard never started
+        reason = "timed out" if run["timed_out"] else f"engine exited with code {run['exit_code']}"
+        begun = [e for e in run["events"] if e.get("event") == "begin"]
+        reported = {test_key(r) for r in shard_results}
+        missing = [(test_key(e), "Interrupted") for e in begun if test_key(e) not in reported]
+        started = {e["game"] for e in begun} | {r["game"] for r in shard_results}
+        missing += [((game_id, None, None), "Not run") for game_id in games if game_id not in started]
+        for (game_id, speed, strategy), status in missing:
+            results.append({"game": game_id, "speed": speed, "strategy": strategy, "passed": False,
+                            "message": f"{status} ({reason})", "load_ms": 0.0, "run_ms": 0.0,
+                            "shard": run["shard"]})
+
+    games = {}
+    for result in results:
+        stats = games.setdefault(result["game"], {"tests": 0, "passed": 0, "failed": 0,
+                                                  "load_ms": [], "run_ms": 0.0})
+        stats["tests"] += 1
+        stats["passed" if result["passed"] else "failed"] += 1
+        if result["load_ms"]:
+            stats["load_ms"].append(result["load_ms"])
+        stats["run_ms"] += result["run_ms"] or 0.0
+    for stats in games.values():
+        loads = stats.pop("load_ms")
+        stats["load_ms_avg"] = round(sum(loads) / len(loads), 2) if loads else None
+        stats["load_ms_max"] = max(loads) if loads else None
+        stats["run_ms"] = round(stats["run_ms"], 2)
+    return {"results": results, "games": dict(sorted(games.items()))}
+
+
+def print_report(report: dict, runs: list[dict], wall: float, verbose: bool) -> None:
+    header = f"{'Game':<20} {'Tests':>5} {'Pass':>5} {'Fail':>5} {'Load avg':>9} {'Load max':>9} {'Run':>9}"
+    print(header)
+    print("-" * len(header))
+    for game_id, stats in report["games"].items():
+        load_avg = "-" if stats["load_ms_avg"] is None else f"{stats['load_ms_avg']:.1f}"
+        load_max = "-" if stats["load_ms_max"] is None else f"{stats['load_ms_max']:.1f}"
+        print(f"{game_id:<20} {stats['tests']:>5} {stats['passed']:>5} {stats['failed']:>5} "
+              f"{load_avg:>9} {load_max:>9} {stats['run_ms'] / 1000:>8.1f}s")
+    print("(load in ms)")
+
+    failures = [r for r in report["results"] if not r["passed"]]
+    if failures:
+        print()
+        print("Failed tests:")
+        for r in failures:
+            speed = "-" if r["speed"] is None else f"{r['speed']:.1f}x"
+            print(f"  - {r['game']} ({speed}, {r['strategy'] or '-'}): {r['message']}")
+
+    for run in runs:
+        if verbose or run["timed_out"] or not any(e.get("event") == "summary" for e in run["events"]):
+            print()
+            print(f"Shard {run['shard']} output (exit {run['exit_code']}, {run['seconds']}s):")
+            for line in run["log"][-40:]:
+                print(f"  {line}")
+
+    serial = sum(run["seconds"] for run in runs)
+    passed = sum(1 for r in report["results"] if r["passed"])
+    print()
+    print(f"Total: {len(report['results'])} | Passed: {passed} | Failed: {len(failures)}")
+    print(f"Wall time {wall:.1f}s across {len(runs)} shards ({serial:.1f}s of engine time)")
+
+
+def stub_worker(argv: list[str]) -> int:
+    """Stand-in for the engine: emits the harness protocol with simulated passes."""
+    games = []
+    for arg in argv:
+        if arg.startswith("--games="):
+            games = [g for g in arg[len("--games="):].split(",") if g]
+    rng = random.Random(",".join(games))
+    print(JSON_LINE_PREFIX + json.dumps({"event": "start", "games": games, "tests": len(games) * len(STUB_TESTS)}))
+    for game_id in games:
+        for speed, strategy in STUB_TESTS:
+            print(JSON_LINE_PREFIX + json.dumps({"event": "begin", "game": game_id, "speed": speed,
+                                                 "strategy": strategy}))
+            print(JSON_LINE_PREFIX + json.dumps({
+                "event": "result", "game": game_id, "speed": speed, "strategy": strategy,
+                "passed": True, "message": "Stub engine (simulated)",
+                "load_ms": round(rng.uniform(2, 40), 2), "run_ms": round(rng.uniform(500, 4000) / speed, 2),
+            }), flush=True)
+    print(JSON_LINE_PREFIX + json.dumps({"event": "summary", "passed": len(games) * len(STUB_TESTS), "failed": 0}))
+    return 0
+
+
+def main():
+    if "--stub-worker" in sys.argv[1:]:
+        return stub_worker(sys.argv[1:])
+
+    parser = argparse.ArgumentParser(description="Run the test harness across parallel headless engines.")
+    parser.add_argument("--project-dir", default=".", help="Godot project directory (default: .)")
+    parser.add_argument("--godot", default=None, help=f"Engine binary (default: ${ENGINE_ENV}, then godot/godot4)")
+    parser.add_argument("--stub", action="store_true", help="Use the stub worker instead of an engine")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Engine processes (default: CPU count)")
+    parser.add_argument("--games", default=None, help="Comma-separated subset of games")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT,
+                        help=f"Seconds before a shard is killed (default: {DEFAULT_TIMEOUT:g})")
+    parser.add_argument("--json", default=None, metavar="FILE", help="Write the merged report as JSON")
+    parser.add_argument("--verbose", action="store_true", help="Print every shard's engine output")
+    args = parser.parse_args()
+
+    project_dir = Path(args.project_dir).resolve()
+    if not (project_dir / "project.godot").exists():
+        print(f"Error: No project.godot in {project_dir}")
+        return 1
+
+    engine = STUB_ENGINE if args.stub else find_engine(args.godot)
+    if engine is None:
+        if args.godot:
+            print(f"Error: Engine not found: {args.godot}")
+            return 1
+        print(f"Error: No Godot binary found (set --godot or ${ENGINE_ENV}, or pass --stub "
+              "to exercise the orchestration with simulated results)")
+        return 1
+    simulated = engine == STUB_ENGINE
+
+    games = game_order(project_dir)
+    if args.games:
+        wanted = [g for g in args.games.split(",") if g]
+        unknown = [g for g in wanted if g not in games]
+        if unknown:
+            print(f"Error: Unknown games: {', '.join(unknown)}")
+            return 1
+        games = [g for g in games if g in wanted]
+    shards = make_shards(games, args.jobs)
+    print(f"Engine: {engine}")
+    print(f"Running {len(games)} games in {len(shards)} shards...")
+
+    start = time.perf_counter()
+    runs = asyncio.run(run_all([shard_command(engine, project_dir, s) for s in shards], args.timeout))
+    wall = time.perf_counter() - start
+
+    report = merge(shards, runs)
+    print()
+    print_report(report, runs, wall, args.verbose)
+    if simulated:
+        print("SIMULATED: stub worker results, no game was actually run")
+
+    if args.json:
+        data = {
+            "engine": engine,
+            "simulated": simulated,
+            "wall_seconds": round(wall, 2),
+            "shards": [{"shard": r["shard"], "games": s, "exit_code": r["exit_code"],
+                        "timed_out": r["timed_out"], "seconds": r["seconds"]} for s, r in zip(shards, runs)],
+            **report,
+        }
+        Path(args.json).write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+        print(f"Wrote {args.json}")
+
+    return 0 if all(r["passed"] for r in report["results"]) else 1
+
+
+if __name__ == "__main__":
+    exit(main())
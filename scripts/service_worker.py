@@ -0,0 +1,235 @@
+"""
+Service worker and precache manifest for the web build.
+
+The generated ``sw.js`` precaches every build artifact listed in
+``precache-manifest.json`` (path -> content hash) so repeat visits and
+offline play don't touch the network:
+
+- Fingerprinted engine files (index.<hash>.wasm, see fingerprint.py) are
+  cache-first: their names change whenever their content does.
+- HTML pages are stale-while-revalidate: served from cache instantly and
+  refreshed in the background.
+
+On update, the worker diffs the new manifest against the one it installed
+last time and only downloads files whose hash changed; entries that left
+the manifest are evicted on activation. ``sw.js`` embeds the manifest
+version, so every deploy that changes any file also changes the worker and
+triggers the browser's update check.
+
+Used by generate_game_pages.py after the game pages are written (and, in the
+deploy workflow, minified; see --service-worker-only).
+"""
+
+import hashlib
+import json
+import re
+from pathlib import Path
+
+from build_utils import file_digest, write_if_changed
+from fingerprint import MANIFEST_NAME as ASSET_MANIFEST_NAME
+
+SERVICE_WORKER_NAME = "sw.js"
+PRECACHE_MANIFEST_NAME = "precache-manifest.json"
+CACHE_NAME = "microgames-precache"
+
+# Build outputs that are never precached
+PRECACHE_EXCLUDE_SUFFIXES = (".gz", ".br", ".zst", ".tmp")
+# Per-game packs (split_packs.py) are fetched on demand and cached at runtime
+PRECACHE_EXCLUDE_DIRS = {"packs"}
+PRECACHE_EXCLUDE_NAMES = {
+    SERVICE_WORKER_NAME, PRECACHE_MANIFEST_NAME, ASSET_MANIFEST_NAME, "og_image.png",
+}
+
+# The registration <script> is found again by its data- attribute, which
+# survives HTML minification (comment markers would be stripped)
+REGISTRATION_ATTRIBUTE = "data-service-worker"
+REGISTRATION_PATTERN = re.compile(
+    r"\n?[ \t]*<script " + re.escape(REGISTRATION_ATTRIBUTE) + r"(?:=\"\"|\s|>).*?</script>\n?",
+    re.DOTALL,
+)
+
+SERVICE_WORKER_TEMPLATE = """\
+// Generated by scripts/generate_game_pages.py - do not edit.
+const VERSION = "%(version)s";
+const CACHE = "%(cache)s";
+const MANIFEST_URL = "%(manifest)s?v=" + VERSION;
+const MANIFEST_KEY = "__precache-manifest__";
+const PENDING_KEY = "__precache-manifest-pending__";
+const HASHED = /\\.[0-9a-f]{%(hash_length)d}\\.[^/]+$/;
+
+function cacheKey(url) {
+	const u = new URL(url, self.location);
+	u.search = "";
+	u.hash = "";
+	if (u.pathname.endsWith("/")) {
+		u.pathname += "index.html";
+	}
+	return u.href;
+}
+
+async function readManifest(cache, key) {
+	const response = await cache.match(key);
+	return response ? (await response.json()).files : {};
+}
+
+self.addEventListener("install", (event) => {
+	event.waitUntil((async () => {
+		const cache = await caches.open(CACHE);
+		const manifest = await (await fetch(MANIFEST_URL, { cache: "no-cache" })).json();
+		const previous = await readManifest(cache, MANIFEST_KEY);
+
+		// Only download what changed since the last installed manifest
+		const changed = [];
+		for (const [path, hash] of Object.entries(manifest.files)) {
+			if (previous[path] !== hash || !(await cache.match(cacheKey(path)))) {
+				changed.push(path);
+			}
+		}
+		await Promise.all(changed.map(async (path) => {
+			const response = await fetch(path, { cache: "no-cache" });
+			if (response.ok) {
+				await cache.put(cacheKey(path), response);
+			}
+		}));
+		await cache.put(PENDING_KEY, new Response(JSON.stringify(manifest)));
+		await self.skipWaiting();
+	})());
+});
+
+self.addEventListener("activate", (event) => {
+	event.waitUntil((async () => {
+		const cache = await caches.open(CACHE);
+		const pending = await cache.match(PENDING_KEY);
+		if (pending) {
+			const manifest = await pending.json();
+			const keep = new Set(Object.keys(manifest.files).map(cacheKey));
+			keep.add(cacheKey(MANIFEST_KEY));
+			for (const request of await cache.keys()) {
+				if (!keep.has(request.url)) {
+					await cache.delete(request);
+				}
+			}
+			await cache.put(MANIFEST_KEY, new Response(JSON.stringify(manifest)));
+		}
+		await self.clients.claim();
+	})());
+});
+
+async function cacheFirst(request) {
+	const cache = await caches.open(CACHE);
+	const cached = await cache.match(cacheKey(request.url));
+	if (cached) {
+		return cached;
+	}
+	const response = await fetch(request);
+	if (response.ok) {
+		await cache.put(cacheKey(request.url), response.clone());
+	}
+	return response;
+}
+
+async function staleWhileRevalidate(event) {
+	const cache = await caches.open(CACHE);
+	const cached = await cache.match(cacheKey(event.request.url));
+	const network = fetch(event.request).then(async (response) => {
+		if (response.ok) {
+			await cache.put(cacheKey(event.request.url), response.clone());
+		}
+		return response;
+	});
+	event.waitUntil(network.catch(() => {}));
+	return cached || network;
+}
+
+self.addEventListener("fetch", (event) => {
+	const request = event.request;
+	const url = new URL(request.url);
+	if (request.method !== "GET" || url.origin !== self.location.origin) {
+		return;  // Leaderboard API and other cross-origin requests go straight to the network
+	}
+	if (HASHED.test(url.pathname)) {
+		event.respondWith(cacheFirst(request));
+	} else if (request.mode === "navigate" || url.pathname.endsWith("/") || url.pathname.endsWith(".html")) {
+		event.respondWith(staleWhileRevalidate(event));
+	}
+});
+"""
+
+REGISTRATION_TEMPLATE = """
+    <script %(attribute)s>
+        if ('serviceWorker' in navigator) {
+            window.addEventListener('load', function() {
+                navigator.serviceWorker.register('%(prefix)s%(worker)s', { scope: '%(scope)s' });
+            });
+        }
+    </script>
+"""
+
+
+def find_precache_files(build_dir: Path) -> list[Path]:
+    """Build artifacts to precache, in a stable order."""
+    return sorted(
+        path for path in build_dir.rglob("*")
+        if path.is_file()
+        and not path.name.startswith(".")
+        and path.name not in PRECACHE_EXCLUDE_NAMES
+        and not path.name.endswith(PRECACHE_EXCLUDE_SUFFIXES)
+        and path.relative_to(build_dir).parts[0] not in PRECACHE_EXCLUDE_DIRS
+    )
+
+
+def build_precache_manifest(build_dir: Path, hash_length: int = 16) -> dict:
+    """``{"version": ..., "files": {relative path: content hash}}``."""
+    files = {
+        path.relative_to(build_dir).as_posix(): file_digest(path)[:hash_length]
+        for path in find_precache_files(build_dir)
+    }
+    version = hashlib.sha256(json.dumps(files, sort_keys=True).encode("utf-8")).hexdigest()
+    return {"version": version[:hash_length], "files": files}
+
+
+def render_service_worker(version: str, fingerprint_hash_length: int) -> str:
+    return SERVICE_WORKER_TEMPLATE % {
+        "version": version,
+        "cache": CACHE_NAME,
+        "manifest": PRECACHE_MANIFEST_NAME,
+        "hash_length": fingerprint_hash_length,
+    }
+
+
+def registration_script(prefix: str = "") -> str:
+    """Registration snippet for a page ``prefix`` levels below the worker ("../")."""
+    return REGISTRATION_TEMPLATE % {
+        "attribute": REGISTRATION_ATTRIBUTE,
+        "prefix": prefix,
+        "scope": prefix or "./",
+        "worker": SERVICE_WORKER_NAME,
+    }
+
+
+def strip_registration(page: str) -> str:
+    """Remove a previously injected registration snippet."""
+    return REGISTRATION_PATTERN.sub("", page)
+
+
+def register_in_page(page_path: Path, prefix: str = "") -> bool:
+    """Insert (or refresh) the registration snippet before </head>."""
+    page = strip_registration(page_path.read_text(encoding="utf-8"))
+    head_close = page.find("</head>")
+    if head_close < 0:
+        return False
+    page = page[:head_close] + registration_script(prefix) + page[head_close:]
+    return write_if_changed(page_path, page.encode("utf-8"))
+
+
+def write_service_worker(build_dir: Path, fingerprint_hash_length: int) -> dict:
+    """Write precache-manifest.json and sw.js for everything in build_dir.
+
+    Call after all pages are written; returns the manifest.
+    """
+    manifest = build_precache_manifest(build_dir)
+    content = json.dumps(manifest, indent=2, sort_keys=True) + "\n"
+    write_if_changed(build_dir / PRECACHE_MANIFEST_NAME, content.encode("utf-8"))
+    worker = render_service_worker(manifest["version"], fingerprint_hash_length)
+    write_if_changed(build_dir / SERVICE_WORKER_NAME, worker.encode("utf-8"))
+    return manifest
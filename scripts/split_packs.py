@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Split the web export into a core pack plus one resource pack per game.
+
+Every permalink currently downloads the single index.pck with all games. This
+computes each game's dependency closure from the static resource graph (see
+resource_graph.py), starting from project.godot (main scene -> director.gd,
+autoloads) for the core and from games/<id>/main.tscn for each game:
+
+- core:  everything the director and autoloads reach, plus resources shared
+         by two or more games (so packs never depend on each other)
+- <id>:  the rest of that game's closure
+
+The director loads a game's pack on demand with
+ProjectSettings.load_resource_pack() (see _ensure_game_pack in director.gd),
+so the first download shrinks to the core plus one game.
+
+Usage:
+    python3 scripts/split_packs.py [--project-dir DIR] [--out FILE]   # report + packs.json
+    python3 scripts/split_packs.py --list                            # game ids, one per line
+    python3 scripts/split_packs.py --write-presets                   # add "Pack <id>" export presets
+    python3 scripts/split_packs.py --finalize builds/web/packs       # hash packs, write res://packs.json
+
+Build order (see .github/workflows/deploy-pages.yml):
+    --write-presets, godot --export-pack "Pack <id>" packs/<id>.pck for each game,
+    --finalize, then the regular "Web" export (which now embeds packs.json).
+
+Pack presets exclude every core file, since Godot's "resources" export mode
+also pulls in dependencies; --finalize fails if an exported game pack still
+contains a core file, so shared code never ships twice.
+"""
+
+import argparse
+import json
+import re
+from pathlib import Path
+
+from build_utils import file_digest, write_if_changed
+from fingerprint import hashed_name
+from pck_analyzer import PckError, attribute, read_pck
+from resource_graph import build_graph, project_roots
+
+PACK_PRESET_PREFIX = "Pack "
+WEB_PRESET_NAME = "Web"
+PACKS_URL_DIR = "packs"
+# Read by director.gd; must match PACK_MANIFEST_PATH there
+PACK_MANIFEST_NAME = "packs.json"
+
+PRESET_HEADER_PATTERN = re.compile(r"^\[preset\.(\d+)(\.options)?\]$", re.MULTILINE)
+
+
+def discover_games(project_dir: Path) -> list[str]:
+    games_dir = project_dir / "games"
+    return sorted(p.name for p in games_dir.iterdir() if (p / "main.tscn").is_file())
+
+
+def compute_packs(project_dir: Path) -> dict:
+    """``{"core": [res paths], "games": {id: [res paths]}}`` plus the graph."""
+    graph = build_graph(project_dir)
+    core = graph.closure(project_roots(project_dir))
+
+    closures = {
+        game_id: graph.closure([f"res://games/{game_id}/main.tscn"]) - core
+        for game_id in discover_games(project_dir)
+    }
+
+    # Resources used by several games move to the core
+    owners = {}
+    for game_id, files in closures.items():
+        for res_path in files:
+            owners.setdefault(res_path, []).append(game_id)
+    shared = {res_path for res_path, games in owners.items() if len(games) > 1}
+    core |= shared
+
+    return {
+        "core": sorted(core),
+        "shared": sorted(shared),
+        "games": {game_id: sorted(files - shared) for game_id, files in closures.items()},
+        "graph": graph,
+    }
+
+
+def format_size(size: int) -> str:
+    return f"{size / 1024:.1f} KB"
+
+
+def print_report(packs: dict) -> None:
+    graph = packs["graph"]
+    core_size = graph.size(packs["core"])
+    print(f"{'Pack':<18} {'Files':>6} {'Source size':>12}")
+    print("-" * 38)
+    print(f"{'core':<18} {len(packs['core']):>6} {format_size(core_size):>12}")
+    total = core_size
+    for game_id, files in packs["games"].items():
+        size = graph.size(files)
+        total += size
+        print(f"{game_id:<18} {len(files):>6} {format_size(size):>12}")
+    print("-" * 38)
+    print(f"{'total':<18} {'':>6} {format_size(total):>12}")
+    if packs["shared"]:
+        print()
+        print(f"Moved to core (used by several games): {len(packs['shared'])} files, "
+              f"{format_size(graph.size(packs['shared']))}")
+    for source, refs in sorted(graph.missing.items()):
+        for ref in sorted(refs):
+            print(f"  Warning: {source} references missing {ref}")
+
+
+def split_presets(text: str) -> tuple[str, list]:
+    """Split export_presets.cfg into (preamble, [(index, section text including options)])."""
+    matches = list(PRESET_HEADER_PATTERN.finditer(text))
+    if not matches:
+        return text, []
+    preamble = text[:matches[0].start()]
+    presets = {}
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
+        index = int(match.group(1))
+        presets.setdefault(index, "")
+        presets[index] += text[match.start():end]
+    return preamble, sorted(presets.items())
+
+
+def _preset_value(section: str, key: str) -> str | None:
+    match = re.search(rf'^{key}="(.*)"$', section, re.MULTILINE)
+    return match.group(1) if match else None
+
+
+def _set_preset_value(section: str, key: str, value: str) -> str:
+    return re.sub(rf'^{key}=.*$', lambda _: f"{key}={value}", section, count=1, flags=re.MULTILINE)
+
+
+def write_presets(presets_path: Path, packs: dict) -> bool:
+    """Add one "Pack <id>" preset per game and exclude game files from "Web"."""
+    preamble, presets = split_presets(presets_path.read_text(encoding="utf-8"))
+    presets = [(i, s) for i, s in presets
+               if not (_preset_value(s, "name") or "").startswith(PACK_PRESET_PREFIX)]
+    web = next((s for _, s in presets if _preset_value(s, "name") == WEB_PRESET_NAME), None)
+    if web is None:
+        raise ValueError(f'No "{WEB_PRESET_NAME}" preset in {presets_path}')
+    web_index = next(i for i, s in presets if s is web)
+
+    game_files = [res_path for files in packs["games"].values() for res_path in files]
+    include = _preset_value(web, "include_filter") or ""
+    if PACK_MANIFEST_NAME not in include.split(","):
+        include = ",".join(filter(None, [include, PACK_MANIFEST_NAME]))
+    updated_web = _set_preset_value(web, "include_filter", json.dumps(include))
+    # Keep entries added by other tools (e.g. find_unused_assets.py --write-presets)
+    exclude = [p for p in (_preset_value(web, "exclude_filter") or "").split(",") if p]
+    exclude += [p for p in game_files if p not in exclude]
+    updated_web = _set_preset_value(updated_web, "exclude_filter", json.dumps(",".join(exclude)))
+    sections = [(i, updated_web if i == web_index else s) for i, s in presets]
+
+    next_index = max(i for i, _ in sections) + 1
+    for offset, (game_id, files) in enumerate(packs["games"].items()):
+        index = next_index + offset
+        section = re.sub(rf"^\[preset\.{web_index}(\.options)?\]$",
+                         lambda m: f"[preset.{index}{m.group(1) or ''}]", web, flags=re.MULTILINE)
+        section = _set_preset_value(section, "name", json.dumps(PACK_PRESET_PREFIX + game_id))
+        section = _set_preset_value(section, "runnable", "false")
+        section = _set_preset_value(section, "export_filter", '"resources"')
+        section = _set_preset_value(section, "include_filter", '""')
+        # "resources" mode also exports every dependency of export_files, so
+        # the core (director, shared scripts and sounds) is excluded explicitly
+        section = _set_preset_value(section, "exclude_filter", json.dumps(",".join(packs["core"])))
+        section = _set_preset_value(section, "export_path",
+                                    json.dumps(f"builds/web/{PACKS_URL_DIR}/{game_id}.pck"))
+        export_files = ", ".join(json.dumps(f) for f in files)
+        section = section.replace('export_filter="resources"\n',
+                                  f'export_filter="resources"\nexport_files=PackedStringArray({export_files})\n', 1)
+        sections.append((index, section))
+
+    body = "".join(s if s.endswith("\n\n") else s.rstrip("\n") + "\n\n" for _, s in sections)
+    return write_if_changed(presets_path, (preamble + body).rstrip("\n").encode("utf-8") + b"\n")
+
+
+def core_overlap(pack_path: Path, core: list[str]) -> list[str]:
+    """Source paths in an exported game pack that also belong to the core pack."""
+    sources = attribute([read_pck(pack_path)])
+    return sorted(set(core) & {"res://" + source for source in sources})
+
+
+def finalize_packs(pack_dir: Path, project_dir: Path, games: list[str]) -> dict:
+    """Rename <id>.pck to <id>.<hash>.pck and write the director's pack manifest."""
+    manifest = {}
+    for game_id in games:
+        pack = pack_dir / f"{game_id}.pck"
+        if not pack.exists():
+            continue
+        name = hashed_name(game_id, file_digest(pack), ".pck")
+        pack.replace(pack_dir / name)
+        manifest[game_id] = f"{PACKS_URL_DIR}/{name}"
+    content = json.dumps({"packs": manifest}, indent=2, sort_keys=True) + "\n"
+    write_if_changed(project_dir / PACK_MANIFEST_NAME, content.encode("utf-8"))
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Split the web export into per-game resource packs.")
+    parser.add_argument("--project-dir", default=".", help="Godot project directory (default: .)")
+    parser.add_argument("--out", default=None, help="Write the pack lists as JSON to this file")
+    parser.add_argument("--list", action="store_true", help="Print game ids that get a pack")
+    parser.add_argument("--write-presets", nargs="?", const="export_presets.cfg", default=None,
+                        metavar="PATH", help="Add pack presets to export_presets.cfg (or PATH)")
+    parser.add_argument("--finalize", default=None, metavar="PACK_DIR",
+                        help="Fingerprint exported packs in PACK_DIR and write packs.json")
+    args = parser.parse_args()
+
+    project_dir = Path(args.project_dir).resolve()
+    if not (project_dir / "project.godot").exists():
+        print(f"Error: No project.godot in {project_dir}")
+        return 1
+
+    if args.finalize:
+        core = compute_packs(project_dir)["core"]
+        for game_id in discover_games(project_dir):
+            pack = Path(args.finalize) / f"{game_id}.pck"
+            if not pack.exists():
+                continue
+            try:
+                overlap = core_overlap(pack, core)
+            except (OSError, PckError) as e:
+                print(f"Error: {e}")
+                return 1
+            if overlap:
+                print(f"Error: {pack} duplicates {len(overlap)} core files:")
+                for res_path in overlap:
+                    print(f"  {res_path}")
+                return 1
+        manifest = finalize_packs(Path(args.finalize), project_dir, discover_games(project_dir))
+        print(f"Fingerprinted {len(manifest)} packs, wrote {project_dir / PACK_MANIFEST_NAME}")
+        for game_id, url in manifest.items():
+            print(f"  {game_id} -> {url}")
+        return 0
+
+    packs = compute_packs(project_dir)
+    if args.list:
+        print("\n".join(packs["games"]))
+        return 0
+
+    print_report(packs)
+    if args.out:
+        lists = {key: packs[key] for key in ("core", "shared", "games")}
+        Path(args.out).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.out).write_text(json.dumps(lists, indent=2) + "\n", encoding="utf-8")
+        print(f"\nWrote pack lists to {args.out}")
+    if args.write_presets:
+        try:
+            changed = write_presets(project_dir / args.write_presets, packs)
+        except ValueError as e:
+            print(f"Error: {e}")
+            return 1
+        print(f"\n{'Updated' if changed else 'Unchanged'}: {args.write_presets} "
+              f"({len(packs['games'])} pack presets)")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
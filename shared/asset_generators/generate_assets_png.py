@@ -1,81 +1,27 @@
-import zlib
-import struct
 import os
+import sys
+from pathlib import Path
 
-def write_png(filename, width, height, data):
-    # data is a list of (r, g, b, a) tuples
-    # We'll use 8-bit depth, truecolor with alpha (color type 6)
-    
-    # Signature
-    png_sig = b'\x89PNG\r\n\x1a\n'
-    
-    # IHDR
-    # Length (4 bytes), Type (4 bytes), Data, CRC (4 bytes)
-    ihdr_data = struct.pack('!IIBBBBB', width, height, 8, 6, 0, 0, 0)
-    ihdr_chunk = struct.pack('!I', len(ihdr_data)) + b'IHDR' + ihdr_data
-    ihdr_crc = zlib.crc32(b'IHDR' + ihdr_data) & 0xffffffff
-    ihdr_chunk += struct.pack('!I', ihdr_crc)
-    
-    # IDAT
-    # Scanlines: each scanline starts with a filter byte (0 = None)
-    # followed by RGBA bytes
-    raw_data = b''
-    for y in range(height):
-        raw_data += b'\x00' # Filter type 0
-        for x in range(width):
-            pixel = data[y * width + x]
-            raw_data += struct.pack('BBBB', pixel[0], pixel[1], pixel[2], pixel[3])
-            
-    compressed_data = zlib.compress(raw_data)
-    idat_chunk = struct.pack('!I', len(compressed_data)) + b'IDAT' + compressed_data
-    idat_crc = zlib.crc32(b'IDAT' + compressed_data) & 0xffffffff
-    idat_chunk += struct.pack('!I', idat_crc)
-    
-    # IEND
-    iend_chunk = struct.pack('!I', 0) + b'IEND' + struct.pack('!I', zlib.crc32(b'IEND') & 0xffffffff)
-    
-    with open(filename, 'wb') as f:
-        f.write(png_sig)
-        f.write(ihdr_chunk)
-        f.write(idat_chunk)
-        f.write(iend_chunk)
+sys.path.insert(0, str(Path(__file__).resolve().parent))
 
-# Palette
-# Neon green, dark grey, industrial yellow
-PALETTE = {
-    ' ': (0, 0, 0, 0),       # Transparent
-    '.': (30, 30, 30, 255),  # Floor bg (Very Dark Grey)
-    'G': (60, 60, 60, 255),  # Metal Grey
-    'D': (40, 40, 40, 255),  # Darker Metal
-    'K': (10, 10, 10, 255),  # Black/Outline
-    'Y': (255, 200, 0, 255), # Industrial Yellow
-    'N': (57, 255, 20, 255), # Neon Green
-    'W': (220, 220, 220, 255)# White/Highlight
-}
+from png_encoder import write_png
+from sprite_compiler import DENSITIES, compile_text, get_palette, render, render_variants, variant_filename
+
+# Palette: neon green, dark grey, industrial yellow (built into sprite_compiler)
+PALETTE = get_palette("industrial")
+
+def parse_sprite(ascii_art, scale=4, name="sprite"):
+    # Compiled once to palette indices (cached), then colored in one lookup.
+    # Unknown characters raise SpriteError instead of rendering magenta.
+    sprite = compile_text(ascii_art, name=name, palette=PALETTE.name)
+    pixels = render(sprite, scale=scale)
+    return pixels.shape[1], pixels.shape[0], pixels
 
-def parse_sprite(ascii_art, scale=4):
-    lines = [l.replace(' ', '') for l in ascii_art.strip().split('\n') if l]
-    h = len(lines)
-    w = len(lines[0])
-    
-    pixels = []
-    # Create original grid
-    grid = []
-    for line in lines:
-        row = []
-        for char in line:
-            row.append(PALETTE.get(char, (255, 0, 255, 255))) # Magenta for error
-        grid.append(row)
-        
-    # Scale up
-    scaled_pixels = []
-    for y in range(h * scale):
-        for x in range(w * scale):
-            orig_x = x // scale
-            orig_y = y // scale
-            scaled_pixels.append(grid[orig_y][orig_x])
-            
-    return w * scale, h * scale, scaled_pixels
+def parse_sprite_variants(ascii_art, scale=4, name="sprite", densities=DENSITIES):
+    # One compile + color lookup, then an exact nearest-neighbour repeat per
+    # density: {1: 64x64, 2: 128x128, 3: 192x192} for scale=4 on 16x16 art.
+    sprite = compile_text(ascii_art, name=name, palette=PALETTE.name)
+    return render_variants(sprite, base_scale=scale, densities=densities)
 
 # Assets Definitions (16x16 designs to be scaled to 64x64)
 
@@ -196,7 +142,8 @@ if not os.path.exists(output_dir):
     os.makedirs(output_dir)
 
 for filename, art in assets.items():
-    w, h, pixels = parse_sprite(art, scale=4) # 16x16 -> 64x64
-    filepath = os.path.join(output_dir, filename)
-    write_png(filepath, w, h, pixels)
-    print(f"Generated {filepath}")
+    # 16x16 -> 64x64 (1x), 128x128 (@2x), 192x192 (@3x)
+    for density, pixels in parse_sprite_variants(art, scale=4, name=filename).items():
+        filepath = os.path.join(output_dir, variant_filename(filename, density))
+        write_png(filepath, pixels)
+        print(f"Generated {filepath}")
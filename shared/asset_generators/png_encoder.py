@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Streaming PNG encoder for NumPy pixel arrays.
+
+Rows are filtered and fed into a zlib stream one band at a time, and IDAT
+chunks are flushed to the file as soon as the compressor yields data, so large
+images (OG previews, atlases, sprite sheets) never need their whole filtered
+scanline buffer in memory.
+
+A small decoder (``read_png``) is included so tools can load existing assets
+(1-8 bits per sample) back into arrays for compositing and verification.
+
+Usage:
+    from png_encoder import read_png, write_png
+    write_png("out.png", pixels)  # pixels: (H, W, 4) or (H, W, 3) uint8
+    rgba = read_png("in.png")     # always (H, W, 4) uint8
+"""
+
+import struct
+import zlib
+
+import numpy as np
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# PNG color types
+COLOR_TYPE_GRAY = 0
+COLOR_TYPE_RGB = 2
+COLOR_TYPE_PALETTE = 3
+COLOR_TYPE_RGBA = 6
+
+# Rows per band handed to the compressor
+BAND_ROWS = 64
+
+# Maximum IDAT payload per chunk
+IDAT_CHUNK_SIZE = 64 * 1024
+
+
+def write_chunk(f, chunk_type: bytes, data: bytes) -> None:
+    """Write a single length/type/data/CRC chunk."""
+    f.write(struct.pack("!I", len(data)))
+    f.write(chunk_type)
+    f.write(data)
+    f.write(struct.pack("!I", zlib.crc32(chunk_type + data) & 0xFFFFFFFF))
+
+
+def _color_type_for(pixels: np.ndarray) -> int:
+    if pixels.ndim == 2:
+        return COLOR_TYPE_GRAY
+    channels = pixels.shape[2]
+    if channels == 3:
+        return COLOR_TYPE_RGB
+    if channels == 4:
+        return COLOR_TYPE_RGBA
+    raise ValueError(f"Unsupported channel count: {channels}")
+
+
+def iter_scanlines(pixels: np.ndarray, band_rows: int = BAND_ROWS):
+    """Yield filter-type-0 scanline bands as bytes."""
+    height = pixels.shape[0]
+    rows = pixels.reshape(height, -1)
+    for start in range(0, height, band_rows):
+        band = rows[start:start + band_rows]
+        out = np.zeros((band.shape[0], band.shape[1] + 1), dtype=np.uint8)
+        out[:, 1:] = band
+        yield out.tobytes()
+
+
+def write_png(filename, pixels: np.ndarray, level: int = 9,
+              palette: np.ndarray | None = None) -> int:
+    """Encode an 8-bit image to a PNG file and return the number of bytes written.
+
+    ``pixels`` is (H, W, 4) RGBA, (H, W, 3) RGB or (H, W) grayscale. When
+    ``palette`` is given, ``pixels`` must be (H, W) palette indices and
+    ``palette`` an (N, 3) or (N, 4) array; alpha becomes a tRNS chunk.
+    """
+    pixels = np.ascontiguousarray(pixels, dtype=np.uint8)
+    height, width = pixels.shape[:2]
+
+    if palette is not None:
+        if pixels.ndim != 2:
+            raise ValueError("Indexed images must be 2-D arrays of palette indices")
+        color_type = COLOR_TYPE_PALETTE
+    else:
+        color_type = _color_type_for(pixels)
+
+    compressor = zlib.compressobj(level)
+    with open(filename, "wb") as f:
+        f.write(PNG_SIGNATURE)
+        write_chunk(f, b"IHDR", struct.pack("!IIBBBBB", width, height, 8, color_type, 0, 0, 0))
+
+        if palette is not None:
+            palette = np.asarray(palette, dtype=np.uint8)
+            write_chunk(f, b"PLTE", palette[:, :3].tobytes())
+            if palette.shape[1] == 4 and (palette[:, 3] != 255).any():
+                # tRNS may stop after the last non-opaque entry
+                last = int(np.nonzero(palette[:, 3] != 255)[0][-1]) + 1
+                write_chunk(f, b"tRNS", palette[:last, 3].tobytes())
+
+        pending = bytearray()
+        for band in iter_scanlines(pixels):
+            pending += compressor.compress(band)
+            while len(pending) >= IDAT_CHUNK_SIZE:
+                write_chunk(f, b"IDAT", bytes(pending[:IDAT_CHUNK_SIZE]))
+                del pending[:IDAT_CHUNK_SIZE]
+        pending += compressor.flush()
+        for start in range(0, len(pending), IDAT_CHUNK_SIZE):
+            write_chunk(f, b"IDAT", bytes(pending[start:start + IDAT_CHUNK_SIZE]))
+
+        write_chunk(f, b"IEND", b"")
+        return f.tell()
+
+
+def iter_chunks(data: bytes):
+    """Yield (chunk_type, payload) pairs from raw PNG bytes."""
+    if data[:8] != PNG_SIGNATURE:
+        raise ValueError("Not a PNG file")
+    pos = 8
+    while pos + 8 <= len(data):
+        length, chunk_type = struct.unpack("!I4s", data[pos:pos + 8])
+        yield chunk_type, data[pos + 8:pos + 8 + length]
+        pos += 12 + length
+        if chunk_type == b"IEND":
+            break
+
+
+def _unfilter_row_sequential(ftype: int, line: bytes, prev: bytes, bpp: int) -> bytes:
+    """Undo Average (3) or Paeth (4) filtering, which depends on reconstructed bytes."""
+    cur = bytearray(line)
+    for x in range(len(cur)):
+        a = cur[x - bpp] if x >= bpp else 0
+        b = prev[x]
+        if ftype == 3:
+            pred = (a + b) >> 1
+        else:
+            c = prev[x - bpp] if x >= bpp else 0
+            p = a + b - c
+            pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+            pred = a if pa <= pb and pa <= pc else (b if pb <= pc else c)
+        cur[x] = (cur[x] + pred) & 0xFF
+    return bytes(cur)
+
+
+def unfilter_scanlines(raw: bytes, height: int, stride: int, bpp: int) -> np.ndarray:
+    """Undo PNG row filters, returning a (height, stride) uint8 array."""
+    rows = np.frombuffer(raw, dtype=np.uint8).reshape(height, stride + 1)
+    out = np.zeros((height, stride), dtype=np.uint8)
+    prev = np.zeros(stride, dtype=np.uint8)
+    for y in range(height):
+        ftype = rows[y, 0]
+        line = rows[y, 1:]
+        if ftype == 0:
+            cur = line
+        elif ftype == 1:
+            # Sub is a running sum per byte lane
+            cur = np.cumsum(line.reshape(-1, bpp), axis=0, dtype=np.uint8).reshape(-1)
+        elif ftype == 2:
+            cur = line + prev
+        elif ftype in (3, 4):
+            cur = np.frombuffer(_unfilter_row_sequential(ftype, line.tobytes(), prev.tobytes(), bpp),
+                                dtype=np.uint8)
+        else:
+            raise ValueError(f"Invalid filter type {ftype} on row {y}")
+        out[y] = cur
+        prev = out[y]
+    return out
+
+
+def pack_samples(samples: np.ndarray, bit_depth: int) -> np.ndarray:
+    """Pack (H, W) sample values into big-endian sub-byte rows."""
+    if bit_depth == 8:
+        return samples.astype(np.uint8)
+    per_byte = 8 // bit_depth
+    height, width = samples.shape
+    padded = np.zeros((height, -(-width // per_byte) * per_byte), dtype=np.uint8)
+    padded[:, :width] = samples
+    shifts = (bit_depth * np.arange(per_byte - 1, -1, -1)).astype(np.uint8)
+    grouped = padded.reshape(height, -1, per_byte) << shifts
+    return np.bitwise_or.reduce(grouped, axis=2).astype(np.uint8)
+
+
+def unpack_samples(rows: np.ndarray, bit_depth: int, width: int) -> np.ndarray:
+    """Inverse of ``pack_samples``: expand packed rows to (H, W) sample values."""
+    bits = np.unpackbits(rows, axis=1)
+    height = rows.shape[0]
+    bits = bits[:, :width * bit_depth].reshape(height, width, bit_depth)
+    weights = (1 << np.arange(bit_depth - 1, -1, -1)).astype(np.uint8)
+    return (bits * weights).sum(axis=2).astype(np.uint8)
+
+
+def read_png(filename) -> np.ndarray:
+    """Decode a non-interlaced PNG (1-8 bits per sample) to an (H, W, 4) RGBA array.
+
+    tRNS is honored for every color type: palette alpha, or the gray/RGB
+    color key, whose matching pixels decode with alpha 0.
+    """
+    with open(filename, "rb") as f:
+        data = f.read()
+
+    header = None
+    palette = None
+    transparency = None
+    idat = bytearray()
+    for chunk_type, payload in iter_chunks(data):
+        if chunk_type == b"IHDR":
+            header = struct.unpack("!IIBBBBB", payload)
+        elif chunk_type == b"PLTE":
+            palette = np.frombuffer(payload, dtype=np.uint8).reshape(-1, 3)
+        elif chunk_type == b"tRNS":
+            transparency = np.frombuffer(payload, dtype=np.uint8)
+        elif chunk_type == b"IDAT":
+            idat += payload
+
+    width, height, bit_depth, color_type, _, _, interlace = header
+    if interlace or bit_depth == 16:
+        raise ValueError(f"{filename}: only non-interlaced PNGs up to 8 bits per sample are supported")
+    channels = {COLOR_TYPE_GRAY: 1, COLOR_TYPE_RGB: 3, COLOR_TYPE_PALETTE: 1,
+                4: 2, COLOR_TYPE_RGBA: 4}[color_type]
+
+    stride = (width * channels * bit_depth + 7) // 8
+    bpp = max(1, channels * bit_depth // 8)
+    rows = unfilter_scanlines(zlib.decompress(bytes(idat)), height, stride, bpp)
+    if bit_depth < 8:
+        rows = unpack_samples(rows, bit_depth, width)
+    pixels = rows.reshape(height, width, channels)
+
+    # Gray and RGB tRNS is a single color key (16-bit samples at the image's
+    # bit depth): matching pixels are fully transparent
+    keyed = None
+    if transparency is not None and color_type in (COLOR_TYPE_GRAY, COLOR_TYPE_RGB):
+        key = np.frombuffer(transparency.tobytes(), dtype=">u2")
+        keyed = (pixels == key).all(axis=2)
+    if bit_depth < 8 and color_type == COLOR_TYPE_GRAY:
+        # Scale low-depth gray up to the 0-255 range
+        pixels = (pixels * (255 // ((1 << bit_depth) - 1))).astype(np.uint8)
+
+    rgba = np.empty((height, width, 4), dtype=np.uint8)
+    rgba[..., 3] = 255
+    if color_type == COLOR_TYPE_PALETTE:
+        lut = np.full((256, 4), 255, dtype=np.uint8)
+        lut[:len(palette), :3] = palette
+        if transparency is not None:
+            lut[:len(transparency), 3] = transparency
+        rgba[:] = lut[pixels[..., 0]]
+    elif color_type in (COLOR_TYPE_GRAY, 4):
+        rgba[..., :3] = pixels[..., :1]
+        if color_type == 4:
+            rgba[..., 3] = pixels[..., 1]
+    else:
+        rgba[..., :3] = pixels[..., :3]
+        if color_type == COLOR_TYPE_RGBA:
+            rgba[..., 3] = pixels[..., 3]
+    if keyed is not None:
+        rgba[keyed, 3] = 0
+    return rgba
@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+ASCII-art sprite compiler with a named palette registry and animation frames.
+
+Sprites are authored as plain text. Each character is one pixel and maps to a
+palette entry; spaces between characters are ignored so art can be written as
+a readable grid. A sprite file may hold several frames:
+
+    # Hazmat bot, two-frame idle
+    @palette industrial
+    @frame idle
+    . . K K K K . .
+    . K Y Y Y Y K .
+    @frame blink
+    . . K K K K . .
+    . K Y K K Y K .
+
+Compilation turns the text into a (frames, height, width) uint8 array of
+palette indices. Compiled arrays are cached in memory and on disk (keyed by
+source text and palette), so unchanged art is never re-parsed. Colors
+are applied as a single vectorized lookup (``palette.colors[indices]``), which
+makes palette swaps and recolored variants free.
+
+Built-in palettes (BUILTIN_PALETTES) are registered on import, so sprite
+files can name them from the command line; generators may register more.
+
+Usage:
+    python3 shared/asset_generators/sprite_compiler.py SPRITE [SPRITE ...]
+        [--out-dir DIR] [--palette NAME] [--scale N] [--layout strip|sheet] [--columns N]
+        [--densities 1,2,3]
+"""
+
+import argparse
+import hashlib
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from png_encoder import write_png
+
+# Bump when the compiled representation changes to invalidate disk caches
+COMPILER_VERSION = 2
+
+DEFAULT_CACHE_DIR = Path(os.environ.get(
+    "SPRITE_CACHE_DIR", Path(__file__).resolve().parent / ".sprite_cache"))
+
+# Index marking a character that is not in the palette
+INVALID_INDEX = 255
+
+# Pixel densities emitted for runtime selection (see shared/scripts/asset_density.gd)
+DENSITIES = (1, 2, 3)
+
+
+class SpriteError(ValueError):
+    """Raised when sprite source is malformed or uses unknown palette keys."""
+
+
+@dataclass(frozen=True)
+class Palette:
+    """An ordered set of single-character keys and their RGBA colors."""
+    name: str
+    keys: str
+    colors: np.ndarray  # (N, 4) uint8
+
+    def lookup_table(self) -> np.ndarray:
+        """256-entry table mapping ASCII codes to palette indices."""
+        table = np.full(256, INVALID_INDEX, dtype=np.uint8)
+        table[np.frombuffer(self.keys.encode("ascii"), dtype=np.uint8)] = np.arange(
+            len(self.keys), dtype=np.uint8)
+        return table
+
+    def derive(self, name: str, overrides: dict) -> "Palette":
+        """Return a recolored copy; keys (and therefore indices) stay identical."""
+        unknown = set(overrides) - set(self.keys)
+        if unknown:
+            raise SpriteError(f"Palette '{self.name}' has no keys {sorted(unknown)}")
+        colors = self.colors.copy()
+        for key, rgba in overrides.items():
+            colors[self.keys.index(key)] = rgba
+        return register_palette(name, dict(zip(self.keys, map(tuple, colors))))
+
+
+PALETTES: dict[str, Palette] = {}
+
+
+def register_palette(name: str, mapping: dict) -> Palette:
+    """Register a palette from a ``{char: (r, g, b, a)}`` mapping."""
+    if len(mapping) >= INVALID_INDEX:
+        raise SpriteError(f"Palette '{name}' has too many entries ({len(mapping)})")
+    for key in mapping:
+        if len(key) != 1 or not key.isascii():
+            raise SpriteError(f"Palette '{name}' key {key!r} must be a single ASCII character")
+    colors = np.array([tuple(rgba) + (255,) * (4 - len(rgba)) for rgba in mapping.values()],
+                      dtype=np.uint8).reshape(-1, 4)
+    palette = Palette(name, "".join(mapping), colors)
+    PALETTES[name] = palette
+    return palette
+
+
+# Shipped palettes, registered below
+BUILTIN_PALETTES = {
+    # Neon green, dark grey, industrial yellow (box_pusher, shared assets)
+    "industrial": {
+        ' ': (0, 0, 0, 0),        # Transparent
+        '.': (30, 30, 30, 255),   # Floor bg (Very Dark Grey)
+        'G': (60, 60, 60, 255),   # Metal Grey
+        'D': (40, 40, 40, 255),   # Darker Metal
+        'K': (10, 10, 10, 255),   # Black/Outline
+        'Y': (255, 200, 0, 255),  # Industrial Yellow
+        'N': (57, 255, 20, 255),  # Neon Green
+        'W': (220, 220, 220, 255),  # White/Highlight
+    },
+}
+
+for _name, _mapping in BUILTIN_PALETTES.items():
+    register_palette(_name, _mapping)
+
+
+def get_palette(name: str) -> Palette:
+    """Look up a registered palette by name."""
+    try:
+        return PALETTES[name]
+    except KeyError:
+        raise SpriteError(f"Unknown palette '{name}' (registered: {', '.join(sorted(PALETTES))})")
+
+
+@dataclass(frozen=True)
+class CompiledSprite:
+    """Palette indices for every frame of a sprite."""
+    name: str
+    palette: str
+    frame_names: tuple
+    indices: np.ndarray  # (frames, height, width) uint8
+
+    @property
+    def size(self) -> tuple:
+        return self.indices.shape[2], self.indices.shape[1]
+
+    def frame(self, name: str) -> np.ndarray:
+        return self.indices[self.frame_names.index(name)]
+
+
+def _split_frames(text: str, default_palette: str | None) -> tuple:
+    """Split source text into (palette_name, [(frame_name, [row, ...]), ...])."""
+    palette_name = default_palette
+    frames = []
+    current = None
+    for line_no, raw in enumerate(text.splitlines(), 1):
+        line = raw.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("@"):
+            directive, _, value = line[1:].partition(" ")
+            value = value.strip()
+            if directive == "palette":
+                palette_name = value
+            elif directive == "frame":
+                current = (value or str(len(frames)), [])
+                frames.append(current)
+            else:
+                raise SpriteError(f"line {line_no}: unknown directive @{directive}")
+            continue
+        if current is None:
+            current = ("0", [])
+            frames.append(current)
+        current[1].append(line.replace(" ", ""))
+    if palette_name is None:
+        raise SpriteError("no @palette directive and no default palette given")
+    if not frames or not any(rows for _, rows in frames):
+        raise SpriteError("sprite has no pixel rows")
+    return palette_name, frames
+
+
+def _cache_key(text: str, palette: Palette) -> str:
+    """Hash of the source and the full palette (name, keys and colors)."""
+    digest = hashlib.sha256()
+    digest.update(f"v{COMPILER_VERSION}\0{palette.name}\0{palette.keys}\0".encode("utf-8"))
+    digest.update(palette.colors.tobytes())
+    digest.update(text.encode("utf-8"))
+    return digest.hexdigest()[:24]
+
+
+_memory_cache: dict[str, np.ndarray] = {}
+
+
+def compile_text(text: str, name: str = "sprite", palette: str | None = None,
+                 cache_dir: Path | None = DEFAULT_CACHE_DIR) -> CompiledSprite:
+    """Compile sprite source text to palette indices, using the caches when possible."""
+    palette_name, frames = _split_frames(text, palette)
+    pal = get_palette(palette_name)
+    key = _cache_key(text, pal)
+    frame_names = tuple(frame_name for frame_name, _ in frames)
+
+    # Only the indices are cached; name and palette always come from this call
+    indices = _memory_cache.get(key)
+    if indices is None:
+        cache_path = cache_dir / f"{key}.npy" if cache_dir is not None else None
+        if cache_path is not None and cache_path.exists():
+            indices = np.load(cache_path)
+        else:
+            indices = _compile_frames(frames, pal, name)
+            if cache_path is not None:
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                np.save(cache_path, indices)
+        _memory_cache[key] = indices
+
+    return CompiledSprite(name, palette_name, frame_names, indices)
+
+
+def _compile_frames(frames: list, pal: Palette, name: str) -> np.ndarray:
+    for frame_name, rows in frames:
+        if not rows:
+            raise SpriteError(f"{name}: frame '{frame_name}' has no pixel rows")
+    height = len(frames[0][1])
+    width = len(frames[0][1][0])
+    for frame_name, rows in frames:
+        if len(rows) != height or any(len(row) != width for row in rows):
+            raise SpriteError(
+                f"{name}: frame '{frame_name}' is not {width}x{height} like the first frame")
+
+    raw = "".join(row for _, rows in frames for row in rows)
+    try:
+        codes = np.frombuffer(raw.encode("ascii"), dtype=np.uint8)
+    except UnicodeEncodeError:
+        raise SpriteError(f"{name}: sprite contains non-ASCII characters")
+    indices = pal.lookup_table()[codes].reshape(len(frames), height, width)
+
+    bad = np.argwhere(indices == INVALID_INDEX)
+    if len(bad):
+        f, y, x = bad[0]
+        char = frames[f][1][y][x]
+        raise SpriteError(
+            f"{name}: frame '{frames[f][0]}' row {y} col {x}: "
+            f"{char!r} is not in palette '{pal.name}' ({len(bad)} invalid pixels)")
+    return indices
+
+
+def compile_file(path, palette: str | None = None,
+                 cache_dir: Path | None = DEFAULT_CACHE_DIR) -> CompiledSprite:
+    """Compile a ``.sprite`` file; the sprite is named after the file stem."""
+    path = Path(path)
+    return compile_text(path.read_text(encoding="utf-8"), path.stem, palette, cache_dir)
+
+
+def render(sprite: CompiledSprite, palette: str | Palette | None = None, scale: int = 1,
+           layout: str = "strip", columns: int | None = None) -> np.ndarray:
+    """Render all frames to an RGBA array laid out as a strip or a sheet.
+
+    ``palette`` swaps in any palette with the same keys as the one the sprite
+    was compiled against.
+    """
+    base = get_palette(sprite.palette)
+    if palette is None:
+        pal = base
+    else:
+        pal = palette if isinstance(palette, Palette) else get_palette(palette)
+        if pal.keys != base.keys:
+            raise SpriteError(f"Palette '{pal.name}' is not key-compatible with '{base.name}'")
+
+    frames = pal.colors[sprite.indices]  # (F, H, W, 4)
+    if scale != 1:
+        frames = frames.repeat(scale, axis=1).repeat(scale, axis=2)
+
+    count, height, width = frames.shape[:3]
+    if layout == "strip":
+        columns = count
+    elif layout == "sheet":
+        columns = columns or int(np.ceil(np.sqrt(count)))
+    else:
+        raise SpriteError(f"Unknown layout '{layout}' (expected 'strip' or 'sheet')")
+    rows = -(-count // columns)
+
+    padded = np.zeros((rows * columns, height, width, 4), dtype=np.uint8)
+    padded[:count] = frames
+    return padded.reshape(rows, columns, height, width, 4).swapaxes(1, 2).reshape(
+        rows * height, columns * width, 4)
+
+
+def render_variants(sprite: CompiledSprite, base_scale: int = 1, densities=DENSITIES,
+                    palette: str | Palette | None = None, layout: str = "strip",
+                    columns: int | None = None) -> dict[int, np.ndarray]:
+    """Render density variants (``base_scale * density``) from one color lookup.
+
+    Colors are resolved once at source resolution; each variant is then a
+    nearest-neighbour repeat of that image, so all densities stay pixel-exact.
+    """
+    base = render(sprite, palette, 1, layout, columns)
+    variants = {}
+    for density in densities:
+        factor = base_scale * density
+        variants[density] = base.repeat(factor, axis=0).repeat(factor, axis=1)
+    return variants
+
+
+def variant_filename(filename: str, density: int) -> str:
+    """``box.png`` -> ``box@2x.png``; density 1 keeps the plain name."""
+    if density == 1:
+        return filename
+    stem, dot, ext = filename.rpartition(".")
+    return f"{stem}@{density}x{dot}{ext}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile ASCII-art sprites to PNG strips/sheets.")
+    parser.add_argument("sprites", nargs="+", help="Sprite source files (.sprite)")
+    parser.add_argument("--out-dir", default=None, help="Output directory (default: next to each sprite)")
+    parser.add_argument("--palette", default=None, help="Render with this palette instead of the source one")
+    parser.add_argument("--scale", type=int, default=1, help="Integer upscale factor (default: 1)")
+    parser.add_argument("--layout", choices=["strip", "sheet"], default="strip")
+    parser.add_argument("--columns", type=int, default=None, help="Columns for --layout sheet")
+    parser.add_argument("--densities", default="1",
+                        help="Comma-separated density variants to emit, e.g. 1,2,3 (default: 1)")
+    args = parser.parse_args()
+    densities = [int(d) for d in args.densities.split(",") if d.strip()]
+
+    for source in map(Path, args.sprites):
+        try:
+            sprite = compile_file(source)
+            variants = render_variants(sprite, args.scale, densities, args.palette,
+                                       args.layout, args.columns)
+        except SpriteError as e:
+            print(f"Error: {source}: {e}")
+            return 1
+        out_dir = Path(args.out_dir) if args.out_dir else source.parent
+        out_dir.mkdir(parents=True, exist_ok=True)
+        suffix = f"_{args.palette}" if args.palette else ""
+        for density, pixels in variants.items():
+            out_path = out_dir / variant_filename(f"{source.stem}{suffix}.png", density)
+            write_png(out_path, pixels)
+            print(f"Generated {out_path} ({len(sprite.frame_names)} frames, {pixels.shape[1]}x{pixels.shape[0]})")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
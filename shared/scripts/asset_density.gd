@@ -0,0 +1,50 @@
+extends RefCounted
+class_name AssetDensity
+
+## Asset Density: Picks the 1x/2x/3x texture variant that matches the display.
+## Generators write "name.png" (1x), "name@2x.png" and "name@3x.png" from one source;
+## games call AssetDensity.load_texture("res://.../name.png") instead of preload().
+
+const MAX_DENSITY: int = 3
+
+static var _density: int = 0  # 0 = not detected yet
+static var _cache: Dictionary = {}  # base path -> Texture2D
+
+static func get_density() -> int:
+	if _density == 0:
+		_density = _detect_density()
+	return _density
+
+static func _detect_density() -> int:
+	# Physical pixels per logical viewport pixel. On web the canvas backing
+	# store already includes window.devicePixelRatio.
+	var viewport_height = float(ProjectSettings.get_setting("display/window/size/viewport_height", 640))
+	var window_height = float(DisplayServer.window_get_size().y)
+	var ratio = window_height / viewport_height
+	if not OS.has_feature("web"):
+		ratio *= DisplayServer.screen_get_scale()
+
+	# Round down slightly so a 1.1x window doesn't pull in 2x textures;
+	# low-end and small screens stay on the smallest (1x) variant.
+	return clampi(int(ceil(ratio - 0.25)), 1, MAX_DENSITY)
+
+static func variant_path(base_path: String, density: int) -> String:
+	if density <= 1:
+		return base_path
+	var ext = base_path.get_extension()
+	return "%s@%dx.%s" % [base_path.get_basename(), density, ext]
+
+static func load_texture(base_path: String) -> Texture2D:
+	"""Load the best available variant at or below the display density."""
+	if _cache.has(base_path):
+		return _cache[base_path]
+
+	var texture: Texture2D = null
+	for density in range(get_density(), 0, -1):
+		var path = variant_path(base_path, density)
+		if ResourceLoader.exists(path):
+			texture = load(path)
+			break
+
+	_cache[base_path] = texture
+	return texture
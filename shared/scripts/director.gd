@@ -6,26 +6,24 @@ extends Node
 @export var games_dir: String = "res://games/"
 @export var initial_speed: float = 1.0
 
-# Static list of games for web export compatibility (DirAccess doesn't work in browser)
+# Games come from GameCatalog (shared/scripts/game_catalog.gd), generated by
+# scripts/build_catalog.py - DirAccess doesn't work in the browser
 # See GAME_CATEGORIES.md for detailed game organization
-const GAME_LIST: Array[String] = [
-	# Grid-Based Puzzles (turn-based, strategic)
-	"box_pusher",      # Sokoban - STYLE_GUIDE_GRID_PUZZLE.md
-	"geo_stacker",     # Tetris-style
-	"loop_connect",    # Path puzzle
-	"minesweeper",     # Classic sweep
-
-	# Platformers & Runners (physics-based, reflex)
-	"infinite_jump",   # Mario runner - STYLE_GUIDE_PLATFORMER.md
-	"flappy_bird",     # Vertical scroller
-
-	# Action & Timing (tap targets, real-time)
-	"balloon_popper",  # Single target
-	"dont_touch",      # Resist clicking buttons
-	"money_grabber",   # Collection game
-	"space_invaders",  # Shooter
-	"whack_a_mole",    # Timing game
-]
+# Per-game resource packs (written by scripts/split_packs.py --finalize).
+# Absent in editor/desktop builds, where every game ships in the main pack.
+const PACK_MANIFEST_PATH: String = "res://packs.json"
+const PACK_CACHE_DIR: String = "user://packs"
+# A download that stalls this long counts as failed; it is retried once, then
+# the director plays a game that is already available instead
+const PACK_DOWNLOAD_TIMEOUT: float = 15.0
+const PACK_DOWNLOAD_ATTEMPTS: int = 2
+# Next-game preloading: recently played scenes stay cached, and games whose
+# catalog load_cost is at least LARGE_GAME_LOAD_COST are requested as soon as
+# the current game starts instead of at the intermission. Builds without
+# thread support (the Web preset: variant/thread_support=false) have no
+# loader threads, so they load the next scene while the static result is shown
+const SCENE_CACHE_SIZE: int = 3
+const LARGE_GAME_LOAD_COST: int = 100000
 @export var speed_increment: float = 0.2
 @export var max_speed: float = 5.0
 @export var max_lives: int = 3
@@ -39,6 +37,12 @@ var current_time_limit: float = 5.0
 var game_timer: float = 0.0
 var game_active: bool = false
 var game_started: bool = false  # Track if initial game start sequence has played
+var pack_manifest: Dictionary = {}  # game_id -> pack URL relative to the site root
+var game_ids: Array[String] = []  # Loaded once from GameCatalog
+var next_game_id: String = ""  # Chosen while the current game runs
+var scene_cache: Dictionary = {}  # game_id -> PackedScene, least recently used first
+var packs_loading: Dictionary = {}  # game_id -> true while its pack downloads
+var last_scene_source: String = ""  # How _get_game_scene got its scene: cache, threaded or sync
 
 # UI Elements
 var ui_layer: CanvasLayer
@@ -51,7 +55,9 @@ var countdown_label: Label  # Shows 3, 2, 1, 0 countdown synced to beats
 var last_countdown_beat: int = -1  # Track last shown countdown beat
 var game_title_label: Label
 var status_label: Label
+var leaderboard_label: Label  # Entries on the leaderboard screen, refreshed on revalidation
 var game_debugger: Node
+var perf_monitor: Node  # Only created when perf_monitor.gd is_enabled()
 
 # Beat-based timing (120 BPM)
 const BPM: float = 120.0
@@ -67,9 +73,13 @@ var game_start_player: AudioStreamPlayer
 var game_over_player: AudioStreamPlayer
 
 func _ready() -> void:
+	game_ids = GameCatalog.ids()
+	_load_pack_manifest()
 	_setup_ui()
 	_setup_audio()
 	_setup_debugger()
+	_setup_perf_monitor()
+	LeaderboardManager.leaderboard_changed.connect(_on_leaderboard_changed)
 	_reset_game_state()
 	# We start the loop deferred to ensure everything is initialized
 	call_deferred("start_game_loop")
@@ -259,6 +269,16 @@ func _setup_debugger() -> void:
 	# Connect to game selection signal
 	game_debugger.game_selected.connect(_on_debugger_game_selected)
 
+func _setup_perf_monitor() -> void:
+	# Opt-in: ?perf=1, "-- --perf" or the override.cfg setting
+	var monitor_script = load("res://shared/scripts/perf_monitor.gd")
+	if not monitor_script.is_enabled():
+		return
+	perf_monitor = CanvasLayer.new()
+	perf_monitor.set_script(monitor_script)
+	perf_monitor.name = "PerfMonitor"
+	add_child(perf_monitor)
+
 func _on_debugger_game_selected(game_id: String) -> void:
 	print("Director: Loading game from debugger - " + game_id)
 
@@ -301,7 +321,7 @@ func start_game_loop() -> void:
 
 	# Check for game ID in URL query parameter
 	var url_game = _get_url_game_param()
-	if url_game != "" and url_game in GAME_LIST:
+	if url_game != "" and url_game in game_ids:
 		print("Director: Starting with game from URL - " + url_game)
 		_load_and_start_game(url_game)
 	else:
@@ -313,21 +333,19 @@ func _play_random_game() -> void:
 		push_error("No games found in " + games_dir)
 		return
 	
-	var game_id = games.pick_random()
+	# Usually picked (and preloading) since the previous game started
+	var game_id = next_game_id if next_game_id != "" else games.pick_random()
+	next_game_id = ""
 	_load_and_start_game(game_id)
 
 func _scan_games() -> Array[String]:
-	# Use static list for web compatibility (DirAccess doesn't work in browser)
-	# Filter to only include games that exist
-	var games: Array[String] = []
-	for game_id in GAME_LIST:
-		var scene_path = games_dir + game_id + "/main.tscn"
-		if ResourceLoader.exists(scene_path):
-			games.append(game_id)
-	return games
+	# The catalog only lists games whose main.tscn existed at build time,
+	# so there's nothing to check per game at runtime
+	return game_ids
 
 func _load_and_start_game(game_id: String) -> void:
 	print("Director: Loading game - ", game_id)
+	var load_start_usec = Time.get_ticks_usec()
 
 	# Store current game ID for sharing
 	current_game_id = game_id
@@ -339,9 +357,16 @@ func _load_and_start_game(game_id: String) -> void:
 	current_time_limit = NORMAL_GAME_BEATS * BEAT_DURATION  # 4 seconds
 	game_timer = 0.0
 
-	# Path to scene
+	# Path to scene (fetching the game's resource pack first if it's split out)
 	var scene_path = games_dir + game_id + "/main.tscn"
-	var game_scene = load(scene_path)
+	if not await _ensure_game_pack(game_id):
+		push_error("Failed to load resource pack for: " + game_id)
+		var fallback_id = _fallback_game_id(game_id)
+		if fallback_id != "":
+			print("Director: Playing ", fallback_id, " instead")
+			_load_and_start_game(fallback_id)
+		return
+	var game_scene = _get_game_scene(game_id)
 	
 	if not game_scene:
 		push_error("Failed to load scene: " + scene_path)
@@ -369,11 +394,19 @@ func _load_and_start_game(game_id: String) -> void:
 	# Read back time_limit in case game overrode it in _ready()
 	current_time_limit = current_game.time_limit
 
+	if perf_monitor:
+		var load_ms = (Time.get_ticks_usec() - load_start_usec) / 1000.0
+		perf_monitor.record_load(game_id, load_ms, last_scene_source, current_speed_multiplier)
+		perf_monitor.end_intermission(game_id)
+
 	# Connect signals
 	current_game.game_over.connect(_on_game_over)
 	
 	# Start intro sequence
 	_start_game_intro(current_game.game_name)
+
+	# Pick the next game now so it can load in the background
+	_queue_next_game()
 	
 func _on_game_over(game_score: int) -> void:
 	# Prevent double-handling (game already ended)
@@ -390,6 +423,10 @@ func _on_game_over(game_score: int) -> void:
 	if is_instance_valid(current_game) and current_game.game_over.is_connected(_on_game_over):
 		current_game.game_over.disconnect(_on_game_over)
 
+	# Intermission: start loading the next game if it wasn't requested yet
+	if next_game_id != "" and _can_load_threaded():
+		_preload_game(next_game_id)
+
 	# Determine win/lose
 	var did_win = game_score > 0
 	
@@ -423,8 +460,12 @@ func _on_game_over(game_score: int) -> void:
 	_update_ui(round_message)
 	ui_layer.visible = true
 
-	# Wait 2 beats to show result (1 second at 120 BPM)
-	await get_tree().create_timer(BEAT_DURATION * 2).timeout
+	# Wait 2 beats to show result (1 second at 120 BPM); without loader
+	# threads the next scene loads here, where the stall is hidden
+	var result_timer = get_tree().create_timer(BEAT_DURATION * 2)
+	if next_game_id != "" and not is_game_over and not _can_load_threaded():
+		await _load_game_blocking(next_game_id)
+	await result_timer.timeout
 
 	# Play countdown sound with pitch based on speed multiplier
 	# Formula: pitch increases as speed increases (1.0x = 1.0 pitch, 5.0x = 2.0 pitch)
@@ -441,6 +482,8 @@ func _on_game_over(game_score: int) -> void:
 		await _show_game_over_screen()
 		# Note: _on_play_again_pressed will handle restart
 	else:
+		if perf_monitor:
+			perf_monitor.begin_intermission()
 		_play_random_game()
 
 func _update_ui(msg: String) -> void:
@@ -765,9 +808,11 @@ func _show_leaderboard(show_leaderboard_button: bool = true) -> void:
 	message_label.text = "LEADERBOARD"
 	score_label.text = "Loading..."
 
-	# Fetch leaderboard
+	# Fetch leaderboard; cached entries show right away while the request
+	# revalidates in the background (see _on_leaderboard_changed)
 	LeaderboardManager._load_leaderboard()
-	await LeaderboardManager.leaderboard_loaded
+	if not LeaderboardManager.has_cached_data:
+		await LeaderboardManager.leaderboard_loaded
 
 	# Display leaderboard in a scrollable container
 	var leaderboard = LeaderboardManager.get_leaderboard()
@@ -779,21 +824,10 @@ func _show_leaderboard(show_leaderboard_button: bool = true) -> void:
 	scroll_container.horizontal_scroll_mode = ScrollContainer.SCROLL_MODE_DISABLED
 
 	# Create label for leaderboard entries
-	var leaderboard_label = Label.new()
+	leaderboard_label = Label.new()
 	leaderboard_label.horizontal_alignment = HORIZONTAL_ALIGNMENT_CENTER
 	leaderboard_label.add_theme_font_size_override("font_size", 20)
-
-	var text = ""
-	for i in range(leaderboard.size()):
-		var entry = leaderboard[i]
-		var rank = i + 1
-		var suffix = LeaderboardManager.get_rank_suffix(rank)
-		text += "%d%s: %s - %d\n" % [rank, suffix, entry["name"], entry["score"]]
-
-	if leaderboard.is_empty():
-		text = "No scores yet!\nBe the first!"
-
-	leaderboard_label.text = text
+	leaderboard_label.text = _format_leaderboard(leaderboard)
 	scroll_container.add_child(leaderboard_label)
 
 	# Add scroll container to UI
@@ -814,6 +848,23 @@ func _show_leaderboard(show_leaderboard_button: bool = true) -> void:
 	else:
 		_show_play_again_and_share_only()
 
+func _format_leaderboard(leaderboard: Array[Dictionary]) -> String:
+	if leaderboard.is_empty():
+		return "No scores yet!\nBe the first!"
+
+	var text = ""
+	for i in range(leaderboard.size()):
+		var entry = leaderboard[i]
+		var rank = i + 1
+		var suffix = LeaderboardManager.get_rank_suffix(rank)
+		text += "%d%s: %s - %d\n" % [rank, suffix, entry["name"], entry["score"]]
+	return text
+
+func _on_leaderboard_changed() -> void:
+	# Background revalidation found newer entries than the ones on screen
+	if is_instance_valid(leaderboard_label):
+		leaderboard_label.text = _format_leaderboard(LeaderboardManager.get_leaderboard())
+
 func _show_play_again_and_share_only() -> void:
 	# Check if buttons already exist to prevent duplicates
 	for child in ui_layer.get_children():
@@ -915,6 +966,165 @@ func _show_game_result(did_win: bool) -> void:
 	await fade_out.finished
 	status_label.visible = false
 
+# =============================================================================
+# Resource Packs
+# =============================================================================
+
+func _load_pack_manifest() -> void:
+	if not FileAccess.file_exists(PACK_MANIFEST_PATH):
+		return
+	var data = JSON.parse_string(FileAccess.get_file_as_string(PACK_MANIFEST_PATH))
+	if data is Dictionary and data.get("packs") is Dictionary:
+		pack_manifest = data["packs"]
+		print("Director: ", pack_manifest.size(), " games load from resource packs")
+
+## Make sure a game's scene is loadable, mounting its resource pack if needed
+func _ensure_game_pack(game_id: String) -> bool:
+	var scene_path = games_dir + game_id + "/main.tscn"
+	# A preload may already be downloading this pack
+	while packs_loading.has(game_id):
+		await get_tree().process_frame
+	if ResourceLoader.exists(scene_path) or not pack_manifest.has(game_id):
+		return ResourceLoader.exists(scene_path)
+
+	var pack_url: String = pack_manifest[game_id]
+	var pack_path: String
+	if OS.has_feature("web"):
+		# Packs are content-hashed, so a cached copy is always current
+		pack_path = PACK_CACHE_DIR.path_join(pack_url.get_file())
+		if not FileAccess.file_exists(pack_path):
+			packs_loading[game_id] = true
+			var downloaded = await _download_pack(game_id, pack_url, pack_path)
+			packs_loading.erase(game_id)
+			if not downloaded:
+				return false
+	else:
+		pack_path = OS.get_executable_path().get_base_dir().path_join(pack_url)
+
+	if not ProjectSettings.load_resource_pack(pack_path):
+		push_error("Director: Could not mount pack " + pack_path)
+		return false
+	print("Director: Mounted pack for ", game_id)
+	return ResourceLoader.exists(scene_path)
+
+## One GET with a timeout; returns [result, code, headers, body]
+func _request_pack(url: String) -> Array:
+	var http = HTTPRequest.new()
+	http.timeout = PACK_DOWNLOAD_TIMEOUT
+	add_child(http)
+	if http.request(url) != OK:
+		http.queue_free()
+		return [HTTPRequest.RESULT_CANT_CONNECT, 0, PackedStringArray(), PackedByteArray()]
+	var response = await http.request_completed
+	http.queue_free()
+	return response
+
+## A game that can start without a download: cached, or already mounted
+## (core or a previously fetched pack). Empty when there is none
+func _fallback_game_id(failed_id: String) -> String:
+	for game_id in scene_cache.keys():
+		if game_id != failed_id:
+			return game_id
+	var available: Array[String] = []
+	for game_id in _scan_games():
+		if game_id != failed_id and ResourceLoader.exists(games_dir + game_id + "/main.tscn"):
+			available.append(game_id)
+	return available.pick_random() if not available.is_empty() else ""
+
+func _download_pack(game_id: String, pack_url: String, pack_path: String) -> bool:
+	# Resolve against the main pack's URL so permalink pages (/<game>/) find /packs/
+	var url = JavaScriptBridge.eval("""
+		new URL('%s', new URL(GODOT_CONFIG.mainPack || 'index.pck', document.baseURI)).href
+	""" % pack_url)
+	if not (url is String):
+		return false
+
+	var response = []
+	for attempt in range(PACK_DOWNLOAD_ATTEMPTS):
+		response = await _request_pack(url)
+		if response[0] == HTTPRequest.RESULT_SUCCESS and response[1] == 200:
+			break
+		push_error("Director: Pack download failed (result %d, HTTP %d) for %s" % [response[0], response[1], url])
+	if response[0] != HTTPRequest.RESULT_SUCCESS or response[1] != 200:
+		return false
+
+	DirAccess.make_dir_recursive_absolute(PACK_CACHE_DIR)
+	# Drop older versions of this game's pack
+	for old_file in DirAccess.get_files_at(PACK_CACHE_DIR):
+		if old_file.begins_with(game_id + "."):
+			DirAccess.remove_absolute(PACK_CACHE_DIR.path_join(old_file))
+	var file = FileAccess.open(pack_path, FileAccess.WRITE)
+	if file == null:
+		return false
+	file.store_buffer(response[3])
+	file.close()
+	return true
+
+# =============================================================================
+# Scene Preloading
+# =============================================================================
+
+## Choose the next game; costly ones start loading right away, the rest at
+## the intermission (see _on_game_over)
+func _queue_next_game() -> void:
+	var games = _scan_games()
+	if games.is_empty():
+		return
+	next_game_id = games.pick_random()
+	if GameCatalog.load_cost(next_game_id) >= LARGE_GAME_LOAD_COST and _can_load_threaded():
+		_preload_game(next_game_id)
+
+## Whether load_threaded_request runs on a worker thread. On no-thread
+## builds it would load on the main thread mid-game, or at load_threaded_get
+func _can_load_threaded() -> bool:
+	return not OS.has_feature("nothreads")
+
+## Load a game's scene into the cache on the main thread (no-thread builds)
+func _load_game_blocking(game_id: String) -> void:
+	if scene_cache.has(game_id):
+		return
+	if not await _ensure_game_pack(game_id):
+		return
+	if _get_game_scene(game_id) != null:
+		print("Director: Loaded ", game_id, " during the result")
+
+## Start a threaded load of a game's scene (no-op if cached or in flight)
+func _preload_game(game_id: String) -> void:
+	if scene_cache.has(game_id):
+		return
+	var scene_path = games_dir + game_id + "/main.tscn"
+	if ResourceLoader.load_threaded_get_status(scene_path) != ResourceLoader.THREAD_LOAD_INVALID_RESOURCE:
+		return
+	if not await _ensure_game_pack(game_id):
+		return
+	if ResourceLoader.load_threaded_request(scene_path, "PackedScene", true) == OK:
+		print("Director: Preloading ", game_id)
+
+## Get a game's PackedScene from the cache, a finished or in-flight threaded
+## load, or a synchronous load as the last resort
+func _get_game_scene(game_id: String) -> PackedScene:
+	var scene_path = games_dir + game_id + "/main.tscn"
+	var scene: PackedScene = scene_cache.get(game_id)
+	last_scene_source = "cache"
+	if scene == null:
+		match ResourceLoader.load_threaded_get_status(scene_path):
+			ResourceLoader.THREAD_LOAD_LOADED, ResourceLoader.THREAD_LOAD_IN_PROGRESS:
+				# Blocks only for the part that isn't loaded yet
+				scene = ResourceLoader.load_threaded_get(scene_path) as PackedScene
+				last_scene_source = "threaded"
+			_:
+				scene = load(scene_path) as PackedScene
+				last_scene_source = "sync"
+		if scene == null:
+			return null
+
+	# Move to the most recently used end and evict the oldest
+	scene_cache.erase(game_id)
+	scene_cache[game_id] = scene
+	while scene_cache.size() > SCENE_CACHE_SIZE:
+		scene_cache.erase(scene_cache.keys()[0])
+	return scene
+
 # =============================================================================
 # URL Sharing Functions (Web Export Only)
 # =============================================================================
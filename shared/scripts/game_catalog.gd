@@ -0,0 +1,100 @@
+extends RefCounted
+class_name GameCatalog
+
+## Game Catalog: Generated by scripts/build_catalog.py from games/*/metadata.json.
+## Do not edit by hand; rerun the script after adding or changing a game.
+
+const GAMES: Array[Dictionary] = [
+	{
+		"id": "balloon_popper",
+		"title": "Tap Target",
+		"scene": "res://games/balloon_popper/main.tscn",
+		"asset_bytes": 20278,
+		"load_cost": 44854,
+	},
+	{
+		"id": "box_pusher",
+		"title": "Box Pusher",
+		"scene": "res://games/box_pusher/main.tscn",
+		"asset_bytes": 71764,
+		"load_cost": 235604,
+	},
+	{
+		"id": "dont_touch",
+		"title": "Don't Touch!",
+		"scene": "res://games/dont_touch/main.tscn",
+		"asset_bytes": 10078,
+		"load_cost": 26462,
+	},
+	{
+		"id": "flappy_bird",
+		"title": "Flappy Bird",
+		"scene": "res://games/flappy_bird/main.tscn",
+		"asset_bytes": 38864,
+		"load_cost": 71632,
+	},
+	{
+		"id": "geo_stacker",
+		"title": "GeoStacker",
+		"scene": "res://games/geo_stacker/main.tscn",
+		"asset_bytes": 47119,
+		"load_cost": 79887,
+	},
+	{
+		"id": "infinite_jump",
+		"title": "Infinite Jump",
+		"scene": "res://games/infinite_jump/main.tscn",
+		"asset_bytes": 25305,
+		"load_cost": 115417,
+	},
+	{
+		"id": "loop_connect",
+		"title": "Loop Connect",
+		"scene": "res://games/loop_connect/main.tscn",
+		"asset_bytes": 116659,
+		"load_cost": 190387,
+	},
+	{
+		"id": "minesweeper",
+		"title": "Minesweeper",
+		"scene": "res://games/minesweeper/main.tscn",
+		"asset_bytes": 25545,
+		"load_cost": 50121,
+	},
+	{
+		"id": "money_grabber",
+		"title": "Money Grabber",
+		"scene": "res://games/money_grabber/main.tscn",
+		"asset_bytes": 61625,
+		"load_cost": 102585,
+	},
+	{
+		"id": "space_invaders",
+		"title": "Space Invaders",
+		"scene": "res://games/space_invaders/main.tscn",
+		"asset_bytes": 50068,
+		"load_cost": 82836,
+	},
+	{
+		"id": "whack_a_mole",
+		"title": "Whack-a-Mole",
+		"scene": "res://games/whack_a_mole/main.tscn",
+		"asset_bytes": 11032,
+		"load_cost": 27416,
+	},
+]
+
+static func ids() -> Array[String]:
+	var result: Array[String] = []
+	for game in GAMES:
+		result.append(game["id"])
+	return result
+
+static func get_game(game_id: String) -> Dictionary:
+	for game in GAMES:
+		if game["id"] == game_id:
+			return game
+	return {}
+
+static func load_cost(game_id: String) -> int:
+	return get_game(game_id).get("load_cost", 0)
@@ -89,16 +89,8 @@ func _populate_game_list():
 	for child in game_list_container.get_children():
 		child.queue_free()
 
-	# Get game list from Director's GAME_LIST constant
-	var director = get_parent()
-	var games_dir = "res://games/"
-	var game_list = director.GAME_LIST if director else []
-
-	for game_id in game_list:
-		var scene_path = games_dir + game_id + "/main.tscn"
-		if not ResourceLoader.exists(scene_path):
-			continue
-
+	# Get game list from the generated catalog
+	for game_id in GameCatalog.ids():
 		# Create button for each game
 		var button = Button.new()
 		button.text = _format_game_name(game_id)
@@ -9,13 +9,75 @@ const SUPABASE_KEY = "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.eyJpc3MiOiJzdXBhYmFzZ
 const TABLE_NAME = "leaderboard"
 const MAX_ENTRIES = 10
 
+# Endpoint overrides, e.g. for the local stand-in (scripts/leaderboard_server.py):
+# - override.cfg next to project.godot: [microgames] leaderboard/url="http://127.0.0.1:8787"
+# - LEADERBOARD_URL environment variable (desktop)
+# - ?leaderboard=URL query parameter (web, only when served from localhost)
+const URL_OVERRIDE_SETTING = "microgames/leaderboard/url"
+const KEY_OVERRIDE_SETTING = "microgames/leaderboard/key"
+const URL_OVERRIDE_ENV = "LEADERBOARD_URL"
+
+# Last top-N payload and its ETag, shown immediately on the next launch and
+# revalidated with If-None-Match (a 304 means the cached copy is current)
+const CACHE_PATH = "user://leaderboard_cache.json"
+
+# Requests that take longer fail with success = false
+const REQUEST_TIMEOUT_MS = 10000
+
+# Web builds fetch through this helper, installed once in _ready. It reports
+# back by calling a JavaScriptBridge callback with a JSON result:
+# {success, status, etag, data} or {success: false, status, error}.
+# cache: 'no-store' keeps the browser cache out of it, so a 304 for our own
+# If-None-Match reaches the game instead of being resolved silently.
+const FETCH_HELPER_JS = """
+window._godotLeaderboardFetch = function(url, optionsJson, callback, timeoutMs) {
+	var options = JSON.parse(optionsJson);
+	var controller = new AbortController();
+	var timer = setTimeout(function() { controller.abort(); }, timeoutMs);
+	options.signal = controller.signal;
+	options.cache = 'no-store';
+	fetch(url, options)
+		.then(function(response) {
+			var etag = response.headers.get('ETag') || '';
+			if (response.status === 304) {
+				return {success: true, status: 304, etag: etag};
+			}
+			return response.text().then(function(text) {
+				if (!response.ok) {
+					return {success: false, status: response.status, error: text};
+				}
+				return {success: true, status: response.status, etag: etag, data: text ? JSON.parse(text) : null};
+			});
+		})
+		.catch(function(error) {
+			var message = error.name === 'AbortError' ? 'Timed out after ' + timeoutMs + ' ms' : error.message;
+			return {success: false, status: 0, error: message};
+		})
+		.then(function(result) {
+			clearTimeout(timer);
+			callback(JSON.stringify(result));
+		});
+};
+"""
+
+var api_url: String = SUPABASE_URL
+var api_key: String = SUPABASE_KEY
 var leaderboard_data: Array[Dictionary] = []
+var leaderboard_etag: String = ""
+var has_cached_data: bool = false  # leaderboard_data came from a previous fetch
 var http_request: HTTPRequest
 var is_loading: bool = false
 var is_submitting: bool = false
 var is_web: bool = false
 
+# Web only: the window object and the callbacks handed to FETCH_HELPER_JS
+# (kept referenced so they aren't freed while a fetch is in flight)
+var js_window: JavaScriptObject
+var js_load_callback: JavaScriptObject
+var js_submit_callback: JavaScriptObject
+
 signal leaderboard_loaded(success: bool)
+signal leaderboard_changed  # Emitted when a fetch returns different entries
 signal score_submitted(success: bool, rank: int)
 
 func _ready():
@@ -23,14 +85,88 @@ func _ready():
 	# JavaScriptBridge is only available in web exports
 	is_web = OS.has_feature("web")
 
-	if not is_web:
+	if is_web:
+		_setup_js_bridge()
+	else:
 		# Create HTTP request node for native builds
 		http_request = HTTPRequest.new()
+		http_request.timeout = REQUEST_TIMEOUT_MS / 1000.0
 		add_child(http_request)
 		http_request.request_completed.connect(_on_request_completed)
 
+	_resolve_endpoint()
+	_load_cache()
 	_load_leaderboard()
 
+func _setup_js_bridge() -> void:
+	JavaScriptBridge.eval(FETCH_HELPER_JS, true)
+	js_window = JavaScriptBridge.get_interface("window")
+	js_load_callback = JavaScriptBridge.create_callback(_on_js_load_complete)
+	js_submit_callback = JavaScriptBridge.create_callback(_on_js_submit_complete)
+
+## Start a fetch through FETCH_HELPER_JS; callback receives the JSON result
+func _js_fetch(url: String, options: Dictionary, callback: JavaScriptObject) -> void:
+	js_window._godotLeaderboardFetch(url, JSON.stringify(options), callback, REQUEST_TIMEOUT_MS)
+
+func _resolve_endpoint() -> void:
+	var override_url = ""
+	if ProjectSettings.has_setting(URL_OVERRIDE_SETTING):
+		override_url = str(ProjectSettings.get_setting(URL_OVERRIDE_SETTING))
+	if OS.has_environment(URL_OVERRIDE_ENV):
+		override_url = OS.get_environment(URL_OVERRIDE_ENV)
+	if is_web:
+		var js_code = """
+			(function() {
+				var local = ['localhost', '127.0.0.1', '[::1]'].indexOf(window.location.hostname) >= 0;
+				return local ? (new URLSearchParams(window.location.search).get('leaderboard') || '') : '';
+			})();
+		"""
+		var result = JavaScriptBridge.eval(js_code)
+		if result is String and result != "":
+			override_url = result
+
+	if override_url == "":
+		return
+	api_url = override_url.trim_suffix("/")
+	if ProjectSettings.has_setting(KEY_OVERRIDE_SETTING):
+		api_key = str(ProjectSettings.get_setting(KEY_OVERRIDE_SETTING))
+	print("Leaderboard: using ", api_url)
+
+func _leaderboard_url() -> String:
+	return api_url + "/rest/v1/" + TABLE_NAME + "?select=*&order=score.desc&limit=" + str(MAX_ENTRIES)
+
+func _load_cache() -> void:
+	if not FileAccess.file_exists(CACHE_PATH):
+		return
+	var cache = JSON.parse_string(FileAccess.get_file_as_string(CACHE_PATH))
+	# Entries from another endpoint (e.g. the local stand-in) don't apply
+	if not (cache is Dictionary) or cache.get("url") != _leaderboard_url() or not (cache.get("data") is Array):
+		return
+	for entry in cache["data"]:
+		leaderboard_data.append(entry)
+	leaderboard_etag = str(cache.get("etag", ""))
+	has_cached_data = true
+	print("Loaded ", leaderboard_data.size(), " cached leaderboard entries")
+
+func _save_cache() -> void:
+	var file = FileAccess.open(CACHE_PATH, FileAccess.WRITE)
+	if file == null:
+		return
+	file.store_string(JSON.stringify({"url": _leaderboard_url(), "etag": leaderboard_etag, "data": leaderboard_data}))
+	file.close()
+
+## Store a fresh (200) response; notify listeners only if the entries changed
+func _apply_leaderboard(data: Array, etag: String) -> void:
+	var changed = JSON.stringify(data) != JSON.stringify(leaderboard_data)
+	leaderboard_data.clear()
+	for entry in data:
+		leaderboard_data.append(entry)
+	leaderboard_etag = etag
+	has_cached_data = true
+	_save_cache()
+	if changed:
+		leaderboard_changed.emit()
+
 func _load_leaderboard() -> void:
 	if is_loading:
 		return
@@ -38,52 +174,27 @@ func _load_leaderboard() -> void:
 	is_loading = true
 	print("Fetching leaderboard from Supabase...")
 
-	var url = SUPABASE_URL + "/rest/v1/" + TABLE_NAME + "?select=*&order=score.desc&limit=" + str(MAX_ENTRIES)
+	var url = _leaderboard_url()
 
 	if is_web:
 		# Use JavaScript fetch API to avoid Godot's gzip decompression issues
-		# Store result in window and poll for it
-		JavaScriptBridge.eval("window._godot_leaderboard_result = null; window._godot_leaderboard_loading = true;")
-
-		var js_code = """
-		console.log('JS LOAD: Starting fetch...');
-		fetch('%s', {
-			method: 'GET',
-			headers: {
-				'apikey': '%s',
-				'Authorization': 'Bearer %s',
-				'Content-Type': 'application/json'
-			}
-		})
-		.then(response => {
-			console.log('JS LOAD: Got response', response.status);
-			return response.json();
-		})
-		.then(data => {
-			console.log('JS LOAD: Got data', data.length, 'entries');
-			window._godot_leaderboard_result = JSON.stringify({success: true, data: data});
-			window._godot_leaderboard_loading = false;
-			console.log('JS LOAD: Result stored!');
-		})
-		.catch(error => {
-			console.log('JS LOAD: Error', error.message);
-			window._godot_leaderboard_result = JSON.stringify({success: false, error: error.message});
-			window._godot_leaderboard_loading = false;
-		});
-		""" % [url, SUPABASE_KEY, SUPABASE_KEY]
-
-		JavaScriptBridge.eval(js_code)
-		print("JS fetch initiated for leaderboard load")
-
-		# Poll for result
-		_poll_load_result()
+		var headers = {
+			"apikey": api_key,
+			"Authorization": "Bearer " + api_key,
+			"Content-Type": "application/json"
+		}
+		if leaderboard_etag != "":
+			headers["If-None-Match"] = leaderboard_etag
+		_js_fetch(url, {"method": "GET", "headers": headers}, js_load_callback)
 	else:
 		# Use Godot HTTPRequest for native builds
 		var headers = [
-			"apikey: " + SUPABASE_KEY,
-			"Authorization: Bearer " + SUPABASE_KEY,
+			"apikey: " + api_key,
+			"Authorization: Bearer " + api_key,
 			"Content-Type: application/json"
 		]
+		if leaderboard_etag != "":
+			headers.append("If-None-Match: " + leaderboard_etag)
 
 		var error = http_request.request(url, headers, HTTPClient.METHOD_GET)
 
@@ -92,16 +203,8 @@ func _load_leaderboard() -> void:
 			is_loading = false
 			leaderboard_loaded.emit(false)
 
-func _poll_load_result() -> void:
-	# Poll every frame until result is ready
-	while true:
-		await get_tree().process_frame
-		var loading = JavaScriptBridge.eval("window._godot_leaderboard_loading")
-		if not loading:
-			break
-
-	# Get the result
-	var result_str = str(JavaScriptBridge.eval("window._godot_leaderboard_result"))
+func _on_js_load_complete(args) -> void:
+	var result_str = str(args[0])
 	print("Godot: Got load result, length: ", result_str.length())
 
 	is_loading = false
@@ -116,21 +219,17 @@ func _poll_load_result() -> void:
 
 	var response = json.get_data()
 
-	if response.get("success", false):
-		var data = response.get("data", [])
-		leaderboard_data.clear()
-		for entry in data:
-			leaderboard_data.append(entry)
+	if response.get("success", false) and response.get("status") == 304:
+		print("Leaderboard not modified, keeping ", leaderboard_data.size(), " cached entries (via JS)")
+		leaderboard_loaded.emit(true)
+	elif response.get("success", false) and response.get("data") is Array:
+		_apply_leaderboard(response["data"], str(response.get("etag", "")))
 		print("Loaded ", leaderboard_data.size(), " leaderboard entries from Supabase (via JS)")
 		leaderboard_loaded.emit(true)
 	else:
 		push_error("JS fetch failed: " + str(response.get("error", "Unknown error")))
 		leaderboard_loaded.emit(false)
 
-func _on_js_load_complete(args) -> void:
-	# Legacy callback - no longer used but kept for reference
-	pass
-
 func _on_request_completed(result: int, response_code: int, headers: PackedStringArray, body: PackedByteArray) -> void:
 	var body_string = body.get_string_from_utf8()
 
@@ -144,16 +243,17 @@ func _on_request_completed(result: int, response_code: int, headers: PackedStrin
 			leaderboard_loaded.emit(false)
 			return
 
-		if response_code == 200:
+		if response_code == 304:
+			print("Leaderboard not modified, keeping ", leaderboard_data.size(), " cached entries")
+			leaderboard_loaded.emit(true)
+		elif response_code == 200:
 			var json = JSON.new()
 			var parse_result = json.parse(body_string)
 
 			if parse_result == OK:
 				var data = json.get_data()
 				if data is Array:
-					leaderboard_data.clear()
-					for entry in data:
-						leaderboard_data.append(entry)
+					_apply_leaderboard(data, _get_header(headers, "etag"))
 					print("Loaded ", leaderboard_data.size(), " leaderboard entries from Supabase")
 					leaderboard_loaded.emit(true)
 				else:
@@ -192,6 +292,13 @@ func _on_request_completed(result: int, response_code: int, headers: PackedStrin
 			print("Response body: ", body_string)
 			score_submitted.emit(false, -1)
 
+func _get_header(headers: PackedStringArray, header_name: String) -> String:
+	for header in headers:
+		var separator = header.find(":")
+		if separator > 0 and header.substr(0, separator).strip_edges().to_lower() == header_name:
+			return header.substr(separator + 1).strip_edges()
+	return ""
+
 func is_top_10(score: int) -> bool:
 	# If less than 10 entries, always qualify
 	if leaderboard_data.size() < MAX_ENTRIES:
@@ -216,60 +323,23 @@ func add_entry(player_name: String, score: int) -> void:
 		"created_at": timestamp
 	}
 
-	var url = SUPABASE_URL + "/rest/v1/" + TABLE_NAME
+	var url = api_url + "/rest/v1/" + TABLE_NAME
 	var body = JSON.stringify(new_entry)
 
 	if is_web:
 		# Use JavaScript fetch API to avoid Godot's gzip decompression issues
-		# Store result in window and poll for it
-		JavaScriptBridge.eval("window._godot_submit_result = null; window._godot_submit_loading = true;")
-
-		# Escape the body JSON properly for embedding in JS string
-		var escaped_body = body.replace("\\", "\\\\").replace("'", "\\'").replace("\n", "\\n")
-
-		var js_code = """
-		console.log('JS SUBMIT: Starting fetch...');
-		fetch('%s', {
-			method: 'POST',
-			headers: {
-				'apikey': '%s',
-				'Authorization': 'Bearer %s',
-				'Content-Type': 'application/json',
-				'Prefer': 'return=representation'
-			},
-			body: '%s'
-		})
-		.then(response => {
-			console.log('JS SUBMIT: Got response', response.status);
-			if (response.status === 201) {
-				return response.json().then(data => ({success: true, data: data}));
-			} else {
-				return response.text().then(text => ({success: false, error: text}));
-			}
-		})
-		.then(result => {
-			console.log('JS SUBMIT: Result', result);
-			window._godot_submit_result = JSON.stringify(result);
-			window._godot_submit_loading = false;
-			console.log('JS SUBMIT: Result stored!');
-		})
-		.catch(error => {
-			console.log('JS SUBMIT: Error', error.message);
-			window._godot_submit_result = JSON.stringify({success: false, error: error.message});
-			window._godot_submit_loading = false;
-		});
-		""" % [url, SUPABASE_KEY, SUPABASE_KEY, escaped_body]
-
-		JavaScriptBridge.eval(js_code)
-		print("JS fetch initiated for score submit")
-
-		# Poll for result
-		_poll_submit_result()
+		var headers = {
+			"apikey": api_key,
+			"Authorization": "Bearer " + api_key,
+			"Content-Type": "application/json",
+			"Prefer": "return=representation"
+		}
+		_js_fetch(url, {"method": "POST", "headers": headers, "body": body}, js_submit_callback)
 	else:
 		# Use Godot HTTPRequest for native builds
 		var headers = [
-			"apikey: " + SUPABASE_KEY,
-			"Authorization: Bearer " + SUPABASE_KEY,
+			"apikey: " + api_key,
+			"Authorization: Bearer " + api_key,
 			"Content-Type: application/json",
 			"Prefer: return=representation"
 		]
@@ -281,16 +351,8 @@ func add_entry(player_name: String, score: int) -> void:
 			is_submitting = false
 			score_submitted.emit(false, -1)
 
-func _poll_submit_result() -> void:
-	# Poll every frame until result is ready
-	while true:
-		await get_tree().process_frame
-		var loading = JavaScriptBridge.eval("window._godot_submit_loading")
-		if not loading:
-			break
-
-	# Get the result
-	var result_str = str(JavaScriptBridge.eval("window._godot_submit_result"))
+func _on_js_submit_complete(args) -> void:
+	var result_str = str(args[0])
 	print("Godot: Got submit result, length: ", result_str.length())
 
 	is_submitting = false
@@ -323,10 +385,6 @@ func _poll_submit_result() -> void:
 		push_error("JS submit failed: " + str(response.get("error", "Unknown error")))
 		score_submitted.emit(false, -1)
 
-func _on_js_submit_complete(args) -> void:
-	# Legacy callback - no longer used but kept for reference
-	pass
-
 func get_leaderboard() -> Array[Dictionary]:
 	return leaderboard_data.duplicate()
 
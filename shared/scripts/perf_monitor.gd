@@ -0,0 +1,205 @@
+extends CanvasLayer
+
+## Performance Monitor: Opt-in frame, load and intermission timings
+## Enable with ?perf=1 (web), "-- --perf" on the command line, or
+## [microgames] debug/perf_monitor=true in override.cfg
+## F9 toggles the overlay, F10 exports a JSON log (downloaded on web, saved
+## to user://perf/ elsewhere). Aggregate logs with scripts/analyze_perf.py
+
+const ENABLE_SETTING = "microgames/debug/perf_monitor"
+const FRAME_CAPACITY = 7200  # ~2 minutes at 60 FPS
+const EVENT_CAPACITY = 256
+const OVERLAY_REFRESH = 0.5  # Seconds between overlay updates
+const EXPORT_DIR = "user://perf"
+const LOG_VERSION = 1
+const NO_GAME = -1  # Frame tag outside gameplay (intros, intermissions, menus)
+
+## Fixed-size float buffer; the oldest value is overwritten when full
+class RingBuffer:
+	var values: PackedFloat32Array
+	var next_index: int = 0
+	var count: int = 0
+
+	func _init(capacity: int) -> void:
+		values.resize(capacity)
+
+	func push(value: float) -> void:
+		values[next_index] = value
+		next_index = (next_index + 1) % values.size()
+		count = mini(count + 1, values.size())
+
+	## Values oldest first
+	func to_array() -> PackedFloat32Array:
+		if count < values.size():
+			return values.slice(0, count)
+		return values.slice(next_index) + values.slice(0, next_index)
+
+	## Nearest-rank percentiles of the buffered values
+	func percentiles(ranks: Array) -> Array:
+		var sorted_values = to_array()
+		sorted_values.sort()
+		var result = []
+		for p in ranks:
+			if sorted_values.is_empty():
+				result.append(0.0)
+			else:
+				var index = clampi(int(ceil(p / 100.0 * sorted_values.size())) - 1, 0, sorted_values.size() - 1)
+				result.append(sorted_values[index])
+		return result
+
+var frame_ms := RingBuffer.new(FRAME_CAPACITY)  # Frame delta
+var process_ms := RingBuffer.new(FRAME_CAPACITY)  # Performance TIME_PROCESS (whole tree)
+var frame_game := RingBuffer.new(FRAME_CAPACITY)  # Index into game_names or NO_GAME
+var game_names: Array[String] = []
+var loads: Array[Dictionary] = []  # {game, ms, source, speed}
+var intermissions: Array[Dictionary] = []  # {game, ms}
+var intermission_start_usec: int = -1
+var started_at: String = ""
+
+var overlay: Label
+var overlay_timer: float = 0.0
+
+static func is_enabled() -> bool:
+	if ProjectSettings.has_setting(ENABLE_SETTING) and ProjectSettings.get_setting(ENABLE_SETTING):
+		return true
+	if "--perf" in OS.get_cmdline_user_args():
+		return true
+	if OS.has_feature("web"):
+		var result = JavaScriptBridge.eval("new URLSearchParams(window.location.search).get('perf') || ''")
+		return result is String and result not in ["", "0", "false"]
+	return false
+
+func _ready() -> void:
+	layer = 999  # Below the debugger
+	started_at = Time.get_datetime_string_from_system(true)
+	_create_overlay()
+	print("PerfMonitor: Recording (F9 overlay, F10 export)")
+
+func _input(event) -> void:
+	if event.is_action_pressed("toggle_perf_overlay"):
+		overlay.visible = not overlay.visible
+		overlay_timer = 0.0
+		get_viewport().set_input_as_handled()
+	elif event.is_action_pressed("export_perf_log"):
+		export_log()
+		get_viewport().set_input_as_handled()
+
+func _process(delta: float) -> void:
+	frame_ms.push(delta * 1000.0)
+	process_ms.push(Performance.get_monitor(Performance.TIME_PROCESS) * 1000.0)
+	var director = get_parent()
+	frame_game.push(_game_index(director.current_game_id) if director.game_active else NO_GAME)
+
+	if overlay.visible:
+		overlay_timer -= delta
+		if overlay_timer <= 0.0:
+			overlay_timer = OVERLAY_REFRESH
+			_update_overlay()
+
+# =============================================================================
+# Recording (called by the director)
+# =============================================================================
+
+func record_load(game_id: String, ms: float, source: String, speed: float) -> void:
+	_append_event(loads, {"game": game_id, "ms": snappedf(ms, 0.01), "source": source, "speed": speed})
+
+## The last intermission beat has passed; the next game isn't on screen yet
+func begin_intermission() -> void:
+	intermission_start_usec = Time.get_ticks_usec()
+
+## The next game is in the tree; the time since begin_intermission is overhead
+func end_intermission(game_id: String) -> void:
+	if intermission_start_usec < 0:
+		return
+	var ms = (Time.get_ticks_usec() - intermission_start_usec) / 1000.0
+	intermission_start_usec = -1
+	_append_event(intermissions, {"game": game_id, "ms": snappedf(ms, 0.01)})
+
+func _append_event(events: Array[Dictionary], event: Dictionary) -> void:
+	events.append(event)
+	if events.size() > EVENT_CAPACITY:
+		events.pop_front()
+
+func _game_index(game_id: String) -> int:
+	var index = game_names.find(game_id)
+	if index < 0:
+		game_names.append(game_id)
+		index = game_names.size() - 1
+	return index
+
+# =============================================================================
+# Overlay
+# =============================================================================
+
+func _create_overlay() -> void:
+	overlay = Label.new()
+	overlay.position = Vector2(8, 8)
+	overlay.add_theme_font_size_override("font_size", 14)
+	overlay.add_theme_color_override("font_color", Color(0.6, 1.0, 0.6))
+	overlay.add_theme_color_override("font_outline_color", Color.BLACK)
+	overlay.add_theme_constant_override("outline_size", 4)
+	overlay.mouse_filter = Control.MOUSE_FILTER_IGNORE
+	overlay.visible = false
+	add_child(overlay)
+
+func _update_overlay() -> void:
+	var frames = frame_ms.percentiles([50, 95, 99])
+	var process = process_ms.percentiles([50, 95, 99])
+	var lines = [
+		"FPS %d  (%d frames)" % [Engine.get_frames_per_second(), frame_ms.count],
+		"frame   p50 %.1f  p95 %.1f  p99 %.1f ms" % frames,
+		"process p50 %.1f  p95 %.1f  p99 %.1f ms" % process,
+	]
+	if not loads.is_empty():
+		var last = loads[-1]
+		lines.append("load %s %.0f ms (%s)" % [last["game"], last["ms"], last["source"]])
+	if not intermissions.is_empty():
+		var worst = 0.0
+		for event in intermissions:
+			worst = maxf(worst, event["ms"])
+		lines.append("intermission gap last %.0f  max %.0f ms" % [intermissions[-1]["ms"], worst])
+	overlay.text = "\n".join(lines)
+
+# =============================================================================
+# Export
+# =============================================================================
+
+func build_log() -> Dictionary:
+	var games = frame_game.to_array()
+	var game_tags: Array[int] = []
+	for value in games:
+		game_tags.append(int(value))
+	return {
+		"version": LOG_VERSION,
+		"started_at": started_at,
+		"exported_at": Time.get_datetime_string_from_system(true),
+		"platform": OS.get_name(),
+		"engine": Engine.get_version_info()["string"],
+		"user_agent": str(JavaScriptBridge.eval("navigator.userAgent")) if OS.has_feature("web") else "",
+		"games": game_names,
+		"frames": {
+			"frame_ms": Array(frame_ms.to_array()),
+			"process_ms": Array(process_ms.to_array()),
+			"game": game_tags,
+		},
+		"loads": loads,
+		"intermissions": intermissions,
+	}
+
+func export_log() -> void:
+	var json = JSON.stringify(build_log())
+	var file_name = "perf_%s.json" % Time.get_datetime_string_from_system(true).replace(":", "-")
+	if OS.has_feature("web"):
+		JavaScriptBridge.download_buffer(json.to_utf8_buffer(), file_name, "application/json")
+		print("PerfMonitor: Downloaded ", file_name)
+		return
+
+	DirAccess.make_dir_recursive_absolute(EXPORT_DIR)
+	var path = EXPORT_DIR.path_join(file_name)
+	var file = FileAccess.open(path, FileAccess.WRITE)
+	if file == null:
+		push_error("PerfMonitor: Could not write " + path)
+		return
+	file.store_string(json)
+	file.close()
+	print("PerfMonitor: Wrote ", ProjectSettings.globalize_path(path))
@@ -2,24 +2,12 @@ extends Node
 
 ## Test Harness for Microgame Winnability Testing
 ## Runs each game with different strategies and reports results
-## Usage: godot4 --headless --script res://shared/scripts/test_harness.gd
+## Usage: godot4 --headless res://test_harness.tscn [-- --games=a,b | --shard=I/N] [--json-lines]
+## --json-lines adds one machine-readable line per event for scripts/run_harness.py,
+## which shards the catalog across several engine processes
 
 const GAMES_DIR = "res://games/"
-
-# Game list (same as Director)
-const GAME_LIST: Array[String] = [
-	"box_pusher",
-	"geo_stacker",
-	"loop_connect",
-	"minesweeper",
-	"infinite_jump",
-	"flappy_bird",
-	"balloon_popper",
-	"dont_touch",
-	"money_grabber",
-	"space_invaders",
-	"whack_a_mole",
-]
+const JSON_LINE_PREFIX = "HARNESS_JSON "
 
 # Test strategies
 enum Strategy { DO_NOTHING, PERFECT_PLAY }
@@ -51,24 +39,62 @@ var test_results: Array = []
 var tests_passed: int = 0
 var tests_failed: int = 0
 
+# Command line (after "--")
+var selected_games: Array[String] = []
+var json_lines: bool = false
+
+# Timing of the current test
+var load_started_usec: int = 0
+var run_started_usec: int = 0
+var current_load_ms: float = 0.0
+
 # AI player state
 var ai_click_timer: float = 0.0
 var ai_action_interval: float = 0.1  # How often AI tries to act
+var ai_move_index: int = 0  # Next step of a replayed solution (box_pusher, minesweeper)
 
 func _ready():
 	print("\n============================================================")
 	print("MICROGAME TEST HARNESS")
 	print("============================================================\n")
 
+	_parse_args()
+
 	# Build test queue
 	_build_test_queue()
+	_emit_json({"event": "start", "games": selected_games, "tests": test_queue.size()})
 
 	# Start first test
 	_run_next_test()
 
+func _parse_args():
+	# Defaults to every game in the catalog; --games or --shard pick a subset
+	selected_games = GameCatalog.ids()
+	for arg in OS.get_cmdline_user_args():
+		if arg.begins_with("--games="):
+			selected_games.clear()
+			for game_id in arg.trim_prefix("--games=").split(",", false):
+				selected_games.append(game_id)
+		elif arg.begins_with("--shard="):
+			# --shard=I/N: every Nth game of the catalog, starting at I (0-based)
+			var parts = arg.trim_prefix("--shard=").split("/")
+			var index = int(parts[0])
+			var count = maxi(1, int(parts[1]) if parts.size() > 1 else 1)
+			var shard: Array[String] = []
+			for i in range(selected_games.size()):
+				if i % count == index:
+					shard.append(selected_games[i])
+			selected_games = shard
+		elif arg == "--json-lines":
+			json_lines = true
+
+func _emit_json(data: Dictionary):
+	if json_lines:
+		print(JSON_LINE_PREFIX + JSON.stringify(data))
+
 func _build_test_queue():
 	# Test each game at speed 1.0 and 5.0 with both strategies
-	for game_id in GAME_LIST:
+	for game_id in selected_games:
 		var scene_path = GAMES_DIR + game_id + "/main.tscn"
 		if not ResourceLoader.exists(scene_path):
 			print("SKIP: %s (scene not found)" % game_id)
@@ -98,7 +124,8 @@ func _build_test_queue():
 func _run_next_test():
 	if test_queue.is_empty():
 		_print_summary()
-		get_tree().quit()
+		_emit_json({"event": "summary", "passed": tests_passed, "failed": tests_failed})
+		get_tree().quit(1 if tests_failed > 0 else 0)
 		return
 
 	var test = test_queue.pop_front()
@@ -107,9 +134,12 @@ func _run_next_test():
 	current_strategy = test["strategy"]
 	game_result = -1
 	ai_click_timer = 0.0
+	ai_move_index = 0
 
 	var strategy_name = "PERFECT" if current_strategy == Strategy.PERFECT_PLAY else "DO_NOTHING"
 	print("Testing: %s | Speed: %.1fx | Strategy: %s" % [current_game_id, current_speed, strategy_name])
+	# Lets run_harness.py tell which test a crashed engine was in
+	_emit_json({"event": "begin", "game": current_game_id, "speed": current_speed, "strategy": strategy_name})
 
 	# Load and start game
 	_load_game(current_game_id)
@@ -120,6 +150,10 @@ func _load_game(game_id: String):
 		current_game.queue_free()
 		current_game = null
 
+	load_started_usec = Time.get_ticks_usec()
+	current_load_ms = 0.0
+	run_started_usec = 0
+
 	var scene_path = GAMES_DIR + game_id + "/main.tscn"
 	var game_scene = load(scene_path)
 
@@ -144,6 +178,8 @@ func _load_game(game_id: String):
 	current_game.game_over.connect(_on_game_over)
 
 	add_child(current_game)
+	current_load_ms = (Time.get_ticks_usec() - load_started_usec) / 1000.0
+	run_started_usec = Time.get_ticks_usec()
 
 func _on_game_over(score: int):
 	game_result = score
@@ -258,23 +294,36 @@ func _ai_flap_bird():
 			_simulate_click(player.global_position)
 
 func _ai_solve_puzzle():
-	# Simple puzzle solving - try clicking interactive elements
-	for child in current_game.get_children():
-		if child is Node2D and child.has_method("push"):
-			_simulate_click(child.global_position)
-			return
+	# Replay the level bank's push-optimal solution, one move per AI tick
+	var moves: String = current_game.solution
+	if ai_move_index >= moves.length():
+		return
+	var dirs = {"U": Vector2i.UP, "R": Vector2i.RIGHT, "D": Vector2i.DOWN, "L": Vector2i.LEFT}
+	current_game._try_move(dirs[moves[ai_move_index]])
+	ai_move_index += 1
 
 func _ai_stack_blocks():
 	# Click to drop blocks
 	_simulate_click(Vector2(320, 100))
 
 func _ai_connect_loops():
-	# Click grid cells to rotate/connect
-	_simulate_click(Vector2(320, 320))
+	# Rotate the first tile that isn't at its (unique) solution rotation yet
+	for row in range(current_game.grid.size()):
+		for col in range(current_game.grid[row].size()):
+			var tile = current_game.grid[row][col]
+			if not current_game._is_tile_solved(tile) and not Vector2(col, row) in current_game.rotating_tiles:
+				current_game._rotate_tile(col, row)
+				return
 
 func _ai_sweep_mines():
-	# Click on safe cells
-	_simulate_click(Vector2(320, 320))
+	# Replay the board bank's logic-solver clicks, one per AI tick
+	var clicks: String = current_game.solution
+	if ai_move_index >= clicks.length():
+		return
+	var cell = clicks.unicode_at(ai_move_index) - "a".unicode_at(0)
+	var size = current_game.grid.size()
+	current_game._on_tile_clicked(cell / size, cell % size)
+	ai_move_index += 1
 
 func _ai_shoot_invaders():
 	# Click to shoot at invaders
@@ -327,14 +376,18 @@ func _record_result(passed: bool, message: String):
 	var status = "PASS" if passed else "FAIL"
 	var icon = "✓" if passed else "✗"
 
+	var run_ms = (Time.get_ticks_usec() - run_started_usec) / 1000.0 if run_started_usec > 0 else 0.0
 	var result = {
 		"game": current_game_id,
 		"speed": current_speed,
 		"strategy": strategy_name,
 		"passed": passed,
-		"message": message
+		"message": message,
+		"load_ms": snappedf(current_load_ms, 0.01),
+		"run_ms": snappedf(run_ms, 0.01)
 	}
 	test_results.append(result)
+	_emit_json({"event": "result"}.merged(result))
 
 	if passed:
 		tests_passed += 1